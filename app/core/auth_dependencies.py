@@ -1,13 +1,30 @@
+from typing import Optional
 from fastapi import Depends, HTTPException, status
+from app.core.config import AUTH_STATELESS_ENABLED
 from app.core.security import oauth2_scheme, verify_token
-from app.services.user_service import UserService, get_user_service
+from app.services.user_service import (
+    AsyncUserService,
+    get_async_user_service
+)
+from app.services.token_revocation_service import (
+    AsyncTokenRevocationService,
+    get_async_token_revocation_service
+)
 from app.domain.exceptions import DomainValidationException
 from app.domain.entities.user import User as DomainUser
+from app.domain.value_objects import (
+    UUIDField,
+    EmailField,
+    UsernameField
+)
 
 
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
-    user_service: UserService = Depends(get_user_service)
+    user_service: AsyncUserService = Depends(get_async_user_service),
+    revocation_service: AsyncTokenRevocationService = Depends(
+        get_async_token_revocation_service
+        )
 ) -> DomainUser:
 
     credentials_exception = HTTPException(
@@ -32,10 +49,24 @@ async def get_current_user(
         raise credentials_exception
 
     try:
-        user = user_service.get_user_by_id(user_id)
+        # Revocations are checked in both modes, it is what makes a logout
+        #  reject the access token. The check is an in-memory lookup, and
+        #  the list is reloaded from the database once per refresh interval
+        await revocation_service.refresh_revocations()
+        if revocation_service.is_revoked(payload):
+            raise credentials_exception
+
+        if AUTH_STATELESS_ENABLED:
+            user = user_from_claims(payload)
+            if user is not None:
+                return user
+
+        user = await user_service.get_user_by_id(user_id)
         if user is None:
             raise credentials_exception
         return user
+    except HTTPException:
+        raise
     except DomainValidationException:
         raise credentials_exception
     except Exception:
@@ -51,3 +82,19 @@ async def get_current_user(
                 }
             }
         )
+
+
+def user_from_claims(payload: dict) -> Optional[DomainUser]:
+    """
+    Builds the authenticated user from the claims of its access token.
+    Returns None for a token issued without them, which is then resolved
+    from the database.
+    """
+    if "username" not in payload or "email" not in payload:
+        return None
+    return DomainUser(
+        id=UUIDField(payload["sub"]),
+        email=EmailField(payload["email"]),
+        username=UsernameField(payload["username"]),
+        password_hash=None
+    )
@@ -0,0 +1,49 @@
+import hashlib
+import math
+from typing import Iterable, Iterator
+
+
+class BloomFilter:
+    """
+    Fixed size set membership filter. might_contain() never returns False
+    for an added item, and returns True for an item that was not added
+    with a probability close to false_positive_rate while no more than
+    capacity items are stored.
+    """
+
+    def __init__(
+            self,
+            capacity: int,
+            false_positive_rate: float = 0.01,
+            items: Iterable[str] = ()
+            ):
+        capacity = max(capacity, 1)
+        self._size = max(8, math.ceil(
+            -capacity * math.log(false_positive_rate) / math.log(2) ** 2
+        ))
+        self._hash_count = max(1, round(self._size / capacity * math.log(2)))
+        self._bits = bytearray((self._size + 7) // 8)
+        for item in items:
+            self.add(item)
+
+    @property
+    def size_in_bytes(self) -> int:
+        return len(self._bits)
+
+    def add(self, item: str) -> None:
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+
+    def might_contain(self, item: str) -> bool:
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(item)
+        )
+
+    def _positions(self, item: str) -> Iterator[int]:
+        # Double hashing: k positions derived from two 64-bit hashes
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        for index in range(self._hash_count):
+            yield (first + index * second) % self._size
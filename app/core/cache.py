@@ -0,0 +1,105 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+from app.core.metrics import MetricsRegistry, metrics
+
+
+class TTLCache:
+    """
+    Thread-safe LRU cache whose entries also expire ttl_seconds after they
+    were stored. Hits, misses, evictions and size are reported to the
+    metrics registry prefixed with the cache name.
+
+    Every invalidation bumps `version`. A value loaded before an
+    invalidation is discarded by set(), so a slow read can never put back
+    a value that was invalidated while it was being loaded.
+    """
+
+    def __init__(
+            self,
+            name: str,
+            max_size: int,
+            ttl_seconds: float,
+            clock: Callable[[], float] = time.monotonic,
+            registry: MetricsRegistry = metrics
+            ):
+        self._max_size = max_size
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._version = 0
+        self._lock = threading.Lock()
+
+        self._hits = registry.counter(
+            f"{name}_hits", "Lookups answered from the cache."
+        )
+        self._misses = registry.counter(
+            f"{name}_misses", "Lookups not found or expired in the cache."
+        )
+        self._evictions = registry.counter(
+            f"{name}_evictions", "Entries dropped to respect max_size."
+        )
+        self._size = registry.gauge(
+            f"{name}_size", "Entries currently stored in the cache."
+        )
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] <= self._clock():
+                del self._entries[key]
+                self._size.set(len(self._entries))
+                entry = None
+            if entry is None:
+                self._misses.inc()
+                return default
+            self._entries.move_to_end(key)
+            self._hits.inc()
+            return entry[0]
+
+    def set(
+            self,
+            key: Hashable,
+            value: Any,
+            version: Optional[int] = None,
+            ttl_seconds: Optional[float] = None
+            ) -> None:
+        """
+        Stores the value. When the version read before loading it is
+        given and an invalidation happened since, the value is dropped.
+        ttl_seconds shortens the lifetime of this entry, it never extends
+        it past the ttl of the cache.
+        """
+        if ttl_seconds is None or ttl_seconds > self._ttl_seconds:
+            ttl_seconds = self._ttl_seconds
+        if ttl_seconds <= 0:
+            return
+        with self._lock:
+            if version is not None and version != self._version:
+                return
+            self._entries[key] = (value, self._clock() + ttl_seconds)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+                self._evictions.inc()
+            self._size.set(len(self._entries))
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            self._version += 1
+            self._entries.pop(key, None)
+            self._size.set(len(self._entries))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._version += 1
+            self._entries.clear()
+            self._size.set(0)
+
+    def __len__(self) -> int:
+        return len(self._entries)
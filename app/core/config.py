@@ -6,3 +6,128 @@ load_dotenv()
 SECRET_KEY = os.getenv("SECRET_KEY", "super-secret-key-development-default")
 ALGORITHM = os.getenv("ALGORITHM", "HS256")
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", 30))
+REFRESH_TOKEN_EXPIRE_DAYS = int(os.getenv("REFRESH_TOKEN_EXPIRE_DAYS", 30))
+
+# get_current_user builds the user from the access token claims instead of
+#  loading it. Revoked tokens are tracked in memory and reloaded from the
+#  database every AUTH_REVOCATION_REFRESH_SECONDS
+AUTH_STATELESS_ENABLED = (
+    os.getenv("AUTH_STATELESS_ENABLED", "false").lower() == "true"
+)
+AUTH_REVOCATION_REFRESH_SECONDS = float(
+    os.getenv("AUTH_REVOCATION_REFRESH_SECONDS", 30)
+)
+AUTH_REVOCATION_BLOOM_CAPACITY = int(
+    os.getenv("AUTH_REVOCATION_BLOOM_CAPACITY", 100000)
+)
+AUTH_REVOCATION_BLOOM_FALSE_POSITIVE_RATE = float(
+    os.getenv("AUTH_REVOCATION_BLOOM_FALSE_POSITIVE_RATE", 0.01)
+)
+
+# Bounded TTL/LRU cache of the users resolved by get_current_user
+USER_CACHE_ENABLED = (
+    os.getenv("USER_CACHE_ENABLED", "true").lower() == "true"
+)
+USER_CACHE_MAX_SIZE = int(os.getenv("USER_CACHE_MAX_SIZE", 10000))
+USER_CACHE_TTL_SECONDS = float(os.getenv("USER_CACHE_TTL_SECONDS", 60))
+
+# Bounded cache of the decoded payload of verified access tokens, kept until
+#  the token expires or at most TOKEN_CACHE_MAX_TTL_SECONDS
+TOKEN_CACHE_ENABLED = (
+    os.getenv("TOKEN_CACHE_ENABLED", "true").lower() == "true"
+)
+TOKEN_CACHE_MAX_SIZE = int(os.getenv("TOKEN_CACHE_MAX_SIZE", 10000))
+TOKEN_CACHE_MAX_TTL_SECONDS = float(
+    os.getenv("TOKEN_CACHE_MAX_TTL_SECONDS", 300)
+)
+
+# bcrypt cost and the thread pool that runs it off the event loop
+PASSWORD_BCRYPT_ROUNDS = int(os.getenv("PASSWORD_BCRYPT_ROUNDS", 12))
+PASSWORD_HASH_WORKERS = int(
+    os.getenv("PASSWORD_HASH_WORKERS", os.cpu_count() or 1)
+)
+PASSWORD_HASH_MAX_PENDING = int(os.getenv("PASSWORD_HASH_MAX_PENDING", 64))
+PASSWORD_HASH_QUEUE_TIMEOUT_SECONDS = float(
+    os.getenv("PASSWORD_HASH_QUEUE_TIMEOUT_SECONDS", 10)
+)
+
+DATABASE_ASYNC = os.getenv("DATABASE_ASYNC", "false").lower() == "true"
+
+# Connection pool of file based databases, sized for multi-threaded uvicorn
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 10))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", 20))
+DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", 30))
+
+# SQLite performance profile applied to every new connection
+SQLITE_PERFORMANCE_PROFILE = (
+    os.getenv("SQLITE_PERFORMANCE_PROFILE", "true").lower() == "true"
+)
+SQLITE_PRAGMAS = {
+    "journal_mode": os.getenv("SQLITE_JOURNAL_MODE", "WAL"),
+    "synchronous": os.getenv("SQLITE_SYNCHRONOUS", "NORMAL"),
+    "cache_size": int(os.getenv("SQLITE_CACHE_SIZE", -64000)),
+    "mmap_size": int(os.getenv("SQLITE_MMAP_SIZE", 268435456)),
+    "temp_store": os.getenv("SQLITE_TEMP_STORE", "MEMORY"),
+    "busy_timeout": int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", 5000)),
+}
+
+# Stores message and session ids as 16-byte BLOBs and their timestamps as
+#  integer epoch microseconds. Existing databases need migrate-schema
+MESSAGE_COMPACT_SCHEMA = (
+    os.getenv("MESSAGE_COMPACT_SCHEMA", "false").lower() == "true"
+)
+
+MESSAGE_BATCH_MAX_SIZE = int(os.getenv("MESSAGE_BATCH_MAX_SIZE", 500))
+
+# One message out of every N is timed stage by stage by the pipeline
+MESSAGE_PIPELINE_TIMING_EVERY = int(
+    os.getenv("MESSAGE_PIPELINE_TIMING_EVERY", 16)
+)
+
+# Runs the processing pipeline of large messages and batches on a pool of
+#  worker processes, small messages stay on the event loop
+MESSAGE_PROCESS_POOL_ENABLED = (
+    os.getenv("MESSAGE_PROCESS_POOL_ENABLED", "false").lower() == "true"
+)
+MESSAGE_PROCESS_POOL_WORKERS = int(
+    os.getenv("MESSAGE_PROCESS_POOL_WORKERS", os.cpu_count() or 1)
+)
+MESSAGE_PROCESS_POOL_MIN_CHARS = int(
+    os.getenv("MESSAGE_PROCESS_POOL_MIN_CHARS", 4096)
+)
+MESSAGE_PROCESS_POOL_MIN_BATCH = int(
+    os.getenv("MESSAGE_PROCESS_POOL_MIN_BATCH", 100)
+)
+MESSAGE_PROCESS_POOL_MAX_PENDING = int(
+    os.getenv("MESSAGE_PROCESS_POOL_MAX_PENDING", 64)
+)
+
+# Rows fetched per round-trip by the session export stream
+MESSAGE_EXPORT_BATCH_SIZE = int(os.getenv("MESSAGE_EXPORT_BATCH_SIZE", 1000))
+
+# check_then_insert: SELECT by id before inserting (default)
+# insert_or_conflict: single INSERT, duplicates detected by the primary key
+MESSAGE_WRITE_MODE = os.getenv("MESSAGE_WRITE_MODE", "check_then_insert")
+
+MESSAGE_WRITE_BUFFER_ENABLED = (
+    os.getenv("MESSAGE_WRITE_BUFFER_ENABLED", "false").lower() == "true"
+)
+MESSAGE_WRITE_BUFFER_MAX_ROWS = int(
+    os.getenv("MESSAGE_WRITE_BUFFER_MAX_ROWS", 256)
+)
+MESSAGE_WRITE_BUFFER_MAX_DELAY_MS = float(
+    os.getenv("MESSAGE_WRITE_BUFFER_MAX_DELAY_MS", 5)
+)
+MESSAGE_WRITE_BUFFER_MAX_QUEUE = int(
+    os.getenv("MESSAGE_WRITE_BUFFER_MAX_QUEUE", 10000)
+)
+
+# Moderation engine of ContentField: auto, sequential, regex or aho_corasick
+CONTENT_FILTER_ENGINE = os.getenv("CONTENT_FILTER_ENGINE", "auto")
+
+# Wordlist file, one word per line, reloaded when it changes. Unset uses
+#  the built-in list
+CONTENT_FILTER_WORDLIST_PATH = os.getenv("CONTENT_FILTER_WORDLIST_PATH")
+CONTENT_FILTER_WORDLIST_POLL_SECONDS = float(
+    os.getenv("CONTENT_FILTER_WORDLIST_POLL_SECONDS", 5)
+)
@@ -0,0 +1,151 @@
+import threading
+from typing import Dict, Optional, Sequence
+
+
+DEFAULT_BUCKETS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+class Counter:
+    def __init__(self, name: str, description: str):
+        self.name = name
+        self.description = description
+        self._value = 0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1) -> None:
+        with self._lock:
+            self._value += amount
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+    def snapshot(self) -> dict:
+        return {"type": "counter", "value": self._value}
+
+
+class Gauge:
+    def __init__(self, name: str, description: str):
+        self.name = name
+        self.description = description
+        self._value = 0
+        self._lock = threading.Lock()
+
+    def set(self, value: float) -> None:
+        self._value = value
+
+    def inc(self, amount: float = 1) -> None:
+        with self._lock:
+            self._value += amount
+
+    def dec(self, amount: float = 1) -> None:
+        self.inc(-amount)
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+    def snapshot(self) -> dict:
+        return {"type": "gauge", "value": self._value}
+
+
+class Histogram:
+    """
+    Cumulative bucketed distribution with count, sum, min and max.
+    """
+
+    def __init__(
+            self,
+            name: str,
+            description: str,
+            buckets: Sequence[float] = DEFAULT_BUCKETS
+            ):
+        self.name = name
+        self.description = description
+        self._buckets = tuple(sorted(buckets))
+        self._bucket_counts = [0] * len(self._buckets)
+        self._count = 0
+        self._sum = 0.0
+        self._min: Optional[float] = None
+        self._max: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        with self._lock:
+            self._count += 1
+            self._sum += value
+            self._min = value if self._min is None else min(self._min, value)
+            self._max = value if self._max is None else max(self._max, value)
+            for index, bound in enumerate(self._buckets):
+                if value <= bound:
+                    self._bucket_counts[index] += 1
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "type": "histogram",
+                "count": self._count,
+                "sum": self._sum,
+                "min": self._min,
+                "max": self._max,
+                "mean": self._sum / self._count if self._count else None,
+                "buckets": {
+                    str(bound): count
+                    for bound, count in zip(
+                        self._buckets, self._bucket_counts
+                    )
+                },
+            }
+
+
+class MetricsRegistry:
+    """
+    In-process registry of the application metrics. Asking twice for the
+    same name returns the same metric.
+    """
+
+    def __init__(self):
+        self._metrics: Dict[str, object] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, description: str = "") -> Counter:
+        return self._get_or_create(name, Counter, description)
+
+    def gauge(self, name: str, description: str = "") -> Gauge:
+        return self._get_or_create(name, Gauge, description)
+
+    def histogram(
+            self,
+            name: str,
+            description: str = "",
+            buckets: Sequence[float] = DEFAULT_BUCKETS
+            ) -> Histogram:
+        return self._get_or_create(name, Histogram, description, buckets)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            metrics = dict(self._metrics)
+        return {
+            name: {"description": metric.description, **metric.snapshot()}
+            for name, metric in sorted(metrics.items())
+        }
+
+    def _get_or_create(self, name, metric_class, description, *args):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = metric_class(name, description, *args)
+                self._metrics[name] = metric
+            elif not isinstance(metric, metric_class):
+                raise ValueError(
+                    f"Metric '{name}' is already registered as "
+                    f"{type(metric).__name__}"
+                )
+            return metric
+
+
+metrics = MetricsRegistry()
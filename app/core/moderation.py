@@ -0,0 +1,160 @@
+import os
+import threading
+import time
+from typing import List, Optional, Tuple
+from app.core.config import (
+    CONTENT_FILTER_ENGINE,
+    CONTENT_FILTER_WORDLIST_PATH,
+    CONTENT_FILTER_WORDLIST_POLL_SECONDS
+)
+from app.core.metrics import MetricsRegistry, metrics
+from app.domain.content_filter import (
+    DEFAULT_INAPPROPRIATE_WORDS,
+    ContentFilterEngine,
+    build_content_filter,
+    get_content_filter,
+    set_content_filter
+)
+
+
+def read_wordlist(path: str) -> List[str]:
+    """
+    One word per line, in priority order. Blank lines and lines starting
+    with # are ignored.
+    """
+    with open(path, encoding="utf-8") as wordlist:
+        return [
+            word for word in (line.strip() for line in wordlist)
+            if word and not word.startswith("#")
+        ]
+
+
+class ContentFilterReloader:
+    """
+    Keeps the ContentField moderation engine in sync with a wordlist
+    file. A daemon thread polls the file and, when it changed, builds the
+    new engine on that thread and swaps it in with set_content_filter.
+    ContentField reads the engine once per value, so requests in flight
+    keep masking with the list they started with.
+
+    A file that cannot be read or built keeps the current engine and
+    counts a reload error.
+    """
+
+    def __init__(
+            self,
+            path: str,
+            engine: str = CONTENT_FILTER_ENGINE,
+            poll_seconds: float = CONTENT_FILTER_WORDLIST_POLL_SECONDS,
+            registry: MetricsRegistry = metrics
+            ):
+        self._path = path
+        self._engine = engine
+        self._poll_seconds = poll_seconds
+        self._signature: Optional[Tuple[int, int, int]] = None
+        self._version = 0
+        self._load_lock = threading.Lock()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self._version_gauge = registry.gauge(
+            "content_filter_version",
+            "Wordlist loads swapped in since startup."
+        )
+        self._words_gauge = registry.gauge(
+            "content_filter_words",
+            "Words of the live moderation engine."
+        )
+        self._build_ms_gauge = registry.gauge(
+            "content_filter_build_ms",
+            "Time to read and build the live engine, in milliseconds."
+        )
+        self._reload_errors = registry.counter(
+            "content_filter_reload_errors",
+            "Wordlist reloads that failed and kept the previous engine."
+        )
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def load(self, force: bool = False) -> bool:
+        """
+        Builds and installs the engine if the file changed since the last
+        load. Returns whether a new engine was swapped in.
+        """
+        with self._load_lock:
+            signature = self._file_signature()
+            if not force and signature == self._signature:
+                return False
+            started = time.perf_counter()
+            words = read_wordlist(self._path)
+            content_filter = build_content_filter(words, self._engine)
+            build_ms = (time.perf_counter() - started) * 1000
+
+            set_content_filter(content_filter)
+            self._signature = signature
+            self._version += 1
+            self._version_gauge.set(self._version)
+            self._words_gauge.set(len(content_filter.words))
+            self._build_ms_gauge.set(build_ms)
+            return True
+
+    def start(self) -> None:
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run,
+                name="content-filter-reloader",
+                daemon=True
+            )
+            self._thread.start()
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is None:
+            return
+        self._stop.set()
+        thread.join(timeout)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._poll_seconds):
+            try:
+                self.load()
+            except Exception:
+                self._reload_errors.inc()
+
+    def _file_signature(self) -> Tuple[int, int, int]:
+        # Editors and deploys usually replace the file, which changes the
+        #  inode even when the size and mtime resolution hide the change
+        stat = os.stat(self._path)
+        return stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+
+content_filter_reloader = (
+    ContentFilterReloader(CONTENT_FILTER_WORDLIST_PATH)
+    if CONTENT_FILTER_WORDLIST_PATH else None
+)
+
+
+def configure_content_filter(
+        engine: str = CONTENT_FILTER_ENGINE
+        ) -> ContentFilterEngine:
+    """
+    Installs the moderation engine every ContentField masks with, built
+    from CONTENT_FILTER_WORDLIST_PATH when set, which is then watched for
+    changes, or from the default list otherwise.
+    """
+    if content_filter_reloader is not None:
+        content_filter_reloader.load(force=True)
+        content_filter_reloader.start()
+        return get_content_filter()
+    content_filter = build_content_filter(
+        DEFAULT_INAPPROPRIATE_WORDS, engine
+    )
+    set_content_filter(content_filter)
+    return content_filter
@@ -0,0 +1,131 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+from passlib.context import CryptContext
+from app.core.config import (
+    PASSWORD_BCRYPT_ROUNDS,
+    PASSWORD_HASH_WORKERS,
+    PASSWORD_HASH_MAX_PENDING,
+    PASSWORD_HASH_QUEUE_TIMEOUT_SECONDS
+)
+from app.core.metrics import MetricsRegistry, metrics
+from app.domain.exceptions import ServiceUnavailableError
+
+
+class PasswordHasher:
+    """
+    bcrypt hashing and verification. The async methods run on a dedicated
+    thread pool of max_workers threads, bcrypt releases the GIL so the
+    event loop keeps serving other requests meanwhile.
+
+    At most max_workers + max_pending calls are admitted at once. Further
+    callers wait on a semaphore for up to queue_timeout seconds and are
+    then rejected with ServiceUnavailableError (503), so a login storm
+    cannot queue unbounded work. The async methods must be called from a
+    single event loop.
+    """
+
+    def __init__(
+            self,
+            rounds: int = PASSWORD_BCRYPT_ROUNDS,
+            max_workers: int = PASSWORD_HASH_WORKERS,
+            max_pending: int = PASSWORD_HASH_MAX_PENDING,
+            queue_timeout: float = PASSWORD_HASH_QUEUE_TIMEOUT_SECONDS,
+            registry: MetricsRegistry = metrics
+            ):
+        self._context = CryptContext(
+            schemes=["bcrypt"],
+            deprecated="auto",
+            bcrypt__rounds=rounds
+        )
+        self._max_workers = max_workers
+        self._slots = asyncio.Semaphore(max_workers + max_pending)
+        self._queue_timeout = queue_timeout
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+        self._in_flight_gauge = registry.gauge(
+            "password_hasher_in_flight",
+            "Hash and verify calls running or queued on the pool."
+        )
+        self._wait_latency = registry.histogram(
+            "password_hasher_wait_ms",
+            "Time from the call until a worker starts it, in milliseconds."
+        )
+        self._rejected = registry.counter(
+            "password_hasher_rejected",
+            "Calls rejected because the pool stayed saturated."
+        )
+
+    def hash(self, password: str) -> str:
+        return self._context.hash(password)
+
+    def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return self._context.verify(plain_password, hashed_password)
+
+    async def hash_async(self, password: str) -> str:
+        return await self._run(self.hash, password)
+
+    async def verify_async(
+            self,
+            plain_password: str,
+            hashed_password: str
+            ) -> bool:
+        return await self._run(self.verify, plain_password, hashed_password)
+
+    def close(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    async def _run(self, function: Callable, *args):
+        submitted_at = time.perf_counter()
+        await self._acquire_slot()
+        try:
+            def timed():
+                self._wait_latency.observe(
+                    (time.perf_counter() - submitted_at) * 1000
+                )
+                return function(*args)
+
+            return await asyncio.wrap_future(
+                self._get_executor().submit(timed)
+            )
+        finally:
+            self._release_slot()
+
+    async def _acquire_slot(self) -> None:
+        # A free slot is taken without wrapping the wait in a task
+        if self._slots.locked():
+            try:
+                await asyncio.wait_for(
+                    self._slots.acquire(), self._queue_timeout
+                )
+            except asyncio.TimeoutError:
+                self._rejected.inc()
+                raise ServiceUnavailableError(code="PASSWORD_HASHER_BUSY")
+        else:
+            await self._slots.acquire()
+        self._in_flight += 1
+        self._in_flight_gauge.set(self._in_flight)
+
+    def _release_slot(self) -> None:
+        self._in_flight -= 1
+        self._in_flight_gauge.set(self._in_flight)
+        self._slots.release()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers,
+                    thread_name_prefix="password-hasher"
+                )
+            return self._executor
+
+
+password_hasher = PasswordHasher()
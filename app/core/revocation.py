@@ -0,0 +1,135 @@
+import threading
+import time
+from typing import Callable, Dict, Iterable, Optional, Set
+from app.core.bloom_filter import BloomFilter
+from app.core.config import (
+    AUTH_REVOCATION_REFRESH_SECONDS,
+    AUTH_REVOCATION_BLOOM_CAPACITY,
+    AUTH_REVOCATION_BLOOM_FALSE_POSITIVE_RATE
+)
+from app.core.metrics import MetricsRegistry, metrics
+
+
+class RevocationList:
+    """
+    In-memory copy of the revoked access tokens: the jti of each revoked
+    token and the current token version of each user that revoked all
+    its tokens.
+
+    A Bloom filter answers the lookup of a jti that was never revoked,
+    which is almost every request, and only its positives are confirmed
+    against the exact set. The content is replaced from the database
+    every refresh_seconds. Revocations made by this process in between
+    apply right away and survive the next replace.
+    """
+
+    def __init__(
+            self,
+            capacity: int = AUTH_REVOCATION_BLOOM_CAPACITY,
+            false_positive_rate: float = (
+                AUTH_REVOCATION_BLOOM_FALSE_POSITIVE_RATE
+            ),
+            refresh_seconds: float = AUTH_REVOCATION_REFRESH_SECONDS,
+            clock: Callable[[], float] = time.monotonic,
+            registry: MetricsRegistry = metrics
+            ):
+        self._capacity = capacity
+        self._false_positive_rate = false_positive_rate
+        self._refresh_seconds = refresh_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._next_refresh = float("-inf")
+        self._bloom = BloomFilter(capacity, false_positive_rate)
+        self._jtis: Set[str] = set()
+        self._user_versions: Dict[str, int] = {}
+        # Revocations made since the last claim_refresh()
+        self._local_jtis: Set[str] = set()
+        self._local_user_versions: Dict[str, int] = {}
+
+        self._size = registry.gauge(
+            "revocation_list_size",
+            "Revoked token ids and user versions held in memory."
+        )
+        self._false_positives = registry.counter(
+            "revocation_list_bloom_false_positives",
+            "Bloom filter positives not confirmed by the exact set."
+        )
+        self._refreshes = registry.counter(
+            "revocation_list_refreshes",
+            "Reloads of the revocation list from the database."
+        )
+
+    def is_revoked(
+            self,
+            jti: Optional[str],
+            user_id: str,
+            version: int
+            ) -> bool:
+        if version < self._user_versions.get(user_id, 0):
+            return True
+        if jti is None or not self._bloom.might_contain(jti):
+            return False
+        if jti in self._jtis:
+            return True
+        self._false_positives.inc()
+        return False
+
+    def revoke_token(self, jti: str) -> None:
+        with self._lock:
+            self._bloom.add(jti)
+            self._jtis.add(jti)
+            self._local_jtis.add(jti)
+            self._update_size()
+
+    def set_user_version(self, user_id: str, version: int) -> None:
+        with self._lock:
+            for versions in (self._user_versions, self._local_user_versions):
+                versions[user_id] = max(versions.get(user_id, 0), version)
+            self._update_size()
+
+    def claim_refresh(self) -> bool:
+        """
+        True for the single caller that must reload the list now, the
+        other callers keep using the current content meanwhile.
+        """
+        with self._lock:
+            now = self._clock()
+            if now < self._next_refresh:
+                return False
+            self._next_refresh = now + self._refresh_seconds
+            self._local_jtis = set()
+            self._local_user_versions = {}
+            return True
+
+    def replace(
+            self,
+            jtis: Iterable[str],
+            user_versions: Dict[str, int]
+            ) -> None:
+        with self._lock:
+            jtis = set(jtis) | self._local_jtis
+            user_versions = dict(user_versions)
+            for user_id, version in self._local_user_versions.items():
+                user_versions[user_id] = max(
+                    user_versions.get(user_id, 0), version
+                )
+            bloom = BloomFilter(
+                max(self._capacity, len(jtis)),
+                self._false_positive_rate,
+                jtis
+            )
+            self._bloom, self._jtis = bloom, jtis
+            self._user_versions = user_versions
+            self._update_size()
+        self._refreshes.inc()
+
+    def retry_refresh(self) -> None:
+        """Makes the next claim_refresh() succeed after a failed reload."""
+        with self._lock:
+            self._next_refresh = float("-inf")
+
+    def _update_size(self) -> None:
+        self._size.set(len(self._jtis) + len(self._user_versions))
+
+
+revocation_list = RevocationList()
@@ -1,13 +1,34 @@
+import hashlib
+import time
+import uuid
 from datetime import datetime, timedelta
 from typing import Optional
 from jose import jwt, JWTError
 from fastapi import HTTPException, status
-from app.core.config import SECRET_KEY, ALGORITHM, ACCESS_TOKEN_EXPIRE_MINUTES
+from app.core.cache import TTLCache
+from app.domain.entities.user import User as DomainUser
+from app.core.config import (
+    SECRET_KEY,
+    ALGORITHM,
+    ACCESS_TOKEN_EXPIRE_MINUTES,
+    TOKEN_CACHE_ENABLED,
+    TOKEN_CACHE_MAX_SIZE,
+    TOKEN_CACHE_MAX_TTL_SECONDS
+)
 from fastapi.security import OAuth2PasswordBearer
 
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/token")
 
+# Payloads of already verified tokens, keyed by the digest of the token
+token_cache: Optional[TTLCache] = None
+if TOKEN_CACHE_ENABLED:
+    token_cache = TTLCache(
+        name="token_cache",
+        max_size=TOKEN_CACHE_MAX_SIZE,
+        ttl_seconds=TOKEN_CACHE_MAX_TTL_SECONDS
+    )
+
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     to_encode = data.copy()
@@ -18,15 +39,42 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
             datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
         )
     to_encode.update({"exp": expire})
+    to_encode.setdefault("jti", uuid.uuid4().hex)
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
 
+def create_user_access_token(
+        user: DomainUser,
+        token_version: int = 0
+        ) -> str:
+    """
+    Access token carrying the claims get_current_user needs to build the
+    user without loading it, and the user's token version at issue time.
+    """
+    return create_access_token(data={
+        "sub": str(user.id),
+        "username": user.username.value,
+        "email": str(user.email),
+        "ver": token_version
+    })
+
+
 def verify_token(token: str) -> Optional[dict]:
+    """
+    Decodes and verifies the token. A token verified before is served from
+    token_cache until its exp, after which it goes through jwt.decode again
+    and is rejected as expired.
+    """
+    cache_key = None
+    if token_cache is not None:
+        cache_key = hashlib.sha256(token.encode()).digest()
+        cached_payload = token_cache.get(cache_key)
+        if cached_payload is not None:
+            return dict(cached_payload)
 
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        return payload
     except JWTError as e:
         if "expired" in str(e).lower():
             raise HTTPException(
@@ -44,3 +92,18 @@ def verify_token(token: str) -> Optional[dict]:
                     "message": f"Token inválido: {str(e)}"
                 }
             )
+
+    if cache_key is not None:
+        token_cache.set(
+            cache_key,
+            dict(payload),
+            ttl_seconds=_seconds_until_expiry(payload)
+        )
+    return payload
+
+
+def _seconds_until_expiry(payload: dict) -> Optional[float]:
+    expire = payload.get("exp")
+    if not isinstance(expire, (int, float)):
+        return None
+    return expire - time.time()
@@ -0,0 +1,428 @@
+import re
+from abc import ABC, abstractmethod
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+REPLACEMENT = "***"
+
+DEFAULT_INAPPROPRIATE_WORDS = ("malo", "ofensivo", "prohibido", "spam")
+
+# Measured with benchmarks/bench_content_filter: up to this size the
+#  precompiled patterns beat any single pass, past it the automaton wins
+AUTO_SEQUENTIAL_MAX_WORDS = 16
+
+CONTENT_FILTER_ENGINES = ("auto", "sequential", "regex", "aho_corasick")
+
+
+class ContentFilterEngine(ABC):
+    """
+    Masks every inappropriate word of a text with REPLACEMENT.
+
+    The reference behaviour is the one of SequentialFilterEngine: one
+    case-insensitive re.sub per word, in list order, each one applied on
+    the output of the previous one. Every engine returns exactly the same
+    text for the same word list.
+    """
+
+    name: str
+
+    def __init__(self, words: Iterable[str]):
+        self.words: Tuple[str, ...] = tuple(words)
+
+    @abstractmethod
+    def mask(self, text: str) -> str:
+        pass
+
+
+class SequentialFilterEngine(ContentFilterEngine):
+    """
+    One precompiled pattern per word, the text is rescanned once per word.
+    Supports any word list.
+    """
+
+    name = "sequential"
+
+    def __init__(self, words: Iterable[str]):
+        super().__init__(words)
+        self._patterns = [
+            re.compile(re.escape(word), re.IGNORECASE)
+            for word in self.words
+        ]
+
+    def mask(self, text: str) -> str:
+        for pattern in self._patterns:
+            text = pattern.sub(REPLACEMENT, text)
+        return text
+
+
+class _CaseClasses:
+    """
+    Groups characters the way re.IGNORECASE compares them, so the
+    automaton agrees with re on every character, including the special
+    cases such as 'ſ' and 's' or 'ı' and 'i'.
+    """
+
+    def __init__(self, chars: Iterable[str]):
+        representatives: List[str] = []
+        by_lower: Dict[str, int] = {}
+        assigned: Dict[str, int] = {}
+        for char in dict.fromkeys(chars):
+            class_id = by_lower.get(char.lower())
+            if class_id is None or not re.fullmatch(
+                    re.escape(representatives[class_id]), char,
+                    re.IGNORECASE):
+                class_id = len(representatives)
+                by_lower.setdefault(char.lower(), class_id)
+                representatives.append(char)
+            assigned[char] = class_id
+
+        # Merges the classes re treats as equal although lower() differs,
+        #  a character belongs to the first group that matches it
+        self._pattern = re.compile(
+            "|".join(f"({re.escape(char)})" for char in representatives),
+            re.IGNORECASE
+        ) if representatives else None
+        self._merged = [
+            self._pattern.fullmatch(char).lastindex - 1
+            for char in representatives
+        ]
+        self.representatives = representatives
+        self.cache: Dict[str, int] = {
+            char: self._merged[class_id]
+            for char, class_id in assigned.items()
+        }
+
+    def class_of(self, char: str) -> int:
+        """Class id of char, -1 if no word contains it."""
+        class_id = self.cache.get(char)
+        if class_id is None:
+            match = self._pattern and self._pattern.fullmatch(char)
+            class_id = self._merged[match.lastindex - 1] if match else -1
+            self.cache[char] = class_id
+        return class_id
+
+
+class _Automaton:
+    """
+    Aho-Corasick automaton over the case classes of the words. Words
+    that only differ in case share a node, the first one in the list
+    keeps it.
+    """
+
+    def __init__(self, words: Sequence[str]):
+        self.classes = _CaseClasses(char for word in words for char in word)
+        class_count = max(len(self.classes.representatives), 1)
+        # Every character of the words is already classified
+        class_ids = self.classes.cache
+        # Transitions of every node in one dict keyed by
+        #  node * class_count + class_id, and flat lists of ints per node:
+        #  much smaller and faster to build than an object per node
+        goto: Dict[int, int] = {}
+        parent = [0]
+        label = [-1]
+        depth = [0]
+        word_of = [-1]
+
+        for index, word in enumerate(words):
+            node = 0
+            for char in word:
+                class_id = class_ids[char]
+                transition = node * class_count + class_id
+                child = goto.get(transition)
+                if child is None:
+                    child = len(depth)
+                    goto[transition] = child
+                    parent.append(node)
+                    label.append(class_id)
+                    depth.append(depth[node] + 1)
+                    word_of.append(-1)
+                node = child
+            if word_of[node] == -1:
+                word_of[node] = index
+
+        # Fail links are computed level by level, a node only needs the
+        #  ones of shallower nodes. output: nearest node on the fail chain
+        #  that ends a word, 0 if none
+        levels: List[List[int]] = [[] for _ in range(max(depth) + 1)]
+        for node in range(1, len(depth)):
+            levels[depth[node]].append(node)
+        fail = [0] * len(depth)
+        output = [0] * len(depth)
+        for level in levels[2:]:
+            for node in level:
+                class_id = label[node]
+                fallback = fail[parent[node]]
+                target = goto.get(fallback * class_count + class_id)
+                while target is None and fallback:
+                    fallback = fail[fallback]
+                    target = goto.get(fallback * class_count + class_id)
+                if target is not None:
+                    fail[node] = target
+                    output[node] = (
+                        target if word_of[target] != -1 else output[target]
+                    )
+
+        self.class_count = class_count
+        self.goto = goto
+        self.parent = parent
+        self.label = label
+        self.depth = depth
+        self.word = word_of
+        self.fail = fail
+        self.output = output
+
+    def has_nested_words(self) -> bool:
+        """True when a word contains another one, e.g. spam and spammer."""
+        if any(self.output):
+            return True
+        # A word that is the prefix of a longer one ends on an inner node
+        return any(
+            self.word[node] != -1 for node in set(self.parent[1:]) - {0}
+        )
+
+    def word_index(self, text: str) -> int:
+        """Position in the list of the word text is a case variant of."""
+        node = 0
+        for char in text:
+            node = self.goto[
+                node * self.class_count + self.classes.class_of(char)
+            ]
+        return self.word[node]
+
+
+def _check_single_pass_words(words: Sequence[str]) -> None:
+    # An empty word or one containing the replacement could match text
+    #  written by a previous replacement, only the sequential engine
+    #  reproduces that
+    for word in words:
+        if not word or "*" in word:
+            raise ValueError(
+                f"La palabra {word!r} requiere el motor secuencial."
+            )
+
+
+def _masked_spans(
+        occurrences: List[Tuple[int, int, int]],
+        length: int
+        ) -> List[Tuple[int, int]]:
+    """
+    Spans the sequential engine masks given every (word index, start,
+    end) occurrence found in the original text: words in list order,
+    each one left to right, skipping occurrences that overlap an earlier
+    occurrence of the same word or text already masked by another word.
+    """
+    if len(occurrences) < 2:
+        return [(start, end) for _, start, end in occurrences]
+    occurrences.sort()
+    masked = bytearray(length)
+    spans = []
+    current_word = None
+    last_end = 0
+    for word, start, end in occurrences:
+        if word != current_word:
+            current_word = word
+            last_end = 0
+        if start < last_end or masked.find(1, start, end) != -1:
+            continue
+        masked[start:end] = b"\x01" * (end - start)
+        spans.append((start, end))
+        last_end = end
+    spans.sort()
+    return spans
+
+
+def _mask_spans(text: str, spans: List[Tuple[int, int]]) -> str:
+    if not spans:
+        return text
+    parts = []
+    position = 0
+    for start, end in spans:
+        parts.append(text[position:start])
+        parts.append(REPLACEMENT)
+        position = end
+    parts.append(text[position:])
+    return "".join(parts)
+
+
+class AhoCorasickFilterEngine(ContentFilterEngine):
+    """
+    Finds every occurrence of every word in one pass over the text and
+    keeps the ones the sequential engine would mask. The cost barely
+    depends on the number of words.
+    """
+
+    name = "aho_corasick"
+
+    def __init__(self, words: Iterable[str]):
+        super().__init__(words)
+        _check_single_pass_words(self.words)
+        self._automaton = _Automaton(self.words)
+
+    def mask(self, text: str) -> str:
+        return _mask_spans(
+            text, _masked_spans(self._occurrences(text), len(text))
+        )
+
+    def _occurrences(self, text: str) -> List[Tuple[int, int, int]]:
+        automaton = self._automaton
+        cache = automaton.classes.cache
+        class_of = automaton.classes.class_of
+        goto = automaton.goto
+        class_count = automaton.class_count
+        fail = automaton.fail
+        word = automaton.word
+        depth = automaton.depth
+        output = automaton.output
+
+        occurrences = []
+        node = 0
+        for position, char in enumerate(text, 1):
+            class_id = cache.get(char)
+            if class_id is None:
+                class_id = class_of(char)
+            if class_id == -1:
+                node = 0
+                continue
+            while True:
+                target = goto.get(node * class_count + class_id)
+                if target is not None or node == 0:
+                    node = target or 0
+                    break
+                node = fail[node]
+            match = node if word[node] != -1 else output[node]
+            while match:
+                occurrences.append(
+                    (word[match], position - depth[match], position)
+                )
+                match = output[match]
+        return occurrences
+
+
+class RegexFilterEngine(ContentFilterEngine):
+    """
+    One precompiled case-insensitive regex for the whole list, shaped as
+    a trie so common prefixes are only tried once. Occurrences that start
+    inside another one are found too, e.g. prohibido and ofensivo in
+    "prohibidofensivo", and solved like the sequential engine does.
+
+    Requires that no word contains another one, then at most one word
+    matches at each position. Other lists are rejected.
+    """
+
+    name = "regex"
+
+    def __init__(self, words: Iterable[str]):
+        super().__init__(words)
+        _check_single_pass_words(self.words)
+        self._automaton = _Automaton(self.words)
+        if self._automaton.has_nested_words():
+            raise ValueError(
+                "La lista tiene palabras contenidas en otras, "
+                "requiere el motor secuencial o aho_corasick."
+            )
+        self._pattern = re.compile(
+            self._trie_pattern(self._automaton), re.IGNORECASE
+        ) if self.words else None
+
+    def mask(self, text: str) -> str:
+        if self._pattern is None:
+            return text
+        pattern = self._pattern
+        occurrences = []
+        for match in pattern.finditer(text):
+            start, end = match.span()
+            occurrences.append((0, start, end))
+            # finditer resumes after the match, occurrences starting
+            #  inside it are looked up one position at a time
+            for position in range(start + 1, end):
+                inner = pattern.match(text, position)
+                if inner is not None:
+                    occurrences.append((0, position, inner.end()))
+        if len(occurrences) > 1:
+            word_index = self._automaton.word_index
+            occurrences = [
+                (word_index(text[start:end]), start, end)
+                for _, start, end in occurrences
+            ]
+        return _mask_spans(text, _masked_spans(occurrences, len(text)))
+
+    @classmethod
+    def _trie_pattern(cls, automaton: _Automaton) -> str:
+        # No word is a prefix of another one, so words only end on leaves
+        representatives = automaton.classes.representatives
+        children: Dict[int, List[Tuple[int, int]]] = {}
+        for node in range(1, len(automaton.parent)):
+            children.setdefault(automaton.parent[node], []).append(
+                (automaton.label[node], node)
+            )
+        branches: list = []
+        stack = [(0, "", branches)]
+        while stack:
+            node, prefix, siblings = stack.pop()
+            node_children = children.get(node)
+            if not node_children:
+                siblings.append(prefix)
+                continue
+            if len(node_children) == 1:
+                class_id, child = node_children[0]
+                stack.append((
+                    child,
+                    prefix + re.escape(representatives[class_id]),
+                    siblings
+                ))
+                continue
+            group: list = []
+            siblings.append((prefix, group))
+            for class_id, child in node_children:
+                stack.append((
+                    child, re.escape(representatives[class_id]), group
+                ))
+        return cls._join(branches)
+
+    @classmethod
+    def _join(cls, branches: list) -> str:
+        return "|".join(
+            branch if isinstance(branch, str)
+            else f"{branch[0]}(?:{cls._join(branch[1])})"
+            for branch in branches
+        )
+
+
+def build_content_filter(
+        words: Iterable[str] = DEFAULT_INAPPROPRIATE_WORDS,
+        engine: str = "auto"
+        ) -> ContentFilterEngine:
+    """
+    Builds the engine for a word list. "auto" keeps the sequential engine
+    for short lists and for words no single-pass engine supports, and
+    uses the automaton for the rest.
+    """
+    words = tuple(words)
+    if engine == "sequential":
+        return SequentialFilterEngine(words)
+    if engine == "regex":
+        return RegexFilterEngine(words)
+    if engine == "aho_corasick":
+        return AhoCorasickFilterEngine(words)
+    if engine != "auto":
+        raise ValueError(
+            f"Motor de filtrado desconocido: {engine!r}. "
+            f"Valores válidos: {', '.join(CONTENT_FILTER_ENGINES)}."
+        )
+
+    if len(words) <= AUTO_SEQUENTIAL_MAX_WORDS or any(
+            not word or "*" in word for word in words):
+        return SequentialFilterEngine(words)
+    return AhoCorasickFilterEngine(words)
+
+
+_content_filter: ContentFilterEngine = build_content_filter()
+
+
+def get_content_filter() -> ContentFilterEngine:
+    """Engine ContentField masks with, shared by every request."""
+    return _content_filter
+
+
+def set_content_filter(engine: ContentFilterEngine) -> None:
+    global _content_filter
+    _content_filter = engine
@@ -10,7 +10,7 @@ from app.domain.value_objects import (
 )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Message:
     session_id: UUIDField
     content: ContentField
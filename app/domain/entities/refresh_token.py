@@ -0,0 +1,32 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+from app.domain.value_objects import UUIDField
+
+
+@dataclass(frozen=True, slots=True)
+class RefreshToken:
+    """
+    Stored state of an issued refresh token. Only the SHA-256 digest of
+    the token is kept. Every rotation of a login issues a new token of
+    the same family and revokes the previous one.
+    """
+    token_hash: str
+    user_id: UUIDField
+    family_id: str
+    expires_at: datetime
+
+    revoked_at: Optional[datetime] = None
+    replaced_by: Optional[str] = None
+    created_at: Optional[datetime] = None
+
+    def __post_init__(self):
+        if self.created_at is None:
+            object.__setattr__(self, 'created_at', datetime.utcnow())
+
+    @property
+    def is_revoked(self) -> bool:
+        return self.revoked_at is not None
+
+    def is_expired(self, now: datetime) -> bool:
+        return self.expires_at <= now
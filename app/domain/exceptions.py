@@ -104,5 +104,20 @@ class DatabaseOperationError(InfrastructureException):
     def __init__(
             self,
             message: str = "Error en operación de base de datos.",
-            detail: Exception = None):
-        super().__init__(message, detail)
+            detail: Exception = None,
+            code: str = "DATABASE_OPERATION_ERROR"):
+        super().__init__(message, detail, code)
+
+
+class ServiceUnavailableError(InfrastructureException):
+    """
+    Exception raised when a saturated resource cannot take more work,
+    the API answers it with 503 so the client retries later.
+    """
+    def __init__(
+            self,
+            message: str = "El servidor está ocupado. "
+            "Inténtalo de nuevo en unos segundos.",
+            detail: Exception = None,
+            code: str = "SERVICE_UNAVAILABLE"):
+        super().__init__(message, detail, code)
@@ -0,0 +1,113 @@
+from abc import ABC, abstractmethod
+from typing import AsyncIterator, List, Optional, Set, Tuple
+from app.domain.entities.message import Message
+from app.domain.read_models.message_view import MessageView
+from app.domain.value_objects import (
+    UUIDField,
+    CursorField,
+    SearchQueryField,
+    SearchCursorField
+)
+
+
+class AsyncMessageRepositoryPort(ABC):
+    @abstractmethod
+    async def create_message(self, message: Message) -> Message:
+        pass
+
+    @abstractmethod
+    async def create_message_if_absent(
+            self,
+            message: Message
+            ) -> Optional[Message]:
+        pass
+
+    @abstractmethod
+    async def create_messages(self, messages: List[Message]) -> List[Message]:
+        pass
+
+    @abstractmethod
+    async def get_existing_message_ids(
+            self,
+            message_ids: List[UUIDField]
+            ) -> Set[str]:
+        pass
+
+    @abstractmethod
+    async def get_message_by_id(self, id: UUIDField) -> Message:
+        pass
+
+    @abstractmethod
+    async def get_message_by_session_id(
+            self,
+            session_id: UUIDField,
+            limit: int = 50,
+            offset: int = 0,
+            sender: Optional[str] = None
+            ) -> Tuple[List[Message], int]:
+        pass
+
+    @abstractmethod
+    async def get_message_page_by_session_id(
+            self,
+            session_id: UUIDField,
+            limit: int = 50,
+            cursor: Optional[CursorField] = None,
+            sender: Optional[str] = None
+            ) -> Tuple[List[Message], bool]:
+        pass
+
+    @abstractmethod
+    async def get_message_view_by_id(
+            self,
+            id: UUIDField
+            ) -> Optional[MessageView]:
+        pass
+
+    @abstractmethod
+    async def get_message_views_by_session_id(
+            self,
+            session_id: UUIDField,
+            limit: int = 50,
+            offset: int = 0,
+            sender: Optional[str] = None
+            ) -> Tuple[List[MessageView], int]:
+        pass
+
+    @abstractmethod
+    async def get_message_view_page_by_session_id(
+            self,
+            session_id: UUIDField,
+            limit: int = 50,
+            cursor: Optional[CursorField] = None,
+            sender: Optional[str] = None
+            ) -> Tuple[List[MessageView], bool]:
+        pass
+
+    @abstractmethod
+    async def count_message_by_session_id(
+            self,
+            session_id: UUIDField,
+            sender: Optional[str] = None
+            ) -> int:
+        pass
+
+    @abstractmethod
+    def stream_messages_by_session_id(
+            self,
+            session_id: UUIDField,
+            cursor: Optional[CursorField] = None,
+            sender: Optional[str] = None,
+            batch_size: int = 1000
+            ) -> AsyncIterator[Message]:
+        pass
+
+    @abstractmethod
+    async def search_messages(
+            self,
+            query: SearchQueryField,
+            session_id: Optional[UUIDField] = None,
+            limit: int = 20,
+            cursor: Optional[SearchCursorField] = None
+            ) -> Tuple[List[Tuple[Message, str, float]], bool]:
+        pass
@@ -0,0 +1,41 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Optional
+from app.domain.entities.refresh_token import RefreshToken
+from app.domain.value_objects import UUIDField
+
+
+class AsyncRefreshTokenRepositoryPort(ABC):
+    @abstractmethod
+    async def create_refresh_token(
+            self,
+            refresh_token: RefreshToken
+            ) -> RefreshToken:
+        pass
+
+    @abstractmethod
+    async def get_refresh_token(
+            self,
+            token_hash: str
+            ) -> Optional[RefreshToken]:
+        pass
+
+    @abstractmethod
+    async def rotate_refresh_token(
+            self,
+            token_hash: str,
+            new_refresh_token: RefreshToken
+            ) -> bool:
+        pass
+
+    @abstractmethod
+    async def revoke_refresh_token_family(self, family_id: str) -> int:
+        pass
+
+    @abstractmethod
+    async def revoke_user_refresh_tokens(self, user_id: UUIDField) -> int:
+        pass
+
+    @abstractmethod
+    async def delete_expired_refresh_tokens(self, now: datetime) -> int:
+        pass
@@ -0,0 +1,40 @@
+from abc import ABC, abstractmethod
+from typing import Optional, Tuple
+from app.domain.entities.user import User
+from app.domain.value_objects import (
+    EmailField,
+    UsernameField
+)
+
+
+class AsyncUserRepositoryPort(ABC):
+    @abstractmethod
+    async def create_user(self, user: User) -> User:
+        pass
+
+    @abstractmethod
+    async def create_user_if_absent(self, user: User) -> Optional[User]:
+        pass
+
+    @abstractmethod
+    async def get_user_by_id(self, user_id: str) -> Optional[User]:
+        pass
+
+    @abstractmethod
+    async def get_user_by_email(self, email: EmailField) -> Optional[User]:
+        pass
+
+    @abstractmethod
+    async def get_user_by_username(
+            self,
+            username: UsernameField
+            ) -> Optional[User]:
+        pass
+
+    @abstractmethod
+    async def exists_by_email_or_username(
+            self,
+            email: EmailField,
+            username: UsernameField
+            ) -> Tuple[bool, bool]:
+        pass
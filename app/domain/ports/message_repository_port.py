@@ -1,7 +1,12 @@
 from abc import ABC, abstractmethod
+from typing import Iterator, List, Optional, Set, Tuple
 from app.domain.entities.message import Message
+from app.domain.read_models.message_view import MessageView
 from app.domain.value_objects import (
-    UUIDField
+    UUIDField,
+    CursorField,
+    SearchQueryField,
+    SearchCursorField
 )
 
 
@@ -10,10 +15,99 @@ class MessageRepositoryPort(ABC):
     def create_message(self, message: Message) -> Message:
         pass
 
+    @abstractmethod
+    def create_message_if_absent(
+            self,
+            message: Message
+            ) -> Optional[Message]:
+        pass
+
+    @abstractmethod
+    def create_messages(self, messages: List[Message]) -> List[Message]:
+        pass
+
+    @abstractmethod
+    def get_existing_message_ids(
+            self,
+            message_ids: List[UUIDField]
+            ) -> Set[str]:
+        pass
+
     @abstractmethod
     def get_message_by_id(self, id: UUIDField) -> Message:
         pass
 
     @abstractmethod
-    def get_message_by_session_id(self, id: UUIDField) -> Message:
+    def get_message_by_session_id(
+            self,
+            session_id: UUIDField,
+            limit: int = 50,
+            offset: int = 0,
+            sender: Optional[str] = None
+            ) -> Tuple[List[Message], int]:
+        pass
+
+    @abstractmethod
+    def get_message_page_by_session_id(
+            self,
+            session_id: UUIDField,
+            limit: int = 50,
+            cursor: Optional[CursorField] = None,
+            sender: Optional[str] = None
+            ) -> Tuple[List[Message], bool]:
+        pass
+
+    @abstractmethod
+    def get_message_view_by_id(
+            self,
+            id: UUIDField
+            ) -> Optional[MessageView]:
+        pass
+
+    @abstractmethod
+    def get_message_views_by_session_id(
+            self,
+            session_id: UUIDField,
+            limit: int = 50,
+            offset: int = 0,
+            sender: Optional[str] = None
+            ) -> Tuple[List[MessageView], int]:
+        pass
+
+    @abstractmethod
+    def get_message_view_page_by_session_id(
+            self,
+            session_id: UUIDField,
+            limit: int = 50,
+            cursor: Optional[CursorField] = None,
+            sender: Optional[str] = None
+            ) -> Tuple[List[MessageView], bool]:
+        pass
+
+    @abstractmethod
+    def count_message_by_session_id(
+            self,
+            session_id: UUIDField,
+            sender: Optional[str] = None
+            ) -> int:
+        pass
+
+    @abstractmethod
+    def stream_messages_by_session_id(
+            self,
+            session_id: UUIDField,
+            cursor: Optional[CursorField] = None,
+            sender: Optional[str] = None,
+            batch_size: int = 1000
+            ) -> Iterator[Message]:
+        pass
+
+    @abstractmethod
+    def search_messages(
+            self,
+            query: SearchQueryField,
+            session_id: Optional[UUIDField] = None,
+            limit: int = 20,
+            cursor: Optional[SearchCursorField] = None
+            ) -> Tuple[List[Tuple[Message, str, float]], bool]:
         pass
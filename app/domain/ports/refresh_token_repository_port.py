@@ -0,0 +1,38 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Optional
+from app.domain.entities.refresh_token import RefreshToken
+from app.domain.value_objects import UUIDField
+
+
+class RefreshTokenRepositoryPort(ABC):
+    @abstractmethod
+    def create_refresh_token(
+            self,
+            refresh_token: RefreshToken
+            ) -> RefreshToken:
+        pass
+
+    @abstractmethod
+    def get_refresh_token(self, token_hash: str) -> Optional[RefreshToken]:
+        pass
+
+    @abstractmethod
+    def rotate_refresh_token(
+            self,
+            token_hash: str,
+            new_refresh_token: RefreshToken
+            ) -> bool:
+        pass
+
+    @abstractmethod
+    def revoke_refresh_token_family(self, family_id: str) -> int:
+        pass
+
+    @abstractmethod
+    def revoke_user_refresh_tokens(self, user_id: UUIDField) -> int:
+        pass
+
+    @abstractmethod
+    def delete_expired_refresh_tokens(self, now: datetime) -> int:
+        pass
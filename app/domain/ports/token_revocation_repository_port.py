@@ -0,0 +1,29 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Dict, List, Tuple
+from app.domain.value_objects import UUIDField
+
+
+class TokenRevocationRepositoryPort(ABC):
+    @abstractmethod
+    def revoke_token(self, jti: str, expires_at: datetime) -> None:
+        pass
+
+    @abstractmethod
+    def increment_user_token_version(self, user_id: UUIDField) -> int:
+        pass
+
+    @abstractmethod
+    def get_user_token_version(self, user_id: UUIDField) -> int:
+        pass
+
+    @abstractmethod
+    def get_token_revocations(
+            self,
+            now: datetime
+            ) -> Tuple[List[str], Dict[str, int]]:
+        pass
+
+    @abstractmethod
+    def delete_expired_revoked_tokens(self, now: datetime) -> int:
+        pass
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Optional, Tuple
 from app.domain.entities.user import User
 from app.domain.value_objects import (
     EmailField,
@@ -12,6 +12,10 @@ class UserRepositoryPort(ABC):
     def create_user(self, user: User) -> User:
         pass
 
+    @abstractmethod
+    def create_user_if_absent(self, user: User) -> Optional[User]:
+        pass
+
     @abstractmethod
     def get_user_by_id(self, user_id: str) -> Optional[User]:
         pass
@@ -23,3 +27,11 @@ class UserRepositoryPort(ABC):
     @abstractmethod
     def get_user_by_username(self, username: UsernameField) -> Optional[User]:
         pass
+
+    @abstractmethod
+    def exists_by_email_or_username(
+            self,
+            email: EmailField,
+            username: UsernameField
+            ) -> Tuple[bool, bool]:
+        pass
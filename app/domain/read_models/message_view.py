@@ -0,0 +1,39 @@
+from datetime import datetime
+from typing import NamedTuple, Optional, Tuple
+
+
+class MessageView(NamedTuple):
+    """
+    Read model of a stored message for the listing and detail endpoints.
+    It is built straight from a row of the returned columns, without an
+    ORM instance or the value objects of the Message entity, and renders
+    the same response as Message.to_dict(). created_at is only kept for
+    the keyset pagination cursors.
+    """
+    id: str
+    session_id: str
+    content: str
+    timestamp: datetime
+    sender: str
+    word_count: Optional[int]
+    character_count: Optional[int]
+    processed_at: Optional[datetime]
+    created_at: datetime
+
+    @property
+    def position(self) -> Tuple[datetime, str]:
+        return self.created_at, self.id
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "session_id": self.session_id,
+            "content": self.content,
+            "timestamp": self.timestamp,
+            "sender": self.sender,
+            "metadata": {
+                "word_count": self.word_count,
+                "character_count": self.character_count,
+                "processed_at": self.processed_at,
+            }
+        }
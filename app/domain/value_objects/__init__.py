@@ -1,4 +1,5 @@
 from .uuid_field import UUIDField
+from .cursor_field import CursorField
 from .email_field import EmailField
 from .sender_field import SenderField
 from .content_field import ContentField
@@ -6,15 +7,22 @@ from .username_field import UsernameField
 from .datetime_field import DatetimeField
 from .password_raw_field import PasswordRawField
 from .password_hash_field import PasswordHashField
+from .search_query_field import SearchQueryField
+from .search_cursor_field import SearchCursorField
+from .stored_field import StoredField
 
 
 __all__ = [
     'UUIDField',
+    'CursorField',
     'EmailField',
     'SenderField',
     'ContentField',
     'UsernameField',
     'DatetimeField',
     'PasswordRawField',
-    'PasswordHashField'
+    'PasswordHashField',
+    'SearchQueryField',
+    'SearchCursorField',
+    'StoredField'
     ]
@@ -1,14 +1,13 @@
 from dataclasses import dataclass
-import re
+from app.domain.content_filter import get_content_filter
 from app.domain.exceptions import RequiredFieldException
+from .stored_field import StoredField
 
 
-@dataclass(frozen=True)
-class ContentField:
+@dataclass(frozen=True, slots=True)
+class ContentField(StoredField):
     value: str
 
-    INAPPROPRIATE_WORDS = ["malo", "ofensivo", "prohibido", "spam"]
-
     def __post_init__(self):
         if not self.value or not self.value.strip():
             raise RequiredFieldException(
@@ -19,14 +18,9 @@ class ContentField:
         self._validate_and_filter()
 
     def _validate_and_filter(self) -> None:
-        cleaned_content = self.value
-
-        for word in self.INAPPROPRIATE_WORDS:
-            cleaned_content = re.sub(
-                re.escape(word),
-                '***',
-                cleaned_content,
-                flags=re.IGNORECASE
-                )
+        # The engine is built once for the whole word list and shared. The
+        #  list is changed by installing another engine, with
+        #  set_content_filter or app.core.moderation.configure_content_filter
+        cleaned_content = get_content_filter().mask(self.value)
 
         object.__setattr__(self, 'value', cleaned_content)
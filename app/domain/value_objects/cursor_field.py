@@ -0,0 +1,72 @@
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Literal, Tuple
+from app.domain.exceptions import (
+    DomainValidationException,
+    RequiredFieldException
+)
+
+
+@dataclass(frozen=True, slots=True)
+class CursorField:
+    """
+    Opaque keyset pagination cursor. It encodes the direction of the
+    requested page and the (created_at, id) position of the boundary row.
+    """
+    NEXT = 'next'
+    PREVIOUS = 'prev'
+    value: str
+
+    def __post_init__(self):
+        if not self.value:
+            raise RequiredFieldException(
+                message="El campo de cursor es requerido.",
+                detail="El campo de cursor no puede ser nulo."
+                )
+
+        self._decode()
+
+    @classmethod
+    def from_position(
+            cls,
+            direction: Literal['next', 'prev'],
+            created_at: datetime,
+            id: str
+            ) -> 'CursorField':
+        raw = json.dumps(
+            [direction, created_at.isoformat(), str(id)],
+            separators=(',', ':')
+            )
+        encoded = base64.urlsafe_b64encode(raw.encode()).decode()
+        return cls(encoded.rstrip('='))
+
+    @property
+    def direction(self) -> str:
+        return self._decode()[0]
+
+    @property
+    def position(self) -> Tuple[datetime, str]:
+        _, created_at, id = self._decode()
+        return created_at, id
+
+    def _decode(self) -> Tuple[str, datetime, str]:
+        try:
+            padding = '=' * (-len(self.value) % 4)
+            direction, created_at, id = json.loads(
+                base64.urlsafe_b64decode(self.value + padding)
+                )
+            if direction not in (self.NEXT, self.PREVIOUS):
+                raise ValueError(direction)
+            return direction, datetime.fromisoformat(created_at), str(id)
+        except (ValueError, TypeError, binascii.Error):
+            raise DomainValidationException(
+                message="Formato de cursor invalido.",
+                detail="El cursor de paginación no es válido.",
+                code="INVALID_FORMAT"
+                )
+
+    def __str__(self) -> str:
+        return self.value
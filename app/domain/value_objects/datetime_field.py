@@ -4,10 +4,11 @@ from app.domain.exceptions import (
     DomainValidationException,
     RequiredFieldException
 )
+from .stored_field import StoredField
 
 
-@dataclass(frozen=True)
-class DatetimeField:
+@dataclass(frozen=True, slots=True)
+class DatetimeField(StoredField):
     value: datetime
 
     def __post_init__(self):
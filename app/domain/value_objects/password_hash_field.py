@@ -3,10 +3,11 @@ from app.domain.exceptions import (
     DomainValidationException,
     RequiredFieldException
 )
+from .stored_field import StoredField
 
 
-@dataclass(frozen=True)
-class PasswordHashField:
+@dataclass(frozen=True, slots=True)
+class PasswordHashField(StoredField):
     value: str
 
     def __post_init__(self):
@@ -6,7 +6,7 @@ from app.domain.exceptions import (
 )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PasswordRawField:
     value: str
 
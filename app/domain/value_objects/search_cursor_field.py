@@ -0,0 +1,56 @@
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from typing import Tuple
+from app.domain.exceptions import (
+    DomainValidationException,
+    RequiredFieldException
+)
+
+
+@dataclass(frozen=True, slots=True)
+class SearchCursorField:
+    """
+    Opaque keyset cursor of the search results. It encodes the (rank, id)
+    position of the last result of a page.
+    """
+    value: str
+
+    def __post_init__(self):
+        if not self.value:
+            raise RequiredFieldException(
+                message="El campo de cursor es requerido.",
+                detail="El campo de cursor no puede ser nulo."
+                )
+
+        self._decode()
+
+    @classmethod
+    def from_position(cls, rank: float, id: str) -> 'SearchCursorField':
+        raw = json.dumps([rank, str(id)], separators=(',', ':'))
+        encoded = base64.urlsafe_b64encode(raw.encode()).decode()
+        return cls(encoded.rstrip('='))
+
+    @property
+    def position(self) -> Tuple[float, str]:
+        return self._decode()
+
+    def _decode(self) -> Tuple[float, str]:
+        try:
+            padding = '=' * (-len(self.value) % 4)
+            rank, id = json.loads(
+                base64.urlsafe_b64decode(self.value + padding)
+                )
+            if isinstance(rank, bool) or not isinstance(rank, (int, float)):
+                raise TypeError(rank)
+            return float(rank), str(id)
+        except (ValueError, TypeError, binascii.Error):
+            raise DomainValidationException(
+                message="Formato de cursor invalido.",
+                detail="El cursor de búsqueda no es válido.",
+                code="INVALID_FORMAT"
+                )
+
+    def __str__(self) -> str:
+        return self.value
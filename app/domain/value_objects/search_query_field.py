@@ -0,0 +1,58 @@
+import re
+from dataclasses import dataclass
+from typing import Tuple
+from app.domain.exceptions import (
+    DomainValidationException,
+    RequiredFieldException
+)
+
+
+@dataclass(frozen=True, slots=True)
+class SearchQueryField:
+    """
+    Free text search query. Only its words are kept, so the user input can
+    never inject full-text query syntax. A trailing '*' on a word turns it
+    into a prefix search.
+    """
+    MAX_LENGTH = 200
+    TERM_PATTERN = re.compile(r"\w+\*?")
+    value: str
+
+    def __post_init__(self):
+        if not self.value or not self.value.strip():
+            raise RequiredFieldException(
+                message="El campo de búsqueda es requerido.",
+                detail="El campo de búsqueda no puede estar vacío."
+                )
+
+        self._validate()
+
+    def _validate(self) -> None:
+        if len(self.value) > self.MAX_LENGTH:
+            raise DomainValidationException(
+                message="Búsqueda demasiado larga.",
+                detail=f"La búsqueda no puede superar los {self.MAX_LENGTH} \
+caracteres.",
+                code="INVALID_FORMAT"
+                )
+        if not self.terms:
+            raise DomainValidationException(
+                message="Formato de búsqueda invalido.",
+                detail="La búsqueda debe contener al menos una palabra.",
+                code="INVALID_FORMAT"
+                )
+
+    @property
+    def terms(self) -> Tuple[str, ...]:
+        return tuple(self.TERM_PATTERN.findall(self.value))
+
+    @property
+    def match_expression(self) -> str:
+        """FTS5 MATCH expression: every term quoted, all of them required."""
+        return " ".join(
+            f'"{term[:-1]}"*' if term.endswith("*") else f'"{term}"'
+            for term in self.terms
+        )
+
+    def __str__(self) -> str:
+        return self.value
@@ -4,10 +4,11 @@ from app.domain.exceptions import (
     DomainValidationException,
     RequiredFieldException
 )
+from .stored_field import StoredField
 
 
-@dataclass(frozen=True)
-class SenderField:
+@dataclass(frozen=True, slots=True)
+class SenderField(StoredField):
     VALID_TYPES = ('user', 'system')
     value: Literal['user', 'system']
 
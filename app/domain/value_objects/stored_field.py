@@ -0,0 +1,22 @@
+from typing import Any, Type, TypeVar
+
+StoredFieldType = TypeVar('StoredFieldType', bound='StoredField')
+
+
+class StoredField:
+    """
+    Trusted construction of a value object from a value read from our own
+    storage. Every stored value was validated, and normalized, when it was
+    written, so it is wrapped as it is without running __post_init__.
+    Values coming from the API must keep using the constructor.
+    """
+    __slots__ = ()
+
+    @classmethod
+    def from_storage(
+            cls: Type[StoredFieldType],
+            value: Any
+            ) -> StoredFieldType:
+        field = object.__new__(cls)
+        object.__setattr__(field, 'value', value)
+        return field
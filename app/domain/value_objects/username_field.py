@@ -4,10 +4,11 @@ from app.domain.exceptions import (
     DomainValidationException,
     RequiredFieldException
 )
+from .stored_field import StoredField
 
 
-@dataclass(frozen=True)
-class UsernameField:
+@dataclass(frozen=True, slots=True)
+class UsernameField(StoredField):
     value: str
 
     def __post_init__(self):
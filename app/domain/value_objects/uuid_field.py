@@ -4,10 +4,11 @@ from app.domain.exceptions import (
     RequiredFieldException,
     InvalidUUIDException
 )
+from .stored_field import StoredField
 
 
-@dataclass(frozen=True)
-class UUIDField:
+@dataclass(frozen=True, slots=True)
+class UUIDField(StoredField):
     ID_FIELD_NAME = 'id'
     value: uuid.UUID
 
@@ -18,6 +19,12 @@ class UUIDField:
     def from_string(cls, value: str) -> 'UUIDField':
         return cls(value)
 
+    @classmethod
+    def from_storage(cls, value: str) -> 'UUIDField':
+        # Ids are stored as their canonical text, the entities hold UUIDs.
+        #  slots=True rebuilds the class, so super() needs its arguments
+        return super(UUIDField, cls).from_storage(uuid.UUID(value))
+
     def _validate(self) -> None:
         if not self.value:
             raise RequiredFieldException(
@@ -3,7 +3,8 @@ from fastapi import status, HTTPException
 from fastapi.responses import JSONResponse
 from app.domain.exceptions import (
     DomainValidationException,
-    RequiredFieldException
+    RequiredFieldException,
+    ServiceUnavailableError
 )
 
 
@@ -31,6 +32,12 @@ def handle_api_exceptions(func):
                 content=e.to_dict()
             )
 
+        except ServiceUnavailableError as e:
+            return JSONResponse(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                content=e.to_dict()
+            )
+
         except Exception as e:
             return JSONResponse(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
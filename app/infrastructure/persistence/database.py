@@ -1,25 +1,72 @@
 import os
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.pool import QueuePool, AsyncAdaptedQueuePool
 from dotenv import load_dotenv
+from app.core.config import (
+    DATABASE_ASYNC,
+    DB_POOL_SIZE,
+    DB_MAX_OVERFLOW,
+    DB_POOL_TIMEOUT,
+    SQLITE_PERFORMANCE_PROFILE,
+    SQLITE_PRAGMAS
+)
+from app.infrastructure.persistence.search_index import create_search_index
 
 load_dotenv()
 DATABASE_URL = os.getenv(
     "DATABASE_URL", "sqlite:///./instance/chat_messages.db"
     )
+ASYNC_DATABASE_URL = os.getenv(
+    "ASYNC_DATABASE_URL",
+    DATABASE_URL.replace("sqlite:///", "sqlite+aiosqlite:///", 1)
+    )
 
 instance_dir = os.path.dirname(DATABASE_URL.replace("sqlite:///", ""))
 if instance_dir and not os.path.exists(instance_dir):
     os.makedirs(instance_dir)
 
+
+def _pool_options(url: str, poolclass) -> dict:
+    # In-memory SQLite uses a single shared connection, so it has no pool
+    database_url = make_url(url)
+    if database_url.get_backend_name() == "sqlite" and (
+        database_url.database in (None, "", ":memory:")
+    ):
+        return {}
+    return {
+        "poolclass": poolclass,
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+    }
+
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma, value in SQLITE_PRAGMAS.items():
+            cursor.execute(f"PRAGMA {pragma}={value}")
+    finally:
+        cursor.close()
+
+
+def _configure_engine(sync_engine) -> None:
+    if SQLITE_PERFORMANCE_PROFILE and sync_engine.dialect.name == "sqlite":
+        event.listen(sync_engine, "connect", _apply_sqlite_pragmas)
+
+
 # connect_args={"check_same_thread": False} is needed for SQLite
 #  to allow multiple threads
 engine = create_engine(
     DATABASE_URL,
     connect_args={
         "check_same_thread": False
-    }
+    },
+    **_pool_options(DATABASE_URL, QueuePool)
 )
+_configure_engine(engine)
 
 # Create a SessionLocal class to get a database session
 SessionLocal = sessionmaker(
@@ -28,6 +75,27 @@ SessionLocal = sessionmaker(
     bind=engine
 )
 
+# The async engine is only built when DATABASE_ASYNC is enabled, so the
+#  async driver (aiosqlite) is not required for the sync mode
+async_engine = None
+AsyncSessionLocal = None
+if DATABASE_ASYNC:
+    from sqlalchemy.ext.asyncio import (
+        create_async_engine,
+        async_sessionmaker
+    )
+
+    async_engine = create_async_engine(
+        ASYNC_DATABASE_URL,
+        **_pool_options(ASYNC_DATABASE_URL, AsyncAdaptedQueuePool)
+    )
+    _configure_engine(async_engine.sync_engine)
+    AsyncSessionLocal = async_sessionmaker(
+        autoflush=False,
+        expire_on_commit=False,
+        bind=async_engine
+    )
+
 # Create a declarative base for defining ORM models
 Base = declarative_base()
 
@@ -41,6 +109,26 @@ def get_db():
         db.close()
 
 
+# Dependency function to get an async database session
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
 # Function to create database tables
 def create_db_tables():
     Base.metadata.create_all(bind=engine)
+    # create_all skips the indexes of tables that already exist
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+    if engine.dialect.name == "sqlite":
+        with engine.begin() as connection:
+            create_search_index(connection)
+
+
+# Function to release the pooled connections on shutdown
+async def dispose_engines():
+    if async_engine is not None:
+        await async_engine.dispose()
+    engine.dispose()
@@ -0,0 +1,248 @@
+"""
+Database maintenance commands.
+
+    python -m app.infrastructure.persistence.maintenance recount-stats
+    python -m app.infrastructure.persistence.maintenance recount-stats \\
+        --session-id <uuid>
+    python -m app.infrastructure.persistence.maintenance migrate-schema
+    python -m app.infrastructure.persistence.maintenance purge-expired-tokens
+"""
+import argparse
+from datetime import datetime
+from typing import List
+from sqlalchemy import (
+    Column,
+    DateTime,
+    LargeBinary,
+    MetaData,
+    String,
+    Table,
+    inspect,
+    insert,
+    select,
+    text
+)
+from sqlalchemy.schema import CreateTable
+from app.core.config import MESSAGE_COMPACT_SCHEMA
+from app.domain.value_objects import UUIDField
+from app.infrastructure.persistence.database import (
+    SessionLocal,
+    create_db_tables,
+    engine
+)
+from app.infrastructure.persistence.orm_models import (
+    MessageORM,
+    SessionStatsORM
+)
+from app.infrastructure.persistence.search_index import drop_search_index
+from app.infrastructure.persistence.types import (
+    CompactUUID,
+    EpochMicroseconds
+)
+from app.infrastructure.persistence.repositories.message_repository import (
+    SQLAlchemyMessageRepository
+)
+from app.infrastructure.persistence.repositories.refresh_token_repository \
+    import SQLAlchemyRefreshTokenRepository
+from app.infrastructure.persistence.repositories \
+    .token_revocation_repository import SQLAlchemyTokenRevocationRepository
+
+
+def recount_session_stats(session_id: str = None) -> int:
+    """
+    Rebuilds the session_stats counters from the messages table to repair
+    any drift. Returns the number of sessions rebuilt.
+    """
+    create_db_tables()
+    db = SessionLocal()
+    try:
+        repository = SQLAlchemyMessageRepository(db)
+        return repository.recount_session_stats(
+            UUIDField(session_id) if session_id else None
+        )
+    finally:
+        db.close()
+
+
+def purge_expired_tokens() -> dict:
+    """
+    Deletes the expired refresh tokens, revoked or not, which can no
+    longer be exchanged, and the revocations of expired access tokens.
+    Returns the number of rows deleted of each kind.
+    """
+    create_db_tables()
+    now = datetime.utcnow()
+    db = SessionLocal()
+    try:
+        return {
+            "refresh_tokens": SQLAlchemyRefreshTokenRepository(
+                db
+            ).delete_expired_refresh_tokens(now),
+            "revoked_tokens": SQLAlchemyTokenRevocationRepository(
+                db
+            ).delete_expired_revoked_tokens(now),
+        }
+    finally:
+        db.close()
+
+
+# Single column indexes covered by the leading column of a composite one
+LEGACY_INDEXES = ("ix_messages_session_id",)
+
+_KEY_COLUMNS = ("id", "session_id")
+_COPY_CHUNK_SIZE = 5000
+
+
+def migrate_message_schema() -> dict:
+    """
+    Brings an existing database to the current message schema: drops the
+    indexes covered by the composite ones, rewrites messages and
+    session_stats when their stored layout (text or compact) differs from
+    MESSAGE_COMPACT_SCHEMA, and creates any missing index.
+    """
+    dropped_indexes, rewritten_tables = [], []
+
+    with engine.begin() as connection:
+        inspector = inspect(connection)
+        existing_tables = inspector.get_table_names()
+
+        if MessageORM.__tablename__ in existing_tables:
+            existing_indexes = {
+                index["name"]
+                for index in inspector.get_indexes(MessageORM.__tablename__)
+            }
+            for index_name in LEGACY_INDEXES:
+                if index_name in existing_indexes:
+                    connection.execute(text(f'DROP INDEX "{index_name}"'))
+                    dropped_indexes.append(index_name)
+
+        for table in (MessageORM.__table__, SessionStatsORM.__table__):
+            if table.name not in existing_tables:
+                continue
+            stored_compact = _is_stored_compact(connection, table.name)
+            if stored_compact != MESSAGE_COMPACT_SCHEMA:
+                if table is MessageORM.__table__:
+                    # The rows get new rowids, create_db_tables reindexes
+                    drop_search_index(connection)
+                _rewrite_table(connection, table, stored_compact)
+                rewritten_tables.append(table.name)
+
+    create_db_tables()
+
+    if rewritten_tables and engine.dialect.name == "sqlite":
+        # Returns the pages of the old copies to the file system
+        with engine.connect().execution_options(
+            isolation_level="AUTOCOMMIT"
+        ) as connection:
+            connection.execute(text("VACUUM"))
+
+    return {
+        "dropped_indexes": dropped_indexes,
+        "rewritten_tables": rewritten_tables,
+    }
+
+
+def _is_stored_compact(connection, table_name: str) -> bool:
+    columns = {
+        column["name"]: column["type"]
+        for column in inspect(connection).get_columns(table_name)
+    }
+    return isinstance(columns["session_id"], LargeBinary)
+
+
+def _rewrite_table(connection, table: Table, stored_compact: bool) -> None:
+    """
+    Renames the table aside, recreates it with the current column types
+    and copies the rows in chunks, converting the ids and timestamps.
+    """
+    legacy_name = f"{table.name}_legacy"
+    for index in inspect(connection).get_indexes(table.name):
+        connection.execute(text(f'DROP INDEX "{index["name"]}"'))
+    connection.execute(
+        text(f'ALTER TABLE "{table.name}" RENAME TO "{legacy_name}"')
+    )
+    connection.execute(CreateTable(table))
+
+    legacy_table = _stored_table(table, legacy_name, stored_compact)
+    result = connection.execution_options(
+        yield_per=_COPY_CHUNK_SIZE
+    ).execute(select(legacy_table))
+    for rows in result.partitions():
+        connection.execute(
+            insert(table), [dict(row._mapping) for row in rows]
+        )
+
+    connection.execute(text(f'DROP TABLE "{legacy_name}"'))
+
+
+def _stored_table(table: Table, name: str, compact: bool) -> Table:
+    # The table as it is stored, so its rows are read with the right types
+    if compact:
+        key_type, datetime_type = CompactUUID, EpochMicroseconds
+    else:
+        key_type, datetime_type = String, DateTime
+
+    columns: List[Column] = []
+    for column in table.columns:
+        if column.name in _KEY_COLUMNS:
+            column_type = key_type
+        elif isinstance(column.type, (DateTime, EpochMicroseconds)):
+            column_type = datetime_type
+        else:
+            column_type = column.type
+        columns.append(Column(column.name, column_type))
+
+    return Table(name, MetaData(), *columns)
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Database maintenance commands."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    recount = commands.add_parser(
+        "recount-stats",
+        help="Rebuild the per-session message counters."
+    )
+    recount.add_argument(
+        "--session-id",
+        help="Only rebuild the counters of this session."
+    )
+
+    commands.add_parser(
+        "migrate-schema",
+        help="Update the indexes and the storage of an existing database."
+    )
+
+    # purge-refresh-tokens is the name the command had before it also
+    #  deleted the revocations, kept so existing jobs keep working
+    commands.add_parser(
+        "purge-expired-tokens",
+        aliases=["purge-refresh-tokens"],
+        help="Delete the expired refresh tokens and token revocations."
+    )
+
+    arguments = parser.parse_args(argv)
+    if arguments.command == "recount-stats":
+        rebuilt = recount_session_stats(arguments.session_id)
+        print(f"Session stats rebuilt for {rebuilt} session(s).")
+    elif arguments.command == "migrate-schema":
+        migration = migrate_message_schema()
+        print(
+            "Dropped indexes: "
+            f"{', '.join(migration['dropped_indexes']) or 'none'}. "
+            "Rewritten tables: "
+            f"{', '.join(migration['rewritten_tables']) or 'none'}."
+        )
+    elif arguments.command in (
+            "purge-expired-tokens", "purge-refresh-tokens"):
+        purged = purge_expired_tokens()
+        print(
+            f"Deleted {purged['refresh_tokens']} refresh token(s) and "
+            f"{purged['revoked_tokens']} token revocation(s)."
+        )
+
+
+if __name__ == "__main__":
+    main()
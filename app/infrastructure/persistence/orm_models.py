@@ -2,11 +2,20 @@ from sqlalchemy import (
     Column,
     String,
     Integer,
-    DateTime
+    DateTime,
+    Index
 )
 from sqlalchemy.ext.declarative import declared_attr
 from sqlalchemy.sql import func
+from app.core.config import MESSAGE_COMPACT_SCHEMA
 from .database import Base
+from .types import CompactUUID, EpochMicroseconds
+
+# Storage types of the message ids and timestamps, see MessageORM
+if MESSAGE_COMPACT_SCHEMA:
+    MessageKey, MessageDateTime = CompactUUID, EpochMicroseconds
+else:
+    MessageKey, MessageDateTime = String, DateTime
 
 
 class IdMixin:
@@ -41,17 +50,40 @@ class TimestampMixin:
 
 class MessageORM(Base, IdMixin, TimestampMixin):
     __tablename__ = "messages"
-
-    session_id = Column(
-        String,
-        index=True
+    __table_args__ = (
+        # Serves the session listing ordered by (created_at, id) and the
+        #  keyset pagination seek predicate without a temp B-tree sort
+        Index(
+            "ix_messages_session_created_id",
+            "session_id",
+            "created_at",
+            "id"
+        ),
+        # Same for the listing filtered by sender
+        Index(
+            "ix_messages_session_sender_created_id",
+            "session_id",
+            "sender",
+            "created_at",
+            "id"
+        ),
     )
+
+    if MESSAGE_COMPACT_SCHEMA:
+        # The repository always sets the timestamps, and the text server
+        #  defaults of TimestampMixin do not fit an integer column
+        id = Column(MessageKey, primary_key=True, nullable=False)
+        created_at = Column(MessageDateTime, nullable=False)
+        updated_at = Column(MessageDateTime, nullable=False)
+
+    # Indexed as the leading column of the composite indexes
+    session_id = Column(MessageKey)
     content = Column(String)
-    timestamp = Column(DateTime)
+    timestamp = Column(MessageDateTime)
     sender = Column(String)
     word_count = Column(Integer)
     character_count = Column(Integer)
-    processed_at = Column(DateTime)
+    processed_at = Column(MessageDateTime)
 
     def __ref__(self):
         return f"<MessageORM(id='{self.id}', \
@@ -59,6 +91,33 @@ class MessageORM(Base, IdMixin, TimestampMixin):
                 sender='{self.sender}')>"
 
 
+class SessionStatsORM(Base):
+    """
+    Per-session counters maintained in the same transaction as every
+    message insert, so listings get their totals without a COUNT(*).
+    """
+    __tablename__ = "session_stats"
+
+    session_id = Column(
+        MessageKey,
+        primary_key=True,
+        nullable=False
+    )
+    total_messages = Column(Integer, nullable=False, default=0)
+    user_messages = Column(Integer, nullable=False, default=0)
+    system_messages = Column(Integer, nullable=False, default=0)
+    last_message_at = Column(MessageDateTime)
+
+    SENDER_COLUMNS = {
+        "user": "user_messages",
+        "system": "system_messages",
+    }
+
+    def __repr__(self):
+        return f"<SessionStatsORM(session_id='{self.session_id}', \
+                total_messages={self.total_messages})>"
+
+
 class UserORM(Base, IdMixin, TimestampMixin):
     __tablename__ = "users"
 
@@ -83,3 +142,49 @@ class UserORM(Base, IdMixin, TimestampMixin):
         return f"<UserORM(id='{self.id}',\
             username='{self.username}',\
                 email='{self.email}')>"
+
+
+class RefreshTokenORM(Base):
+    """
+    Issued refresh tokens, looked up by the SHA-256 digest of the token.
+    A revoked row stays until it expires so that reusing a rotated token
+    is detected, and purge-expired-tokens deletes the expired ones.
+    """
+    __tablename__ = "refresh_tokens"
+
+    token_hash = Column(String, primary_key=True, nullable=False)
+    user_id = Column(String, index=True, nullable=False)
+    family_id = Column(String, index=True, nullable=False)
+    expires_at = Column(DateTime, index=True, nullable=False)
+    revoked_at = Column(DateTime, nullable=True)
+    replaced_by = Column(String, nullable=True)
+    created_at = Column(DateTime, nullable=False)
+
+    def __repr__(self):
+        return f"<RefreshTokenORM(user_id='{self.user_id}',\
+            family_id='{self.family_id}')>"
+
+
+class RevokedTokenORM(Base):
+    """
+    Access tokens revoked before their expiry, by jti. Rows are only
+    needed until the token expires.
+    """
+    __tablename__ = "revoked_tokens"
+
+    jti = Column(String, primary_key=True, nullable=False)
+    expires_at = Column(DateTime, index=True, nullable=False)
+    revoked_at = Column(DateTime, nullable=False)
+
+
+class UserTokenVersionORM(Base):
+    """
+    Current access token version of the users that revoked all their
+    tokens. Tokens carrying a lower version are rejected, users without
+    a row are at version 0.
+    """
+    __tablename__ = "user_token_versions"
+
+    user_id = Column(String, primary_key=True, nullable=False)
+    version = Column(Integer, nullable=False)
+    updated_at = Column(DateTime, nullable=False)
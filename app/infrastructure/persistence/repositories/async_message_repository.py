@@ -0,0 +1,322 @@
+from abc import abstractmethod
+from itertools import islice
+from typing import AsyncIterator, Iterator, List, Set, Tuple, Optional
+from fastapi import Depends
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import iterate_in_threadpool
+from app.domain.entities.message import Message as DomainMessage
+from app.domain.read_models.message_view import MessageView
+from app.domain.ports.message_repository_port import MessageRepositoryPort
+from app.domain.ports.async_message_repository_port import (
+    AsyncMessageRepositoryPort
+)
+from app.domain.value_objects import (
+    UUIDField,
+    CursorField,
+    SearchQueryField,
+    SearchCursorField
+)
+from app.domain.exceptions import DomainValidationException
+from app.core.config import DATABASE_ASYNC
+from app.infrastructure.persistence.database import get_async_db
+from app.infrastructure.persistence.write_buffer import (
+    MessageWriteBuffer,
+    message_write_buffer
+)
+from app.infrastructure.persistence.repositories.message_repository import (
+    SQLAlchemyMessageRepository,
+    get_sqlalchemy_message_repository
+)
+
+
+class _AsyncMessageRepositoryBridge(AsyncMessageRepositoryPort):
+    """
+    Exposes the SQLAlchemy message repository through the async port.
+    Subclasses decide how each repository operation is executed.
+    """
+
+    @abstractmethod
+    async def _run(self, operation: str, *args, **kwargs):
+        pass
+
+    async def create_message(self, message: DomainMessage) -> DomainMessage:
+        return await self._run("create_message", message)
+
+    async def create_message_if_absent(
+            self,
+            message: DomainMessage
+            ) -> Optional[DomainMessage]:
+        return await self._run("create_message_if_absent", message)
+
+    async def create_messages(
+            self,
+            messages: List[DomainMessage]
+            ) -> List[DomainMessage]:
+        return await self._run("create_messages", messages)
+
+    async def get_existing_message_ids(
+            self,
+            message_ids: List[UUIDField]
+            ) -> Set[str]:
+        return await self._run("get_existing_message_ids", message_ids)
+
+    async def get_message_by_id(
+            self,
+            message_id: UUIDField
+            ) -> DomainMessage:
+        return await self._run("get_message_by_id", message_id)
+
+    async def get_message_by_session_id(
+            self,
+            session_id: UUIDField,
+            limit: int = 50,
+            offset: int = 0,
+            sender: Optional[str] = None
+            ) -> Tuple[List[DomainMessage], int]:
+        return await self._run(
+            "get_message_by_session_id",
+            session_id,
+            limit=limit,
+            offset=offset,
+            sender=sender
+            )
+
+    async def get_message_page_by_session_id(
+            self,
+            session_id: UUIDField,
+            limit: int = 50,
+            cursor: Optional[CursorField] = None,
+            sender: Optional[str] = None
+            ) -> Tuple[List[DomainMessage], bool]:
+        return await self._run(
+            "get_message_page_by_session_id",
+            session_id,
+            limit=limit,
+            cursor=cursor,
+            sender=sender
+            )
+
+    async def get_message_view_by_id(
+            self,
+            message_id: UUIDField
+            ) -> Optional[MessageView]:
+        return await self._run("get_message_view_by_id", message_id)
+
+    async def get_message_views_by_session_id(
+            self,
+            session_id: UUIDField,
+            limit: int = 50,
+            offset: int = 0,
+            sender: Optional[str] = None
+            ) -> Tuple[List[MessageView], int]:
+        return await self._run(
+            "get_message_views_by_session_id",
+            session_id,
+            limit=limit,
+            offset=offset,
+            sender=sender
+            )
+
+    async def get_message_view_page_by_session_id(
+            self,
+            session_id: UUIDField,
+            limit: int = 50,
+            cursor: Optional[CursorField] = None,
+            sender: Optional[str] = None
+            ) -> Tuple[List[MessageView], bool]:
+        return await self._run(
+            "get_message_view_page_by_session_id",
+            session_id,
+            limit=limit,
+            cursor=cursor,
+            sender=sender
+            )
+
+    async def count_message_by_session_id(
+            self,
+            session_id: UUIDField,
+            sender: Optional[str] = None
+            ) -> int:
+        return await self._run(
+            "count_message_by_session_id",
+            session_id,
+            sender=sender
+            )
+
+    async def search_messages(
+            self,
+            query: SearchQueryField,
+            session_id: Optional[UUIDField] = None,
+            limit: int = 20,
+            cursor: Optional[SearchCursorField] = None
+            ) -> Tuple[List[Tuple[DomainMessage, str, float]], bool]:
+        return await self._run(
+            "search_messages",
+            query,
+            session_id=session_id,
+            limit=limit,
+            cursor=cursor
+            )
+
+
+class AsyncSQLAlchemyMessageRepository(_AsyncMessageRepositoryBridge):
+    """
+    Non-blocking repository backed by an AsyncSession. The queries are
+    the ones of SQLAlchemyMessageRepository, executed through run_sync so
+    every database round-trip is awaited on the async driver.
+    """
+
+    def __init__(
+            self,
+            db: AsyncSession,
+            repository_factory=SQLAlchemyMessageRepository
+            ):
+        self.db = db
+        self._repository_factory = repository_factory
+
+    async def _run(self, operation: str, *args, **kwargs):
+        def run(session: Session):
+            repository = self._repository_factory(session)
+            return getattr(repository, operation)(*args, **kwargs)
+
+        return await self.db.run_sync(run)
+
+    async def stream_messages_by_session_id(
+            self,
+            session_id: UUIDField,
+            cursor: Optional[CursorField] = None,
+            sender: Optional[str] = None,
+            batch_size: int = 1000
+            ) -> AsyncIterator[DomainMessage]:
+        # Own session, the request scoped one is closed before streaming
+        async with AsyncSession(bind=self.db.bind) as session:
+            repository = self._repository_factory(session.sync_session)
+            messages = await session.stream_scalars(
+                repository._stream_query(session_id, cursor, sender)
+                .execution_options(yield_per=batch_size)
+            )
+            async for message_orm in messages:
+                yield repository._to_domain_entity(message_orm)
+
+
+class AsyncBufferedMessageRepository(_AsyncMessageRepositoryBridge):
+    """
+    Routes create_message through the write-behind buffer so concurrent
+    inserts share one group commit. Every other operation goes to the
+    wrapped repository.
+    """
+
+    def __init__(
+            self,
+            repository: AsyncMessageRepositoryPort,
+            write_buffer: MessageWriteBuffer
+            ):
+        self._repository = repository
+        self._write_buffer = write_buffer
+
+    async def _run(self, operation: str, *args, **kwargs):
+        return await getattr(self._repository, operation)(*args, **kwargs)
+
+    async def create_message(self, message: DomainMessage) -> DomainMessage:
+        return await self._write_buffer.submit_async(message)
+
+    async def create_message_if_absent(
+            self,
+            message: DomainMessage
+            ) -> Optional[DomainMessage]:
+        try:
+            return await self._write_buffer.submit_async(message)
+        except DomainValidationException:
+            return None
+
+    def stream_messages_by_session_id(
+            self,
+            session_id: UUIDField,
+            cursor: Optional[CursorField] = None,
+            sender: Optional[str] = None,
+            batch_size: int = 1000
+            ) -> AsyncIterator[DomainMessage]:
+        return self._repository.stream_messages_by_session_id(
+            session_id,
+            cursor=cursor,
+            sender=sender,
+            batch_size=batch_size
+            )
+
+
+class BlockingMessageRepositoryAdapter(_AsyncMessageRepositoryBridge):
+    """
+    Adapts a sync MessageRepositoryPort to the async port. The calls run
+    inline on the caller's thread, exactly like the sync mode did before.
+    """
+
+    def __init__(self, repository: MessageRepositoryPort):
+        self._repository = repository
+
+    async def _run(self, operation: str, *args, **kwargs):
+        return getattr(self._repository, operation)(*args, **kwargs)
+
+    def stream_messages_by_session_id(
+            self,
+            session_id: UUIDField,
+            cursor: Optional[CursorField] = None,
+            sender: Optional[str] = None,
+            batch_size: int = 1000
+            ) -> AsyncIterator[DomainMessage]:
+        # Each fetched batch is read in the threadpool, one hop per batch
+        messages = self._repository.stream_messages_by_session_id(
+            session_id,
+            cursor=cursor,
+            sender=sender,
+            batch_size=batch_size
+            )
+        return _flatten(
+            iterate_in_threadpool(_batched(messages, batch_size))
+            )
+
+
+def _batched(
+        messages: Iterator[DomainMessage],
+        size: int
+        ) -> Iterator[List[DomainMessage]]:
+    while batch := list(islice(messages, size)):
+        yield batch
+
+
+async def _flatten(
+        batches: AsyncIterator[List[DomainMessage]]
+        ) -> AsyncIterator[DomainMessage]:
+    async for batch in batches:
+        for message in batch:
+            yield message
+
+
+def get_async_sqlalchemy_message_repository(
+        db: AsyncSession = Depends(get_async_db)
+        ) -> AsyncMessageRepositoryPort:
+    return _with_write_buffer(AsyncSQLAlchemyMessageRepository(db))
+
+
+def get_blocking_message_repository_adapter(
+        repository: MessageRepositoryPort = Depends(
+            get_sqlalchemy_message_repository
+            )
+        ) -> AsyncMessageRepositoryPort:
+    return _with_write_buffer(BlockingMessageRepositoryAdapter(repository))
+
+
+def _with_write_buffer(
+        repository: AsyncMessageRepositoryPort
+        ) -> AsyncMessageRepositoryPort:
+    if message_write_buffer is None:
+        return repository
+    return AsyncBufferedMessageRepository(repository, message_write_buffer)
+
+
+# Repository dependency used by the routes, chosen by DATABASE_ASYNC
+get_async_message_repository = (
+    get_async_sqlalchemy_message_repository
+    if DATABASE_ASYNC
+    else get_blocking_message_repository_adapter
+)
@@ -0,0 +1,124 @@
+from abc import abstractmethod
+from datetime import datetime
+from typing import Optional
+from fastapi import Depends
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.domain.entities.refresh_token import RefreshToken
+from app.domain.value_objects import UUIDField
+from app.domain.ports.refresh_token_repository_port import (
+    RefreshTokenRepositoryPort
+)
+from app.domain.ports.async_refresh_token_repository_port import (
+    AsyncRefreshTokenRepositoryPort
+)
+from app.core.config import DATABASE_ASYNC
+from app.infrastructure.persistence.database import get_async_db
+from app.infrastructure.persistence.repositories.refresh_token_repository \
+    import (
+        SQLAlchemyRefreshTokenRepository,
+        get_sqlalchemy_refresh_token_repository
+    )
+
+
+class _AsyncRefreshTokenRepositoryBridge(AsyncRefreshTokenRepositoryPort):
+    """
+    Exposes the SQLAlchemy refresh token repository through the async
+    port. Subclasses decide how each repository operation is executed.
+    """
+
+    @abstractmethod
+    async def _run(self, operation: str, *args, **kwargs):
+        pass
+
+    async def create_refresh_token(
+            self,
+            refresh_token: RefreshToken
+            ) -> RefreshToken:
+        return await self._run("create_refresh_token", refresh_token)
+
+    async def get_refresh_token(
+            self,
+            token_hash: str
+            ) -> Optional[RefreshToken]:
+        return await self._run("get_refresh_token", token_hash)
+
+    async def rotate_refresh_token(
+            self,
+            token_hash: str,
+            new_refresh_token: RefreshToken
+            ) -> bool:
+        return await self._run(
+            "rotate_refresh_token", token_hash, new_refresh_token
+            )
+
+    async def revoke_refresh_token_family(self, family_id: str) -> int:
+        return await self._run("revoke_refresh_token_family", family_id)
+
+    async def revoke_user_refresh_tokens(self, user_id: UUIDField) -> int:
+        return await self._run("revoke_user_refresh_tokens", user_id)
+
+    async def delete_expired_refresh_tokens(self, now: datetime) -> int:
+        return await self._run("delete_expired_refresh_tokens", now)
+
+
+class AsyncSQLAlchemyRefreshTokenRepository(
+        _AsyncRefreshTokenRepositoryBridge
+        ):
+    """
+    Non-blocking repository backed by an AsyncSession. The queries are
+    the ones of SQLAlchemyRefreshTokenRepository, executed through
+    run_sync.
+    """
+
+    def __init__(
+            self,
+            db: AsyncSession,
+            repository_factory=SQLAlchemyRefreshTokenRepository
+            ):
+        self.db = db
+        self._repository_factory = repository_factory
+
+    async def _run(self, operation: str, *args, **kwargs):
+        def run(session: Session):
+            repository = self._repository_factory(session)
+            return getattr(repository, operation)(*args, **kwargs)
+
+        return await self.db.run_sync(run)
+
+
+class BlockingRefreshTokenRepositoryAdapter(
+        _AsyncRefreshTokenRepositoryBridge
+        ):
+    """
+    Adapts a sync RefreshTokenRepositoryPort to the async port. The calls
+    run inline on the caller's thread.
+    """
+
+    def __init__(self, repository: RefreshTokenRepositoryPort):
+        self._repository = repository
+
+    async def _run(self, operation: str, *args, **kwargs):
+        return getattr(self._repository, operation)(*args, **kwargs)
+
+
+def get_async_sqlalchemy_refresh_token_repository(
+        db: AsyncSession = Depends(get_async_db)
+        ) -> AsyncRefreshTokenRepositoryPort:
+    return AsyncSQLAlchemyRefreshTokenRepository(db)
+
+
+def get_blocking_refresh_token_repository_adapter(
+        repository: RefreshTokenRepositoryPort = Depends(
+            get_sqlalchemy_refresh_token_repository
+            )
+        ) -> AsyncRefreshTokenRepositoryPort:
+    return BlockingRefreshTokenRepositoryAdapter(repository)
+
+
+# Repository dependency used by the routes, chosen by DATABASE_ASYNC
+get_async_refresh_token_repository = (
+    get_async_sqlalchemy_refresh_token_repository
+    if DATABASE_ASYNC
+    else get_blocking_refresh_token_repository_adapter
+)
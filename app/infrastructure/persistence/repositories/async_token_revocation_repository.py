@@ -0,0 +1,113 @@
+from abc import abstractmethod
+from datetime import datetime
+from typing import Dict, List, Tuple
+from fastapi import Depends
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.domain.value_objects import UUIDField
+from app.domain.ports.token_revocation_repository_port import (
+    TokenRevocationRepositoryPort
+)
+from app.domain.ports.async_token_revocation_repository_port import (
+    AsyncTokenRevocationRepositoryPort
+)
+from app.core.config import DATABASE_ASYNC
+from app.infrastructure.persistence.database import get_async_db
+from app.infrastructure.persistence.repositories.token_revocation_repository \
+    import (
+        SQLAlchemyTokenRevocationRepository,
+        get_sqlalchemy_token_revocation_repository
+    )
+
+
+class _AsyncTokenRevocationRepositoryBridge(
+        AsyncTokenRevocationRepositoryPort
+        ):
+    """
+    Exposes the SQLAlchemy token revocation repository through the async
+    port. Subclasses decide how each repository operation is executed.
+    """
+
+    @abstractmethod
+    async def _run(self, operation: str, *args, **kwargs):
+        pass
+
+    async def revoke_token(self, jti: str, expires_at: datetime) -> None:
+        return await self._run("revoke_token", jti, expires_at)
+
+    async def increment_user_token_version(self, user_id: UUIDField) -> int:
+        return await self._run("increment_user_token_version", user_id)
+
+    async def get_user_token_version(self, user_id: UUIDField) -> int:
+        return await self._run("get_user_token_version", user_id)
+
+    async def get_token_revocations(
+            self,
+            now: datetime
+            ) -> Tuple[List[str], Dict[str, int]]:
+        return await self._run("get_token_revocations", now)
+
+    async def delete_expired_revoked_tokens(self, now: datetime) -> int:
+        return await self._run("delete_expired_revoked_tokens", now)
+
+
+class AsyncSQLAlchemyTokenRevocationRepository(
+        _AsyncTokenRevocationRepositoryBridge
+        ):
+    """
+    Non-blocking repository backed by an AsyncSession. The queries are
+    the ones of SQLAlchemyTokenRevocationRepository, executed through
+    run_sync.
+    """
+
+    def __init__(
+            self,
+            db: AsyncSession,
+            repository_factory=SQLAlchemyTokenRevocationRepository
+            ):
+        self.db = db
+        self._repository_factory = repository_factory
+
+    async def _run(self, operation: str, *args, **kwargs):
+        def run(session: Session):
+            repository = self._repository_factory(session)
+            return getattr(repository, operation)(*args, **kwargs)
+
+        return await self.db.run_sync(run)
+
+
+class BlockingTokenRevocationRepositoryAdapter(
+        _AsyncTokenRevocationRepositoryBridge
+        ):
+    """
+    Adapts a sync TokenRevocationRepositoryPort to the async port. The
+    calls run inline on the caller's thread.
+    """
+
+    def __init__(self, repository: TokenRevocationRepositoryPort):
+        self._repository = repository
+
+    async def _run(self, operation: str, *args, **kwargs):
+        return getattr(self._repository, operation)(*args, **kwargs)
+
+
+def get_async_sqlalchemy_token_revocation_repository(
+        db: AsyncSession = Depends(get_async_db)
+        ) -> AsyncTokenRevocationRepositoryPort:
+    return AsyncSQLAlchemyTokenRevocationRepository(db)
+
+
+def get_blocking_token_revocation_repository_adapter(
+        repository: TokenRevocationRepositoryPort = Depends(
+            get_sqlalchemy_token_revocation_repository
+            )
+        ) -> AsyncTokenRevocationRepositoryPort:
+    return BlockingTokenRevocationRepositoryAdapter(repository)
+
+
+# Repository dependency used by the routes, chosen by DATABASE_ASYNC
+get_async_token_revocation_repository = (
+    get_async_sqlalchemy_token_revocation_repository
+    if DATABASE_ASYNC
+    else get_blocking_token_revocation_repository_adapter
+)
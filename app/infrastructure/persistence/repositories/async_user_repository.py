@@ -0,0 +1,180 @@
+from abc import abstractmethod
+from typing import Optional, Tuple
+from fastapi import Depends
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.domain.entities.user import User as DomainUser
+from app.domain.ports.user_repository_port import UserRepositoryPort
+from app.domain.ports.async_user_repository_port import (
+    AsyncUserRepositoryPort
+)
+from app.domain.value_objects import (
+    UUIDField,
+    EmailField,
+    UsernameField
+)
+from app.core.cache import TTLCache
+from app.core.config import DATABASE_ASYNC
+from app.infrastructure.persistence.database import get_async_db
+from app.infrastructure.persistence.user_cache import user_cache
+from app.infrastructure.persistence.repositories.user_repository import (
+    SQLAlchemyUserRepository,
+    get_sqlalchemy_user_repository
+)
+
+
+class _AsyncUserRepositoryBridge(AsyncUserRepositoryPort):
+    """
+    Exposes the SQLAlchemy user repository through the async port.
+    Subclasses decide how each repository operation is executed.
+    """
+
+    @abstractmethod
+    async def _run(self, operation: str, *args, **kwargs):
+        pass
+
+    async def create_user(self, user: DomainUser) -> DomainUser:
+        return await self._run("create_user", user)
+
+    async def create_user_if_absent(
+            self,
+            user: DomainUser
+            ) -> Optional[DomainUser]:
+        return await self._run("create_user_if_absent", user)
+
+    async def get_user_by_id(
+            self,
+            user_id: UUIDField
+            ) -> Optional[DomainUser]:
+        return await self._run("get_user_by_id", user_id)
+
+    async def get_user_by_email(
+            self,
+            email: EmailField
+            ) -> Optional[DomainUser]:
+        return await self._run("get_user_by_email", email)
+
+    async def get_user_by_username(
+            self,
+            username: UsernameField
+            ) -> Optional[DomainUser]:
+        return await self._run("get_user_by_username", username)
+
+    async def exists_by_email_or_username(
+            self,
+            email: EmailField,
+            username: UsernameField
+            ) -> Tuple[bool, bool]:
+        return await self._run("exists_by_email_or_username", email, username)
+
+
+class AsyncSQLAlchemyUserRepository(_AsyncUserRepositoryBridge):
+    """
+    Non-blocking repository backed by an AsyncSession. The queries are
+    the ones of SQLAlchemyUserRepository, executed through run_sync.
+    """
+
+    def __init__(
+            self,
+            db: AsyncSession,
+            repository_factory=SQLAlchemyUserRepository
+            ):
+        self.db = db
+        self._repository_factory = repository_factory
+
+    async def _run(self, operation: str, *args, **kwargs):
+        def run(session: Session):
+            repository = self._repository_factory(session)
+            return getattr(repository, operation)(*args, **kwargs)
+
+        return await self.db.run_sync(run)
+
+
+class BlockingUserRepositoryAdapter(_AsyncUserRepositoryBridge):
+    """
+    Adapts a sync UserRepositoryPort to the async port. The calls run
+    inline on the caller's thread, exactly like the sync mode did before.
+    """
+
+    def __init__(self, repository: UserRepositoryPort):
+        self._repository = repository
+
+    async def _run(self, operation: str, *args, **kwargs):
+        return getattr(self._repository, operation)(*args, **kwargs)
+
+
+class AsyncCachedUserRepository(_AsyncUserRepositoryBridge):
+    """
+    Answers get_user_by_id from the user cache and fills it on a miss.
+    Every other operation goes to the wrapped repository.
+    """
+
+    def __init__(
+            self,
+            repository: AsyncUserRepositoryPort,
+            cache: TTLCache
+            ):
+        self._repository = repository
+        self._cache = cache
+
+    async def _run(self, operation: str, *args, **kwargs):
+        return await getattr(self._repository, operation)(*args, **kwargs)
+
+    async def create_user(self, user: DomainUser) -> DomainUser:
+        created_user = await self._repository.create_user(user)
+        self._cache.invalidate(str(created_user.id))
+        return created_user
+
+    async def create_user_if_absent(
+            self,
+            user: DomainUser
+            ) -> Optional[DomainUser]:
+        created_user = await self._repository.create_user_if_absent(user)
+        if created_user is not None:
+            self._cache.invalidate(str(created_user.id))
+        return created_user
+
+    async def get_user_by_id(
+            self,
+            user_id: UUIDField
+            ) -> Optional[DomainUser]:
+        key = str(user_id)
+        user = self._cache.get(key)
+        if user is not None:
+            return user
+
+        version = self._cache.version
+        user = await self._repository.get_user_by_id(user_id)
+        if user is not None:
+            self._cache.set(key, user, version=version)
+        return user
+
+
+def get_async_sqlalchemy_user_repository(
+        db: AsyncSession = Depends(get_async_db)
+        ) -> AsyncUserRepositoryPort:
+    return _with_user_cache(AsyncSQLAlchemyUserRepository(db))
+
+
+def get_blocking_user_repository_adapter(
+        repository: UserRepositoryPort = Depends(
+            get_sqlalchemy_user_repository
+            )
+        ) -> AsyncUserRepositoryPort:
+    return _with_user_cache(BlockingUserRepositoryAdapter(repository))
+
+
+def _with_user_cache(
+        repository: AsyncUserRepositoryPort
+        ) -> AsyncUserRepositoryPort:
+    if user_cache is None:
+        return repository
+    return AsyncCachedUserRepository(repository, user_cache)
+
+
+# Repository dependency used by the routes, chosen by DATABASE_ASYNC
+get_async_user_repository = (
+    get_async_sqlalchemy_user_repository
+    if DATABASE_ASYNC
+    else get_blocking_user_repository_adapter
+)
@@ -1,20 +1,57 @@
-from typing import List, Tuple, Optional
+from typing import Iterable, Iterator, List, Set, Tuple, Optional
 from fastapi import Depends
+from sqlalchemy import (
+    case,
+    delete,
+    func,
+    insert,
+    literal,
+    literal_column,
+    select,
+    tuple_,
+    update
+)
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 from app.domain.entities.message import Message as DomainMessage
+from app.domain.read_models.message_view import MessageView
 from app.domain.ports.message_repository_port import MessageRepositoryPort
 from app.domain.value_objects import (
     UUIDField,
+    CursorField,
+    SearchQueryField,
+    SearchCursorField,
     SenderField,
     ContentField,
     DatetimeField
 )
 from app.infrastructure.persistence.database import get_db
-from app.infrastructure.persistence.orm_models import MessageORM
+from app.infrastructure.persistence.search_index import (
+    MESSAGES_FTS_TABLE,
+    messages_fts
+)
+from app.infrastructure.persistence.orm_models import (
+    MessageORM,
+    SessionStatsORM
+)
 from app.infrastructure.decorators.exception_repository_handlers import (
     exception_repository_handlers
 )
 
+# Core table of MessageORM and the columns of MessageView, in its order
+_messages = MessageORM.__table__
+_VIEW_COLUMNS = (
+    _messages.c.id,
+    _messages.c.session_id,
+    _messages.c.content,
+    _messages.c.timestamp,
+    _messages.c.sender,
+    _messages.c.word_count,
+    _messages.c.character_count,
+    _messages.c.processed_at,
+    _messages.c.created_at,
+)
+
 
 class SQLAlchemyMessageRepository(MessageRepositoryPort):
     def __init__(self, db: Session):
@@ -24,11 +61,73 @@ class SQLAlchemyMessageRepository(MessageRepositoryPort):
     def create_message(self, message: DomainMessage) -> DomainMessage:
         db_message = self._to_orm_model(message)
         self.db.add(db_message)
+        self._increment_session_stats([message])
         self.db.commit()
-        self.db.refresh(db_message)
 
         return message
 
+    @exception_repository_handlers("crear mensaje si no existe")
+    def create_message_if_absent(
+            self,
+            message: DomainMessage
+            ) -> Optional[DomainMessage]:
+        """
+        Inserts the message with a single INSERT and lets the primary key
+        detect duplicates. Returns None when the id already exists.
+        """
+        result = self.db.execute(
+            self._insert_if_absent(), self._to_row(message)
+        )
+        if not result.rowcount:
+            return None
+
+        self._increment_session_stats([message])
+        self.db.commit()
+
+        return message
+
+    @exception_repository_handlers("crear mensajes en lote")
+    def create_messages(
+            self,
+            messages: List[DomainMessage]
+            ) -> List[DomainMessage]:
+        """
+        Inserts all the messages with a single multi-row INSERT and updates
+        the session counters in the same transaction. A message whose id is
+        already stored, e.g. by a concurrent request after the lookup of
+        existing ids, is skipped. Returns the messages inserted.
+        """
+        if not messages:
+            return []
+
+        inserted_ids = set(self.db.scalars(
+            self._insert_if_absent().returning(_messages.c.id),
+            [self._to_row(message) for message in messages]
+        ))
+        inserted = [
+            message for message in messages
+            if str(message.id) in inserted_ids
+        ]
+        self._increment_session_stats(inserted)
+        self.db.commit()
+
+        return inserted
+
+    @exception_repository_handlers("obtener ids de mensajes existentes")
+    def get_existing_message_ids(
+            self,
+            message_ids: List[UUIDField]
+            ) -> Set[str]:
+        if not message_ids:
+            return set()
+
+        rows = self.db.execute(
+            select(MessageORM.id).where(
+                MessageORM.id.in_([str(id) for id in message_ids])
+            )
+        )
+        return {row.id for row in rows}
+
     @exception_repository_handlers("obtener mensaje por Id")
     def get_message_by_id(self, message_id: UUIDField) -> DomainMessage:
         message_orm = self.db.query(MessageORM).filter(
@@ -45,32 +144,442 @@ class SQLAlchemyMessageRepository(MessageRepositoryPort):
             offset: int = 0,
             sender: Optional[str] = None
             ) -> Tuple[List[DomainMessage], int]:
+        total_count = self.count_message_by_session_id(session_id, sender)
 
-        base_query = self.db.query(MessageORM).filter(
-            MessageORM.session_id == str(session_id)
+        message_orm_list = self._session_listing(
+            self.db.query(MessageORM), session_id, limit, offset, sender
+        ).all()
+
+        messages = (
+            [self._to_domain_entity(message) for message in message_orm_list]
         )
 
-        if sender:
-            base_query = base_query.filter(MessageORM.sender == sender)
+        return messages, total_count
+
+    @exception_repository_handlers("obtener pagina de mensajes por session")
+    def get_message_page_by_session_id(
+            self,
+            session_id: UUIDField,
+            limit: int = 50,
+            cursor: Optional[CursorField] = None,
+            sender: Optional[str] = None
+            ) -> Tuple[List[DomainMessage], bool]:
+        """
+        Keyset pagination over (created_at, id), newest first. Returns the
+        page in display order and whether more rows exist beyond it in
+        the direction of the cursor.
+        """
+        query, backwards = self._session_page(
+            self.db.query(MessageORM), session_id, limit, cursor, sender
+        )
+        message_orm_list, has_more = self._page_rows(
+            query.all(), limit, backwards
+        )
+
+        messages = (
+            [self._to_domain_entity(message) for message in message_orm_list]
+        )
+
+        return messages, has_more
+
+    @exception_repository_handlers("obtener vista de mensaje por Id")
+    def get_message_view_by_id(
+            self,
+            message_id: UUIDField
+            ) -> Optional[MessageView]:
+        row = self.db.execute(
+            select(*_VIEW_COLUMNS).where(_messages.c.id == str(message_id))
+        ).first()
+
+        return MessageView._make(row) if row is not None else None
+
+    @exception_repository_handlers("obtener vistas de mensajes por session")
+    def get_message_views_by_session_id(
+            self,
+            session_id: UUIDField,
+            limit: int = 50,
+            offset: int = 0,
+            sender: Optional[str] = None
+            ) -> Tuple[List[MessageView], int]:
+        """
+        Same page as get_message_by_session_id through a Core select() of
+        the returned columns, mapped straight to MessageView records.
+        """
+        total_count = self.count_message_by_session_id(session_id, sender)
+
+        rows = self.db.execute(self._session_listing(
+            select(*_VIEW_COLUMNS), session_id, limit, offset, sender
+        ))
+
+        return list(map(MessageView._make, rows)), total_count
+
+    @exception_repository_handlers(
+        "obtener pagina de vistas de mensajes por session"
+    )
+    def get_message_view_page_by_session_id(
+            self,
+            session_id: UUIDField,
+            limit: int = 50,
+            cursor: Optional[CursorField] = None,
+            sender: Optional[str] = None
+            ) -> Tuple[List[MessageView], bool]:
+        """
+        Same page as get_message_page_by_session_id through a Core
+        select() of the returned columns, mapped to MessageView records.
+        """
+        query, backwards = self._session_page(
+            select(*_VIEW_COLUMNS), session_id, limit, cursor, sender
+        )
+        rows, has_more = self._page_rows(
+            self.db.execute(query).all(), limit, backwards
+        )
+
+        return list(map(MessageView._make, rows)), has_more
+
+    def stream_messages_by_session_id(
+            self,
+            session_id: UUIDField,
+            cursor: Optional[CursorField] = None,
+            sender: Optional[str] = None,
+            batch_size: int = 1000
+            ) -> Iterator[DomainMessage]:
+        """
+        Yields every message of the session oldest first, after the cursor
+        position when given, fetching batch_size rows per round-trip.
+        It reads through its own session because the request scoped one is
+        closed before a streaming response is sent.
+        """
+        with Session(bind=self.db.get_bind()) as session:
+            messages = session.scalars(
+                self._stream_query(session_id, cursor, sender)
+                .execution_options(yield_per=batch_size)
+            )
+            for message_orm in messages:
+                yield self._to_domain_entity(message_orm)
+
+    @exception_repository_handlers("buscar mensajes")
+    def search_messages(
+            self,
+            query: SearchQueryField,
+            session_id: Optional[UUIDField] = None,
+            limit: int = 20,
+            cursor: Optional[SearchCursorField] = None
+            ) -> Tuple[List[Tuple[DomainMessage, str, float]], bool]:
+        """
+        Full-text search over the FTS5 index, best bm25 rank first (lower
+        is better) and id as tie-breaker. Returns (message, snippet, rank)
+        tuples and whether more results exist after the page.
+        """
+        fts = literal_column(MESSAGES_FTS_TABLE)
+        rank = func.bm25(fts)
+        search_query = (
+            select(
+                MessageORM,
+                func.snippet(fts, 0, "[", "]", "…", 12).label("snippet"),
+                rank.label("rank")
+            )
+            .select_from(messages_fts)
+            .join(
+                MessageORM,
+                literal_column("messages.rowid") == messages_fts.c.rowid
+            )
+            .where(fts.op("MATCH")(query.match_expression))
+        )
 
-        total_count = base_query.count()
+        if session_id:
+            search_query = search_query.where(
+                MessageORM.session_id == str(session_id)
+            )
+        if cursor is not None:
+            last_rank, last_id = cursor.position
+            search_query = search_query.where(
+                tuple_(rank, MessageORM.id) > tuple_(
+                    literal(last_rank),
+                    literal(last_id, MessageORM.id.type)
+                )
+            )
+
+        rows = self.db.execute(
+            search_query
+            .order_by(rank, MessageORM.id)
+            .limit(limit + 1)
+        ).all()
+        has_more = len(rows) > limit
+
+        results = [
+            (self._to_domain_entity(row.MessageORM), row.snippet, row.rank)
+            for row in rows[:limit]
+        ]
+        return results, has_more
+
+    @exception_repository_handlers("contar mensajes por session")
+    def count_message_by_session_id(
+            self,
+            session_id: UUIDField,
+            sender: Optional[str] = None
+            ) -> int:
+        """
+        Reads the total from the maintained session_stats counters. Falls
+        back to COUNT(*) for sessions written before the counters existed.
+        """
+        stats = self.db.query(SessionStatsORM).filter(
+            SessionStatsORM.session_id == str(session_id)
+            ).first()
 
-        message_orm_list = (
-            base_query
-            .order_by(MessageORM.created_at.desc())
+        if stats is None:
+            count_query = self.db.query(func.count(MessageORM.id)).filter(
+                MessageORM.session_id == str(session_id)
+            )
+            if sender:
+                count_query = count_query.filter(MessageORM.sender == sender)
+            return count_query.scalar()
+
+        if not sender:
+            return stats.total_messages
+
+        column_name = SessionStatsORM.SENDER_COLUMNS.get(sender)
+        return getattr(stats, column_name) if column_name else 0
+
+    @exception_repository_handlers("recalcular estadisticas de sesiones")
+    def recount_session_stats(
+            self,
+            session_id: Optional[UUIDField] = None
+            ) -> int:
+        """
+        Rebuilds the session_stats counters from the messages table, for
+        one session or for all of them. Returns the sessions rebuilt.
+        """
+        session_ids = [str(session_id)] if session_id else None
+
+        delete_query = delete(SessionStatsORM)
+        if session_ids:
+            delete_query = delete_query.where(
+                SessionStatsORM.session_id.in_(session_ids)
+            )
+        self.db.execute(delete_query)
+        inserted = self._insert_session_stats_from_messages(session_ids)
+        self.db.commit()
+
+        return inserted
+
+    def _session_listing(
+            self,
+            query,
+            session_id: UUIDField,
+            limit: int,
+            offset: int,
+            sender: Optional[str]
+            ):
+        """
+        Filters a Query or select() to the offset page of the session,
+        newest first. It uses the table columns so a Core select() is not
+        turned into an ORM one.
+        """
+        query = query.filter(_messages.c.session_id == str(session_id))
+        if sender:
+            query = query.filter(_messages.c.sender == sender)
+        return (
+            query
+            .order_by(_messages.c.created_at.desc(), _messages.c.id.desc())
             .offset(offset)
             .limit(limit)
-            .all()
         )
 
-        messages = (
-            [self._to_domain_entity(message) for message in message_orm_list]
+    def _session_page(
+            self,
+            query,
+            session_id: UUIDField,
+            limit: int,
+            cursor: Optional[CursorField],
+            sender: Optional[str]
+            ):
+        """
+        Filters a Query or select() to the keyset page of the session plus
+        one row. Returns it and whether it walks backwards from the cursor.
+        """
+        query = query.filter(_messages.c.session_id == str(session_id))
+        if sender:
+            query = query.filter(_messages.c.sender == sender)
+
+        key = tuple_(_messages.c.created_at, _messages.c.id)
+        backwards = (
+            cursor is not None and cursor.direction == CursorField.PREVIOUS
         )
 
-        return messages, total_count
+        if backwards:
+            query = query.filter(key > self._seek_position(cursor)).order_by(
+                _messages.c.created_at.asc(), _messages.c.id.asc()
+            )
+        else:
+            if cursor is not None:
+                query = query.filter(key < self._seek_position(cursor))
+            query = query.order_by(
+                _messages.c.created_at.desc(), _messages.c.id.desc()
+            )
+
+        return query.limit(limit + 1), backwards
+
+    def _page_rows(
+            self,
+            rows: list,
+            limit: int,
+            backwards: bool
+            ) -> Tuple[list, bool]:
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        if backwards:
+            rows.reverse()
+        return rows, has_more
+
+    def _stream_query(
+            self,
+            session_id: UUIDField,
+            cursor: Optional[CursorField],
+            sender: Optional[str]
+            ):
+        query = select(MessageORM).where(
+            MessageORM.session_id == str(session_id)
+        )
+        if sender:
+            query = query.where(MessageORM.sender == sender)
+        if cursor is not None:
+            query = query.where(
+                tuple_(MessageORM.created_at, MessageORM.id)
+                > self._seek_position(cursor)
+            )
+        return query.order_by(
+            MessageORM.created_at.asc(), MessageORM.id.asc()
+        )
+
+    def _seek_position(self, cursor: CursorField):
+        # Typed binds, the columns may not store the values as text
+        created_at, message_id = cursor.position
+        return tuple_(
+            literal(created_at, MessageORM.created_at.type),
+            literal(message_id, MessageORM.id.type)
+        )
+
+    def _increment_session_stats(
+            self,
+            messages: Iterable[DomainMessage]
+            ) -> None:
+        increments = {}
+        for message in messages:
+            stats = increments.setdefault(str(message.session_id), {
+                "total_messages": 0,
+                "user_messages": 0,
+                "system_messages": 0,
+                "last_message_at": message.created_at.value,
+            })
+            stats["total_messages"] += 1
+            column_name = SessionStatsORM.SENDER_COLUMNS.get(
+                message.sender.value
+            )
+            if column_name:
+                stats[column_name] += 1
+            stats["last_message_at"] = max(
+                stats["last_message_at"], message.created_at.value
+            )
+
+        new_session_ids = []
+        for session_id, stats in increments.items():
+            # Typed, so the value is stored like the column stores it
+            last_message_at = literal(
+                stats["last_message_at"], SessionStatsORM.last_message_at.type
+            )
+            result = self.db.execute(
+                update(SessionStatsORM)
+                .where(SessionStatsORM.session_id == session_id)
+                .values(
+                    total_messages=(
+                        SessionStatsORM.total_messages
+                        + stats["total_messages"]
+                    ),
+                    user_messages=(
+                        SessionStatsORM.user_messages
+                        + stats["user_messages"]
+                    ),
+                    system_messages=(
+                        SessionStatsORM.system_messages
+                        + stats["system_messages"]
+                    ),
+                    last_message_at=case(
+                        (
+                            SessionStatsORM.last_message_at.is_(None)
+                            | (
+                                SessionStatsORM.last_message_at
+                                < last_message_at
+                            ),
+                            last_message_at
+                        ),
+                        else_=SessionStatsORM.last_message_at
+                    ),
+                )
+                .execution_options(synchronize_session=False)
+            )
+            if not result.rowcount:
+                new_session_ids.append(session_id)
+
+        if new_session_ids:
+            # A session without counters may hold rows written before they
+            #  existed, so its counters are born from a recount
+            self.db.flush()
+            self._insert_session_stats_from_messages(new_session_ids)
+
+    def _insert_session_stats_from_messages(
+            self,
+            session_ids: Optional[List[str]] = None
+            ) -> int:
+        sender_counts = [
+            func.coalesce(func.sum(case(
+                (MessageORM.sender == sender, 1), else_=0
+            )), 0)
+            for sender in SessionStatsORM.SENDER_COLUMNS
+        ]
+        aggregate = (
+            select(
+                MessageORM.session_id,
+                func.count(MessageORM.id),
+                *sender_counts,
+                func.max(MessageORM.created_at)
+            )
+            .where(MessageORM.session_id.is_not(None))
+            .group_by(MessageORM.session_id)
+        )
+        if session_ids:
+            aggregate = aggregate.where(
+                MessageORM.session_id.in_(session_ids)
+            )
+
+        result = self.db.execute(
+            insert(SessionStatsORM).from_select(
+                [
+                    SessionStatsORM.session_id,
+                    SessionStatsORM.total_messages,
+                    *[
+                        getattr(SessionStatsORM, column_name)
+                        for column_name
+                        in SessionStatsORM.SENDER_COLUMNS.values()
+                    ],
+                    SessionStatsORM.last_message_at,
+                ],
+                aggregate
+            )
+        )
+        return result.rowcount
+
+    def _insert_if_absent(self):
+        # Only a conflict on the primary key is skipped, any other
+        #  constraint failure still raises
+        return sqlite_insert(_messages).on_conflict_do_nothing(
+            index_elements=[_messages.c.id]
+        )
 
     def _to_orm_model(self, message_entity: DomainMessage) -> MessageORM:
-        return MessageORM(
+        return MessageORM(**self._to_row(message_entity))
+
+    def _to_row(self, message_entity: DomainMessage) -> dict:
+        return dict(
             id=str(message_entity.id.value),
             session_id=str(message_entity.session_id.value),
             content=message_entity.content.value,
@@ -87,17 +596,18 @@ class SQLAlchemyMessageRepository(MessageRepositoryPort):
         if message_orm is None:
             return None
 
+        # Rows were validated and filtered when they were written
         return DomainMessage(
-            id=UUIDField(message_orm.id),
-            session_id=UUIDField(message_orm.session_id),
-            content=ContentField(message_orm.content),
-            timestamp=DatetimeField(message_orm.timestamp),
-            sender=SenderField(message_orm.sender),
+            id=UUIDField.from_storage(message_orm.id),
+            session_id=UUIDField.from_storage(message_orm.session_id),
+            content=ContentField.from_storage(message_orm.content),
+            timestamp=DatetimeField.from_storage(message_orm.timestamp),
+            sender=SenderField.from_storage(message_orm.sender),
             word_count=message_orm.word_count,
             character_count=message_orm.character_count,
-            processed_at=DatetimeField(message_orm.processed_at),
-            created_at=DatetimeField(message_orm.created_at),
-            updated_at=DatetimeField(message_orm.updated_at),
+            processed_at=DatetimeField.from_storage(message_orm.processed_at),
+            created_at=DatetimeField.from_storage(message_orm.created_at),
+            updated_at=DatetimeField.from_storage(message_orm.updated_at),
         )
 
 
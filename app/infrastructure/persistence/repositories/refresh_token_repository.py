@@ -0,0 +1,137 @@
+from datetime import datetime
+from typing import Optional
+from fastapi import Depends
+from sqlalchemy import delete, update
+from sqlalchemy.orm import Session
+from app.domain.entities.refresh_token import RefreshToken
+from app.domain.value_objects import UUIDField
+from app.domain.ports.refresh_token_repository_port import (
+    RefreshTokenRepositoryPort
+)
+from app.infrastructure.persistence.orm_models import RefreshTokenORM
+from app.infrastructure.persistence.database import get_db
+from app.infrastructure.decorators.exception_repository_handlers import (
+    exception_repository_handlers
+)
+
+
+class SQLAlchemyRefreshTokenRepository(RefreshTokenRepositoryPort):
+    def __init__(self, db: Session):
+        self.db = db
+
+    @exception_repository_handlers("crear refresh token")
+    def create_refresh_token(
+            self,
+            refresh_token: RefreshToken
+            ) -> RefreshToken:
+        self.db.add(self._to_orm_model(refresh_token))
+        self.db.commit()
+
+        return refresh_token
+
+    @exception_repository_handlers("obtener refresh token")
+    def get_refresh_token(self, token_hash: str) -> Optional[RefreshToken]:
+        refresh_token_orm = self.db.get(RefreshTokenORM, token_hash)
+
+        return self._to_domain_entity(refresh_token_orm)
+
+    @exception_repository_handlers("rotar refresh token")
+    def rotate_refresh_token(
+            self,
+            token_hash: str,
+            new_refresh_token: RefreshToken
+            ) -> bool:
+        """
+        Revokes the token and stores its replacement in one transaction.
+        The UPDATE only matches a token that is still active, so when two
+        requests rotate the same token only one of them succeeds.
+        """
+        result = self.db.execute(
+            update(RefreshTokenORM)
+            .where(
+                RefreshTokenORM.token_hash == token_hash,
+                RefreshTokenORM.revoked_at.is_(None)
+            )
+            .values(
+                revoked_at=new_refresh_token.created_at,
+                replaced_by=new_refresh_token.token_hash
+            )
+        )
+        if result.rowcount != 1:
+            self.db.rollback()
+            return False
+
+        self.db.add(self._to_orm_model(new_refresh_token))
+        self.db.commit()
+        return True
+
+    @exception_repository_handlers("revocar refresh tokens")
+    def revoke_refresh_token_family(self, family_id: str) -> int:
+        result = self.db.execute(
+            update(RefreshTokenORM)
+            .where(
+                RefreshTokenORM.family_id == family_id,
+                RefreshTokenORM.revoked_at.is_(None)
+            )
+            .values(revoked_at=datetime.utcnow())
+        )
+        self.db.commit()
+
+        return result.rowcount
+
+    @exception_repository_handlers("revocar refresh tokens del usuario")
+    def revoke_user_refresh_tokens(self, user_id: UUIDField) -> int:
+        result = self.db.execute(
+            update(RefreshTokenORM)
+            .where(
+                RefreshTokenORM.user_id == str(user_id),
+                RefreshTokenORM.revoked_at.is_(None)
+            )
+            .values(revoked_at=datetime.utcnow())
+        )
+        self.db.commit()
+
+        return result.rowcount
+
+    @exception_repository_handlers("eliminar refresh tokens expirados")
+    def delete_expired_refresh_tokens(self, now: datetime) -> int:
+        result = self.db.execute(
+            delete(RefreshTokenORM)
+            .where(RefreshTokenORM.expires_at <= now)
+        )
+        self.db.commit()
+
+        return result.rowcount
+
+    def _to_domain_entity(
+            self,
+            refresh_token_orm: RefreshTokenORM
+            ) -> Optional[RefreshToken]:
+        if refresh_token_orm is None:
+            return None
+        return RefreshToken(
+            token_hash=refresh_token_orm.token_hash,
+            user_id=UUIDField.from_storage(refresh_token_orm.user_id),
+            family_id=refresh_token_orm.family_id,
+            expires_at=refresh_token_orm.expires_at,
+            revoked_at=refresh_token_orm.revoked_at,
+            replaced_by=refresh_token_orm.replaced_by,
+            created_at=refresh_token_orm.created_at
+        )
+
+    def _to_orm_model(self, refresh_token: RefreshToken) -> RefreshTokenORM:
+        return RefreshTokenORM(
+            token_hash=refresh_token.token_hash,
+            user_id=str(refresh_token.user_id),
+            family_id=refresh_token.family_id,
+            expires_at=refresh_token.expires_at,
+            revoked_at=refresh_token.revoked_at,
+            replaced_by=refresh_token.replaced_by,
+            created_at=refresh_token.created_at
+        )
+
+
+def get_sqlalchemy_refresh_token_repository(
+        db: Session = Depends(get_db)
+        ) -> RefreshTokenRepositoryPort:
+    return SQLAlchemyRefreshTokenRepository(db)
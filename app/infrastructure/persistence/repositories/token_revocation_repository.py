@@ -0,0 +1,106 @@
+from datetime import datetime
+from typing import Dict, List, Tuple
+from fastapi import Depends
+from sqlalchemy import delete, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from app.domain.value_objects import UUIDField
+from app.domain.ports.token_revocation_repository_port import (
+    TokenRevocationRepositoryPort
+)
+from app.infrastructure.persistence.orm_models import (
+    RevokedTokenORM,
+    UserTokenVersionORM
+)
+from app.infrastructure.persistence.database import get_db
+from app.infrastructure.decorators.exception_repository_handlers import (
+    exception_repository_handlers
+)
+
+
+class SQLAlchemyTokenRevocationRepository(TokenRevocationRepositoryPort):
+    def __init__(self, db: Session):
+        self.db = db
+
+    @exception_repository_handlers("revocar token")
+    def revoke_token(self, jti: str, expires_at: datetime) -> None:
+        self.db.merge(RevokedTokenORM(
+            jti=jti,
+            expires_at=expires_at,
+            revoked_at=datetime.utcnow()
+        ))
+        self.db.commit()
+
+    @exception_repository_handlers("incrementar versión de token")
+    def increment_user_token_version(self, user_id: UUIDField) -> int:
+        if not self._increment_version(str(user_id)):
+            try:
+                self.db.add(UserTokenVersionORM(
+                    user_id=str(user_id),
+                    version=1,
+                    updated_at=datetime.utcnow()
+                ))
+                self.db.commit()
+            except IntegrityError:
+                # Another request created the row first
+                self.db.rollback()
+                self._increment_version(str(user_id))
+
+        return self.get_user_token_version(user_id)
+
+    @exception_repository_handlers("obtener versión de token")
+    def get_user_token_version(self, user_id: UUIDField) -> int:
+        version = self.db.execute(
+            select(UserTokenVersionORM.version)
+            .where(UserTokenVersionORM.user_id == str(user_id))
+        ).scalar_one_or_none()
+
+        return version or 0
+
+    @exception_repository_handlers("obtener tokens revocados")
+    def get_token_revocations(
+            self,
+            now: datetime
+            ) -> Tuple[List[str], Dict[str, int]]:
+        """
+        Returns the jti of the revoked tokens that have not expired yet and
+        the token version of every user that has one.
+        """
+        jtis = self.db.execute(
+            select(RevokedTokenORM.jti)
+            .where(RevokedTokenORM.expires_at > now)
+        ).scalars().all()
+        versions = self.db.execute(
+            select(UserTokenVersionORM.user_id, UserTokenVersionORM.version)
+        ).all()
+
+        return list(jtis), dict(versions)
+
+    @exception_repository_handlers("eliminar tokens revocados expirados")
+    def delete_expired_revoked_tokens(self, now: datetime) -> int:
+        result = self.db.execute(
+            delete(RevokedTokenORM)
+            .where(RevokedTokenORM.expires_at <= now)
+        )
+        self.db.commit()
+
+        return result.rowcount
+
+    def _increment_version(self, user_id: str) -> bool:
+        result = self.db.execute(
+            update(UserTokenVersionORM)
+            .where(UserTokenVersionORM.user_id == user_id)
+            .values(
+                version=UserTokenVersionORM.version + 1,
+                updated_at=datetime.utcnow()
+            )
+        )
+        self.db.commit()
+
+        return result.rowcount == 1
+
+
+def get_sqlalchemy_token_revocation_repository(
+        db: Session = Depends(get_db)
+        ) -> TokenRevocationRepositoryPort:
+    return SQLAlchemyTokenRevocationRepository(db)
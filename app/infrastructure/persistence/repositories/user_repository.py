@@ -1,5 +1,7 @@
-from typing import Optional
+from typing import Optional, Tuple
 from fastapi import Depends
+from sqlalchemy import exists, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from app.domain.entities.user import User as DomainUser
 from app.domain.value_objects import (
@@ -29,6 +31,25 @@ class SQLAlchemyUserRepository(UserRepositoryPort):
 
         return self._to_domain_entity(db_user)
 
+    @exception_repository_handlers("crear usuario si no existe")
+    def create_user_if_absent(
+            self,
+            user: DomainUser
+            ) -> Optional[DomainUser]:
+        """
+        Inserts the user and relies on the UNIQUE email and username
+        constraints to detect a duplicate, returning None for it. The
+        given entity is returned as is, without reading the row back.
+        """
+        self.db.add(self._to_orm_model(user))
+        try:
+            self.db.commit()
+        except IntegrityError:
+            self.db.rollback()
+            return None
+
+        return user
+
     @exception_repository_handlers("obtener usuario por id")
     def get_user_by_id(self, user_id: UUIDField) -> Optional[DomainUser]:
         user_orm = self.db.query(UserORM).filter(
@@ -56,14 +77,32 @@ class SQLAlchemyUserRepository(UserRepositoryPort):
 
         return self._to_domain_entity(user_orm)
 
+    @exception_repository_handlers("comprobar usuario existente")
+    def exists_by_email_or_username(
+            self,
+            email: EmailField,
+            username: UsernameField
+            ) -> Tuple[bool, bool]:
+        """
+        Whether the email and whether the username are already taken, in
+        a single SELECT that reads only the unique indexes.
+        """
+        email_taken, username_taken = self.db.execute(select(
+            exists().where(UserORM.email == email.value),
+            exists().where(UserORM.username == username.value)
+        )).one()
+
+        return bool(email_taken), bool(username_taken)
+
     def _to_domain_entity(self, user_orm: UserORM) -> DomainUser:
         if user_orm is None:
             return None
+        # Rows were validated when they were written
         return DomainUser(
-            id=UUIDField(user_orm.id),
-            email=EmailField(user_orm.email),
-            username=UsernameField(user_orm.username),
-            password_hash=PasswordHashField(user_orm.password),
+            id=UUIDField.from_storage(user_orm.id),
+            email=EmailField.from_storage(user_orm.email),
+            username=UsernameField.from_storage(user_orm.username),
+            password_hash=PasswordHashField.from_storage(user_orm.password),
             created_at=user_orm.created_at,
             updated_at=user_orm.updated_at
         )
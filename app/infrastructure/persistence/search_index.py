@@ -0,0 +1,63 @@
+"""
+SQLite FTS5 index over messages.content. It is an external content table,
+so the text is not stored twice, and triggers keep it in sync with every
+insert, update and delete of the messages table.
+"""
+from sqlalchemy import column, inspect, table, text
+
+MESSAGES_FTS_TABLE = "messages_fts"
+
+# Selectable used by the repository to join and rank the matches
+messages_fts = table(MESSAGES_FTS_TABLE, column("rowid"))
+
+_TRIGGERS = {
+    "messages_fts_insert": """
+        CREATE TRIGGER messages_fts_insert AFTER INSERT ON messages BEGIN
+            INSERT INTO messages_fts (rowid, content)
+            VALUES (new.rowid, new.content);
+        END
+    """,
+    "messages_fts_delete": """
+        CREATE TRIGGER messages_fts_delete AFTER DELETE ON messages BEGIN
+            INSERT INTO messages_fts (messages_fts, rowid, content)
+            VALUES ('delete', old.rowid, old.content);
+        END
+    """,
+    "messages_fts_update": """
+        CREATE TRIGGER messages_fts_update AFTER UPDATE OF content
+        ON messages BEGIN
+            INSERT INTO messages_fts (messages_fts, rowid, content)
+            VALUES ('delete', old.rowid, old.content);
+            INSERT INTO messages_fts (rowid, content)
+            VALUES (new.rowid, new.content);
+        END
+    """,
+}
+
+
+def create_search_index(connection) -> bool:
+    """
+    Creates the FTS5 table and its triggers when missing, indexing the
+    messages already stored. Returns whether the index was created.
+    """
+    if MESSAGES_FTS_TABLE in inspect(connection).get_table_names():
+        return False
+
+    connection.execute(text(
+        f"CREATE VIRTUAL TABLE {MESSAGES_FTS_TABLE} USING fts5("
+        "content, content='messages', content_rowid='rowid', "
+        "tokenize='unicode61 remove_diacritics 2')"
+    ))
+    for statement in _TRIGGERS.values():
+        connection.execute(text(statement))
+    connection.execute(text(
+        f"INSERT INTO {MESSAGES_FTS_TABLE} ({MESSAGES_FTS_TABLE}) "
+        "VALUES ('rebuild')"
+    ))
+    return True
+
+
+def drop_search_index(connection) -> None:
+    for trigger_name in _TRIGGERS:
+        connection.execute(text(f"DROP TRIGGER IF EXISTS {trigger_name}"))
+    connection.execute(text(f"DROP TABLE IF EXISTS {MESSAGES_FTS_TABLE}"))
@@ -0,0 +1,49 @@
+import uuid
+from datetime import datetime, timedelta
+from sqlalchemy import BigInteger, LargeBinary
+from sqlalchemy.types import TypeDecorator
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+class CompactUUID(TypeDecorator):
+    """
+    Stores a UUID as its 16 raw bytes instead of the 36 characters of its
+    text form. Accepts and returns the canonical string, and the byte order
+    keeps the same sort order as the lowercase text.
+    """
+    impl = LargeBinary(16)
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        if not isinstance(value, uuid.UUID):
+            value = uuid.UUID(str(value))
+        return value.bytes
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return str(uuid.UUID(bytes=bytes(value)))
+
+
+class EpochMicroseconds(TypeDecorator):
+    """
+    Stores a datetime as integer microseconds since the Unix epoch instead
+    of an ISO text. Like the SQLite DateTime type, it keeps the wall clock
+    time and drops the tzinfo, so it returns naive datetimes.
+    """
+    impl = BigInteger
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return (value.replace(tzinfo=None) - _EPOCH) // _MICROSECOND
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return _EPOCH + timedelta(microseconds=value)
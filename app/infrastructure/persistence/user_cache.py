@@ -0,0 +1,53 @@
+"""
+Process wide cache of the users resolved by id, set when
+USER_CACHE_ENABLED. Every commit that updates or deletes a UserORM row
+through the ORM invalidates its entry, and invalidate_user() is the hook
+for any other mutation path.
+"""
+from typing import Optional
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from app.core.cache import TTLCache
+from app.core.config import (
+    USER_CACHE_ENABLED,
+    USER_CACHE_MAX_SIZE,
+    USER_CACHE_TTL_SECONDS
+)
+from app.infrastructure.persistence.orm_models import UserORM
+
+_PENDING_KEY = "user_cache_pending_invalidations"
+
+user_cache: Optional[TTLCache] = None
+if USER_CACHE_ENABLED:
+    user_cache = TTLCache(
+        name="user_cache",
+        max_size=USER_CACHE_MAX_SIZE,
+        ttl_seconds=USER_CACHE_TTL_SECONDS
+    )
+
+
+def invalidate_user(user_id: str) -> None:
+    if user_cache is not None:
+        user_cache.invalidate(str(user_id))
+
+
+def _track_user_mutation(mapper, connection, target: UserORM) -> None:
+    # Invalidated once committed, until then readers see the old row too
+    session = Session.object_session(target)
+    if session is not None:
+        session.info.setdefault(_PENDING_KEY, set()).add(str(target.id))
+
+
+def _invalidate_committed_users(session: Session) -> None:
+    for user_id in session.info.pop(_PENDING_KEY, ()):
+        invalidate_user(user_id)
+
+
+def _discard_rolled_back_users(session: Session, transaction) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+event.listen(UserORM, "after_update", _track_user_mutation)
+event.listen(UserORM, "after_delete", _track_user_mutation)
+event.listen(Session, "after_commit", _invalidate_committed_users)
+event.listen(Session, "after_soft_rollback", _discard_rolled_back_users)
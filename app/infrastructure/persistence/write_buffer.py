@@ -0,0 +1,266 @@
+import asyncio
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, List, Optional, Tuple
+from sqlalchemy.orm import Session
+from app.core.config import (
+    MESSAGE_WRITE_BUFFER_ENABLED,
+    MESSAGE_WRITE_BUFFER_MAX_ROWS,
+    MESSAGE_WRITE_BUFFER_MAX_DELAY_MS,
+    MESSAGE_WRITE_BUFFER_MAX_QUEUE
+)
+from app.core.metrics import metrics
+from app.domain.entities.message import Message as DomainMessage
+from app.domain.exceptions import (
+    DomainValidationException,
+    InfrastructureException
+)
+from app.infrastructure.persistence.database import SessionLocal
+from app.infrastructure.persistence.repositories.message_repository import (
+    SQLAlchemyMessageRepository
+)
+
+_STOP = object()
+
+
+class MessageWriteBuffer:
+    """
+    In-process write-behind buffer with group commit. Concurrent message
+    inserts are gathered for up to max_delay_ms or max_rows and written by
+    a single writer thread in one transaction. Each submitted future is
+    resolved only once its transaction has been committed.
+    """
+
+    def __init__(
+            self,
+            session_factory: Callable[[], Session] = SessionLocal,
+            max_rows: int = MESSAGE_WRITE_BUFFER_MAX_ROWS,
+            max_delay_ms: float = MESSAGE_WRITE_BUFFER_MAX_DELAY_MS,
+            max_queue: int = MESSAGE_WRITE_BUFFER_MAX_QUEUE
+            ):
+        self._session_factory = session_factory
+        self._max_rows = max_rows
+        self._max_delay = max_delay_ms / 1000
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._closed = False
+        # Callers waiting for room in a full queue, woken by the writer
+        #  thread once it takes a batch. Guarded by _lock.
+        self._room_waiters: List[
+            Tuple[asyncio.AbstractEventLoop, asyncio.Future]
+        ] = []
+
+        self._queue_depth = metrics.gauge(
+            "message_write_buffer_queue_depth",
+            "Messages waiting in the write buffer."
+        )
+        self._flush_size = metrics.histogram(
+            "message_write_buffer_flush_size",
+            "Messages written per group commit.",
+            buckets=(1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024)
+        )
+        self._flush_latency = metrics.histogram(
+            "message_write_buffer_flush_latency_ms",
+            "Duration of each group commit in milliseconds."
+        )
+        self._wait_latency = metrics.histogram(
+            "message_write_buffer_wait_ms",
+            "Time from submit until the message is durable, in milliseconds."
+        )
+
+    def start(self) -> None:
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._closed = False
+            self._thread = threading.Thread(
+                target=self._run,
+                name="message-write-buffer",
+                daemon=True
+            )
+            self._thread.start()
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """
+        Stops accepting messages and waits until the buffered ones are
+        written.
+        """
+        with self._lock:
+            if self._thread is None:
+                return
+            self._closed = True
+            thread, self._thread = self._thread, None
+        self._queue.put(_STOP)
+        thread.join(timeout)
+
+    async def submit_async(self, message: DomainMessage) -> DomainMessage:
+        """
+        Queues a message without blocking the event loop and waits until
+        it is durable. A full queue makes the caller wait until the writer
+        thread takes the next batch.
+        """
+        future = self._new_future()
+        item = (message, future, time.perf_counter())
+        while True:
+            try:
+                self._queue.put_nowait(item)
+                break
+            except queue.Full:
+                await self._wait_for_room()
+                self._check_open()
+        self._queue_depth.set(self._queue.qsize())
+        return await asyncio.wrap_future(future)
+
+    def _new_future(self) -> Future:
+        self._check_open()
+        if self._thread is None:
+            self.start()
+        return Future()
+
+    def _check_open(self) -> None:
+        if self._closed:
+            raise InfrastructureException(
+                message="El buffer de escritura está cerrado.",
+                code="WRITE_BUFFER_CLOSED"
+            )
+
+    async def _wait_for_room(self) -> None:
+        loop = asyncio.get_running_loop()
+        waiter = loop.create_future()
+        with self._lock:
+            # The writer may have taken a batch since the put failed
+            if not self._queue.full():
+                return
+            self._room_waiters.append((loop, waiter))
+        await waiter
+
+    def _wake_room_waiters(self) -> None:
+        with self._lock:
+            waiters, self._room_waiters = self._room_waiters, []
+        for loop, waiter in waiters:
+            try:
+                loop.call_soon_threadsafe(_wake, waiter)
+            except RuntimeError:
+                # The waiter's event loop is already closed
+                pass
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            if item is _STOP:
+                break
+            batch = [item]
+            deadline = time.monotonic() + self._max_delay
+            while len(batch) < self._max_rows:
+                remaining = deadline - time.monotonic()
+                try:
+                    item = (
+                        self._queue.get(timeout=remaining)
+                        if remaining > 0 else self._queue.get_nowait()
+                    )
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+            self._queue_depth.set(self._queue.qsize())
+            self._wake_room_waiters()
+            self._flush(batch)
+
+        self._drain()
+
+    def _drain(self) -> None:
+        batch = []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not _STOP:
+                batch.append(item)
+        self._wake_room_waiters()
+        for first in range(0, len(batch), self._max_rows):
+            self._flush(batch[first:first + self._max_rows])
+        self._queue_depth.set(0)
+
+    def _flush(self, batch: List[Tuple[DomainMessage, Future, float]]) -> None:
+        started = time.perf_counter()
+        db = self._session_factory()
+        try:
+            repository = SQLAlchemyMessageRepository(db)
+            pending = self._reject_duplicates(repository, batch)
+            try:
+                created_ids = {
+                    str(message.id)
+                    for message in repository.create_messages(
+                        [message for message, _, _ in pending]
+                    )
+                }
+                for message, future, _ in pending:
+                    if str(message.id) in created_ids:
+                        future.set_result(message)
+                    else:
+                        # Stored by a concurrent writer after the lookup
+                        future.set_exception(_duplicated_message_exception())
+            except Exception:
+                db.rollback()
+                self._flush_one_by_one(repository, pending)
+        except Exception as e:
+            for _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(e)
+        finally:
+            db.close()
+
+        finished = time.perf_counter()
+        self._flush_size.observe(len(batch))
+        self._flush_latency.observe((finished - started) * 1000)
+        for _, _, submitted_at in batch:
+            self._wait_latency.observe((finished - submitted_at) * 1000)
+
+    def _reject_duplicates(self, repository, batch):
+        existing_ids = repository.get_existing_message_ids(
+            [message.id for message, _, _ in batch]
+        )
+        pending = []
+        for message, future, submitted_at in batch:
+            message_id = str(message.id)
+            if message_id in existing_ids:
+                future.set_exception(_duplicated_message_exception())
+                continue
+            existing_ids.add(message_id)
+            pending.append((message, future, submitted_at))
+        return pending
+
+    def _flush_one_by_one(self, repository, pending) -> None:
+        # Isolates the row that made the group commit fail, so only its
+        #  own request sees the error
+        for message, future, _ in pending:
+            try:
+                repository.create_message(message)
+                future.set_result(message)
+            except Exception as e:
+                repository.db.rollback()
+                future.set_exception(e)
+
+
+def _wake(waiter: asyncio.Future) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+def _duplicated_message_exception() -> DomainValidationException:
+    return DomainValidationException(
+        message="Mensaje con id registrado",
+        detail="Ya existe un mensaje con el id."
+    )
+
+
+message_write_buffer = (
+    MessageWriteBuffer() if MESSAGE_WRITE_BUFFER_ENABLED else None
+)
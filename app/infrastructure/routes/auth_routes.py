@@ -1,8 +1,31 @@
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from fastapi import APIRouter, Depends, status
-from app.services.user_service import UserService, get_user_service
-from app.core.security import create_access_token
+from app.services.user_service import (
+    AsyncUserService,
+    get_async_user_service
+)
+from app.services.refresh_token_service import (
+    AsyncRefreshTokenService,
+    get_async_refresh_token_service
+)
+from app.services.token_revocation_service import (
+    AsyncTokenRevocationService,
+    get_async_token_revocation_service
+)
+from app.core.security import (
+    create_user_access_token,
+    oauth2_scheme,
+    verify_token
+)
+from app.core.auth_dependencies import get_current_user
+from app.domain.entities.user import User as DomainUser
+from app.domain.exceptions import DomainValidationException
 from app.infrastructure.decorators import handle_api_exceptions
+from app.infrastructure.routes.request_schemas import (
+    LoginRequest,
+    body_openapi,
+    parsed_body
+)
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
@@ -17,19 +40,155 @@ router = APIRouter(prefix="/auth", tags=["Authentication"])
         status.HTTP_500_INTERNAL_SERVER_ERROR: {
             "description": "Internal server error."
             }
-    }
+    },
+    openapi_extra=body_openapi(LoginRequest)
 )
 @handle_api_exceptions
 async def login_for_access_token(
-    form_data: Dict[str, Any],
-    user_service: UserService = Depends(get_user_service)
+    form_data: Dict[str, Any] = Depends(parsed_body(LoginRequest)),
+    user_service: AsyncUserService = Depends(get_async_user_service),
+    refresh_token_service: AsyncRefreshTokenService = Depends(
+        get_async_refresh_token_service
+        ),
+    revocation_service: AsyncTokenRevocationService = Depends(
+        get_async_token_revocation_service
+        )
+):
+    user = await user_service.authenticate_user(form_data)
+
+    access_token = create_user_access_token(
+        user,
+        await revocation_service.get_user_token_version(user.id)
+    )
+    refresh_token = await refresh_token_service.issue_refresh_token(user.id)
+    return {
+        "access_token": access_token,
+        "refresh_token": refresh_token,
+        "token_type": "bearer"
+        }
+
+
+@router.post(
+    "/refresh",
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_400_BAD_REQUEST: {
+            "description": "Invalid, expired or revoked refresh token."
+            },
+        status.HTTP_500_INTERNAL_SERVER_ERROR: {
+            "description": "Internal server error."
+            }
+    }
+)
+@handle_api_exceptions
+async def refresh_access_token(
+    token_data: Dict[str, Any],
+    user_service: AsyncUserService = Depends(get_async_user_service),
+    refresh_token_service: AsyncRefreshTokenService = Depends(
+        get_async_refresh_token_service
+        ),
+    revocation_service: AsyncTokenRevocationService = Depends(
+        get_async_token_revocation_service
+        )
 ):
-    user = user_service.authenticate_user(form_data)
+    user_id, refresh_token = (
+        await refresh_token_service.rotate_refresh_token(
+            token_data.get("refresh_token")
+            )
+        )
+    user = await user_service.get_user_by_id(str(user_id))
+    if user is None:
+        raise DomainValidationException(
+            message="Refresh token inválido.",
+            detail="El usuario del refresh token no existe.",
+            code="INVALID_REFRESH_TOKEN"
+        )
 
-    access_token = create_access_token(
-        data={"sub": str(user.id)}
+    access_token = create_user_access_token(
+        user,
+        await revocation_service.get_user_token_version(user.id)
     )
     return {
         "access_token": access_token,
+        "refresh_token": refresh_token,
         "token_type": "bearer"
         }
+
+
+@router.post(
+    "/revoke",
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_400_BAD_REQUEST: {
+            "description": "Invalid refresh token."
+            },
+        status.HTTP_500_INTERNAL_SERVER_ERROR: {
+            "description": "Internal server error."
+            }
+    }
+)
+@handle_api_exceptions
+async def revoke_refresh_token(
+    token_data: Dict[str, Any],
+    refresh_token_service: AsyncRefreshTokenService = Depends(
+        get_async_refresh_token_service
+        )
+):
+    await refresh_token_service.revoke_refresh_token(
+        token_data.get("refresh_token")
+        )
+
+    return {
+        "status": "success",
+        "data": {"revoked": True}
+        }
+
+
+@router.post(
+    "/logout",
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {
+            "description": "Invalid, expired or revoked access token."
+            },
+        status.HTTP_500_INTERNAL_SERVER_ERROR: {
+            "description": "Internal server error."
+            }
+    }
+)
+@handle_api_exceptions
+async def logout_endpoint(
+    logout_data: Optional[Dict[str, Any]] = None,
+    token: str = Depends(oauth2_scheme),
+    refresh_token_service: AsyncRefreshTokenService = Depends(
+        get_async_refresh_token_service
+        ),
+    revocation_service: AsyncTokenRevocationService = Depends(
+        get_async_token_revocation_service
+        ),
+    current_user: DomainUser = Depends(get_current_user)
+):
+    all_sessions = bool((logout_data or {}).get("all_sessions"))
+    refresh_token = (logout_data or {}).get("refresh_token")
+    # The refresh tokens go first, so an invalid one leaves the access
+    #  token untouched and the client can retry the logout
+    if all_sessions:
+        await refresh_token_service.revoke_user_refresh_tokens(
+            current_user.id
+            )
+    elif refresh_token is not None:
+        await refresh_token_service.revoke_refresh_token(
+            refresh_token, current_user.id
+            )
+
+    payload = verify_token(token)
+    # Tokens issued without a jti can only be revoked with all the others
+    if all_sessions or "jti" not in payload:
+        await revocation_service.revoke_user_tokens(current_user.id)
+    else:
+        await revocation_service.revoke_token(payload)
+
+    return {
+        "status": "success",
+        "data": {"revoked": True, "all_sessions": all_sessions}
+        }
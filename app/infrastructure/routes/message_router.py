@@ -1,20 +1,46 @@
-from typing import Dict, Any, Optional
+import zlib
+from typing import (
+    Dict,
+    Any,
+    AsyncIterator,
+    List,
+    Optional,
+    Literal,
+    Tuple
+)
+import orjson
 from fastapi import (
     APIRouter,
     Depends,
+    Request,
     status,
     Query
 )
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from app.domain.entities.message import Message as DomainMessage
 from app.domain.entities.user import User as DomainUser
 from app.services.message_service import (
-    MessageService,
-    get_message_service
+    AsyncMessageService,
+    get_async_message_service
 )
 from app.infrastructure.decorators import handle_api_exceptions
+from app.infrastructure.routes.request_schemas import (
+    MessageCreateRequest,
+    body_openapi,
+    parsed_body
+)
 from app.core.auth_dependencies import get_current_user
 
+# The JSON endpoints return an ORJSONResponse themselves, which skips the
+#  jsonable_encoder pass, since their payloads only hold str, int, bool,
+#  float, None and datetime values that orjson writes natively. The export
+#  encodes its lines with orjson too
 router = APIRouter(prefix="/messages", tags=["Messages"])
 
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+# Lines sent per chunk of the export stream
+EXPORT_LINES_PER_CHUNK = 100
+
 
 @router.post(
     "/",
@@ -26,17 +52,59 @@ router = APIRouter(prefix="/messages", tags=["Messages"])
         status.HTTP_500_INTERNAL_SERVER_ERROR: {
             "description": "Internal server error."
             }
-    }
+    },
+    openapi_extra=body_openapi(MessageCreateRequest)
 )
 @handle_api_exceptions
 async def register_message_endpoint(
-    message_data: Dict[str, Any],
-    message_service: MessageService = Depends(get_message_service),
+    message_data: Dict[str, Any] = Depends(
+        parsed_body(MessageCreateRequest)
+        ),
+    message_service: AsyncMessageService = Depends(
+        get_async_message_service
+        ),
+    current_user: DomainUser = Depends(get_current_user)
+):
+    new_message_entity = await message_service.register_message(
+        message_data
+        )
+
+    return ORJSONResponse(
+        new_message_entity.to_dict(),
+        status_code=status.HTTP_201_CREATED
+        )
+
+
+@router.post(
+    "/batch",
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_400_BAD_REQUEST: {
+            "description": "Empty or too large batch."
+            },
+        status.HTTP_500_INTERNAL_SERVER_ERROR: {
+            "description": "Internal server error."
+            }
+    }
+)
+@handle_api_exceptions
+async def register_message_batch_endpoint(
+    messages_data: List[Any],
+    message_service: AsyncMessageService = Depends(
+        get_async_message_service
+        ),
     current_user: DomainUser = Depends(get_current_user)
 ):
-    new_message_entity = message_service.register_message(message_data)
+    results = await message_service.register_messages(messages_data)
+
+    summary = {"created": 0, "duplicate": 0, "invalid": 0}
+    for result in results:
+        summary[result["status"]] += 1
 
-    return new_message_entity.to_dict()
+    return ORJSONResponse({
+        "results": results,
+        "summary": summary
+    })
 
 
 @router.get(
@@ -57,12 +125,65 @@ async def register_message_endpoint(
 @handle_api_exceptions
 async def get_message_by_id_endpoint(
     message_id: str,
-    message_service: MessageService = Depends(get_message_service),
+    message_service: AsyncMessageService = Depends(
+        get_async_message_service
+        ),
+    current_user: DomainUser = Depends(get_current_user)
+):
+    message_view = await message_service.get_message_view_by_id(message_id)
+
+    return ORJSONResponse(message_view.to_dict())
+
+
+@router.get(
+    "/search",
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_400_BAD_REQUEST: {
+            "description": "Empty query or invalid session ID or cursor."
+            },
+        status.HTTP_500_INTERNAL_SERVER_ERROR: {
+            "description": "Internal server error."
+            }
+    }
+)
+@handle_api_exceptions
+async def search_messages_endpoint(
+    q: str = Query(
+        default="",
+        description="Words to search, a trailing * searches a prefix"),
+    session_id: Optional[str] = Query(
+        default=None,
+        description="Only search the messages of this session"),
+    limit: Optional[int] = Query(
+        default=20, ge=1, le=100,
+        description="Number of results to return"),
+    cursor: Optional[str] = Query(
+        default=None,
+        description="Opaque next_cursor of a previous page"),
+    message_service: AsyncMessageService = Depends(
+        get_async_message_service
+        ),
     current_user: DomainUser = Depends(get_current_user)
 ):
-    message_entity = message_service.get_message_by_id(message_id)
+    results, next_cursor = await message_service.search_messages(
+        query=q,
+        session_id=session_id,
+        limit=limit,
+        cursor=cursor
+        )
 
-    return message_entity.to_dict()
+    return ORJSONResponse({
+        "results": [
+            {**message.to_dict(), "snippet": snippet, "rank": rank}
+            for message, snippet, rank in results
+        ],
+        "pagination": {
+            "limit": limit,
+            "next_cursor": next_cursor,
+            "has_next": next_cursor is not None
+        }
+    })
 
 
 @router.get(
@@ -92,19 +213,53 @@ async def get_message_by_session_endpoint(
     sender: Optional[str] = Query(
         default=None,
         description="Filter by sender"),
-    message_service: MessageService = Depends(get_message_service),
+    pagination: Literal["offset", "cursor"] = Query(
+        default="offset",
+        description="Pagination mode, offset or keyset cursor"),
+    cursor: Optional[str] = Query(
+        default=None,
+        description="Opaque next_cursor/prev_cursor of a previous page"),
+    message_service: AsyncMessageService = Depends(
+        get_async_message_service
+        ),
     current_user: DomainUser = Depends(get_current_user)
 ):
-    message_entities, total_count = message_service.get_message_by_session_id(
-        session_id=session_id,
-        limit=limit,
-        offset=offset,
-        sender=sender
+    if pagination == "cursor" or cursor:
+        message_views, next_cursor, prev_cursor, total_count = (
+            await message_service.get_message_view_page_by_session_id(
+                session_id=session_id,
+                limit=limit,
+                cursor=cursor,
+                sender=sender
+                )
+            )
+
+        return ORJSONResponse({
+            "messages": (
+                [message.to_dict() for message in message_views]
+            ),
+            "pagination": {
+                "total": total_count,
+                "limit": limit,
+                "next_cursor": next_cursor,
+                "prev_cursor": prev_cursor,
+                "has_next": next_cursor is not None,
+                "has_previous": prev_cursor is not None
+            }
+        })
+
+    message_views, total_count = (
+        await message_service.get_message_views_by_session_id(
+            session_id=session_id,
+            limit=limit,
+            offset=offset,
+            sender=sender
+            )
         )
 
-    return {
+    return ORJSONResponse({
         "messages": (
-            [message.to_dict() for message in message_entities]
+            [message.to_dict() for message in message_views]
         ),
         "pagination": {
             "total": total_count,
@@ -113,4 +268,79 @@ async def get_message_by_session_endpoint(
             "has_next": offset + limit < total_count,
             "has_previous": offset > 0
         }
+    })
+
+
+@router.get(
+    "/{session_id}/export",
+    status_code=status.HTTP_200_OK,
+    response_class=StreamingResponse,
+    responses={
+        status.HTTP_200_OK: {
+            "content": {NDJSON_MEDIA_TYPE: {}},
+            "description": "One JSON message per line, oldest first."
+            },
+        status.HTTP_400_BAD_REQUEST: {
+            "description": "Invalid session ID or cursor."
+            },
+        status.HTTP_500_INTERNAL_SERVER_ERROR: {
+            "description": "Internal server error."
+            }
     }
+)
+@handle_api_exceptions
+async def export_session_messages_endpoint(
+    session_id: str,
+    request: Request,
+    sender: Optional[str] = Query(
+        default=None,
+        description="Filter by sender"),
+    cursor: Optional[str] = Query(
+        default=None,
+        description="cursor of the last received line, to resume after it"),
+    message_service: AsyncMessageService = Depends(
+        get_async_message_service
+        ),
+    current_user: DomainUser = Depends(get_current_user)
+):
+    messages = message_service.export_messages_by_session_id(
+        session_id=session_id,
+        cursor=cursor,
+        sender=sender
+        )
+
+    content = _ndjson_chunks(messages)
+    headers = {"Vary": "Accept-Encoding"}
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        content = _gzip_chunks(content)
+        headers["Content-Encoding"] = "gzip"
+
+    return StreamingResponse(
+        content,
+        media_type=NDJSON_MEDIA_TYPE,
+        headers=headers
+        )
+
+
+async def _ndjson_chunks(
+        messages: AsyncIterator[Tuple[DomainMessage, str]]
+        ) -> AsyncIterator[bytes]:
+    lines = []
+    async for message, cursor in messages:
+        line = message.to_dict()
+        line["cursor"] = cursor
+        lines.append(orjson.dumps(line))
+        if len(lines) == EXPORT_LINES_PER_CHUNK:
+            yield b"\n".join(lines) + b"\n"
+            lines = []
+    if lines:
+        yield b"\n".join(lines) + b"\n"
+
+
+async def _gzip_chunks(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    compressor = zlib.compressobj(wbits=16 + zlib.MAX_WBITS)
+    async for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
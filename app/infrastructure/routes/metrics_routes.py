@@ -0,0 +1,24 @@
+from fastapi import APIRouter, Depends, status
+from app.core.metrics import metrics
+from app.core.auth_dependencies import get_current_user
+from app.domain.entities.user import User as DomainUser
+
+router = APIRouter(prefix="/metrics", tags=["Metrics"])
+
+
+@router.get(
+    "/",
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {
+            "description": "Invalid, expired or revoked access token."
+            }
+    }
+)
+async def get_metrics_endpoint(
+    current_user: DomainUser = Depends(get_current_user)
+):
+    """
+    Snapshot of the in-process application metrics.
+    """
+    return metrics.snapshot()
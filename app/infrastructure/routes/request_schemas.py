@@ -0,0 +1,147 @@
+"""
+Request bodies of the write endpoints, parsed and typed by the compiled
+pydantic core straight from the raw bytes.
+
+A body that matches its schema reaches the services with the UUID and
+datetime values already built, so the value objects only check them.
+Any other body is handed over as the plain JSON object it was before,
+and the value objects raise the same domain exceptions, so the error
+envelope of handle_api_exceptions does not change. Bodies that are not
+a JSON object fail with the 422 errors FastAPI raised for Dict bodies.
+"""
+import email.message
+import json
+from datetime import datetime
+from typing import (
+    Annotated,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Literal,
+    Optional
+)
+from uuid import UUID
+from fastapi import Request
+from fastapi.exceptions import RequestValidationError
+from pydantic import (
+    BeforeValidator,
+    ConfigDict,
+    Field,
+    Strict,
+    TypeAdapter,
+    ValidationError,
+    with_config
+)
+from typing_extensions import TypedDict
+
+
+def _iso_8601(value: Any) -> Any:
+    # Only ISO 8601 strings, the core also reads unix timestamps and a
+    #  lowercase 'z', which DatetimeField rejects
+    if not isinstance(value, str) or value[4:5] != '-' or (
+            value.endswith('z')):
+        raise ValueError("not an ISO 8601 date")
+    return value
+
+
+@with_config(ConfigDict(strict=True, extra='allow'))
+class MessageCreateRequest(TypedDict):
+    # Extra keys are kept for the enrichment stages of the pipeline
+    message_id: UUID
+    session_id: UUID
+    content: str
+    # After a before validator the core sees a Python str, which a strict
+    #  datetime refuses, so the string check above replaces strict mode
+    timestamp: Annotated[
+        datetime, Strict(False), BeforeValidator(_iso_8601)
+    ]
+    sender: Literal['user', 'system']
+
+
+@with_config(ConfigDict(strict=True))
+class UserRegisterRequest(TypedDict):
+    email: str
+    username: Annotated[str, Field(min_length=3, max_length=30)]
+    password: Annotated[str, Field(min_length=6, max_length=128)]
+
+
+@with_config(ConfigDict(strict=True))
+class LoginRequest(TypedDict):
+    email: str
+    password: str
+
+
+def _is_json(content_type: Optional[str]) -> bool:
+    # The same media types FastAPI decodes for a body parameter
+    if not content_type:
+        return True
+    message = email.message.Message()
+    message["content-type"] = content_type
+    subtype = message.get_content_subtype()
+    return message.get_content_maintype() == "application" and (
+        subtype == "json" or subtype.endswith("+json")
+    )
+
+
+def _object_required(value: Any) -> RequestValidationError:
+    return RequestValidationError([{
+        "type": "dict_type",
+        "loc": ("body",),
+        "msg": "Input should be a valid dictionary",
+        "input": value,
+    }], body=value)
+
+
+def parsed_body(
+        schema: type
+        ) -> Callable[[Request], Awaitable[Dict[str, Any]]]:
+    """Dependency returning the JSON object of the body as a dict."""
+    adapter = TypeAdapter(schema)
+
+    async def dependency(request: Request) -> Dict[str, Any]:
+        body = await request.body()
+        if not body:
+            raise RequestValidationError([{
+                "type": "missing",
+                "loc": ("body",),
+                "msg": "Field required",
+                "input": None,
+            }], body=None)
+        if not _is_json(request.headers.get("content-type")):
+            raise _object_required(body)
+
+        try:
+            return adapter.validate_json(body)
+        except ValidationError:
+            pass
+
+        try:
+            data = json.loads(body)
+        except json.JSONDecodeError as e:
+            raise RequestValidationError([{
+                "type": "json_invalid",
+                "loc": ("body", e.pos),
+                "msg": "JSON decode error",
+                "input": {},
+                "ctx": {"error": e.msg},
+            }], body=e.doc) from e
+        if not isinstance(data, dict):
+            raise _object_required(data)
+        return data
+
+    return dependency
+
+
+def body_openapi(schema: type) -> Dict[str, Any]:
+    """openapi_extra documenting the schema of a parsed_body route."""
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": TypeAdapter(schema).json_schema()
+                }
+            }
+        }
+    }
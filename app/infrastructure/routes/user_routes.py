@@ -1,10 +1,15 @@
 from typing import Dict, Any
 from fastapi import APIRouter, Depends, status
 from app.services.user_service import (
-    UserService,
-    get_user_service
+    AsyncUserService,
+    get_async_user_service
 )
 from app.infrastructure.decorators import handle_api_exceptions
+from app.infrastructure.routes.request_schemas import (
+    UserRegisterRequest,
+    body_openapi,
+    parsed_body
+)
 
 router = APIRouter(prefix="/users", tags=["Users"])
 
@@ -19,14 +24,15 @@ router = APIRouter(prefix="/users", tags=["Users"])
         status.HTTP_500_INTERNAL_SERVER_ERROR: {
             "description": "Internal server error."
             }
-    }
+    },
+    openapi_extra=body_openapi(UserRegisterRequest)
 )
 @handle_api_exceptions
 async def register_user_endpoint(
-    user_data: Dict[str, Any],
-    user_service: UserService = Depends(get_user_service)
+    user_data: Dict[str, Any] = Depends(parsed_body(UserRegisterRequest)),
+    user_service: AsyncUserService = Depends(get_async_user_service)
 ):
-    new_user_entity = user_service.register_user(user_data)
+    new_user_entity = await user_service.register_user(user_data)
 
     return {
         "status": "success",
@@ -0,0 +1,226 @@
+import asyncio
+import math
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, List, Optional
+from app.core.config import (
+    MESSAGE_PROCESS_POOL_ENABLED,
+    MESSAGE_PROCESS_POOL_WORKERS,
+    MESSAGE_PROCESS_POOL_MIN_CHARS,
+    MESSAGE_PROCESS_POOL_MIN_BATCH,
+    MESSAGE_PROCESS_POOL_MAX_PENDING
+)
+from app.core.metrics import MetricsRegistry, metrics
+from app.domain.exceptions import DomainValidationException
+from app.services.message_pipeline import message_pipeline
+
+
+def _init_worker() -> None:
+    # Each worker builds its own moderation engine, and watches the
+    #  wordlist file when one is configured
+    from app.core.moderation import configure_content_filter
+    configure_content_filter()
+
+
+def _warm_up() -> None:
+    # Runs the pipeline once, so the first task finds every stage imported
+    #  and the moderation engine already built
+    message_pipeline.run({"content": "warm up"})
+
+
+def process_messages(messages_data: List[Any]) -> List[Any]:
+    """
+    Runs the message pipeline over each item, in a worker process. Each
+    result is a (content, fields) tuple, the validation error of the item,
+    or None for items that are not objects.
+    """
+    results = []
+    for message_data in messages_data:
+        if not isinstance(message_data, dict):
+            results.append(None)
+            continue
+        try:
+            processed = message_pipeline.run(message_data)
+        except DomainValidationException as e:
+            results.append(e)
+            continue
+        results.append((processed.content, processed.fields))
+    return results
+
+
+class MessageProcessingPool:
+    """
+    Execution policy for the message processing pipeline. Messages with
+    at least min_chars characters of content, and batches of at least
+    min_batch messages split in one chunk per worker, run on a pool of
+    worker processes so they use every core and leave the event loop
+    free. Smaller work stays inline.
+
+    The pool is started and warmed up at startup, so no request pays for
+    spawning the workers. At most max_workers + max_pending tasks are
+    queued, when the pool is saturated process() returns None and the
+    caller processes inline. It also returns None when a task fails on
+    the pool, and a pool broken by a dead worker is replaced.
+    """
+
+    def __init__(
+            self,
+            max_workers: int = MESSAGE_PROCESS_POOL_WORKERS,
+            min_chars: int = MESSAGE_PROCESS_POOL_MIN_CHARS,
+            min_batch: int = MESSAGE_PROCESS_POOL_MIN_BATCH,
+            max_pending: int = MESSAGE_PROCESS_POOL_MAX_PENDING,
+            registry: MetricsRegistry = metrics
+            ):
+        self._max_workers = max_workers
+        self._min_chars = min_chars
+        self._min_batch = min_batch
+        self._max_in_flight = max_workers + max_pending
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+        self._in_flight_gauge = registry.gauge(
+            "message_process_pool_in_flight",
+            "Pipeline tasks running or queued on the process pool."
+        )
+        self._offloaded = registry.counter(
+            "message_process_pool_offloaded",
+            "Messages processed on the process pool."
+        )
+        self._inline_fallbacks = registry.counter(
+            "message_process_pool_inline_fallbacks",
+            "Pool eligible tasks processed inline because it was saturated."
+        )
+        self._errors = registry.counter(
+            "message_process_pool_errors",
+            "Pool tasks that failed and were processed inline."
+        )
+        self._restarts = registry.counter(
+            "message_process_pool_restarts",
+            "Process pools replaced after a worker died."
+        )
+
+    def start(self) -> None:
+        """Spawns every worker and waits until they are ready."""
+        with self._lock:
+            if self._executor is not None:
+                return
+            self._executor = executor = self._new_executor()
+        wait(self._start_workers(executor))
+
+    def close(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def offloads_message(self, message_data: Any) -> bool:
+        content = (
+            message_data.get('content')
+            if isinstance(message_data, dict) else None
+        )
+        return isinstance(content, str) and len(content) >= self._min_chars
+
+    def offloads_batch(self, messages_data: List[Any]) -> bool:
+        return len(messages_data) >= self._min_batch
+
+    async def process(self, message_data: dict) -> Optional[Any]:
+        """
+        Result of process_messages for one message, None when it has to
+        be processed inline.
+        """
+        results = await self.process_batch([message_data])
+        return results[0] if results is not None else None
+
+    async def process_batch(
+            self,
+            messages_data: List[Any]
+            ) -> Optional[List[Any]]:
+        """
+        Results of process_messages for the batch, None when it has to be
+        processed inline.
+        """
+        size = math.ceil(len(messages_data) / self._max_workers)
+        chunks = [
+            messages_data[first:first + size]
+            for first in range(0, len(messages_data), size)
+        ]
+        executor = self._try_acquire_slots(len(chunks))
+        if executor is None:
+            self._inline_fallbacks.inc()
+            return None
+        try:
+            # Every chunk settles before its slot is released
+            results = await asyncio.gather(*(
+                self._submit(executor, chunk) for chunk in chunks
+            ), return_exceptions=True)
+        finally:
+            self._release_slots(len(chunks))
+
+        errors = [
+            result for result in results if isinstance(result, Exception)
+        ]
+        if errors:
+            self._errors.inc(len(errors))
+            if any(isinstance(error, BrokenProcessPool) for error in errors):
+                self._restart(executor)
+            return None
+        self._offloaded.inc(len(messages_data))
+        return [result for chunk in results for result in chunk]
+
+    async def _submit(
+            self,
+            executor: ProcessPoolExecutor,
+            messages_data: List[Any]
+            ) -> List[Any]:
+        return await asyncio.wrap_future(
+            executor.submit(process_messages, messages_data)
+        )
+
+    def _new_executor(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=self._max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker
+        )
+
+    def _start_workers(self, executor: ProcessPoolExecutor) -> list:
+        return [executor.submit(_warm_up) for _ in range(self._max_workers)]
+
+    def _restart(self, broken: ProcessPoolExecutor) -> None:
+        """Replaces a broken executor, unless another task already did."""
+        with self._lock:
+            if self._executor is not broken:
+                return
+            self._executor = executor = self._new_executor()
+        self._restarts.inc()
+        broken.shutdown(wait=False)
+        # The new workers warm up in the background
+        self._start_workers(executor)
+
+    def _try_acquire_slots(
+            self,
+            count: int
+            ) -> Optional[ProcessPoolExecutor]:
+        """The executor to submit to, None when there is no free slot."""
+        with self._lock:
+            if (
+                self._executor is None
+                or self._in_flight + count > self._max_in_flight
+            ):
+                return None
+            self._in_flight += count
+            self._in_flight_gauge.set(self._in_flight)
+            return self._executor
+
+    def _release_slots(self, count: int) -> None:
+        with self._lock:
+            self._in_flight -= count
+            self._in_flight_gauge.set(self._in_flight)
+
+
+message_processing_pool = (
+    MessageProcessingPool() if MESSAGE_PROCESS_POOL_ENABLED else None
+)
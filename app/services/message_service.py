@@ -1,49 +1,129 @@
 from datetime import datetime
-from typing import Optional, List, Tuple
+from typing import Any, AsyncIterator, Optional, List, Tuple
 from fastapi import Depends
-from app.domain.ports.message_repository_port import MessageRepositoryPort
+from app.domain.ports.async_message_repository_port import (
+    AsyncMessageRepositoryPort
+)
 from app.domain.entities.message import Message
+from app.domain.read_models.message_view import MessageView
 from app.domain.exceptions import (
-    DomainValidationException
+    DomainValidationException,
+    RequiredFieldException
 )
 from app.domain.value_objects import (
     UUIDField,
+    CursorField,
+    SearchQueryField,
+    SearchCursorField,
     SenderField,
     ContentField,
     DatetimeField
 )
-from app.infrastructure.persistence.repositories.message_repository import (
-    get_sqlalchemy_message_repository
+from app.services.message_pipeline import (
+    MessagePipeline,
+    message_pipeline
+)
+from app.services.message_processing_pool import (
+    MessageProcessingPool,
+    message_processing_pool
+)
+from app.core.config import (
+    MESSAGE_BATCH_MAX_SIZE,
+    MESSAGE_EXPORT_BATCH_SIZE,
+    MESSAGE_WRITE_MODE
 )
+from app.infrastructure.persistence.repositories.async_message_repository \
+    import get_async_message_repository
 
 
-class MessageService:
-    def __init__(self, message_repository: MessageRepositoryPort):
+class AsyncMessageService:
+    """
+    Registers and reads messages for the routes. Every repository call is
+    awaited, the pipeline runs inline or on the process pool.
+    """
+
+    INSERT_OR_CONFLICT = "insert_or_conflict"
+
+    def __init__(
+            self,
+            message_repository: AsyncMessageRepositoryPort,
+            write_mode: str = MESSAGE_WRITE_MODE,
+            pipeline: MessagePipeline = message_pipeline,
+            processing_pool: Optional[MessageProcessingPool] = (
+                message_processing_pool
+                )
+            ):
         self._message_repository = message_repository
+        self._write_mode = write_mode
+        self._pipeline = pipeline
+        self._processing_pool = processing_pool
 
-    def register_message(
+    async def register_message(
             self,
             message_data: dict
             ) -> Message:
 
-        new_message_entity = self._validate_message_data(message_data)
-
-        if self._message_repository.get_message_by_id(new_message_entity.id):
-            raise DomainValidationException(
-                message="Mensaje con id registrado",
-                detail="Ya existe un mensaje con el id."
+        processed = None
+        pool = self._processing_pool
+        if pool is not None and pool.offloads_message(message_data):
+            processed = self._pipeline_result(
+                await pool.process(message_data)
+                )
+        new_message_entity = self._validate_message_data(
+            message_data, processed
             )
 
-        created_message = self._message_repository.create_message(
+        if self._write_mode == self.INSERT_OR_CONFLICT:
+            created_message = (
+                await self._message_repository.create_message_if_absent(
+                    new_message_entity
+                    )
+                )
+            if created_message is None:
+                raise self._duplicated_message_exception()
+            return created_message
+
+        if await self._message_repository.get_message_by_id(
+            new_message_entity.id
+        ):
+            raise self._duplicated_message_exception()
+
+        created_message = await self._message_repository.create_message(
             new_message_entity
             )
         return created_message
 
-    def get_message_by_id(self, message_id: str) -> Optional[Message]:
+    async def register_messages(
+            self,
+            messages_data: List[dict]
+            ) -> List[dict]:
+        self._check_batch_size(messages_data)
+        processed = None
+        pool = self._processing_pool
+        if pool is not None and pool.offloads_batch(messages_data):
+            processed = await pool.process_batch(messages_data)
+        results, candidates = self._validate_batch(messages_data, processed)
+
+        existing_ids = (
+            await self._message_repository.get_existing_message_ids(
+                [message.id for message in candidates.values()]
+                )
+            )
+        new_messages = self._resolve_batch(results, candidates, existing_ids)
+
+        created_messages = await self._message_repository.create_messages(
+            new_messages
+            )
+        self._mark_skipped_duplicates(results, created_messages)
+        return results
+
+    async def get_message_by_id(self, message_id: str) -> Optional[Message]:
         message_uuid_field = UUIDField(message_id)
-        return self._message_repository.get_message_by_id(message_uuid_field)
+        return await self._message_repository.get_message_by_id(
+            message_uuid_field
+            )
 
-    def get_message_by_session_id(
+    async def get_message_by_session_id(
             self,
             session_id: str,
             limit: int = 50,
@@ -51,41 +131,349 @@ class MessageService:
             sender: Optional[str] = None
             ) -> Tuple[List[Message], int]:
         session_uuid_field = UUIDField(session_id)
-        return self._message_repository.get_message_by_session_id(
+        return await self._message_repository.get_message_by_session_id(
             session_uuid_field,
             limit=limit,
             offset=offset,
             sender=sender
             )
 
-    def _validate_message_data(self, message_data: dict) -> Message:
-        content = ContentField(message_data.get('content'))
-        character_count = self._calculate_character_count(content.value)
-        word_count = self._calculate_word_count(content.value)
+    async def get_message_page_by_session_id(
+            self,
+            session_id: str,
+            limit: int = 50,
+            cursor: Optional[str] = None,
+            sender: Optional[str] = None
+            ) -> Tuple[List[Message], Optional[str], Optional[str], int]:
+        session_uuid_field = UUIDField(session_id)
+        cursor_field = CursorField(cursor) if cursor else None
+        messages, has_more = (
+            await self._message_repository.get_message_page_by_session_id(
+                session_uuid_field,
+                limit=limit,
+                cursor=cursor_field,
+                sender=sender
+                )
+            )
+        total_count = (
+            await self._message_repository.count_message_by_session_id(
+                session_uuid_field,
+                sender=sender
+                )
+            )
+        next_cursor, prev_cursor = self._page_cursors(
+            self._entity_positions(messages), has_more, cursor_field
+            )
+        return messages, next_cursor, prev_cursor, total_count
+
+    async def get_message_view_by_id(
+            self,
+            message_id: str
+            ) -> Optional[MessageView]:
+        message_uuid_field = UUIDField(message_id)
+        return await self._message_repository.get_message_view_by_id(
+            message_uuid_field
+            )
+
+    async def get_message_views_by_session_id(
+            self,
+            session_id: str,
+            limit: int = 50,
+            offset: int = 0,
+            sender: Optional[str] = None
+            ) -> Tuple[List[MessageView], int]:
+        session_uuid_field = UUIDField(session_id)
+        return await (
+            self._message_repository.get_message_views_by_session_id(
+                session_uuid_field,
+                limit=limit,
+                offset=offset,
+                sender=sender
+                )
+            )
+
+    async def get_message_view_page_by_session_id(
+            self,
+            session_id: str,
+            limit: int = 50,
+            cursor: Optional[str] = None,
+            sender: Optional[str] = None
+            ) -> Tuple[List[MessageView], Optional[str], Optional[str], int]:
+        session_uuid_field = UUIDField(session_id)
+        cursor_field = CursorField(cursor) if cursor else None
+        repository = self._message_repository
+        views, has_more = (
+            await repository.get_message_view_page_by_session_id(
+                session_uuid_field,
+                limit=limit,
+                cursor=cursor_field,
+                sender=sender
+                )
+            )
+        total_count = await repository.count_message_by_session_id(
+            session_uuid_field,
+            sender=sender
+            )
+        next_cursor, prev_cursor = self._page_cursors(
+            self._view_positions(views), has_more, cursor_field
+            )
+        return views, next_cursor, prev_cursor, total_count
+
+    async def search_messages(
+            self,
+            query: str,
+            session_id: Optional[str] = None,
+            limit: int = 20,
+            cursor: Optional[str] = None
+            ) -> Tuple[List[Tuple[Message, str, float]], Optional[str]]:
+        search_query, session_uuid_field, cursor_field = (
+            self._search_arguments(query, session_id, cursor)
+            )
+        results, has_more = await self._message_repository.search_messages(
+            search_query,
+            session_id=session_uuid_field,
+            limit=limit,
+            cursor=cursor_field
+            )
+        return results, self._search_cursor(results, has_more)
+
+    def _search_arguments(
+            self,
+            query: str,
+            session_id: Optional[str],
+            cursor: Optional[str]
+            ) -> Tuple[SearchQueryField, Optional[UUIDField],
+                       Optional[SearchCursorField]]:
+        return (
+            SearchQueryField(query),
+            UUIDField(session_id) if session_id else None,
+            SearchCursorField(cursor) if cursor else None
+        )
+
+    def _search_cursor(
+            self,
+            results: List[Tuple[Message, str, float]],
+            has_more: bool
+            ) -> Optional[str]:
+        if not has_more or not results:
+            return None
+        last_message, _, last_rank = results[-1]
+        return str(SearchCursorField.from_position(
+            last_rank, last_message.id
+            ))
+
+    def export_messages_by_session_id(
+            self,
+            session_id: str,
+            cursor: Optional[str] = None,
+            sender: Optional[str] = None
+            ) -> AsyncIterator[Tuple[Message, str]]:
+        """
+        Validates the arguments right away and returns an async iterator
+        over every message of the session, oldest first, each one with the
+        cursor that resumes the export after it.
+        """
+        session_uuid_field = UUIDField(session_id)
+        cursor_field = CursorField(cursor) if cursor else None
+        messages = self._message_repository.stream_messages_by_session_id(
+            session_uuid_field,
+            cursor=cursor_field,
+            sender=sender,
+            batch_size=MESSAGE_EXPORT_BATCH_SIZE
+            )
+        return (
+            (message, self._export_cursor(message))
+            async for message in messages
+        )
+
+    def _export_cursor(self, message: Message) -> str:
+        return str(CursorField.from_position(
+            CursorField.NEXT,
+            message.created_at.value,
+            message.id
+            ))
+
+    def _page_cursors(
+            self,
+            positions: Tuple[Tuple[datetime, Any], ...],
+            has_more: bool,
+            cursor: Optional[CursorField]
+            ) -> Tuple[Optional[str], Optional[str]]:
+        """
+        positions holds the (created_at, id) of the first and the last
+        message of the page, and is empty for an empty page.
+        """
+        if not positions:
+            return None, None
+        first, last = positions
+
+        if cursor is not None and cursor.direction == CursorField.PREVIOUS:
+            has_next, has_previous = True, has_more
+        else:
+            has_next, has_previous = has_more, cursor is not None
+
+        next_cursor = prev_cursor = None
+        if has_next:
+            next_cursor = str(CursorField.from_position(
+                CursorField.NEXT, *last
+                ))
+        if has_previous:
+            prev_cursor = str(CursorField.from_position(
+                CursorField.PREVIOUS, *first
+                ))
+        return next_cursor, prev_cursor
+
+    def _entity_positions(
+            self,
+            messages: List[Message]
+            ) -> Tuple[Tuple[datetime, Any], ...]:
+        if not messages:
+            return ()
+        return tuple(
+            (message.created_at.value, message.id)
+            for message in (messages[0], messages[-1])
+        )
+
+    def _view_positions(
+            self,
+            views: List[MessageView]
+            ) -> Tuple[Tuple[datetime, Any], ...]:
+        if not views:
+            return ()
+        return views[0].position, views[-1].position
+
+    def _duplicated_message_exception(self) -> DomainValidationException:
+        return DomainValidationException(
+            message="Mensaje con id registrado",
+            detail="Ya existe un mensaje con el id."
+        )
+
+    def _validate_batch(
+            self,
+            messages_data: List[dict],
+            processed: Optional[List[Any]] = None
+            ) -> Tuple[List[dict], dict]:
+        """
+        Validates every item of a batch. Returns one result per item (the
+        invalid ones already resolved) and the valid messages by index.
+        processed holds the pipeline results when it ran on the process
+        pool.
+        """
+        results = []
+        candidates = {}
+        for index, message_data in enumerate(messages_data):
+            result = {"index": index, "message_id": None, "status": None}
+            results.append(result)
+            try:
+                if not isinstance(message_data, dict):
+                    raise DomainValidationException(
+                        message="Formato de mensaje invalido.",
+                        detail="Cada elemento del lote debe ser un objeto.",
+                        code="INVALID_FORMAT"
+                    )
+                message = self._validate_message_data(
+                    message_data,
+                    self._pipeline_result(processed[index])
+                    if processed else None
+                    )
+            except DomainValidationException as e:
+                result["status"] = "invalid"
+                result["message_id"] = (
+                    message_data.get('message_id')
+                    if isinstance(message_data, dict) else None
+                )
+                result["error"] = e.to_dict()["error"]
+                continue
+
+            result["message_id"] = str(message.id)
+            candidates[index] = message
+
+        return results, candidates
+
+    def _check_batch_size(self, messages_data: List[dict]) -> None:
+        if not messages_data:
+            raise RequiredFieldException(
+                message="El lote de mensajes es requerido.",
+                detail="El lote debe contener al menos un mensaje."
+            )
+        if len(messages_data) > MESSAGE_BATCH_MAX_SIZE:
+            raise DomainValidationException(
+                message="Lote de mensajes demasiado grande.",
+                detail=f"El lote no puede tener más de \
+{MESSAGE_BATCH_MAX_SIZE} mensajes.",
+                code="BATCH_TOO_LARGE"
+            )
+
+    def _resolve_batch(
+            self,
+            results: List[dict],
+            candidates: dict,
+            existing_ids: set
+            ) -> List[Message]:
+        """
+        Marks as duplicates the messages already stored or repeated inside
+        the batch, and returns the ones to insert.
+        """
+        seen_ids = set(existing_ids)
+        new_messages = []
+        for index, message in candidates.items():
+            message_id = str(message.id)
+            if message_id in seen_ids:
+                results[index]["status"] = "duplicate"
+                continue
+            seen_ids.add(message_id)
+            results[index]["status"] = "created"
+            new_messages.append(message)
+
+        return new_messages
+
+    def _mark_skipped_duplicates(
+            self,
+            results: List[dict],
+            created_messages: List[Message]
+            ) -> None:
+        # The repository skips the ids another request stored after the
+        #  lookup of existing ids
+        created_ids = {str(message.id) for message in created_messages}
+        for result in results:
+            if result["status"] == "created" and (
+                    result["message_id"] not in created_ids):
+                result["status"] = "duplicate"
+
+    def _validate_message_data(
+            self,
+            message_data: dict,
+            processed: Optional[Tuple[ContentField, dict]] = None
+            ) -> Message:
+        # Content filter, counts and any registered enrichment stage,
+        #  unless they already ran on the process pool
+        if processed is None:
+            context = self._pipeline.run(message_data)
+            processed = context.content, context.fields
+        content, fields = processed
 
         return Message.create_from_dict({
+            **fields,
             'id': UUIDField(message_data.get('message_id')),
             'session_id': UUIDField(message_data.get('session_id')),
             'content': content,
             'timestamp': DatetimeField(message_data.get('timestamp')),
             'sender': SenderField(message_data.get('sender')),
-            'word_count': word_count,
-            'character_count': character_count,
             'processed_at': DatetimeField(datetime.now())
         })
 
-    def _calculate_character_count(self, content: ContentField) -> int:
-        return len(content.replace(' ', '')) if content else 0
-
-    def _calculate_word_count(self, content: ContentField) -> int:
-        if not content or not content.strip():
-            return 0
-        return len(content.strip().split())
+    def _pipeline_result(
+            self,
+            result: Any
+            ) -> Optional[Tuple[ContentField, dict]]:
+        if isinstance(result, DomainValidationException):
+            raise result
+        return result
 
 
-def get_message_service(
-        message_repository: MessageRepositoryPort = Depends(
-            get_sqlalchemy_message_repository
+def get_async_message_service(
+        message_repository: AsyncMessageRepositoryPort = Depends(
+            get_async_message_repository
             )
-        ) -> 'MessageService':
-    return MessageService(message_repository)
+        ) -> 'AsyncMessageService':
+    return AsyncMessageService(message_repository)
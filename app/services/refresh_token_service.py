@@ -0,0 +1,171 @@
+import hashlib
+import secrets
+import uuid
+from datetime import datetime, timedelta
+from typing import Optional, Tuple
+from fastapi import Depends
+from app.core.config import REFRESH_TOKEN_EXPIRE_DAYS
+from app.domain.entities.refresh_token import RefreshToken
+from app.domain.ports.async_refresh_token_repository_port import (
+    AsyncRefreshTokenRepositoryPort
+)
+from app.domain.value_objects import UUIDField
+from app.domain.exceptions import (
+    DomainValidationException,
+    RequiredFieldException
+)
+from app.infrastructure.persistence.repositories \
+    .async_refresh_token_repository import get_async_refresh_token_repository
+
+
+class AsyncRefreshTokenService:
+    """
+    Issues opaque refresh tokens and exchanges them for new ones, so a
+    client renews its access token without sending the password again.
+    Only the SHA-256 digest of each token is stored, and checking a token
+    is a single primary key lookup.
+
+    Every refresh rotates the token. Presenting a token that was already
+    rotated or revoked revokes its whole family, since it means the token
+    leaked.
+    """
+
+    def __init__(
+            self,
+            refresh_token_repository: AsyncRefreshTokenRepositoryPort,
+            expire_days: int = REFRESH_TOKEN_EXPIRE_DAYS
+            ):
+        self._refresh_token_repository = refresh_token_repository
+        self._expire_days = expire_days
+
+    async def issue_refresh_token(self, user_id: UUIDField) -> str:
+        token, refresh_token = self._new_refresh_token(
+            user_id, family_id=str(uuid.uuid4())
+            )
+        await self._refresh_token_repository.create_refresh_token(
+            refresh_token
+            )
+        return token
+
+    async def rotate_refresh_token(
+            self,
+            token: str
+            ) -> Tuple[UUIDField, str]:
+        """
+        Returns the user of the token and the refresh token that replaces
+        it.
+        """
+        stored = await self._refresh_token_repository.get_refresh_token(
+            self._token_hash(token)
+            )
+        await self._check_active(stored)
+
+        new_token, new_refresh_token = self._new_refresh_token(
+            stored.user_id, family_id=stored.family_id
+            )
+        if not await self._refresh_token_repository.rotate_refresh_token(
+            stored.token_hash,
+            new_refresh_token
+        ):
+            await self._refresh_token_repository.revoke_refresh_token_family(
+                stored.family_id
+                )
+            raise self._revoked_exception()
+        return stored.user_id, new_token
+
+    async def revoke_refresh_token(
+            self,
+            token: str,
+            user_id: Optional[UUIDField] = None
+            ) -> None:
+        """
+        Revokes the family of the token. With user_id, the token must
+        belong to that user.
+        """
+        stored = await self._refresh_token_repository.get_refresh_token(
+            self._token_hash(token)
+            )
+        self._check_owner(stored, user_id)
+        await self._refresh_token_repository.revoke_refresh_token_family(
+            stored.family_id
+            )
+
+    async def revoke_user_refresh_tokens(self, user_id: UUIDField) -> int:
+        return (
+            await self._refresh_token_repository.revoke_user_refresh_tokens(
+                user_id
+                )
+        )
+
+    def _check_owner(
+            self,
+            stored: Optional[RefreshToken],
+            user_id: Optional[UUIDField]
+            ) -> None:
+        if stored is None or (
+                user_id is not None and stored.user_id != user_id):
+            raise self._invalid_exception()
+
+    async def _check_active(self, stored: Optional[RefreshToken]) -> None:
+        if stored is None:
+            raise self._invalid_exception()
+        if stored.is_revoked:
+            await self._refresh_token_repository.revoke_refresh_token_family(
+                stored.family_id
+                )
+            raise self._revoked_exception()
+        if stored.is_expired(datetime.utcnow()):
+            raise self._expired_exception()
+
+    def _new_refresh_token(
+            self,
+            user_id: UUIDField,
+            family_id: str
+            ) -> Tuple[str, RefreshToken]:
+        token = secrets.token_urlsafe(32)
+        now = datetime.utcnow()
+        return token, RefreshToken(
+            token_hash=self._token_hash(token),
+            user_id=user_id,
+            family_id=family_id,
+            expires_at=now + timedelta(days=self._expire_days),
+            created_at=now
+        )
+
+    def _token_hash(self, token: str) -> str:
+        if not isinstance(token, str) or not token:
+            raise RequiredFieldException(
+                message="El refresh token es requerido.",
+                detail="El campo refresh_token no puede ser nulo."
+                )
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    def _invalid_exception(self) -> DomainValidationException:
+        return DomainValidationException(
+            message="Refresh token inválido.",
+            detail="El refresh token no existe.",
+            code="INVALID_REFRESH_TOKEN"
+        )
+
+    def _revoked_exception(self) -> DomainValidationException:
+        return DomainValidationException(
+            message="Refresh token revocado.",
+            detail="El refresh token ya fue usado o revocado. "
+            "Inicia sesión nuevamente.",
+            code="REFRESH_TOKEN_REVOKED"
+        )
+
+    def _expired_exception(self) -> DomainValidationException:
+        return DomainValidationException(
+            message="Refresh token expirado.",
+            detail="El refresh token ha expirado. Inicia sesión nuevamente.",
+            code="REFRESH_TOKEN_EXPIRED"
+        )
+
+
+def get_async_refresh_token_service(
+        refresh_token_repository: AsyncRefreshTokenRepositoryPort = Depends(
+            get_async_refresh_token_repository
+            )
+        ) -> 'AsyncRefreshTokenService':
+    return AsyncRefreshTokenService(refresh_token_repository)
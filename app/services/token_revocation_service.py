@@ -0,0 +1,75 @@
+from datetime import datetime
+from fastapi import Depends
+from app.core.revocation import RevocationList, revocation_list
+from app.domain.ports.async_token_revocation_repository_port import (
+    AsyncTokenRevocationRepositoryPort
+)
+from app.domain.value_objects import UUIDField
+from app.infrastructure.persistence.repositories \
+    .async_token_revocation_repository import (
+        get_async_token_revocation_repository
+    )
+
+
+class AsyncTokenRevocationService:
+    """
+    Revokes access tokens, one by its jti or every token of a user by
+    bumping the user's token version, and answers whether a token payload
+    was revoked from the in-memory revocation list.
+    """
+
+    def __init__(
+            self,
+            token_revocation_repository: AsyncTokenRevocationRepositoryPort,
+            revocations: RevocationList = revocation_list
+            ):
+        self._token_revocation_repository = token_revocation_repository
+        self._revocations = revocations
+
+    async def get_user_token_version(self, user_id: UUIDField) -> int:
+        return await (
+            self._token_revocation_repository.get_user_token_version(user_id)
+        )
+
+    async def revoke_token(self, payload: dict) -> None:
+        await self._token_revocation_repository.revoke_token(
+            payload["jti"], self._expires_at(payload)
+            )
+        self._revocations.revoke_token(payload["jti"])
+
+    async def revoke_user_tokens(self, user_id: UUIDField) -> int:
+        repository = self._token_revocation_repository
+        version = await repository.increment_user_token_version(user_id)
+        self._revocations.set_user_version(str(user_id), version)
+        return version
+
+    async def refresh_revocations(self) -> None:
+        if not self._revocations.claim_refresh():
+            return
+        try:
+            jtis, user_versions = (
+                await self._token_revocation_repository
+                .get_token_revocations(datetime.utcnow())
+            )
+        except Exception:
+            self._revocations.retry_refresh()
+            raise
+        self._revocations.replace(jtis, user_versions)
+
+    def is_revoked(self, payload: dict) -> bool:
+        return self._revocations.is_revoked(
+            payload.get("jti"),
+            payload.get("sub"),
+            payload.get("ver", 0)
+        )
+
+    def _expires_at(self, payload: dict) -> datetime:
+        return datetime.utcfromtimestamp(payload["exp"])
+
+
+def get_async_token_revocation_service(
+        token_revocation_repository: AsyncTokenRevocationRepositoryPort = (
+            Depends(get_async_token_revocation_repository)
+            )
+        ) -> 'AsyncTokenRevocationService':
+    return AsyncTokenRevocationService(token_revocation_repository)
@@ -1,8 +1,10 @@
 import uuid
 from fastapi import Depends
-from passlib.context import CryptContext
+from app.core.password_hasher import password_hasher
 from app.domain.entities.user import User
-from app.domain.ports.user_repository_port import UserRepositoryPort
+from app.domain.ports.async_user_repository_port import (
+    AsyncUserRepositoryPort
+)
 
 from app.domain.value_objects import (
     UUIDField,
@@ -12,19 +14,22 @@ from app.domain.value_objects import (
     PasswordHashField
 )
 from app.domain.exceptions import DomainValidationException
-from app.infrastructure.persistence.repositories.user_repository import (
-    get_sqlalchemy_user_repository
+from app.infrastructure.persistence.repositories.async_user_repository import (
+    get_async_user_repository
 )
 
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
+class AsyncUserService:
+    """
+    Registers and authenticates users for the routes and the
+    get_current_user dependency. Every repository call is awaited, and
+    bcrypt runs on the password hasher pool instead of the event loop.
+    """
 
-class UserService:
-    def __init__(self, user_repository: UserRepositoryPort):
+    def __init__(self, user_repository: AsyncUserRepositoryPort):
         self._user_repository = user_repository
 
-    def register_user(
+    async def register_user(
             self,
             user_data: dict
             ) -> User:
@@ -32,22 +37,17 @@ class UserService:
         email = EmailField(user_data.get('email'))
         username = UsernameField(user_data.get('username'))
 
-        if self._user_repository.get_user_by_email(email):
-            raise DomainValidationException(
-                message="Usuario ya se encuentra registrado",
-                detail=f"Ya existe un usuario con el email '{email}'.",
-                code="USER_ALREADY_REGISTERED"
-            )
-        if self._user_repository.get_user_by_username(username):
-            raise DomainValidationException(
-                message="Usuario ya se encuentra registrado",
-                detail=f"Ya existe un usuario con el nombre de\
-                    usuario '{username}'.",
-                code="USER_ALREADY_REGISTERED"
+        email_taken, username_taken = (
+            await self._user_repository.exists_by_email_or_username(
+                email, username
+                )
+        )
+        self._check_user_available(
+            email, username, email_taken, username_taken
             )
 
         hashed_password = PasswordHashField(
-            self._get_password_hash(password.value)
+            await password_hasher.hash_async(password.value)
         )
 
         new_user_entity = User(
@@ -57,25 +57,29 @@ class UserService:
             password_hash=hashed_password
         )
 
-        created_user = self._user_repository.create_user(new_user_entity)
+        created_user = await self._user_repository.create_user_if_absent(
+            new_user_entity
+            )
+        if created_user is None:
+            raise self._user_already_registered()
         return created_user
 
-    def get_user_by_id(self, user_id: str) -> User:
+    async def get_user_by_id(self, user_id: str) -> User:
         user_uuid_field = UUIDField(user_id)
-        return self._user_repository.get_user_by_id(user_uuid_field)
+        return await self._user_repository.get_user_by_id(user_uuid_field)
 
-    def authenticate_user(self, user_credentials: dict) -> User:
+    async def authenticate_user(self, user_credentials: dict) -> User:
         email = EmailField(user_credentials.get('email'))
         password = PasswordRawField(user_credentials.get('password'))
 
-        user = self._user_repository.get_user_by_email(email)
+        user = await self._user_repository.get_user_by_email(email)
         if not user:
             raise DomainValidationException(
                 message="Credenciales incorrectas.",
                 detail="Se ingresaron credenciales incorrectas",
                 code="INVALID_CREDENTIALS"
             )
-        if not self._verify_password(
+        if not await password_hasher.verify_async(
             password.value,
             user.password_hash.value
         ):
@@ -87,20 +91,40 @@ class UserService:
 
         return user
 
-    def _get_password_hash(self, password: str) -> str:
-        return pwd_context.hash(password)
+    def _check_user_available(
+            self,
+            email: EmailField,
+            username: UsernameField,
+            email_taken: bool,
+            username_taken: bool
+            ) -> None:
+        if email_taken:
+            raise self._user_already_registered(
+                f"Ya existe un usuario con el email '{email}'."
+            )
+        if username_taken:
+            raise self._user_already_registered(
+                f"Ya existe un usuario con el nombre de\
+                    usuario '{username}'."
+            )
 
-    def _verify_password(
+    def _user_already_registered(
             self,
-            plain_password: str,
-            hashed_password: str
-            ) -> bool:
-        return pwd_context.verify(plain_password, hashed_password)
+            detail: str = "Ya existe un usuario con el email o el nombre "
+            "de usuario."
+            ) -> DomainValidationException:
+        # Also raised when the UNIQUE constraints reject a concurrent
+        #  registration that passed the existence check
+        return DomainValidationException(
+            message="Usuario ya se encuentra registrado",
+            detail=detail,
+            code="USER_ALREADY_REGISTERED"
+        )
 
 
-def get_user_service(
-        user_repository: UserRepositoryPort = Depends(
-            get_sqlalchemy_user_repository
+def get_async_user_service(
+        user_repository: AsyncUserRepositoryPort = Depends(
+            get_async_user_repository
             )
-        ) -> 'UserService':
-    return UserService(user_repository)
+        ) -> 'AsyncUserService':
+    return AsyncUserService(user_repository)
@@ -0,0 +1,125 @@
+"""
+Helpers shared by the benchmark scripts: a throwaway uvicorn server on a
+temporary SQLite database, an authenticated HTTP client and latency
+percentiles.
+"""
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from contextlib import contextmanager
+
+import httpx
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BENCH_PASSWORD = "BenchPassword123"
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@contextmanager
+def temporary_database_url():
+    with tempfile.TemporaryDirectory() as directory:
+        yield f"sqlite:///{directory}/bench.db"
+
+
+@contextmanager
+def running_server(env: dict = None, database_url: str = None):
+    """Starts `uvicorn main:app` in a subprocess and yields its base URL."""
+    with temporary_database_url() as default_url:
+        port = free_port()
+        process_env = {
+            **os.environ,
+            "DATABASE_URL": database_url or default_url,
+            **(env or {}),
+        }
+        process = subprocess.Popen(
+            [
+                sys.executable, "-m", "uvicorn", "main:app",
+                "--port", str(port), "--log-level", "warning",
+            ],
+            cwd=ROOT_DIR,
+            env=process_env,
+        )
+        base_url = f"http://127.0.0.1:{port}"
+        try:
+            _wait_until_ready(base_url)
+            yield base_url
+        finally:
+            process.terminate()
+            process.wait(timeout=30)
+
+
+def _wait_until_ready(base_url: str, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(f"{base_url}/").status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        time.sleep(0.1)
+    raise RuntimeError(f"Server at {base_url} did not start")
+
+
+def register_and_login(base_url: str) -> dict:
+    """Registers a fresh user and returns the Authorization header."""
+    suffix = uuid.uuid4().hex[:10]
+    credentials = {
+        "email": f"bench_{suffix}@example.com",
+        "username": f"bench_{suffix}",
+        "password": BENCH_PASSWORD,
+    }
+    httpx.post(
+        f"{base_url}/api/users/register", json=credentials
+    ).raise_for_status()
+    response = httpx.post(
+        f"{base_url}/api/auth/token",
+        json={"email": credentials["email"], "password": BENCH_PASSWORD},
+    )
+    response.raise_for_status()
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+def message_payload(session_id: str, content: str = None) -> dict:
+    return {
+        "message_id": str(uuid.uuid4()),
+        "session_id": session_id,
+        "content": content or "Hola, este es un mensaje de prueba.",
+        "timestamp": "2023-06-15T14:30:00Z",
+        "sender": "user",
+    }
+
+
+def percentiles(samples_ms: list) -> dict:
+    ordered = sorted(samples_ms)
+
+    def pick(fraction: float) -> float:
+        index = min(len(ordered) - 1, int(round(fraction * len(ordered))))
+        return ordered[index]
+
+    return {
+        "p50": pick(0.50),
+        "p95": pick(0.95),
+        "p99": pick(0.99),
+        "mean": statistics.fmean(ordered),
+    }
+
+
+def print_table(title: str, rows: list, columns: list) -> None:
+    print(f"\n{title}")
+    print("  ".join(f"{column:>18}" for column in columns))
+    for row in rows:
+        print("  ".join(
+            f"{row[column]:>18.3f}" if isinstance(row[column], float)
+            else f"{row[column]:>18}"
+            for column in columns
+        ))
@@ -0,0 +1,96 @@
+"""
+p99 latency of GET /api/messages/{session_id} under concurrent clients,
+sync engine (DATABASE_ASYNC=false) against the async engine
+(DATABASE_ASYNC=true). A share of the clients keep writing messages so
+reads and writes compete for the event loop.
+
+    python -m benchmarks.bench_async_engine --clients 50 --duration 15
+"""
+import argparse
+import asyncio
+import time
+import uuid
+
+import httpx
+
+from benchmarks._common import (
+    message_payload,
+    percentiles,
+    print_table,
+    register_and_login,
+    running_server,
+)
+
+
+async def _client_loop(client, headers, session_id, deadline, samples,
+                       write):
+    while time.monotonic() < deadline:
+        started = time.perf_counter()
+        if write:
+            await client.post(
+                "/api/messages/",
+                json=message_payload(session_id),
+                headers=headers,
+            )
+        else:
+            await client.get(
+                f"/api/messages/{session_id}",
+                params={"limit": 50},
+                headers=headers,
+            )
+            samples.append((time.perf_counter() - started) * 1000)
+
+
+async def _drive(base_url, headers, clients, duration, writers):
+    session_id = str(uuid.uuid4())
+    limits = httpx.Limits(max_connections=clients)
+    async with httpx.AsyncClient(
+        base_url=base_url, limits=limits, timeout=60
+    ) as client:
+        for _ in range(200):
+            await client.post(
+                "/api/messages/",
+                json=message_payload(session_id),
+                headers=headers,
+            )
+        samples = []
+        deadline = time.monotonic() + duration
+        await asyncio.gather(*(
+            _client_loop(
+                client, headers, session_id, deadline, samples,
+                write=index < writers,
+            )
+            for index in range(clients)
+        ))
+    return samples
+
+
+def run(clients: int, duration: float, writers: int) -> None:
+    rows = []
+    for mode in ("false", "true"):
+        with running_server({"DATABASE_ASYNC": mode}) as base_url:
+            headers = register_and_login(base_url)
+            samples = asyncio.run(
+                _drive(base_url, headers, clients, duration, writers)
+            )
+        rows.append({
+            "mode": "async" if mode == "true" else "sync",
+            "reads": len(samples),
+            "reads/s": len(samples) / duration,
+            **percentiles(samples),
+        })
+    print_table(
+        f"GET /api/messages/{{session_id}} ({clients} clients, "
+        f"{writers} writers, {duration:.0f}s) latency in ms",
+        rows,
+        ["mode", "reads", "reads/s", "p50", "p95", "p99"],
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--clients", type=int, default=50)
+    parser.add_argument("--duration", type=float, default=15.0)
+    parser.add_argument("--writers", type=int, default=5)
+    arguments = parser.parse_args()
+    run(arguments.clients, arguments.duration, arguments.writers)
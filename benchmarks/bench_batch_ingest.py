@@ -0,0 +1,73 @@
+"""
+Ingest throughput over HTTP on SQLite: POST /api/messages/ one message at
+a time against POST /api/messages/batch.
+
+    python -m benchmarks.bench_batch_ingest --messages 5000 --batch-size 500
+"""
+import argparse
+import time
+import uuid
+
+import httpx
+
+from benchmarks._common import (
+    message_payload,
+    print_table,
+    register_and_login,
+    running_server,
+)
+
+
+def ingest_single(client, headers, messages) -> float:
+    started = time.perf_counter()
+    for message in messages:
+        client.post(
+            "/api/messages/", json=message, headers=headers
+        ).raise_for_status()
+    return time.perf_counter() - started
+
+
+def ingest_batch(client, headers, messages, batch_size) -> float:
+    started = time.perf_counter()
+    for first in range(0, len(messages), batch_size):
+        response = client.post(
+            "/api/messages/batch",
+            json=messages[first:first + batch_size],
+            headers=headers,
+        )
+        response.raise_for_status()
+        assert response.json()["summary"]["invalid"] == 0
+    return time.perf_counter() - started
+
+
+def run(messages_count: int, batch_size: int) -> None:
+    with running_server() as base_url:
+        headers = register_and_login(base_url)
+        with httpx.Client(base_url=base_url, timeout=120) as client:
+            session_id = str(uuid.uuid4())
+            single = ingest_single(client, headers, [
+                message_payload(session_id) for _ in range(messages_count)
+            ])
+            session_id = str(uuid.uuid4())
+            batch = ingest_batch(client, headers, [
+                message_payload(session_id) for _ in range(messages_count)
+            ], batch_size)
+
+    print_table(
+        f"Ingest of {messages_count} messages",
+        [
+            {"route": "single", "seconds": single,
+             "msg/s": messages_count / single, "speedup": 1.0},
+            {"route": f"batch({batch_size})", "seconds": batch,
+             "msg/s": messages_count / batch, "speedup": single / batch},
+        ],
+        ["route", "seconds", "msg/s", "speedup"],
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=5000)
+    parser.add_argument("--batch-size", type=int, default=500)
+    arguments = parser.parse_args()
+    run(arguments.messages, arguments.batch_size)
@@ -0,0 +1,166 @@
+"""
+Storage size and listing latency of the messages table on SQLite for three
+layouts: the original single column indexes, the composite indexes, and
+the composite indexes on the compact schema (16-byte UUIDs, epoch
+microsecond timestamps). Sizes are read from the dbstat virtual table.
+
+    python -m benchmarks.bench_compact_schema --messages 200000
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from benchmarks._common import ROOT_DIR, print_table
+
+LAYOUTS = {
+    "single_indexes": {"MESSAGE_COMPACT_SCHEMA": "false"},
+    "composite": {"MESSAGE_COMPACT_SCHEMA": "false"},
+    "compact": {"MESSAGE_COMPACT_SCHEMA": "true"},
+}
+QUERY_REPEATS = 200
+
+
+def _child(layout: str, messages: int, sessions: int) -> dict:
+    from sqlalchemy import text
+    from app.domain.entities.message import Message
+    from app.domain.value_objects import (
+        UUIDField,
+        SenderField,
+        ContentField,
+        DatetimeField
+    )
+    from app.infrastructure.persistence.database import (
+        SessionLocal,
+        create_db_tables,
+        engine
+    )
+    from app.infrastructure.persistence.orm_models import MessageORM
+    from app.infrastructure.persistence.repositories.message_repository \
+        import SQLAlchemyMessageRepository
+
+    create_db_tables()
+    if layout == "single_indexes":
+        with engine.begin() as connection:
+            for index in MessageORM.__table__.indexes:
+                if len(index.columns) > 1:
+                    connection.execute(text(f'DROP INDEX "{index.name}"'))
+            connection.execute(text(
+                "CREATE INDEX ix_messages_session_id ON messages (session_id)"
+            ))
+
+    session_ids = [str(uuid.uuid4()) for _ in range(sessions)]
+    started_at = datetime(2024, 1, 1)
+    db = SessionLocal()
+    repository = SQLAlchemyMessageRepository(db)
+    chunk = []
+    for number in range(messages):
+        moment = DatetimeField(started_at + timedelta(seconds=number))
+        chunk.append(Message(
+            id=UUIDField(str(uuid.uuid4())),
+            session_id=UUIDField(session_ids[number % sessions]),
+            content=ContentField(f"Mensaje de prueba numero {number}"),
+            timestamp=moment,
+            sender=SenderField("user" if number % 3 else "system"),
+            word_count=4,
+            character_count=26,
+            processed_at=moment,
+            created_at=moment,
+            updated_at=moment,
+        ))
+        if len(chunk) == 5000:
+            repository.create_messages(chunk)
+            chunk = []
+    repository.create_messages(chunk)
+
+    session_field = UUIDField(session_ids[0])
+    timings = {}
+    for sender in (None, "user"):
+        started = time.perf_counter()
+        for _ in range(QUERY_REPEATS):
+            repository.get_message_by_session_id(
+                session_field, limit=50, sender=sender
+            )
+        timings[sender or "all"] = (
+            (time.perf_counter() - started) * 1000 / QUERY_REPEATS
+        )
+
+    plan = db.execute(
+        text(
+            "EXPLAIN QUERY PLAN SELECT * FROM messages "
+            "WHERE session_id = :session_id AND sender = 'user' "
+            "ORDER BY created_at DESC, id DESC LIMIT 50"
+        ),
+        {"session_id": db.execute(
+            text("SELECT session_id FROM messages LIMIT 1")
+        ).scalar()},
+    ).all()
+    sizes = dict(db.execute(text(
+        "SELECT name, SUM(pgsize) FROM dbstat "
+        "WHERE name NOT LIKE 'sqlite_%' OR name LIKE 'sqlite_autoindex_m%' "
+        "GROUP BY name"
+    )).all())
+    db.close()
+
+    index_bytes = sum(
+        size for name, size in sizes.items()
+        if name.startswith(("ix_messages", "sqlite_autoindex_messages"))
+    )
+    return {
+        "table_mb": sizes["messages"] / 2 ** 20,
+        "indexes_mb": index_bytes / 2 ** 20,
+        "list_ms": timings["all"],
+        "sender_list_ms": timings["user"],
+        "temp_sort": any("TEMP B-TREE" in row[-1] for row in plan),
+    }
+
+
+def run(messages: int, sessions: int) -> None:
+    rows = []
+    for layout, env in LAYOUTS.items():
+        with tempfile.TemporaryDirectory() as directory:
+            output = subprocess.run(
+                [
+                    sys.executable, "-m", "benchmarks.bench_compact_schema",
+                    "--child", layout, "--messages", str(messages),
+                    "--sessions", str(sessions),
+                ],
+                cwd=ROOT_DIR,
+                env={
+                    **os.environ,
+                    **env,
+                    "DATABASE_URL": f"sqlite:///{directory}/bench.db",
+                },
+                check=True, capture_output=True, text=True,
+            ).stdout
+        rows.append({
+            "layout": layout,
+            **json.loads(output.strip().splitlines()[-1]),
+        })
+
+    print_table(
+        f"{messages} messages in {sessions} sessions (sizes in MiB, "
+        f"latency of a 50 row page in ms)",
+        rows,
+        ["layout", "table_mb", "indexes_mb", "list_ms", "sender_list_ms",
+         "temp_sort"],
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=200000)
+    parser.add_argument("--sessions", type=int, default=20)
+    parser.add_argument("--child", choices=LAYOUTS)
+    arguments = parser.parse_args()
+    if arguments.child:
+        print(json.dumps(_child(
+            arguments.child, arguments.messages, arguments.sessions
+        )))
+    else:
+        run(arguments.messages, arguments.sessions)
@@ -0,0 +1,117 @@
+"""
+Cost of masking a message with the ContentField moderation engines for
+word lists of several sizes: the sequential re.sub per word, the single
+trie-shaped regex and the Aho-Corasick automaton. Every engine output is
+checked against the sequential one. The single regex is only built for
+lists without overlapping words, random lists of 1k words and more
+always have some.
+
+    python -m benchmarks.bench_content_filter --sizes 4,1000,50000
+"""
+import argparse
+import os
+import random
+import string
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from app.domain.content_filter import (  # noqa: E402
+    DEFAULT_INAPPROPRIATE_WORDS,
+    AhoCorasickFilterEngine,
+    RegexFilterEngine,
+    SequentialFilterEngine,
+)
+from benchmarks._common import percentiles, print_table  # noqa: E402
+
+ENGINES = (SequentialFilterEngine, RegexFilterEngine, AhoCorasickFilterEngine)
+
+
+def _word_list(size: int) -> list:
+    words = list(DEFAULT_INAPPROPRIATE_WORDS[:size])
+    seen = set(words)
+    while len(words) < size:
+        word = "".join(
+            random.choice(string.ascii_lowercase)
+            for _ in range(random.randint(5, 10))
+        )
+        if word not in seen:
+            seen.add(word)
+            words.append(word)
+    return words
+
+
+def _messages(words: list, count: int) -> list:
+    filler = ["hola", "como", "estas", "el", "mensaje", "de", "chat", "hoy"]
+    messages = []
+    for _ in range(count):
+        tokens = random.choices(filler, k=random.randint(10, 40))
+        for _ in range(random.randint(0, 3)):
+            tokens.insert(
+                random.randrange(len(tokens) + 1),
+                random.choice(words).upper()
+            )
+        messages.append(" ".join(tokens) + ".")
+    return messages
+
+
+def run(sizes: list, messages_count: int) -> None:
+    rows = []
+    for size in sizes:
+        words = _word_list(size)
+        messages = _messages(words, messages_count)
+        expected = None
+        for engine_class in ENGINES:
+            started = time.perf_counter()
+            try:
+                engine = engine_class(words)
+            except ValueError:
+                rows.append({
+                    "words": size, "engine": engine_class.name,
+                    "build ms": "-", "msgs/s": "-", "p50": "-",
+                    "p95": "-", "p99": "-", "mean": "-",
+                })
+                continue
+            build_ms = (time.perf_counter() - started) * 1000
+
+            samples = []
+            output = []
+            for message in messages:
+                started = time.perf_counter()
+                output.append(engine.mask(message))
+                samples.append((time.perf_counter() - started) * 1_000_000)
+            if expected is None:
+                expected = output
+            elif output != expected:
+                raise SystemExit(
+                    f"{engine.name} output differs from sequential "
+                    f"for {size} words"
+                )
+            rows.append({
+                "words": size,
+                "engine": engine.name,
+                "build ms": build_ms,
+                "msgs/s": len(samples) / (sum(samples) / 1_000_000),
+                **percentiles(samples),
+            })
+    print_table(
+        f"ContentField masking ({messages_count} messages per list), "
+        f"latency in µs",
+        rows,
+        ["words", "engine", "build ms", "msgs/s", "p50", "p95", "p99",
+         "mean"],
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="4,1000,50000")
+    parser.add_argument("--messages", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=17)
+    arguments = parser.parse_args()
+    random.seed(arguments.seed)
+    run(
+        [int(size) for size in arguments.sizes.split(",")],
+        arguments.messages
+    )
@@ -0,0 +1,128 @@
+"""
+Page latency of the session listing at increasing depths, OFFSET/LIMIT
+against keyset (cursor) pagination, on a single session with --rows
+messages.
+
+    python -m benchmarks.bench_cursor_pagination --rows 1000000
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta
+
+_DIRECTORY = tempfile.mkdtemp()
+os.environ.setdefault(
+    "DATABASE_URL", f"sqlite:///{_DIRECTORY}/bench_pagination.db"
+)
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from sqlalchemy import insert  # noqa: E402
+
+from app.domain.value_objects import CursorField, UUIDField  # noqa: E402
+from app.infrastructure.persistence.database import (  # noqa: E402
+    SessionLocal,
+    create_db_tables,
+)
+from app.infrastructure.persistence.orm_models import MessageORM  # noqa: E402
+from app.infrastructure.persistence.repositories.message_repository import (  # noqa: E402,E501
+    SQLAlchemyMessageRepository,
+)
+from benchmarks._common import print_table  # noqa: E402
+
+PAGE_SIZE = 50
+
+
+def seed(db, session_id: str, rows: int, chunk: int = 20000) -> None:
+    start = datetime(2024, 1, 1)
+    for first in range(0, rows, chunk):
+        db.execute(insert(MessageORM), [
+            {
+                "id": str(uuid.uuid4()),
+                "session_id": session_id,
+                "content": f"Mensaje numero {index}",
+                "timestamp": start + timedelta(seconds=index),
+                "sender": "user" if index % 2 else "system",
+                "word_count": 2,
+                "character_count": 14,
+                "processed_at": start + timedelta(seconds=index),
+                "created_at": start + timedelta(milliseconds=index),
+                "updated_at": start + timedelta(milliseconds=index),
+            }
+            for index in range(first, min(rows, first + chunk))
+        ])
+        db.commit()
+
+
+def timed(callable_, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        callable_()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def run(rows: int, repeat: int) -> None:
+    create_db_tables()
+    db = SessionLocal()
+    session_id = str(uuid.uuid4())
+    started = time.perf_counter()
+    seed(db, session_id, rows)
+    print(f"Seeded {rows} messages in {time.perf_counter() - started:.1f}s")
+
+    repository = SQLAlchemyMessageRepository(db)
+    session_field = UUIDField(session_id)
+    depths = sorted({
+        depth for depth in (0, 1000, 10000, 100000, rows // 2,
+                            rows - PAGE_SIZE)
+        if 0 <= depth <= rows - PAGE_SIZE
+    })
+
+    results = []
+    for depth in depths:
+        cursor = None
+        if depth:
+            boundary, _ = repository.get_message_by_session_id(
+                session_field, limit=1, offset=depth - 1
+            )
+            cursor = CursorField.from_position(
+                CursorField.NEXT,
+                boundary[0].created_at.value,
+                boundary[0].id,
+            )
+        offset_ms = timed(
+            lambda: repository.get_message_by_session_id(
+                session_field, limit=PAGE_SIZE, offset=depth
+            ),
+            repeat,
+        )
+        cursor_ms = timed(
+            lambda: repository.get_message_page_by_session_id(
+                session_field, limit=PAGE_SIZE, cursor=cursor
+            ),
+            repeat,
+        )
+        results.append({
+            "depth": depth,
+            "offset_ms": offset_ms,
+            "cursor_ms": cursor_ms,
+        })
+
+    db.close()
+    print_table(
+        f"Median page latency ({PAGE_SIZE} rows, {rows} rows in session)",
+        results,
+        ["depth", "offset_ms", "cursor_ms"],
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=10)
+    arguments = parser.parse_args()
+    run(arguments.rows, arguments.repeat)
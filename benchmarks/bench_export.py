@@ -0,0 +1,112 @@
+"""
+Time and bytes needed to read a whole session over HTTP: walking
+GET /api/messages/{session_id} 100 rows at a time (offset and cursor)
+against one GET /api/messages/{session_id}/export stream, plain and gzip.
+
+    python -m benchmarks.bench_export --messages 50000
+"""
+import argparse
+import time
+import uuid
+
+import httpx
+
+from benchmarks._common import (
+    message_payload,
+    print_table,
+    register_and_login,
+    running_server,
+)
+
+PAGE_SIZE = 100
+
+
+def seed(client, headers, session_id: str, messages: int) -> None:
+    for first in range(0, messages, 500):
+        client.post(
+            "/api/messages/batch",
+            json=[
+                message_payload(session_id)
+                for _ in range(min(500, messages - first))
+            ],
+            headers=headers,
+        ).raise_for_status()
+
+
+def walk_pages(client, headers, session_id: str, pagination: str) -> dict:
+    received = wire_bytes = 0
+    cursor, offset = None, 0
+    started = time.perf_counter()
+    while True:
+        params = {"limit": PAGE_SIZE, "pagination": pagination}
+        if pagination == "cursor" and cursor:
+            params["cursor"] = cursor
+        if pagination == "offset":
+            params["offset"] = offset
+        response = client.get(
+            f"/api/messages/{session_id}", params=params, headers=headers
+        )
+        response.raise_for_status()
+        wire_bytes += len(response.content)
+        page = response.json()
+        received += len(page["messages"])
+        offset += PAGE_SIZE
+        cursor = page["pagination"].get("next_cursor")
+        if not page["pagination"]["has_next"]:
+            break
+    return {
+        "seconds": time.perf_counter() - started,
+        "messages": received,
+        "wire_mb": wire_bytes / 2 ** 20,
+    }
+
+
+def export(client, headers, session_id: str, encoding: str) -> dict:
+    received = wire_bytes = 0
+    started = time.perf_counter()
+    with client.stream(
+        "GET",
+        f"/api/messages/{session_id}/export",
+        headers={**headers, "Accept-Encoding": encoding},
+    ) as response:
+        response.raise_for_status()
+        for line in response.iter_lines():
+            if line:
+                received += 1
+        wire_bytes = response.num_bytes_downloaded
+    return {
+        "seconds": time.perf_counter() - started,
+        "messages": received,
+        "wire_mb": wire_bytes / 2 ** 20,
+    }
+
+
+def run(messages: int) -> None:
+    with running_server() as base_url:
+        headers = register_and_login(base_url)
+        with httpx.Client(base_url=base_url, timeout=300) as client:
+            session_id = str(uuid.uuid4())
+            seed(client, headers, session_id, messages)
+            rows = [
+                {"read": "offset pages",
+                 **walk_pages(client, headers, session_id, "offset")},
+                {"read": "cursor pages",
+                 **walk_pages(client, headers, session_id, "cursor")},
+                {"read": "export",
+                 **export(client, headers, session_id, "identity")},
+                {"read": "export gzip",
+                 **export(client, headers, session_id, "gzip")},
+            ]
+
+    print_table(
+        f"Full read of a {messages} message session",
+        rows,
+        ["read", "seconds", "messages", "wire_mb"],
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=50000)
+    arguments = parser.parse_args()
+    run(arguments.messages)
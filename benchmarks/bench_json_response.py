@@ -0,0 +1,104 @@
+"""
+Serialization of message listing payloads of 1, 100 and 10,000 messages
+from the read model: the previous path (jsonable_encoder, then the
+stdlib json of JSONResponse), the app default ORJSONResponse after
+jsonable_encoder (routes returning a dict), and ORJSONResponse built
+directly by the route. Checks that every path writes the same bytes.
+
+    python -m benchmarks.bench_json_response
+"""
+import argparse
+import os
+import random
+import sys
+import timeit
+import uuid
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from fastapi.responses import JSONResponse, ORJSONResponse  # noqa: E402
+
+from app.domain.read_models.message_view import MessageView  # noqa: E402
+from benchmarks._common import print_table  # noqa: E402
+
+WORDS = ["hola", "cómo", "estás", "mensaje", "de", "chat", "envío", "hoy"]
+PATHS = {
+    "jsonable_encoder + json": (
+        lambda content: JSONResponse(jsonable_encoder(content)).body
+    ),
+    "jsonable_encoder + orjson": (
+        lambda content: ORJSONResponse(jsonable_encoder(content)).body
+    ),
+    "orjson": lambda content: ORJSONResponse(content).body,
+}
+
+
+def _payload(count: int, words: int) -> dict:
+    session_id = str(uuid.uuid4())
+    started_at = datetime(2024, 1, 1, 0, 0, 0, 123456)
+    views = []
+    for number in range(count):
+        moment = started_at + timedelta(seconds=number)
+        views.append(MessageView(
+            id=str(uuid.uuid4()),
+            session_id=session_id,
+            content=" ".join(random.choices(WORDS, k=words)),
+            timestamp=moment,
+            sender="user" if number % 3 else "system",
+            word_count=words,
+            character_count=words * 5,
+            processed_at=moment,
+            created_at=moment,
+        ))
+    return {
+        "messages": [view.to_dict() for view in views],
+        "pagination": {
+            "total": count,
+            "limit": count,
+            "offset": 0,
+            "has_next": False,
+            "has_previous": False
+        }
+    }
+
+
+def _microseconds(render, content) -> float:
+    timer = timeit.Timer(lambda: render(content))
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=5, number=number)) / number * 1_000_000
+
+
+def run(words: int) -> None:
+    rows = []
+    for count in (1, 100, 10_000):
+        content = _payload(count, words)
+        bodies = {render(content) for render in PATHS.values()}
+        assert len(bodies) == 1, "the paths write different bytes"
+        baseline = None
+        for label, render in PATHS.items():
+            elapsed = _microseconds(render, content)
+            baseline = baseline or elapsed
+            rows.append({
+                "messages": count,
+                "serialization": label,
+                "µs": elapsed,
+                "msgs/s": count / (elapsed / 1_000_000),
+                "speedup": baseline / elapsed,
+            })
+    print_table(
+        f"Listing payload serialization ({words} words per message), "
+        f"identical bytes on every path",
+        rows,
+        ["messages", "serialization", "µs", "msgs/s", "speedup"],
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--words", type=int, default=40)
+    parser.add_argument("--seed", type=int, default=24)
+    arguments = parser.parse_args()
+    random.seed(arguments.seed)
+    run(arguments.words)
@@ -0,0 +1,141 @@
+"""
+Latency of GET /api/messages/{session_id} alone and during a login storm
+(clients calling POST /api/auth/token in a loop). bcrypt runs on the
+password hasher pool, so reads should stay close to their idle latency
+while logins are limited by PASSWORD_HASH_WORKERS.
+
+    python -m benchmarks.bench_login_storm --readers 10 --logins 20
+"""
+import argparse
+import asyncio
+import time
+import uuid
+
+import httpx
+
+from benchmarks._common import (
+    BENCH_PASSWORD,
+    message_payload,
+    percentiles,
+    print_table,
+    running_server,
+)
+
+
+async def _register(client):
+    suffix = uuid.uuid4().hex[:10]
+    email = f"bench_{suffix}@example.com"
+    response = await client.post("/api/users/register", json={
+        "email": email,
+        "username": f"bench_{suffix}",
+        "password": BENCH_PASSWORD,
+    })
+    response.raise_for_status()
+    return {"email": email, "password": BENCH_PASSWORD}
+
+
+async def _login(client, credentials):
+    response = await client.post("/api/auth/token", json=credentials)
+    return response
+
+
+async def _reader_loop(client, headers, session_id, deadline, samples):
+    while time.monotonic() < deadline:
+        started = time.perf_counter()
+        response = await client.get(
+            f"/api/messages/{session_id}",
+            params={"limit": 10},
+            headers=headers,
+        )
+        response.raise_for_status()
+        samples.append((time.perf_counter() - started) * 1000)
+
+
+async def _login_loop(client, credentials, deadline, outcomes):
+    while time.monotonic() < deadline:
+        response = await _login(client, credentials)
+        outcomes.append(response.status_code)
+
+
+async def _drive(base_url, readers, logins, duration):
+    limits = httpx.Limits(max_connections=readers + logins)
+    async with httpx.AsyncClient(
+        base_url=base_url, limits=limits, timeout=120
+    ) as client:
+        credentials = await _register(client)
+        token = (await _login(client, credentials)).json()["access_token"]
+        headers = {"Authorization": f"Bearer {token}"}
+        session_id = str(uuid.uuid4())
+        for _ in range(10):
+            await client.post(
+                "/api/messages/",
+                json=message_payload(session_id),
+                headers=headers,
+            )
+
+        results = {}
+        for phase, login_clients in (("idle", 0), ("login storm", logins)):
+            samples, outcomes = [], []
+            deadline = time.monotonic() + duration
+            await asyncio.gather(
+                *(
+                    _reader_loop(
+                        client, headers, session_id, deadline, samples
+                    )
+                    for _ in range(readers)
+                ),
+                *(
+                    _login_loop(client, credentials, deadline, outcomes)
+                    for _ in range(login_clients)
+                ),
+            )
+            results[phase] = (samples, outcomes)
+        snapshot = (
+            await client.get("/api/metrics/", headers=headers)
+        ).json()
+    return results, snapshot
+
+
+def run(readers: int, logins: int, duration: float, workers: int) -> None:
+    env = {"PASSWORD_HASH_WORKERS": str(workers)}
+    with running_server(env) as base_url:
+        results, snapshot = asyncio.run(
+            _drive(base_url, readers, logins, duration)
+        )
+    rows = []
+    for phase, (samples, outcomes) in results.items():
+        rows.append({
+            "phase": phase,
+            "reads/s": len(samples) / duration,
+            **percentiles(samples),
+            "logins/s": outcomes.count(200) / duration,
+            "503": outcomes.count(503),
+        })
+    print_table(
+        f"GET /api/messages/{{session_id}} ({readers} readers, {logins} "
+        f"login clients, {workers} hasher workers, {duration:.0f}s) "
+        f"latency in ms",
+        rows,
+        ["phase", "reads/s", "p50", "p95", "p99", "logins/s", "503"],
+    )
+    wait = snapshot.get("password_hasher_wait_ms", {})
+    if wait.get("count"):
+        print(
+            f"\npassword hasher wait: mean "
+            f"{wait['mean']:.1f} ms over {wait['count']} calls"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--readers", type=int, default=10)
+    parser.add_argument("--logins", type=int, default=20)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--workers", type=int, default=2)
+    arguments = parser.parse_args()
+    run(
+        arguments.readers,
+        arguments.logins,
+        arguments.duration,
+        arguments.workers,
+    )
@@ -0,0 +1,96 @@
+"""
+Cost of processing a message before it is stored: the previous
+hardcoded steps (ContentField, then replace() for the character count and
+strip().split() for the word count) against the stage pipeline, with
+every run timed and with one run out of 16 timed, and with an extra
+enrichment stage reusing the words of the content.
+
+    python -m benchmarks.bench_message_pipeline --messages 20000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from app.core.metrics import MetricsRegistry  # noqa: E402
+from app.domain.value_objects import ContentField  # noqa: E402
+from app.services.message_pipeline import (  # noqa: E402
+    MessagePipeline,
+    MessageProcessingStage,
+)
+from benchmarks._common import percentiles, print_table  # noqa: E402
+
+WORDS = ["hola", "como", "estas", "mensaje", "de", "chat", "malo", "hoy"]
+
+
+class LongestWordStage(MessageProcessingStage):
+    name = "longest_word"
+
+    def process(self, context) -> None:
+        context.fields['longest_word'] = max(context.words, key=len)
+
+
+def _hardcoded_steps(message_data: dict) -> dict:
+    content = ContentField(message_data.get('content'))
+    text = content.value
+    return {
+        'content': content,
+        'character_count': len(text.replace(' ', '')) if text else 0,
+        'word_count': (
+            len(text.strip().split()) if text and text.strip() else 0
+        ),
+    }
+
+
+def _measure(process, messages: list) -> list:
+    samples = []
+    for message_data in messages:
+        started = time.perf_counter()
+        process(message_data)
+        samples.append((time.perf_counter() - started) * 1_000_000)
+    return samples
+
+
+def run(messages_count: int, words: int) -> None:
+    messages = [
+        {"content": " ".join(random.choices(WORDS, k=words))}
+        for _ in range(messages_count)
+    ]
+    enriched = MessagePipeline(registry=MetricsRegistry())
+    enriched.register(LongestWordStage())
+    variants = (
+        ("hardcoded steps", _hardcoded_steps),
+        ("pipeline, all timed",
+         MessagePipeline(timing_every=1, registry=MetricsRegistry()).run),
+        ("pipeline, 1/16 timed",
+         MessagePipeline(timing_every=16, registry=MetricsRegistry()).run),
+        ("+ enrichment stage", enriched.run),
+    )
+    rows = []
+    for label, process in variants:
+        _measure(process, messages[:1000])
+        samples = _measure(process, messages)
+        rows.append({
+            "processing": label,
+            "msgs/s": len(samples) / (sum(samples) / 1_000_000),
+            **percentiles(samples),
+        })
+    print_table(
+        f"Message processing ({messages_count} messages of {words} words) "
+        f"latency in µs",
+        rows,
+        ["processing", "msgs/s", "p50", "p95", "p99", "mean"],
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=20000)
+    parser.add_argument("--words", type=int, default=40)
+    parser.add_argument("--seed", type=int, default=19)
+    arguments = parser.parse_args()
+    random.seed(arguments.seed)
+    run(arguments.messages, arguments.words)
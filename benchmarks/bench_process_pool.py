@@ -0,0 +1,168 @@
+"""
+Ingest throughput of large messages through AsyncMessageService with
+the processing pipeline inline on the event loop against the process
+pool with 1, 2 and 4 workers. Storage is an in-memory stub so only the
+processing is measured. The moderation list is loaded from a file of
+--words terms, as in production, so masking uses the automaton.
+
+    python -m benchmarks.bench_process_pool --messages 400 --size 16384
+"""
+import argparse
+import asyncio
+import os
+import random
+import shutil
+import string
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+# The spawned workers import this module again, they inherit the path
+if "CONTENT_FILTER_WORDLIST_PATH" not in os.environ:
+    os.environ["CONTENT_FILTER_WORDLIST_PATH"] = os.path.join(
+        tempfile.mkdtemp(), "wordlist.txt"
+    )
+    os.environ["CONTENT_FILTER_WORDLIST_POLL_SECONDS"] = "3600"
+WORDLIST_PATH = os.environ["CONTENT_FILTER_WORDLIST_PATH"]
+
+from app.core.metrics import MetricsRegistry  # noqa: E402
+from app.core.moderation import content_filter_reloader  # noqa: E402
+from app.services.message_processing_pool import (  # noqa: E402
+    MessageProcessingPool,
+)
+from app.services.message_service import AsyncMessageService  # noqa: E402
+from benchmarks._common import print_table  # noqa: E402
+
+
+class InMemoryMessageRepository:
+    async def get_message_by_id(self, message_id):
+        return None
+
+    async def create_message(self, message):
+        return message
+
+    async def get_existing_message_ids(self, message_ids):
+        return set()
+
+    async def create_messages(self, messages):
+        return messages
+
+
+def _write_wordlist(terms: int) -> list:
+    words = set()
+    while len(words) < terms:
+        words.add("".join(
+            random.choice(string.ascii_lowercase)
+            for _ in range(random.randint(5, 10))
+        ))
+    with open(WORDLIST_PATH, "w", encoding="utf-8") as wordlist:
+        wordlist.write("\n".join(words) + "\n")
+    return sorted(words)
+
+
+def _messages(words: list, count: int, size: int) -> list:
+    vocabulary = ["hola", "mensaje", "chat", "de", "la", "sesion"] + words[:50]
+    messages = []
+    for _ in range(count):
+        tokens = []
+        length = 0
+        while length < size:
+            token = random.choice(vocabulary)
+            tokens.append(token)
+            length += len(token) + 1
+        messages.append({
+            "message_id": str(uuid.uuid4()),
+            "session_id": str(uuid.uuid4()),
+            "content": " ".join(tokens)[:size],
+            "timestamp": datetime.now().isoformat(),
+            "sender": "user",
+        })
+    return messages
+
+
+async def _ingest(service, messages: list, concurrency: int) -> float:
+    queue = list(messages)
+
+    async def client():
+        while queue:
+            await service.register_message(queue.pop())
+
+    started = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    return time.perf_counter() - started
+
+
+async def _ingest_batches(service, messages: list, batch_size: int) -> float:
+    started = time.perf_counter()
+    for first in range(0, len(messages), batch_size):
+        await service.register_messages(messages[first:first + batch_size])
+    return time.perf_counter() - started
+
+
+async def run(
+        messages_count: int,
+        size: int,
+        terms: int,
+        concurrency: int,
+        batch_size: int
+        ) -> None:
+    words = _write_wordlist(terms)
+    content_filter_reloader.load(force=True)
+    messages = _messages(words, messages_count, size)
+
+    rows = []
+    for workers in (0, 1, 2, 4):
+        pool = None
+        if workers:
+            pool = MessageProcessingPool(
+                max_workers=workers, min_chars=size // 2, min_batch=2,
+                registry=MetricsRegistry()
+            )
+            started = time.perf_counter()
+            pool.start()
+            warm_up_s = time.perf_counter() - started
+        service = AsyncMessageService(
+            InMemoryMessageRepository(), processing_pool=pool
+        )
+        single_s = await _ingest(service, messages, concurrency)
+        batch_s = await _ingest_batches(service, messages, batch_size)
+        if pool is not None:
+            pool.close()
+        rows.append({
+            "processing": f"pool, {workers} workers" if workers
+            else "inline",
+            "warm-up s": warm_up_s if workers else "-",
+            "single msgs/s": messages_count / single_s,
+            "batch msgs/s": messages_count / batch_s,
+        })
+
+    print_table(
+        f"Ingest of {messages_count} messages of {size} chars, "
+        f"{terms} moderation terms, {os.cpu_count()} CPUs",
+        rows,
+        ["processing", "warm-up s", "single msgs/s", "batch msgs/s"],
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=400)
+    parser.add_argument("--size", type=int, default=16384)
+    parser.add_argument("--words", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=20)
+    arguments = parser.parse_args()
+    random.seed(arguments.seed)
+    asyncio.run(run(
+        arguments.messages,
+        arguments.size,
+        arguments.words,
+        arguments.concurrency,
+        arguments.batch_size,
+    ))
+    shutil.rmtree(os.path.dirname(WORDLIST_PATH))
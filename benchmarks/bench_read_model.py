@@ -0,0 +1,163 @@
+"""
+Listing of 100-message pages rendered as the endpoints do, through the
+ORM entities (MessageORM instances in the identity map, Message entities,
+to_dict) against the Core select() read model (MessageView records,
+to_dict), with offset and keyset pagination. Reports rows/s and the
+tracemalloc peak of building one page. Runs on an in-memory SQLite
+database so the query costs are not hidden by disk reads.
+
+    python -m benchmarks.bench_read_model --messages 5000 --page 100
+"""
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+import uuid
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+from sqlalchemy.pool import StaticPool  # noqa: E402
+
+from app.domain.entities.message import Message  # noqa: E402
+from app.domain.value_objects import (  # noqa: E402
+    UUIDField,
+    ContentField,
+    DatetimeField,
+    SenderField
+)
+from app.infrastructure.persistence.database import Base  # noqa: E402
+from app.infrastructure.persistence.repositories.message_repository import (  # noqa: E402,E501
+    SQLAlchemyMessageRepository
+)
+from benchmarks._common import percentiles, print_table  # noqa: E402
+
+WORDS = ["hola", "como", "estas", "mensaje", "de", "chat", "pedido", "hoy"]
+
+
+def _seed(session_factory, messages_count: int, words: int) -> UUIDField:
+    session_id = UUIDField(uuid.uuid4())
+    started_at = datetime(2024, 1, 1)
+    db = session_factory()
+    repository = SQLAlchemyMessageRepository(db)
+    chunk = []
+    for number in range(messages_count):
+        moment = DatetimeField(started_at + timedelta(seconds=number))
+        chunk.append(Message(
+            id=UUIDField(uuid.uuid4()),
+            session_id=session_id,
+            content=ContentField(" ".join(random.choices(WORDS, k=words))),
+            timestamp=moment,
+            sender=SenderField("user" if number % 3 else "system"),
+            word_count=words,
+            character_count=words * 5,
+            processed_at=moment,
+            created_at=moment,
+            updated_at=moment,
+        ))
+        if len(chunk) == 5000:
+            repository.create_messages(chunk)
+            chunk = []
+    repository.create_messages(chunk)
+    db.close()
+    return session_id
+
+
+def _page_readers(repository, session_id, page: int) -> dict:
+    def entities_offset(number):
+        messages, _ = repository.get_message_by_session_id(
+            session_id, limit=page, offset=(number * page) % 1000
+        )
+        return [message.to_dict() for message in messages]
+
+    def views_offset(number):
+        views, _ = repository.get_message_views_by_session_id(
+            session_id, limit=page, offset=(number * page) % 1000
+        )
+        return [view.to_dict() for view in views]
+
+    def entities_cursor(number):
+        messages, _ = repository.get_message_page_by_session_id(
+            session_id, limit=page
+        )
+        return [message.to_dict() for message in messages]
+
+    def views_cursor(number):
+        views, _ = repository.get_message_view_page_by_session_id(
+            session_id, limit=page
+        )
+        return [view.to_dict() for view in views]
+
+    return {
+        ("offset", "ORM entities"): entities_offset,
+        ("offset", "read model"): views_offset,
+        ("cursor", "ORM entities"): entities_cursor,
+        ("cursor", "read model"): views_cursor,
+    }
+
+
+def _peak_kib(read_page, db) -> float:
+    db.expunge_all()
+    tracemalloc.start()
+    read_page(0)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 1024
+
+
+def run(messages_count: int, page: int, pages: int, words: int) -> None:
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    Base.metadata.create_all(bind=engine)
+    session_factory = sessionmaker(autoflush=False, bind=engine)
+    session_id = _seed(session_factory, messages_count, words)
+
+    rows = []
+    db = session_factory()
+    repository = SQLAlchemyMessageRepository(db)
+    for (pagination, path), read_page in _page_readers(
+            repository, session_id, page).items():
+        for number in range(20):
+            read_page(number)
+        samples = []
+        for number in range(pages):
+            # A request scoped session starts with an empty identity map
+            db.expunge_all()
+            started = time.perf_counter()
+            read_page(number)
+            samples.append((time.perf_counter() - started) * 1000)
+        rows.append({
+            "pagination": pagination,
+            "path": path,
+            "rows/s": page * len(samples) / (sum(samples) / 1000),
+            "peak KiB": _peak_kib(read_page, db),
+            **percentiles(samples),
+        })
+    db.close()
+    engine.dispose()
+
+    print_table(
+        f"Pages of {page} messages of {words} words ({messages_count} "
+        f"stored) rendered with to_dict(), latency in ms",
+        rows,
+        ["pagination", "path", "rows/s", "peak KiB", "p50", "p95", "mean"],
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=5000)
+    parser.add_argument("--page", type=int, default=100)
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--words", type=int, default=40)
+    parser.add_argument("--seed", type=int, default=23)
+    arguments = parser.parse_args()
+    random.seed(arguments.seed)
+    run(arguments.messages, arguments.page, arguments.pages, arguments.words)
@@ -0,0 +1,147 @@
+"""
+Validation cost of the request bodies of message registration, user
+registration and login, from the raw bytes to the value objects built by
+the services. The previous Dict[str, Any] path (json.loads, the Dict
+validation of FastAPI, value objects parsing the strings) against the
+compiled request schemas (TypeAdapter.validate_json, value objects
+checking typed values), and the fallback of a body outside the schema.
+The content filter and password hashing are left out, they cost the same
+on every path.
+
+    python -m benchmarks.bench_request_validation
+"""
+import argparse
+import json
+import os
+import sys
+import timeit
+from typing import Any, Dict
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from pydantic import TypeAdapter, ValidationError  # noqa: E402
+
+from app.domain.exceptions import DomainValidationException  # noqa: E402
+from app.domain.value_objects import (  # noqa: E402
+    UUIDField,
+    DatetimeField,
+    SenderField,
+    EmailField,
+    UsernameField,
+    PasswordRawField
+)
+from app.infrastructure.routes.request_schemas import (  # noqa: E402
+    MessageCreateRequest,
+    UserRegisterRequest,
+    LoginRequest
+)
+from benchmarks._common import print_table  # noqa: E402
+
+DICT_BODY = TypeAdapter(Dict[str, Any])
+CONTENT = "Hola, quería saber cuándo llega mi pedido de la semana pasada"
+MESSAGE = {
+    "message_id": "366defc3-ac55-44fe-8354-463a7b391e12",
+    "session_id": "7dbc8073-6634-4b34-84db-9033f6133a95",
+    "content": CONTENT,
+    "timestamp": "2023-06-15T14:30:00.125Z",
+    "sender": "user"
+}
+USER = {
+    "email": "cliente@example.com",
+    "username": "cliente.frecuente",
+    "password": "Secreta123"
+}
+
+
+def _message_fields(data: dict) -> tuple:
+    return (
+        UUIDField(data.get('message_id')),
+        UUIDField(data.get('session_id')),
+        DatetimeField(data.get('timestamp')),
+        SenderField(data.get('sender')),
+    )
+
+
+def _user_fields(data: dict) -> tuple:
+    return (
+        PasswordRawField(data.get('password')),
+        EmailField(data.get('email')),
+        UsernameField(data.get('username')),
+    )
+
+
+def _login_fields(data: dict) -> tuple:
+    return (
+        EmailField(data.get('email')),
+        PasswordRawField(data.get('password')),
+    )
+
+
+def _dict_body(body: bytes) -> dict:
+    return DICT_BODY.validate_python(json.loads(body))
+
+
+def _schema_body(schema):
+    adapter = TypeAdapter(schema)
+
+    def parse(body: bytes) -> dict:
+        try:
+            return adapter.validate_json(body)
+        except ValidationError:
+            return json.loads(body)
+    return parse
+
+
+def _microseconds(run) -> float:
+    timer = timeit.Timer(run)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=5, number=number)) / number * 1_000_000
+
+
+def _validated(build, data: dict) -> None:
+    try:
+        build(data)
+    except DomainValidationException:
+        pass
+
+
+def run() -> None:
+    cases = (
+        ("message", MESSAGE, MessageCreateRequest, _message_fields),
+        ("message, invalid id", {**MESSAGE, "message_id": "12"},
+         MessageCreateRequest, _message_fields),
+        ("user registration", USER, UserRegisterRequest, _user_fields),
+        ("login", {"email": USER["email"], "password": USER["password"]},
+         LoginRequest, _login_fields),
+    )
+    rows = []
+    for label, data, schema, build in cases:
+        body = json.dumps(data).encode()
+        paths = (
+            ("Dict[str, Any]", _dict_body),
+            ("request schema", _schema_body(schema)),
+        )
+        baseline = None
+        for path, parse in paths:
+            elapsed = _microseconds(
+                lambda: _validated(build, parse(body))
+            )
+            baseline = baseline or elapsed
+            rows.append({
+                "body": label,
+                "path": path,
+                "µs": elapsed,
+                "bodies/s": 1_000_000 / elapsed,
+                "speedup": baseline / elapsed,
+            })
+    print_table(
+        "Request body validation, raw bytes to value objects",
+        rows,
+        ["body", "path", "µs", "bodies/s", "speedup"],
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.parse_args()
+    run()
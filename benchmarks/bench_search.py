@@ -0,0 +1,139 @@
+"""
+Latency of a 20 result search page over --rows synthetic messages, the
+FTS5 index (bm25 ranked, with snippets) against a LIKE '%term%' scan of
+messages.content paged newest first, for a rare and a common word, across
+all sessions and inside one session.
+
+    python -m benchmarks.bench_search --rows 2000000
+"""
+import argparse
+import os
+import random
+import statistics
+import string
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta
+
+_DIRECTORY = tempfile.mkdtemp()
+os.environ.setdefault(
+    "DATABASE_URL", f"sqlite:///{_DIRECTORY}/bench_search.db"
+)
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from sqlalchemy import insert, select  # noqa: E402
+
+from app.domain.value_objects import SearchQueryField, UUIDField  # noqa: E402
+from app.infrastructure.persistence.database import (  # noqa: E402
+    SessionLocal,
+    create_db_tables,
+)
+from app.infrastructure.persistence.orm_models import MessageORM  # noqa: E402
+from app.infrastructure.persistence.repositories.message_repository import (  # noqa: E402,E501
+    SQLAlchemyMessageRepository,
+)
+from benchmarks._common import print_table  # noqa: E402
+
+PAGE_SIZE = 20
+VOCABULARY_SIZE = 50000
+WORDS_PER_MESSAGE = 8
+COMMON_WORD = "hola"
+
+
+def seed(db, rows: int, sessions: list, chunk: int = 20000) -> list:
+    generator = random.Random(7)
+    vocabulary = [
+        "".join(generator.choices(string.ascii_lowercase, k=7))
+        for _ in range(VOCABULARY_SIZE)
+    ]
+    start = datetime(2024, 1, 1)
+    for first in range(0, rows, chunk):
+        db.execute(insert(MessageORM), [
+            {
+                "id": str(uuid.uuid4()),
+                "session_id": sessions[index % len(sessions)],
+                "content": " ".join(
+                    generator.choices(vocabulary, k=WORDS_PER_MESSAGE)
+                    + ([COMMON_WORD] if index % 3 == 0 else [])
+                ),
+                "timestamp": start + timedelta(seconds=index),
+                "sender": "user",
+                "word_count": WORDS_PER_MESSAGE,
+                "character_count": 64,
+                "processed_at": start + timedelta(seconds=index),
+                "created_at": start + timedelta(milliseconds=index),
+                "updated_at": start + timedelta(milliseconds=index),
+            }
+            for index in range(first, min(rows, first + chunk))
+        ])
+        db.commit()
+    return vocabulary
+
+
+def timed(callable_, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        callable_()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def like_page(db, term: str, session_id: str = None):
+    query = select(MessageORM).where(MessageORM.content.like(f"%{term}%"))
+    if session_id:
+        query = query.where(MessageORM.session_id == session_id)
+    return db.execute(
+        query
+        .order_by(MessageORM.created_at.desc(), MessageORM.id.desc())
+        .limit(PAGE_SIZE + 1)
+    ).all()
+
+
+def run(rows: int, sessions_count: int, repeat: int) -> None:
+    create_db_tables()
+    db = SessionLocal()
+    sessions = [str(uuid.uuid4()) for _ in range(sessions_count)]
+    started = time.perf_counter()
+    vocabulary = seed(db, rows, sessions)
+    print(f"Seeded {rows} messages in {time.perf_counter() - started:.1f}s")
+
+    repository = SQLAlchemyMessageRepository(db)
+    rare_word = vocabulary[0]
+    results = []
+    for label, term in (("rare", rare_word), ("common", COMMON_WORD)):
+        for session_id in (None, sessions[0]):
+            session_field = UUIDField(session_id) if session_id else None
+            results.append({
+                "word": label,
+                "scope": "session" if session_id else "all",
+                "fts_ms": timed(
+                    lambda: repository.search_messages(
+                        SearchQueryField(term),
+                        session_id=session_field,
+                        limit=PAGE_SIZE
+                    ),
+                    repeat,
+                ),
+                "like_ms": timed(
+                    lambda: like_page(db, term, session_id), repeat
+                ),
+            })
+
+    db.close()
+    print_table(
+        f"Median latency of a {PAGE_SIZE} result page over {rows} messages",
+        results,
+        ["word", "scope", "fts_ms", "like_ms"],
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=2_000_000)
+    parser.add_argument("--sessions", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    arguments = parser.parse_args()
+    run(arguments.rows, arguments.sessions, arguments.repeat)
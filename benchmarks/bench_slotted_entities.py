@@ -0,0 +1,143 @@
+"""
+Memory per message and construction cost of the slotted domain classes
+against dict based twins (the same dataclasses without slots=True). A
+message is built as the repository rebuilds a stored row, one Message
+and its nine value objects, and with the validating constructors used
+for API input. Memory is the tracemalloc delta of keeping --messages of
+them alive.
+
+    python -m benchmarks.bench_slotted_entities --messages 20000
+"""
+import argparse
+import dataclasses
+import os
+import sys
+import timeit
+import tracemalloc
+import uuid
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from app.domain.entities.message import Message  # noqa: E402
+from app.domain.value_objects import (  # noqa: E402
+    UUIDField,
+    ContentField,
+    DatetimeField,
+    SenderField
+)
+from benchmarks._common import print_table  # noqa: E402
+
+CONTENT = "Hola, quería saber cuándo llega mi pedido de la semana pasada"
+_GENERATED = {
+    '__slots__', '__dict__', '__weakref__', '__init__', '__repr__',
+    '__eq__', '__hash__', '__setattr__', '__delattr__', '__getstate__',
+    '__setstate__', '__match_args__', '__dataclass_fields__',
+    '__dataclass_params__',
+}
+
+
+def _dict_based(cls):
+    """The same frozen dataclass, methods and constants without slots."""
+    namespace = {
+        name: value for name, value in cls.__dict__.items()
+        if name not in _GENERATED and name not in cls.__slots__
+    }
+    for field in dataclasses.fields(cls):
+        if field.default is not dataclasses.MISSING:
+            namespace[field.name] = field.default
+    return dataclasses.dataclass(frozen=True)(
+        type(cls.__name__, (), namespace)
+    )
+
+
+def _stored(cls, value):
+    field = object.__new__(cls)
+    object.__setattr__(field, 'value', value)
+    return field
+
+
+def _builders(message, uuid_field, content, moment, sender):
+    def from_storage(row):
+        return message(
+            id=_stored(uuid_field, uuid.UUID(row[0])),
+            session_id=_stored(uuid_field, uuid.UUID(row[1])),
+            content=_stored(content, row[2]),
+            timestamp=_stored(moment, row[3]),
+            sender=_stored(sender, row[4]),
+            word_count=11,
+            character_count=51,
+            processed_at=_stored(moment, row[3]),
+            created_at=_stored(moment, row[3]),
+            updated_at=_stored(moment, row[3]),
+        )
+
+    def validating(row):
+        return message(
+            id=uuid_field(row[0]),
+            session_id=uuid_field(row[1]),
+            content=content(row[2]),
+            timestamp=moment(row[3]),
+            sender=sender(row[4]),
+            word_count=11,
+            character_count=51,
+            processed_at=moment(row[3]),
+            created_at=moment(row[3]),
+            updated_at=moment(row[3]),
+        )
+
+    return from_storage, validating
+
+
+def _bytes_per_message(build, rows: list) -> float:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = [build(row) for row in rows]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before) / len(kept)
+
+
+def _microseconds(build, rows: list) -> float:
+    row = rows[0]
+    timer = timeit.Timer(lambda: build(row))
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=5, number=number)) / number * 1_000_000
+
+
+def run(messages_count: int) -> None:
+    started_at = datetime(2024, 1, 1)
+    session_id = str(uuid.uuid4())
+    rows = [
+        (str(uuid.uuid4()), session_id, CONTENT,
+         started_at + timedelta(seconds=number), "user")
+        for number in range(messages_count)
+    ]
+    layouts = (
+        ("slots", (Message, UUIDField, ContentField, DatetimeField,
+                   SenderField)),
+        ("__dict__", tuple(map(_dict_based, (
+            Message, UUIDField, ContentField, DatetimeField, SenderField
+        )))),
+    )
+    results = []
+    for label, classes in layouts:
+        from_storage, validating = _builders(*classes)
+        results.append({
+            "layout": label,
+            "bytes/msg": _bytes_per_message(from_storage, rows),
+            "from_storage µs": _microseconds(from_storage, rows),
+            "validating µs": _microseconds(validating, rows),
+        })
+    print_table(
+        f"Message with 9 value objects ({messages_count} kept alive)",
+        results,
+        ["layout", "bytes/msg", "from_storage µs", "validating µs"],
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=20000)
+    arguments = parser.parse_args()
+    run(arguments.messages)
@@ -0,0 +1,144 @@
+"""
+Concurrent read/write throughput on a SQLite file with the default
+rollback-journal settings against the SQLite performance profile (WAL,
+synchronous=NORMAL, cache, mmap, busy_timeout). Writer threads register
+messages one per transaction while reader threads list the session.
+
+    python -m benchmarks.bench_sqlite_profile --writers 4 --readers 8
+"""
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from datetime import datetime
+
+from benchmarks._common import ROOT_DIR, percentiles, print_table
+
+
+def _child(writers: int, readers: int, duration: float) -> dict:
+    from app.domain.value_objects import UUIDField
+    from app.infrastructure.persistence.database import (
+        SessionLocal,
+        create_db_tables,
+    )
+    from app.infrastructure.persistence.repositories.message_repository \
+        import SQLAlchemyMessageRepository
+    from app.infrastructure.persistence.repositories \
+        .async_message_repository import BlockingMessageRepositoryAdapter
+    from app.services.message_service import AsyncMessageService
+
+    create_db_tables()
+    session_id = str(uuid.uuid4())
+    deadline = time.monotonic() + duration
+    write_samples, read_samples, errors = [], [], []
+
+    def payload():
+        return {
+            "message_id": str(uuid.uuid4()),
+            "session_id": session_id,
+            "content": "Hola, este es un mensaje de prueba.",
+            "timestamp": datetime.now().isoformat(),
+            "sender": "user",
+        }
+
+    def writer():
+        while time.monotonic() < deadline:
+            db = SessionLocal()
+            try:
+                started = time.perf_counter()
+                service = AsyncMessageService(
+                    BlockingMessageRepositoryAdapter(
+                        SQLAlchemyMessageRepository(db)
+                    ),
+                    processing_pool=None,
+                )
+                asyncio.run(service.register_message(payload()))
+                write_samples.append((time.perf_counter() - started) * 1000)
+            except Exception as e:
+                errors.append(type(e).__name__)
+            finally:
+                db.close()
+
+    def reader():
+        session_field = UUIDField(session_id)
+        while time.monotonic() < deadline:
+            db = SessionLocal()
+            try:
+                started = time.perf_counter()
+                SQLAlchemyMessageRepository(db).get_message_by_session_id(
+                    session_field, limit=50
+                )
+                read_samples.append((time.perf_counter() - started) * 1000)
+            except Exception as e:
+                errors.append(type(e).__name__)
+            finally:
+                db.close()
+
+    threads = [threading.Thread(target=writer) for _ in range(writers)]
+    threads += [threading.Thread(target=reader) for _ in range(readers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    return {
+        "writes/s": len(write_samples) / duration,
+        "reads/s": len(read_samples) / duration,
+        "write_p99": percentiles(write_samples or [0])["p99"],
+        "read_p99": percentiles(read_samples or [0])["p99"],
+        "errors": len(errors),
+    }
+
+
+def run(writers: int, readers: int, duration: float) -> None:
+    rows = []
+    for profile in ("false", "true"):
+        with tempfile.TemporaryDirectory() as directory:
+            env = {
+                **os.environ,
+                "DATABASE_URL": f"sqlite:///{directory}/bench.db",
+                "SQLITE_PERFORMANCE_PROFILE": profile,
+            }
+            output = subprocess.run(
+                [
+                    sys.executable, "-m", "benchmarks.bench_sqlite_profile",
+                    "--child", "--writers", str(writers),
+                    "--readers", str(readers), "--duration", str(duration),
+                ],
+                cwd=ROOT_DIR, env=env, check=True,
+                capture_output=True, text=True,
+            ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        rows.append({
+            "profile": "wal" if profile == "true" else "default",
+            **result,
+        })
+
+    print_table(
+        f"{writers} writers + {readers} readers for {duration:.0f}s "
+        f"(latency in ms)",
+        rows,
+        ["profile", "writes/s", "reads/s", "write_p99", "read_p99",
+         "errors"],
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--writers", type=int, default=4)
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--child", action="store_true")
+    arguments = parser.parse_args()
+    if arguments.child:
+        print(json.dumps(_child(
+            arguments.writers, arguments.readers, arguments.duration
+        )))
+    else:
+        run(arguments.writers, arguments.readers, arguments.duration)
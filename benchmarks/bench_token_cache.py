@@ -0,0 +1,72 @@
+"""
+Per-request cost of verify_token, the first step of get_current_user,
+with every call running jwt.decode (token cache disabled) against the
+cache of verified tokens. Requests are spread over a pool of distinct
+tokens, as sent by different clients.
+
+    python -m benchmarks.bench_token_cache --requests 100000 --tokens 1000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from app.core import security  # noqa: E402
+from app.core.cache import TTLCache  # noqa: E402
+from app.core.config import (  # noqa: E402
+    TOKEN_CACHE_MAX_SIZE,
+    TOKEN_CACHE_MAX_TTL_SECONDS,
+)
+from app.core.metrics import MetricsRegistry  # noqa: E402
+from benchmarks._common import percentiles, print_table  # noqa: E402
+
+
+def _measure(tokens: list, requests: int) -> list:
+    samples = []
+    for _ in range(requests):
+        token = random.choice(tokens)
+        started = time.perf_counter()
+        security.verify_token(token)
+        samples.append((time.perf_counter() - started) * 1_000_000)
+    return samples
+
+
+def run(requests: int, tokens_count: int) -> None:
+    tokens = [
+        security.create_access_token({"sub": f"user-{index}"})
+        for index in range(tokens_count)
+    ]
+    rows = []
+    for label, cache in (
+        ("disabled", None),
+        ("enabled", TTLCache(
+            name="token_cache",
+            max_size=TOKEN_CACHE_MAX_SIZE,
+            ttl_seconds=TOKEN_CACHE_MAX_TTL_SECONDS,
+            registry=MetricsRegistry(),
+        )),
+    ):
+        security.token_cache = cache
+        samples = _measure(tokens, requests)
+        rows.append({
+            "token cache": label,
+            "calls/s": len(samples) / (sum(samples) / 1_000_000),
+            **percentiles(samples),
+        })
+    print_table(
+        f"verify_token ({requests} calls over {tokens_count} tokens) "
+        f"latency in µs",
+        rows,
+        ["token cache", "calls/s", "p50", "p95", "p99", "mean"],
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=100000)
+    parser.add_argument("--tokens", type=int, default=1000)
+    arguments = parser.parse_args()
+    run(arguments.requests, arguments.tokens)
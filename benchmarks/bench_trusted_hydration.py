@@ -0,0 +1,193 @@
+"""
+Listing throughput of the message repository when the rows are rebuilt
+through the validating value object constructors (UUID parsing, content
+moderation, sender and datetime checks) against the trusted from_storage
+path, plus the cost of rebuilding one user with each path. Runs on an
+in-memory SQLite database so the hydration weighs as in production.
+
+    python -m benchmarks.bench_trusted_hydration --messages 5000 --page 100
+"""
+import argparse
+import os
+import random
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+from sqlalchemy.pool import StaticPool  # noqa: E402
+
+from app.domain.entities.message import Message  # noqa: E402
+from app.domain.entities.user import User  # noqa: E402
+from app.domain.value_objects import (  # noqa: E402
+    UUIDField,
+    ContentField,
+    DatetimeField,
+    EmailField,
+    PasswordHashField,
+    SenderField,
+    UsernameField
+)
+from app.infrastructure.persistence.database import Base  # noqa: E402
+from app.infrastructure.persistence.orm_models import UserORM  # noqa: E402
+from app.infrastructure.persistence.repositories.message_repository import (  # noqa: E402,E501
+    SQLAlchemyMessageRepository
+)
+from app.infrastructure.persistence.repositories.user_repository import (  # noqa: E402,E501
+    SQLAlchemyUserRepository
+)
+from benchmarks._common import percentiles, print_table  # noqa: E402
+
+WORDS = ["hola", "como", "estas", "mensaje", "de", "chat", "pedido", "hoy"]
+PASSWORD_HASH = "$2b$12$" + "a" * 53
+
+
+class ValidatingMessageRepository(SQLAlchemyMessageRepository):
+    """Rebuilds every row through the validating constructors."""
+
+    def _to_domain_entity(self, message_orm):
+        return Message(
+            id=UUIDField(message_orm.id),
+            session_id=UUIDField(message_orm.session_id),
+            content=ContentField(message_orm.content),
+            timestamp=DatetimeField(message_orm.timestamp),
+            sender=SenderField(message_orm.sender),
+            word_count=message_orm.word_count,
+            character_count=message_orm.character_count,
+            processed_at=DatetimeField(message_orm.processed_at),
+            created_at=DatetimeField(message_orm.created_at),
+            updated_at=DatetimeField(message_orm.updated_at),
+        )
+
+
+class ValidatingUserRepository(SQLAlchemyUserRepository):
+    """Rebuilds every row through the validating constructors."""
+
+    def _to_domain_entity(self, user_orm):
+        return User(
+            id=UUIDField(user_orm.id),
+            email=EmailField(user_orm.email),
+            username=UsernameField(user_orm.username),
+            password_hash=PasswordHashField(user_orm.password),
+            created_at=user_orm.created_at,
+            updated_at=user_orm.updated_at
+        )
+
+
+def _seed(session_factory, messages_count: int, words: int) -> UUIDField:
+    session_id = UUIDField(uuid.uuid4())
+    started_at = datetime(2024, 1, 1)
+    db = session_factory()
+    repository = SQLAlchemyMessageRepository(db)
+    chunk = []
+    for number in range(messages_count):
+        moment = DatetimeField(started_at + timedelta(seconds=number))
+        chunk.append(Message(
+            id=UUIDField(uuid.uuid4()),
+            session_id=session_id,
+            content=ContentField(" ".join(random.choices(WORDS, k=words))),
+            timestamp=moment,
+            sender=SenderField("user" if number % 3 else "system"),
+            word_count=words,
+            character_count=words * 5,
+            processed_at=moment,
+            created_at=moment,
+            updated_at=moment,
+        ))
+        if len(chunk) == 5000:
+            repository.create_messages(chunk)
+            chunk = []
+    repository.create_messages(chunk)
+    db.close()
+    return session_id
+
+
+def _list_pages(repository, session_id, page: int, pages: int) -> list:
+    samples = []
+    for number in range(pages):
+        started = time.perf_counter()
+        repository.get_message_by_session_id(
+            session_id, limit=page, offset=(number * page) % 1000
+        )
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+def _user_samples(repository, user_orm, repeats: int) -> list:
+    samples = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        repository._to_domain_entity(user_orm)
+        samples.append((time.perf_counter() - started) * 1_000_000)
+    return samples
+
+
+def run(messages_count: int, page: int, pages: int, words: int) -> None:
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    Base.metadata.create_all(bind=engine)
+    session_factory = sessionmaker(autoflush=False, bind=engine)
+    session_id = _seed(session_factory, messages_count, words)
+
+    rows = []
+    for label, repository_class in (
+            ("validating", ValidatingMessageRepository),
+            ("trusted", SQLAlchemyMessageRepository)):
+        db = session_factory()
+        repository = repository_class(db)
+        _list_pages(repository, session_id, page, 20)
+        samples = _list_pages(repository, session_id, page, pages)
+        db.close()
+        rows.append({
+            "hydration": label,
+            "rows/s": page * len(samples) / (sum(samples) / 1000),
+            **percentiles(samples),
+        })
+    print_table(
+        f"Listing pages of {page} messages of {words} words "
+        f"({messages_count} stored), latency in ms",
+        rows,
+        ["hydration", "rows/s", "p50", "p95", "p99", "mean"],
+    )
+
+    user_orm = UserORM(
+        id=str(uuid.uuid4()),
+        email="benchmark.user@example.com",
+        username="benchmark_user",
+        password=PASSWORD_HASH,
+        created_at=datetime.now(),
+        updated_at=datetime.now()
+    )
+    rows = []
+    for label, repository_class in (
+            ("validating", ValidatingUserRepository),
+            ("trusted", SQLAlchemyUserRepository)):
+        repository = repository_class(None)
+        _user_samples(repository, user_orm, 1000)
+        samples = _user_samples(repository, user_orm, 20000)
+        rows.append({"hydration": label, **percentiles(samples)})
+    print_table(
+        "Rebuilding one user, latency in µs",
+        rows,
+        ["hydration", "p50", "p95", "p99", "mean"],
+    )
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=5000)
+    parser.add_argument("--page", type=int, default=100)
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--words", type=int, default=40)
+    parser.add_argument("--seed", type=int, default=21)
+    arguments = parser.parse_args()
+    random.seed(arguments.seed)
+    run(arguments.messages, arguments.page, arguments.pages, arguments.words)
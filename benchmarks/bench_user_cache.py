@@ -0,0 +1,91 @@
+"""
+Throughput and latency of GET /api/messages/{session_id} with the
+authenticated user read from the database on every request
+(USER_CACHE_ENABLED=false) against the in-process user cache
+(USER_CACHE_ENABLED=true), plus the cache counters of /api/metrics.
+
+    python -m benchmarks.bench_user_cache --clients 20 --duration 10
+"""
+import argparse
+import asyncio
+import time
+import uuid
+
+import httpx
+
+from benchmarks._common import (
+    message_payload,
+    percentiles,
+    print_table,
+    register_and_login,
+    running_server,
+)
+
+
+async def _client_loop(client, headers, session_id, deadline, samples):
+    while time.monotonic() < deadline:
+        started = time.perf_counter()
+        response = await client.get(
+            f"/api/messages/{session_id}",
+            params={"limit": 10},
+            headers=headers,
+        )
+        response.raise_for_status()
+        samples.append((time.perf_counter() - started) * 1000)
+
+
+async def _drive(base_url, headers, clients, duration):
+    session_id = str(uuid.uuid4())
+    limits = httpx.Limits(max_connections=clients)
+    async with httpx.AsyncClient(
+        base_url=base_url, limits=limits, timeout=60
+    ) as client:
+        for _ in range(10):
+            await client.post(
+                "/api/messages/",
+                json=message_payload(session_id),
+                headers=headers,
+            )
+        samples = []
+        deadline = time.monotonic() + duration
+        await asyncio.gather(*(
+            _client_loop(client, headers, session_id, deadline, samples)
+            for _ in range(clients)
+        ))
+        snapshot = (await client.get("/api/metrics/", headers=headers)).json()
+    return samples, snapshot
+
+
+def _counter(snapshot, name):
+    return snapshot.get(name, {}).get("value", 0)
+
+
+def run(clients: int, duration: float) -> None:
+    rows = []
+    for enabled in ("false", "true"):
+        with running_server({"USER_CACHE_ENABLED": enabled}) as base_url:
+            headers = register_and_login(base_url)
+            samples, snapshot = asyncio.run(
+                _drive(base_url, headers, clients, duration)
+            )
+        rows.append({
+            "user cache": enabled,
+            "requests/s": len(samples) / duration,
+            **percentiles(samples),
+            "hits": _counter(snapshot, "user_cache_hits"),
+            "misses": _counter(snapshot, "user_cache_misses"),
+        })
+    print_table(
+        f"GET /api/messages/{{session_id}} ({clients} clients, "
+        f"{duration:.0f}s) latency in ms",
+        rows,
+        ["user cache", "requests/s", "p50", "p95", "p99", "hits", "misses"],
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--clients", type=int, default=20)
+    parser.add_argument("--duration", type=float, default=10.0)
+    arguments = parser.parse_args()
+    run(arguments.clients, arguments.duration)
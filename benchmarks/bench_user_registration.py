@@ -0,0 +1,114 @@
+"""
+Database cost per registered user during bulk onboarding, without the
+bcrypt hash: the previous flow (get_user_by_email, get_user_by_username,
+then create_user with its refresh) against exists_by_email_or_username
+plus create_user_if_absent. Statements issued and latency per user.
+
+    python -m benchmarks.bench_user_registration --users 2000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+import uuid
+
+_DIRECTORY = tempfile.mkdtemp()
+os.environ.setdefault(
+    "DATABASE_URL", f"sqlite:///{_DIRECTORY}/bench_user_registration.db"
+)
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from sqlalchemy import event  # noqa: E402
+
+from app.domain.entities.user import User  # noqa: E402
+from app.domain.value_objects import (  # noqa: E402
+    EmailField,
+    PasswordHashField,
+    UsernameField,
+    UUIDField,
+)
+from app.infrastructure.persistence.database import (  # noqa: E402
+    SessionLocal,
+    create_db_tables,
+    engine,
+)
+from app.infrastructure.persistence.repositories.user_repository import (  # noqa: E402,E501
+    SQLAlchemyUserRepository,
+)
+from benchmarks._common import print_table  # noqa: E402
+
+PASSWORD_HASH = "$2b$12$d1.KSoZmbtgRKbbFO8uY1.vRcbZDV0DBzrXIP/v/Cy8MBo7xlf/OS"
+
+statements = []
+
+
+@event.listens_for(engine, "before_cursor_execute")
+def _count_statement(conn, cursor, statement, *args):
+    statements.append(statement.split(None, 1)[0].upper())
+
+
+def _new_user() -> User:
+    suffix = uuid.uuid4().hex[:12]
+    return User(
+        id=UUIDField(uuid.uuid4()),
+        email=EmailField(f"user_{suffix}@example.com"),
+        username=UsernameField(f"user_{suffix}"),
+        password_hash=PasswordHashField(PASSWORD_HASH),
+    )
+
+
+def _check_then_create(repository, user):
+    if repository.get_user_by_email(user.email):
+        return None
+    if repository.get_user_by_username(user.username):
+        return None
+    return repository.create_user(user)
+
+
+def _exists_then_create(repository, user):
+    email_taken, username_taken = repository.exists_by_email_or_username(
+        user.email, user.username
+    )
+    if email_taken or username_taken:
+        return None
+    return repository.create_user_if_absent(user)
+
+
+def run(users: int) -> None:
+    create_db_tables()
+    rows = []
+    for label, register in (
+        ("two lookups", _check_then_create),
+        ("single query", _exists_then_create),
+    ):
+        db = SessionLocal()
+        repository = SQLAlchemyUserRepository(db)
+        new_users = [_new_user() for _ in range(users)]
+        statements.clear()
+        started = time.perf_counter()
+        for user in new_users:
+            register(repository, user)
+        elapsed = time.perf_counter() - started
+        db.close()
+
+        rows.append({
+            "flow": label,
+            "stmts/user": len(statements) / users,
+            "SELECT/user": statements.count("SELECT") / users,
+            "ms/user": elapsed * 1000 / users,
+            "users/s": users / elapsed,
+        })
+
+    print_table(
+        f"user registration x{users} on SQLite (bcrypt excluded)",
+        rows,
+        ["flow", "stmts/user", "SELECT/user", "ms/user", "users/s"],
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, default=2000)
+    arguments = parser.parse_args()
+    run(arguments.users)
@@ -0,0 +1,110 @@
+"""
+Rebuild latency of a moderation wordlist of 100k terms loaded from a
+file, and the masking latency seen by requests while the new engine is
+built on the reloader thread and swapped in, against an idle reloader.
+
+    python -m benchmarks.bench_wordlist_reload --terms 100000 --reloads 3
+"""
+import argparse
+import os
+import random
+import string
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from app.core.metrics import MetricsRegistry  # noqa: E402
+from app.core.moderation import ContentFilterReloader  # noqa: E402
+from app.domain.content_filter import get_content_filter  # noqa: E402
+from benchmarks._common import percentiles, print_table  # noqa: E402
+
+MESSAGE = "hola como estas, este es un mensaje de chat normal " * 4
+
+
+def _write_wordlist(path: str, terms: int) -> None:
+    words = set()
+    while len(words) < terms:
+        words.add("".join(
+            random.choice(string.ascii_lowercase)
+            for _ in range(random.randint(5, 12))
+        ))
+    with open(path, "w", encoding="utf-8") as wordlist:
+        wordlist.write("\n".join(words) + "\n")
+
+
+def _mask_while(running: threading.Event) -> list:
+    samples = []
+    while running.is_set():
+        started = time.perf_counter()
+        get_content_filter().mask(MESSAGE)
+        samples.append((time.perf_counter() - started) * 1_000_000)
+        time.sleep(0.0005)
+    return samples
+
+
+def _measure_requests(action) -> list:
+    running = threading.Event()
+    running.set()
+    result = {}
+    requests = threading.Thread(
+        target=lambda: result.setdefault("samples", _mask_while(running))
+    )
+    requests.start()
+    try:
+        action()
+    finally:
+        running.clear()
+        requests.join()
+    return result["samples"]
+
+
+def run(terms: int, reloads: int, engine: str) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "wordlist.txt")
+        _write_wordlist(path, terms)
+        registry = MetricsRegistry()
+        reloader = ContentFilterReloader(path, engine, registry=registry)
+        reloader.load(force=True)
+
+        build_ms = []
+        rebuilding = []
+        for _ in range(reloads):
+            def reload():
+                reloader.load(force=True)
+                build_ms.append(
+                    registry.snapshot()["content_filter_build_ms"]["value"]
+                )
+
+            rebuilding += _measure_requests(reload)
+        idle = _measure_requests(lambda: time.sleep(max(build_ms) / 1000))
+
+    print_table(
+        f"Wordlist rebuild ({terms} terms, {engine} engine, "
+        f"{reloads} reloads) in ms",
+        [{"reloads": reloads, **percentiles(build_ms)}],
+        ["reloads", "p50", "p95", "p99", "mean"],
+    )
+    print_table(
+        "Masking latency of concurrent requests in µs",
+        [
+            {"reloader": "idle", "requests": len(idle),
+             **percentiles(idle)},
+            {"reloader": "rebuilding", "requests": len(rebuilding),
+             **percentiles(rebuilding)},
+        ],
+        ["reloader", "requests", "p50", "p95", "p99", "mean"],
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--terms", type=int, default=100000)
+    parser.add_argument("--reloads", type=int, default=3)
+    parser.add_argument("--engine", default="auto")
+    parser.add_argument("--seed", type=int, default=18)
+    arguments = parser.parse_args()
+    random.seed(arguments.seed)
+    run(arguments.terms, arguments.reloads, arguments.engine)
@@ -0,0 +1,91 @@
+"""
+Concurrent single-message ingest through POST /api/messages/ with the
+write-behind buffer disabled and enabled (group commit).
+
+    python -m benchmarks.bench_write_buffer --clients 32 --messages 3000
+"""
+import argparse
+import asyncio
+import time
+import uuid
+
+import httpx
+
+from benchmarks._common import (
+    message_payload,
+    percentiles,
+    print_table,
+    register_and_login,
+    running_server,
+)
+
+
+async def _writer(client, headers, session_id, remaining, samples):
+    while remaining:
+        remaining.pop()
+        started = time.perf_counter()
+        response = await client.post(
+            "/api/messages/",
+            json=message_payload(session_id),
+            headers=headers,
+        )
+        response.raise_for_status()
+        samples.append((time.perf_counter() - started) * 1000)
+
+
+async def _drive(base_url, headers, clients, messages):
+    remaining = list(range(messages))
+    samples = []
+    limits = httpx.Limits(max_connections=clients)
+    async with httpx.AsyncClient(
+        base_url=base_url, limits=limits, timeout=120
+    ) as client:
+        started = time.perf_counter()
+        await asyncio.gather(*(
+            _writer(client, headers, str(uuid.uuid4()), remaining, samples)
+            for _ in range(clients)
+        ))
+        elapsed = time.perf_counter() - started
+        snapshot = (
+            await client.get("/api/metrics/", headers=headers)
+        ).json()
+        flush_size = snapshot.get(
+            "message_write_buffer_flush_size", {}
+        ).get("mean")
+    return elapsed, samples, flush_size
+
+
+def run(clients: int, messages: int, delay_ms: float) -> None:
+    rows = []
+    for enabled in ("false", "true"):
+        env = {
+            "MESSAGE_WRITE_BUFFER_ENABLED": enabled,
+            "MESSAGE_WRITE_BUFFER_MAX_DELAY_MS": str(delay_ms),
+        }
+        with running_server(env) as base_url:
+            headers = register_and_login(base_url)
+            elapsed, samples, flush_size = asyncio.run(
+                _drive(base_url, headers, clients, messages)
+            )
+        rows.append({
+            "buffer": "on" if enabled == "true" else "off",
+            "msg/s": messages / elapsed,
+            "avg_flush": flush_size or 1.0,
+            **percentiles(samples),
+        })
+
+    print_table(
+        f"{messages} messages from {clients} concurrent clients "
+        f"(buffer delay {delay_ms} ms), latency in ms",
+        rows,
+        ["buffer", "msg/s", "avg_flush", "p50", "p99"],
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--clients", type=int, default=32)
+    parser.add_argument("--messages", type=int, default=3000)
+    parser.add_argument("--delay-ms", type=float, default=5.0)
+    arguments = parser.parse_args()
+    run(arguments.clients, arguments.messages, arguments.delay_ms)
@@ -0,0 +1,99 @@
+"""
+Per-message cost of AsyncMessageService.register_message on SQLite with the
+check_then_insert and insert_or_conflict write modes: SQL statements
+issued and latency per message.
+
+    python -m benchmarks.bench_write_mode --messages 2000
+"""
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime
+
+_DIRECTORY = tempfile.mkdtemp()
+os.environ.setdefault(
+    "DATABASE_URL", f"sqlite:///{_DIRECTORY}/bench_write_mode.db"
+)
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from sqlalchemy import event  # noqa: E402
+
+from app.infrastructure.persistence.database import (  # noqa: E402
+    SessionLocal,
+    create_db_tables,
+    engine,
+)
+from app.infrastructure.persistence.repositories.message_repository import (  # noqa: E402,E501
+    SQLAlchemyMessageRepository,
+)
+from app.infrastructure.persistence.repositories.async_message_repository import (  # noqa: E402,E501
+    BlockingMessageRepositoryAdapter,
+)
+from app.services.message_service import AsyncMessageService  # noqa: E402
+from benchmarks._common import print_table  # noqa: E402
+
+statements = []
+
+
+@event.listens_for(engine, "before_cursor_execute")
+def _count_statement(conn, cursor, statement, *args):
+    statements.append(statement.split(None, 1)[0].upper())
+
+
+async def _register(service: AsyncMessageService, payloads: list) -> float:
+    started = time.perf_counter()
+    for payload in payloads:
+        await service.register_message(payload)
+    return time.perf_counter() - started
+
+
+def run(messages: int) -> None:
+    create_db_tables()
+    rows = []
+    for write_mode in ("check_then_insert", "insert_or_conflict"):
+        db = SessionLocal()
+        service = AsyncMessageService(
+            BlockingMessageRepositoryAdapter(SQLAlchemyMessageRepository(db)),
+            write_mode=write_mode,
+            processing_pool=None,
+        )
+        session_id = str(uuid.uuid4())
+        payloads = [
+            {
+                "message_id": str(uuid.uuid4()),
+                "session_id": session_id,
+                "content": "Hola, este es un mensaje de prueba.",
+                "timestamp": datetime.now().isoformat(),
+                "sender": "user",
+            }
+            for _ in range(messages)
+        ]
+        statements.clear()
+        elapsed = asyncio.run(_register(service, payloads))
+        db.close()
+
+        kinds = {kind: statements.count(kind) for kind in set(statements)}
+        rows.append({
+            "mode": write_mode,
+            "stmts/msg": len(statements) / messages,
+            "SELECT/msg": kinds.get("SELECT", 0) / messages,
+            "INSERT/msg": kinds.get("INSERT", 0) / messages,
+            "ms/msg": elapsed * 1000 / messages,
+        })
+
+    print_table(
+        f"register_message x{messages} on SQLite",
+        rows,
+        ["mode", "stmts/msg", "SELECT/msg", "INSERT/msg", "ms/msg"],
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=2000)
+    arguments = parser.parse_args()
+    run(arguments.messages)
@@ -1,14 +1,28 @@
+import asyncio
 from fastapi import FastAPI
-from app.infrastructure.persistence.database import create_db_tables
+from fastapi.responses import ORJSONResponse
+from app.infrastructure.persistence.database import (
+    create_db_tables,
+    dispose_engines
+)
 from app.infrastructure.routes.auth_routes import router as auth_router
 from app.infrastructure.routes.user_routes import router as user_router
 from app.infrastructure.routes.message_router import router as message_router
+from app.infrastructure.routes.metrics_routes import router as metrics_router
+from app.infrastructure.persistence.write_buffer import message_write_buffer
+from app.core.password_hasher import password_hasher
+from app.services.message_processing_pool import message_processing_pool
+from app.core.moderation import (
+    configure_content_filter,
+    content_filter_reloader
+)
 
 app = FastAPI(
     title="API de Procesamiento de Mensajes de Chat",
     description="Una API RESTful simple para procesar y\
         almacenar mensajes de chat.",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
 )
 
 
@@ -16,15 +30,41 @@ app = FastAPI(
 def on_startup():
     """
     Function that runs when the application starts.
-    Creates the database tables if they don't exist.
+    Creates the database tables if they don't exist, builds the
+    moderation engine and warms up the message processing pool.
     """
     create_db_tables()
+    configure_content_filter()
     print("Database and tables initialized.")
+    if message_write_buffer is not None:
+        message_write_buffer.start()
+    if message_processing_pool is not None:
+        message_processing_pool.start()
+
+
+@app.on_event("shutdown")
+async def on_shutdown():
+    """
+    Function that runs when the application stops.
+    Drains the message write buffer, stops the password hasher and
+    message processing pools and the wordlist reloader and releases the
+    pooled database connections.
+    """
+    if message_write_buffer is not None:
+        # Joining the writer thread blocks until the queue is drained
+        await asyncio.to_thread(message_write_buffer.close)
+    if message_processing_pool is not None:
+        message_processing_pool.close()
+    if content_filter_reloader is not None:
+        content_filter_reloader.close()
+    password_hasher.close()
+    await dispose_engines()
 
 
 app.include_router(auth_router, prefix="/api")
 app.include_router(user_router, prefix="/api")
 app.include_router(message_router, prefix="/api")
+app.include_router(metrics_router, prefix="/api")
 
 
 @app.get("/")
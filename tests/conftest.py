@@ -2,10 +2,15 @@ from datetime import datetime
 import uuid
 import pytest
 from unittest.mock import create_autospec, MagicMock
-from app.services.user_service import UserService
-from app.services.message_service import MessageService
-from app.domain.ports.user_repository_port import UserRepositoryPort
-from app.domain.ports.message_repository_port import MessageRepositoryPort
+from app.core.password_hasher import password_hasher
+from app.services.user_service import AsyncUserService
+from app.services.message_service import AsyncMessageService
+from app.domain.ports.async_user_repository_port import (
+    AsyncUserRepositoryPort
+)
+from app.domain.ports.async_message_repository_port import (
+    AsyncMessageRepositoryPort
+)
 from app.domain.entities.user import User
 from app.domain.entities.message import Message
 from app.domain.value_objects import (
@@ -61,12 +66,12 @@ def valid_datetime_now():
 
 @pytest.fixture
 def user_repository_mock():
-    return create_autospec(UserRepositoryPort)
+    return create_autospec(AsyncUserRepositoryPort)
 
 
 @pytest.fixture
 def user_service(user_repository_mock):
-    return UserService(user_repository_mock)
+    return AsyncUserService(user_repository_mock)
 
 
 @pytest.fixture
@@ -79,10 +84,8 @@ def valid_user_data():
 
 
 @pytest.fixture
-def mocked_user_entity(valid_user_data, user_service):
-    hashed_password = user_service._get_password_hash(
-        valid_user_data["password"]
-        )
+def mocked_user_entity(valid_user_data):
+    hashed_password = password_hasher.hash(valid_user_data["password"])
     return User(
         id=UUIDField(uuid.uuid4()),
         email=EmailField(valid_user_data["email"]),
@@ -93,12 +96,12 @@ def mocked_user_entity(valid_user_data, user_service):
 
 @pytest.fixture
 def message_repository_mock():
-    return create_autospec(MessageRepositoryPort)
+    return create_autospec(AsyncMessageRepositoryPort)
 
 
 @pytest.fixture
 def message_service(message_repository_mock):
-    return MessageService(message_repository_mock)
+    return AsyncMessageService(message_repository_mock)
 
 
 @pytest.fixture
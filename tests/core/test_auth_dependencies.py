@@ -0,0 +1,119 @@
+import uuid
+from unittest.mock import AsyncMock, create_autospec
+import pytest
+from fastapi import HTTPException
+from app.core import auth_dependencies
+from app.core.auth_dependencies import get_current_user
+from app.core.metrics import MetricsRegistry
+from app.core.revocation import RevocationList
+from app.core.security import (
+    create_access_token,
+    create_user_access_token
+)
+from app.domain.ports.async_token_revocation_repository_port import (
+    AsyncTokenRevocationRepositoryPort
+)
+from app.services.token_revocation_service import (
+    AsyncTokenRevocationService
+)
+
+
+@pytest.fixture
+def revocation_service():
+    repository = create_autospec(AsyncTokenRevocationRepositoryPort)
+    repository.get_token_revocations.return_value = ([], {})
+    return AsyncTokenRevocationService(
+        repository,
+        RevocationList(capacity=10, registry=MetricsRegistry())
+    )
+
+
+@pytest.fixture
+def user_service():
+    user_service = AsyncMock()
+    user_service.get_user_by_id.return_value = None
+    return user_service
+
+
+@pytest.fixture
+def token(mock_user_entity):
+    return create_user_access_token(mock_user_entity)
+
+
+@pytest.mark.asyncio
+class TestGetCurrentUser:
+    async def test_stateless_mode_builds_user_from_claims(
+            self,
+            monkeypatch,
+            token,
+            user_service,
+            revocation_service,
+            mock_user_entity
+            ):
+        monkeypatch.setattr(
+            auth_dependencies, "AUTH_STATELESS_ENABLED", True
+        )
+
+        user = await get_current_user(token, user_service, revocation_service)
+
+        assert str(user.id) == str(mock_user_entity.id)
+        assert user.username.value == mock_user_entity.username.value
+        assert user.to_dict() == mock_user_entity.to_dict()
+        user_service.get_user_by_id.assert_not_called()
+
+    async def test_revoked_token_is_rejected(
+            self,
+            monkeypatch,
+            token,
+            user_service,
+            revocation_service,
+            mock_user_entity
+            ):
+        monkeypatch.setattr(
+            auth_dependencies, "AUTH_STATELESS_ENABLED", True
+        )
+        repository = revocation_service._token_revocation_repository
+        repository.get_token_revocations.return_value = (
+            [], {str(mock_user_entity.id): 1}
+        )
+
+        with pytest.raises(HTTPException) as error:
+            await get_current_user(token, user_service, revocation_service)
+
+        assert error.value.status_code == 401
+
+    async def test_unknown_user_is_rejected_with_401(
+            self,
+            user_service,
+            revocation_service
+            ):
+        token = create_access_token({"sub": str(uuid.uuid4())})
+
+        with pytest.raises(HTTPException) as error:
+            await get_current_user(token, user_service, revocation_service)
+
+        assert error.value.status_code == 401
+
+    async def test_revoked_token_is_rejected_without_stateless_mode(
+            self,
+            monkeypatch,
+            token,
+            user_service,
+            revocation_service,
+            mock_user_entity
+            ):
+        """The database mode checks revocations too, for logout."""
+        monkeypatch.setattr(
+            auth_dependencies, "AUTH_STATELESS_ENABLED", False
+        )
+        user_service.get_user_by_id.return_value = mock_user_entity
+        repository = revocation_service._token_revocation_repository
+        repository.get_token_revocations.return_value = (
+            [], {str(mock_user_entity.id): 1}
+        )
+
+        with pytest.raises(HTTPException) as error:
+            await get_current_user(token, user_service, revocation_service)
+
+        assert error.value.status_code == 401
+        user_service.get_user_by_id.assert_not_called()
@@ -0,0 +1,24 @@
+from app.core.bloom_filter import BloomFilter
+
+
+class TestBloomFilter:
+    def test_added_items_are_always_found(self):
+        items = [f"token-{index}" for index in range(1000)]
+        bloom = BloomFilter(capacity=1000, items=items)
+
+        assert all(bloom.might_contain(item) for item in items)
+
+    def test_false_positive_rate_stays_near_target(self):
+        """At capacity, unknown items match at about the target rate."""
+        bloom = BloomFilter(
+            capacity=1000,
+            false_positive_rate=0.01,
+            items=(f"revoked-{index}" for index in range(1000))
+        )
+
+        false_positives = sum(
+            bloom.might_contain(f"active-{index}") for index in range(10000)
+        )
+
+        assert false_positives < 300
+        assert bloom.size_in_bytes < 2000
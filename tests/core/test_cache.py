@@ -0,0 +1,84 @@
+from app.core.cache import TTLCache
+from app.core.metrics import MetricsRegistry
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _cache(registry, clock=None, max_size=2, ttl_seconds=10):
+    return TTLCache(
+        name="test_cache",
+        max_size=max_size,
+        ttl_seconds=ttl_seconds,
+        clock=clock or FakeClock(),
+        registry=registry
+    )
+
+
+class TestTTLCache:
+    def test_hits_and_misses_are_counted(self):
+        registry = MetricsRegistry()
+        cache = _cache(registry)
+
+        assert cache.get("a") is None
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+
+        snapshot = registry.snapshot()
+        assert snapshot["test_cache_hits"]["value"] == 1
+        assert snapshot["test_cache_misses"]["value"] == 1
+        assert snapshot["test_cache_size"]["value"] == 1
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Reading an entry keeps it over the ones not read since."""
+        registry = MetricsRegistry()
+        cache = _cache(registry)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert (cache.get("a"), cache.get("c")) == (1, 3)
+        assert registry.snapshot()["test_cache_evictions"]["value"] == 1
+
+    def test_entries_expire_after_ttl(self):
+        clock = FakeClock()
+        cache = _cache(MetricsRegistry(), clock=clock, ttl_seconds=10)
+        cache.set("a", 1)
+
+        clock.now = 9.9
+        assert cache.get("a") == 1
+        clock.now = 10
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_value_loaded_before_an_invalidation_is_dropped(self):
+        """A slow load cannot put back an entry invalidated meanwhile."""
+        cache = _cache(MetricsRegistry())
+        version = cache.version
+
+        cache.invalidate("a")
+        cache.set("a", "stale", version=version)
+
+        assert cache.get("a") is None
+
+    def test_entry_ttl_is_capped_by_the_cache_ttl(self):
+        clock = FakeClock()
+        cache = _cache(MetricsRegistry(), clock=clock, ttl_seconds=10)
+        cache.set("short", 1, ttl_seconds=2)
+        cache.set("long", 2, ttl_seconds=60)
+        cache.set("expired", 3, ttl_seconds=0)
+
+        clock.now = 5
+        assert cache.get("short") is None
+        assert cache.get("long") == 2
+        assert cache.get("expired") is None
+        clock.now = 10
+        assert cache.get("long") is None
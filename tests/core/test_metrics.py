@@ -0,0 +1,35 @@
+import pytest
+from app.core.metrics import MetricsRegistry
+
+
+class TestMetricsRegistry:
+    def test_same_name_returns_same_metric(self):
+        """Asking twice for a metric name returns the same instance."""
+        registry = MetricsRegistry()
+
+        registry.counter("requests_total").inc()
+        registry.counter("requests_total").inc(2)
+
+        assert registry.snapshot()["requests_total"]["value"] == 3
+
+    def test_histogram_snapshot(self):
+        """A histogram reports count, sum, extremes and bucket counts."""
+        registry = MetricsRegistry()
+        histogram = registry.histogram("latency_ms", buckets=(1, 10))
+
+        for value in (0.5, 5, 50):
+            histogram.observe(value)
+
+        snapshot = registry.snapshot()["latency_ms"]
+        assert snapshot["count"] == 3
+        assert snapshot["sum"] == 55.5
+        assert (snapshot["min"], snapshot["max"]) == (0.5, 50)
+        assert snapshot["buckets"] == {"1": 1, "10": 2}
+
+    def test_name_clash_between_types_raises(self):
+        """A name cannot be registered with two metric types."""
+        registry = MetricsRegistry()
+        registry.gauge("queue_depth")
+
+        with pytest.raises(ValueError):
+            registry.counter("queue_depth")
@@ -0,0 +1,115 @@
+import os
+import time
+import pytest
+from app.core.metrics import MetricsRegistry
+from app.core.moderation import ContentFilterReloader, read_wordlist
+from app.domain.content_filter import get_content_filter, set_content_filter
+from app.domain.value_objects import ContentField
+
+
+@pytest.fixture
+def registry():
+    return MetricsRegistry()
+
+
+@pytest.fixture(autouse=True)
+def restore_content_filter():
+    previous = get_content_filter()
+    yield
+    set_content_filter(previous)
+
+
+@pytest.fixture
+def wordlist(tmp_path):
+    path = tmp_path / "wordlist.txt"
+    path.write_text("# palabras bloqueadas\nhola\n\n  adios  \n")
+    return path
+
+
+def _replace(path, content):
+    # Written aside and renamed, the way deploys update the file
+    temporary = path.with_suffix(".tmp")
+    temporary.write_text(content)
+    os.replace(temporary, path)
+
+
+class TestContentFilterReloader:
+    def test_read_wordlist_skips_comments_and_blank_lines(self, wordlist):
+        assert read_wordlist(wordlist) == ["hola", "adios"]
+
+    def test_load_swaps_the_engine_and_publishes_metrics(
+            self,
+            wordlist,
+            registry
+            ):
+        reloader = ContentFilterReloader(str(wordlist), registry=registry)
+
+        assert reloader.load() is True
+
+        assert ContentField("Hola y adios, malo").value == "*** y ***, malo"
+        snapshot = registry.snapshot()
+        assert snapshot["content_filter_version"]["value"] == 1
+        assert snapshot["content_filter_words"]["value"] == 2
+        assert snapshot["content_filter_build_ms"]["value"] >= 0
+
+    def test_unchanged_file_is_not_rebuilt(self, wordlist, registry):
+        reloader = ContentFilterReloader(str(wordlist), registry=registry)
+        reloader.load()
+        engine = get_content_filter()
+
+        assert reloader.load() is False
+        assert get_content_filter() is engine
+        assert reloader.version == 1
+
+    def test_failed_reload_keeps_the_current_engine(self, wordlist, registry):
+        reloader = ContentFilterReloader(
+            str(wordlist), engine="regex", registry=registry
+        )
+        reloader.load()
+        engine = get_content_filter()
+
+        # The regex engine rejects nested words
+        _replace(wordlist, "spam\nspammer\n")
+        with pytest.raises(ValueError):
+            reloader.load()
+
+        assert get_content_filter() is engine
+        assert reloader.version == 1
+
+    def test_background_thread_picks_up_changes(self, wordlist, registry):
+        reloader = ContentFilterReloader(
+            str(wordlist), poll_seconds=0.01, registry=registry
+        )
+        reloader.load()
+        reloader.start()
+        try:
+            _replace(wordlist, "nuevo\n")
+            deadline = time.monotonic() + 5
+            while reloader.version < 2 and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            reloader.close()
+
+        assert reloader.version == 2
+        assert ContentField("hola nuevo").value == "hola ***"
+
+    def test_background_errors_are_counted(self, wordlist, registry):
+        reloader = ContentFilterReloader(
+            str(wordlist), poll_seconds=0.01, registry=registry
+        )
+        reloader.load()
+        wordlist.unlink()
+        reloader.start()
+        try:
+            deadline = time.monotonic() + 5
+            while (
+                registry.snapshot()["content_filter_reload_errors"]["value"]
+                == 0 and time.monotonic() < deadline
+            ):
+                time.sleep(0.01)
+        finally:
+            reloader.close()
+
+        snapshot = registry.snapshot()
+        assert snapshot["content_filter_reload_errors"]["value"] >= 1
+        assert reloader.version == 1
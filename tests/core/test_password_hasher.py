@@ -0,0 +1,75 @@
+import asyncio
+import threading
+import pytest
+from app.core.metrics import MetricsRegistry
+from app.core.password_hasher import PasswordHasher
+from app.domain.exceptions import ServiceUnavailableError
+
+
+@pytest.fixture
+def registry():
+    return MetricsRegistry()
+
+
+def _hasher(registry, **options):
+    options.setdefault("rounds", 4)
+    return PasswordHasher(registry=registry, **options)
+
+
+@pytest.mark.asyncio
+class TestPasswordHasher:
+    async def test_hash_uses_configured_rounds(self, registry):
+        hasher = _hasher(registry, rounds=5)
+
+        hashed = await hasher.hash_async("StrongPassword123")
+
+        assert hashed.startswith("$2b$05$")
+        assert await hasher.verify_async("StrongPassword123", hashed)
+        assert not await hasher.verify_async("WrongPassword123", hashed)
+        hasher.close()
+
+    async def test_saturated_pool_rejects_after_queue_timeout(
+            self,
+            registry
+            ):
+        """With every slot taken, a caller waits queue_timeout, then fails."""
+        hasher = _hasher(
+            registry, max_workers=1, max_pending=0, queue_timeout=0.05
+        )
+        release = threading.Event()
+        hasher.hash = lambda password: release.wait(5)
+
+        running = asyncio.ensure_future(hasher.hash_async("first"))
+        await asyncio.sleep(0.01)
+        with pytest.raises(ServiceUnavailableError) as error:
+            await hasher.hash_async("second")
+
+        release.set()
+        assert await running is True
+        assert error.value.code == "PASSWORD_HASHER_BUSY"
+        snapshot = registry.snapshot()
+        assert snapshot["password_hasher_rejected"]["value"] == 1
+        assert snapshot["password_hasher_in_flight"]["value"] == 0
+        hasher.close()
+
+    async def test_waiting_caller_runs_once_a_slot_frees(self, registry):
+        hasher = _hasher(
+            registry, max_workers=1, max_pending=0, queue_timeout=5
+        )
+        release = threading.Event()
+        blocking_hash = hasher.hash
+        hasher.hash = lambda password: (
+            release.wait(5) and blocking_hash(password)
+        )
+
+        first = asyncio.ensure_future(hasher.hash_async("first"))
+        second = asyncio.ensure_future(hasher.hash_async("second"))
+        await asyncio.sleep(0.01)
+        assert not second.done()
+        release.set()
+
+        hashes = await asyncio.gather(first, second)
+
+        assert all(hasher.verify(password, hashed) for password, hashed in
+                   zip(("first", "second"), hashes))
+        hasher.close()
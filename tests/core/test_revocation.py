@@ -0,0 +1,67 @@
+from app.core.metrics import MetricsRegistry
+from app.core.revocation import RevocationList
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _revocation_list(clock=None):
+    return RevocationList(
+        capacity=100,
+        refresh_seconds=30,
+        clock=clock or FakeClock(),
+        registry=MetricsRegistry()
+    )
+
+
+class TestRevocationList:
+    def test_revoked_jti_and_older_user_versions_are_revoked(self):
+        revocations = _revocation_list()
+        revocations.revoke_token("revoked-jti")
+        revocations.set_user_version("user-id", 2)
+
+        assert revocations.is_revoked("revoked-jti", "other-user", 0)
+        assert revocations.is_revoked("active-jti", "user-id", 1)
+        assert not revocations.is_revoked("active-jti", "user-id", 2)
+        assert not revocations.is_revoked("active-jti", "other-user", 0)
+
+    def test_only_one_caller_refreshes_per_interval(self):
+        clock = FakeClock()
+        revocations = _revocation_list(clock)
+
+        assert revocations.claim_refresh()
+        assert not revocations.claim_refresh()
+        clock.now = 30
+        assert revocations.claim_refresh()
+
+    def test_failed_refresh_is_retried_right_away(self):
+        revocations = _revocation_list()
+        revocations.claim_refresh()
+
+        revocations.retry_refresh()
+
+        assert revocations.claim_refresh()
+
+    def test_replace_keeps_revocations_made_during_the_reload(self):
+        """
+        A revocation committed after the reload query started is not in
+        its result, but must not be lost when the result is applied.
+        """
+        revocations = _revocation_list()
+        revocations.revoke_token("old-jti")
+        revocations.claim_refresh()
+        revocations.revoke_token("new-jti")
+        revocations.set_user_version("user-id", 1)
+
+        revocations.replace(["stored-jti"], {"other-user": 3})
+
+        assert not revocations.is_revoked("old-jti", "anyone", 0)
+        assert revocations.is_revoked("new-jti", "anyone", 0)
+        assert revocations.is_revoked("stored-jti", "anyone", 0)
+        assert revocations.is_revoked(None, "user-id", 0)
+        assert revocations.is_revoked(None, "other-user", 2)
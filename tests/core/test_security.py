@@ -0,0 +1,82 @@
+from datetime import timedelta
+from unittest.mock import patch
+import pytest
+from fastapi import HTTPException
+from jose import jwt
+from jose.exceptions import ExpiredSignatureError
+from app.core import security
+from app.core.cache import TTLCache
+from app.core.metrics import MetricsRegistry
+from app.core.security import create_access_token, verify_token
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(security, "token_cache", TTLCache(
+        name="token_cache_test",
+        max_size=10,
+        ttl_seconds=300,
+        clock=clock,
+        registry=MetricsRegistry()
+    ))
+    return clock
+
+
+class TestVerifyToken:
+    def test_verified_token_is_served_from_cache(self, clock):
+        token = create_access_token({"sub": "user-id"})
+
+        with patch.object(
+                security.jwt, "decode", wraps=jwt.decode) as decode:
+            first = verify_token(token)
+            second = verify_token(token)
+
+        assert first == second
+        assert second["sub"] == "user-id"
+        decode.assert_called_once()
+
+    def test_cached_token_is_rejected_once_expired(self, clock):
+        """After exp the token is decoded again and reported as expired."""
+        token = create_access_token(
+            {"sub": "user-id"}, expires_delta=timedelta(seconds=30)
+        )
+        verify_token(token)
+        clock.now = 31
+
+        with patch.object(
+                security.jwt, "decode",
+                side_effect=ExpiredSignatureError("Signature has expired.")):
+            with pytest.raises(HTTPException) as error:
+                verify_token(token)
+
+        assert error.value.status_code == 401
+        assert error.value.detail["error"] == "TOKEN_EXPIRED"
+
+    def test_expired_token_is_not_cached(self, clock):
+        token = create_access_token(
+            {"sub": "user-id"}, expires_delta=timedelta(seconds=-1)
+        )
+
+        for _ in range(2):
+            with pytest.raises(HTTPException) as error:
+                verify_token(token)
+            assert error.value.detail["error"] == "TOKEN_EXPIRED"
+        assert len(security.token_cache) == 0
+
+    def test_invalid_token_is_not_cached(self, clock):
+        token = create_access_token({"sub": "user-id"}) + "x"
+
+        with pytest.raises(HTTPException) as error:
+            verify_token(token)
+
+        assert error.value.detail["error"] == "INVALID_TOKEN"
+        assert len(security.token_cache) == 0
@@ -27,3 +27,9 @@ class TestContentField:
         content_field = ContentField(content_with_inappropriate_words)
         expected_value = "Este es un mensaje *** y ***."
         assert content_field.value == expected_value
+
+    def test_from_storage_does_not_filter_again(self):
+        """Stored content is wrapped as it is, it was filtered on write."""
+        content_field = ContentField.from_storage("Este es un mensaje ***")
+
+        assert content_field == ContentField("Este es un mensaje malo")
@@ -0,0 +1,107 @@
+import random
+import pytest
+from app.domain.content_filter import (
+    DEFAULT_INAPPROPRIATE_WORDS,
+    AhoCorasickFilterEngine,
+    RegexFilterEngine,
+    SequentialFilterEngine,
+    build_content_filter,
+    get_content_filter,
+    set_content_filter
+)
+from app.domain.value_objects import ContentField
+
+SINGLE_PASS_ENGINES = [RegexFilterEngine, AhoCorasickFilterEngine]
+
+
+class TestContentFilterEngines:
+    @pytest.mark.parametrize("engine_class", SINGLE_PASS_ENGINES)
+    @pytest.mark.parametrize("text", [
+        "Este es un mensaje malo y ofensivo.",
+        "MALO, Malo y mAlO",
+        "prohibidofensivo",
+        "malofensivo spamspam",
+        "un mensaje limpio",
+    ])
+    def test_matches_the_sequential_engine(self, engine_class, text):
+        """Must mask exactly like one re.sub per word, in list order."""
+        expected = SequentialFilterEngine(
+            DEFAULT_INAPPROPRIATE_WORDS
+            ).mask(text)
+        engine = engine_class(DEFAULT_INAPPROPRIATE_WORDS)
+        assert engine.mask(text) == expected
+
+    def test_overlapping_words_follow_the_list_order(self):
+        """A word earlier in the list wins over an overlapping one."""
+        engine = AhoCorasickFilterEngine(["bc", "ab"])
+        assert engine.mask("abc") == "a***"
+        engine = AhoCorasickFilterEngine(["ab", "bc"])
+        assert engine.mask("abc") == "***c"
+
+    def test_case_folding_agrees_with_re(self):
+        """Must treat the re.IGNORECASE special cases like re does."""
+        words = ["spam", "kilo", "bit"]
+        text = "ſPAM Kilo bıt"
+        expected = SequentialFilterEngine(words).mask(text)
+        for engine_class in SINGLE_PASS_ENGINES:
+            assert engine_class(words).mask(text) == expected
+        assert expected == "*** *** ***"
+
+    @pytest.mark.parametrize("engine_class", SINGLE_PASS_ENGINES)
+    def test_random_lists_match_the_sequential_engine(self, engine_class):
+        """Must agree with the sequential engine on random lists."""
+        rng = random.Random(17)
+        for _ in range(300):
+            words = [
+                "".join(rng.choice("abcAB") for _ in range(rng.randint(1, 4)))
+                for _ in range(rng.randint(1, 6))
+            ]
+            text = "".join(rng.choice("abcABC ") for _ in range(40))
+            try:
+                engine = engine_class(words)
+            except ValueError:
+                continue
+            assert engine.mask(text) == SequentialFilterEngine(
+                words
+                ).mask(text)
+
+    def test_regex_engine_rejects_nested_words(self):
+        """Must refuse lists where a word contains another one."""
+        with pytest.raises(ValueError):
+            RegexFilterEngine(["spam", "spammer"])
+
+    @pytest.mark.parametrize("engine_class", SINGLE_PASS_ENGINES)
+    def test_single_pass_engines_reject_replacement_words(
+            self,
+            engine_class
+            ):
+        """Must refuse words a previous replacement could create."""
+        with pytest.raises(ValueError):
+            engine_class(["**"])
+
+
+class TestBuildContentFilter:
+    def test_auto_keeps_short_lists_sequential(self):
+        engine = build_content_filter(DEFAULT_INAPPROPRIATE_WORDS)
+        assert engine.name == "sequential"
+
+    def test_auto_uses_the_automaton_for_long_lists(self):
+        words = [f"palabra{index}x" for index in range(100)]
+        assert build_content_filter(words).name == "aho_corasick"
+
+    def test_auto_falls_back_for_unsupported_words(self):
+        words = [f"palabra{index}x" for index in range(100)] + ["*"]
+        assert build_content_filter(words).name == "sequential"
+
+    def test_unknown_engine_raises_value_error(self):
+        with pytest.raises(ValueError):
+            build_content_filter(engine="fancy")
+
+    def test_content_field_masks_with_the_shared_engine(self):
+        """ContentField must use the engine installed at startup."""
+        previous = get_content_filter()
+        set_content_filter(build_content_filter(["hola"], "aho_corasick"))
+        try:
+            assert ContentField("Hola, malo").value == "***, malo"
+        finally:
+            set_content_filter(previous)
@@ -0,0 +1,45 @@
+import uuid
+from datetime import datetime
+import pytest
+from app.domain.value_objects import CursorField
+from app.domain.exceptions import (
+    DomainValidationException,
+    RequiredFieldException
+)
+
+
+class TestCursorField:
+    def test_cursor_round_trip(self, valid_uuid_str, valid_datetime_now):
+        """Encode a position and decode the same direction and position."""
+        cursor = CursorField.from_position(
+            CursorField.NEXT,
+            valid_datetime_now,
+            uuid.UUID(valid_uuid_str)
+            )
+
+        decoded = CursorField(str(cursor))
+
+        assert decoded.direction == CursorField.NEXT
+        assert decoded.position == (valid_datetime_now, valid_uuid_str)
+
+    def test_cursor_is_url_safe(self, valid_uuid_str):
+        """The encoded cursor must not need escaping in a query string."""
+        cursor = CursorField.from_position(
+            CursorField.PREVIOUS,
+            datetime(2023, 6, 15, 14, 30),
+            valid_uuid_str
+            )
+
+        assert all(char.isalnum() or char in "-_" for char in cursor.value)
+
+    def test_invalid_cursor_raises_domain_validation_exception(self):
+        """Throw DomainValidationException for a tampered cursor."""
+        with pytest.raises(DomainValidationException) as excinfo:
+            CursorField("not-a-cursor")
+
+        assert excinfo.value.code == "INVALID_FORMAT"
+
+    def test_empty_cursor_raises_required_field_exception(self):
+        """Throw RequiredFieldException for an empty cursor."""
+        with pytest.raises(RequiredFieldException):
+            CursorField("")
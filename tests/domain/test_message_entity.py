@@ -82,3 +82,26 @@ class TestMessageEntity:
         assert isinstance(message.content, ContentField)
         assert isinstance(message.timestamp, DatetimeField)
         assert isinstance(message.sender, SenderField)
+
+    def test_message_and_fields_have_no_instance_dict(
+            self,
+            mocked_message_entity
+            ):
+        """Entities and value objects are slotted and compare by value."""
+        copy = Message.create_from_dict({
+            "id": UUIDField(str(mocked_message_entity.id)),
+            "session_id": mocked_message_entity.session_id,
+            "content": ContentField(mocked_message_entity.content.value),
+            "timestamp": mocked_message_entity.timestamp,
+            "sender": SenderField("user"),
+            "word_count": mocked_message_entity.word_count,
+            "character_count": mocked_message_entity.character_count,
+            "processed_at": mocked_message_entity.processed_at,
+            "created_at": mocked_message_entity.created_at,
+            "updated_at": mocked_message_entity.updated_at,
+        })
+
+        assert not hasattr(mocked_message_entity, "__dict__")
+        assert not hasattr(mocked_message_entity.content, "__dict__")
+        assert copy == mocked_message_entity
+        assert hash(copy.content) == hash(mocked_message_entity.content)
@@ -0,0 +1,21 @@
+import pytest
+from app.domain.value_objects import SearchCursorField
+from app.domain.exceptions import DomainValidationException
+
+
+class TestSearchCursorField:
+    def test_cursor_round_trip(self, valid_uuid_str):
+        """Encode a (rank, id) position and decode the same values."""
+        cursor = SearchCursorField.from_position(
+            -1.3253012048192771e-06, valid_uuid_str
+            )
+
+        assert SearchCursorField(str(cursor)).position == (
+            -1.3253012048192771e-06, valid_uuid_str
+            )
+
+    def test_invalid_cursor_raises_domain_validation_exception(self):
+        with pytest.raises(DomainValidationException) as excinfo:
+            SearchCursorField("not-a-cursor")
+
+        assert excinfo.value.code == "INVALID_FORMAT"
@@ -0,0 +1,31 @@
+import pytest
+from app.domain.value_objects import SearchQueryField
+from app.domain.exceptions import (
+    DomainValidationException,
+    RequiredFieldException
+)
+
+
+class TestSearchQueryField:
+    def test_match_expression_quotes_every_term(self):
+        """Full-text operators in the input are searched as plain words."""
+        query = SearchQueryField('envio OR "tarde" NEAR(')
+
+        assert query.match_expression == '"envio" "OR" "tarde" "NEAR"'
+
+    def test_trailing_star_searches_a_prefix(self):
+        assert SearchQueryField("entre*").match_expression == '"entre"*'
+
+    def test_empty_query_raises_required_field_exception(self):
+        with pytest.raises(RequiredFieldException):
+            SearchQueryField("   ")
+
+    def test_query_without_words_raises_domain_validation_exception(self):
+        with pytest.raises(DomainValidationException) as excinfo:
+            SearchQueryField('"" ()')
+
+        assert excinfo.value.code == "INVALID_FORMAT"
+
+    def test_too_long_query_raises_domain_validation_exception(self):
+        with pytest.raises(DomainValidationException):
+            SearchQueryField("a" * (SearchQueryField.MAX_LENGTH + 1))
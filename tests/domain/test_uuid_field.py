@@ -28,3 +28,10 @@ class TestUUIDField:
             UUIDField("invalid-uuid-string")
 
         assert "Formato de ID invalido." in str(excinfo.value.message)
+
+    def test_from_storage_parses_the_stored_text(self, valid_uuid_str):
+        """Rebuild a stored id as the same value the constructor gives."""
+        uuid_field = UUIDField.from_storage(valid_uuid_str)
+
+        assert uuid_field == UUIDField(valid_uuid_str)
+        assert isinstance(uuid_field.value, uuid.UUID)
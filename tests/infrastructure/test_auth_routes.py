@@ -0,0 +1,93 @@
+import pytest
+from fastapi.testclient import TestClient
+from app.infrastructure.persistence.database import get_db
+from main import app
+
+CREDENTIALS = {"email": "logout@example.com", "password": "Logout123"}
+
+
+@pytest.fixture
+def client(sqlite_session_factory):
+    def get_test_db():
+        db = sqlite_session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = get_test_db
+    client = TestClient(app)
+    client.post(
+        "/api/users/register",
+        json={**CREDENTIALS, "username": "logout_user"}
+    )
+    yield client
+    app.dependency_overrides.pop(get_db)
+
+
+def _login(client) -> dict:
+    response = client.post("/api/auth/token", json=CREDENTIALS)
+    assert response.status_code == 200
+    return response.json()
+
+
+def _refresh(client, tokens: dict):
+    return client.post(
+        "/api/auth/refresh",
+        json={"refresh_token": tokens["refresh_token"]}
+    )
+
+
+def _logout(client, tokens: dict, body: dict):
+    return client.post(
+        "/api/auth/logout",
+        json=body,
+        headers={"Authorization": f"Bearer {tokens['access_token']}"}
+    )
+
+
+class TestLogoutRevokesRefreshTokens:
+    def test_refresh_fails_after_logout_with_the_refresh_token(
+            self, client):
+        tokens = _login(client)
+        other_session = _login(client)
+
+        response = _logout(
+            client, tokens, {"refresh_token": tokens["refresh_token"]}
+        )
+
+        assert response.status_code == 200
+        refreshed = _refresh(client, tokens)
+        assert refreshed.status_code == 400
+        assert refreshed.json()["error"]["code"] == "REFRESH_TOKEN_REVOKED"
+        assert _refresh(client, other_session).status_code == 200
+
+    def test_refresh_fails_for_every_session_after_logout_of_all(
+            self, client):
+        tokens = _login(client)
+        other_session = _login(client)
+
+        response = _logout(client, tokens, {"all_sessions": True})
+
+        assert response.status_code == 200
+        assert _refresh(client, tokens).status_code == 400
+        assert _refresh(client, other_session).status_code == 400
+
+    def test_refresh_token_of_another_user_is_rejected(self, client):
+        client.post("/api/users/register", json={
+            "email": "other@example.com",
+            "username": "other_user",
+            "password": "Other1234"
+        })
+        other_tokens = client.post("/api/auth/token", json={
+            "email": "other@example.com", "password": "Other1234"
+        }).json()
+        tokens = _login(client)
+
+        response = _logout(
+            client, tokens, {"refresh_token": other_tokens["refresh_token"]}
+        )
+
+        assert response.status_code == 400
+        assert response.json()["error"]["code"] == "INVALID_REFRESH_TOKEN"
+        assert _refresh(client, other_tokens).status_code == 200
@@ -0,0 +1,79 @@
+from unittest.mock import create_autospec
+import pytest
+from sqlalchemy import text
+from app.core.cache import TTLCache
+from app.core.metrics import MetricsRegistry
+from app.domain.ports.async_user_repository_port import (
+    AsyncUserRepositoryPort
+)
+from app.infrastructure.persistence.repositories.async_user_repository \
+    import AsyncCachedUserRepository
+
+
+@pytest.fixture
+def cached_repository():
+    repository = create_autospec(AsyncUserRepositoryPort)
+    cache = TTLCache(
+        name="user_cache_test",
+        max_size=10,
+        ttl_seconds=60,
+        registry=MetricsRegistry()
+    )
+    return AsyncCachedUserRepository(repository, cache), repository
+
+
+@pytest.mark.asyncio
+class TestAsyncCachedUserRepository:
+    async def test_second_lookup_is_served_from_cache(
+            self,
+            cached_repository,
+            mock_user_entity
+            ):
+        repository, wrapped = cached_repository
+        wrapped.get_user_by_id.return_value = mock_user_entity
+
+        first = await repository.get_user_by_id(mock_user_entity.id)
+        second = await repository.get_user_by_id(mock_user_entity.id)
+
+        assert first is second is mock_user_entity
+        wrapped.get_user_by_id.assert_awaited_once()
+
+    async def test_missing_users_are_not_cached(
+            self,
+            cached_repository,
+            mock_user_entity
+            ):
+        repository, wrapped = cached_repository
+        wrapped.get_user_by_id.return_value = None
+
+        await repository.get_user_by_id(mock_user_entity.id)
+        await repository.get_user_by_id(mock_user_entity.id)
+
+        assert wrapped.get_user_by_id.await_count == 2
+
+    async def test_other_operations_go_to_the_wrapped_repository(
+            self,
+            cached_repository,
+            mock_user_entity
+            ):
+        repository, wrapped = cached_repository
+        wrapped.get_user_by_email.return_value = mock_user_entity
+
+        user = await repository.get_user_by_email(mock_user_entity.email)
+
+        assert user is mock_user_entity
+        wrapped.get_user_by_email.assert_awaited_once_with(
+            mock_user_entity.email
+            )
+
+
+class TestUserCacheInvalidation:
+    def test_rolled_back_session_keeps_working(self, sqlite_session_factory):
+        """A rollback discards the pending invalidations of the session."""
+        db = sqlite_session_factory()
+        db.info["user_cache_pending_invalidations"] = {"user-id"}
+        db.execute(text("SELECT 1"))
+        db.rollback()
+
+        assert "user_cache_pending_invalidations" not in db.info
+        db.close()
@@ -0,0 +1,19 @@
+import json
+import pytest
+from app.domain.exceptions import ServiceUnavailableError
+from app.infrastructure.decorators import handle_api_exceptions
+
+
+@pytest.mark.asyncio
+class TestHandleApiExceptions:
+    async def test_service_unavailable_maps_to_503(self):
+        @handle_api_exceptions
+        async def endpoint():
+            raise ServiceUnavailableError(code="PASSWORD_HASHER_BUSY")
+
+        response = await endpoint()
+
+        assert response.status_code == 503
+        body = json.loads(response.body)
+        assert body["status"] == "error"
+        assert body["error"]["code"] == "PASSWORD_HASHER_BUSY"
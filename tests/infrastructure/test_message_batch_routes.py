@@ -0,0 +1,78 @@
+import uuid
+from datetime import datetime
+import pytest
+from fastapi.testclient import TestClient
+from app.infrastructure.persistence.database import get_db
+from app.services import message_service
+from main import app
+
+CREDENTIALS = {"email": "batch@example.com", "password": "Batch1234"}
+
+
+@pytest.fixture
+def client(sqlite_session_factory):
+    def get_test_db():
+        db = sqlite_session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = get_test_db
+    client = TestClient(app)
+    client.post(
+        "/api/users/register",
+        json={**CREDENTIALS, "username": "batch_user"}
+    )
+    token = client.post("/api/auth/token", json=CREDENTIALS).json()
+    client.headers["Authorization"] = f"Bearer {token['access_token']}"
+    yield client
+    app.dependency_overrides.pop(get_db)
+
+
+def _message(**fields) -> dict:
+    return {
+        "message_id": str(uuid.uuid4()),
+        "session_id": "7dbc8073-6634-4b34-84db-9033f6133a95",
+        "content": "Hola, ¿cómo estás?",
+        "timestamp": datetime(2024, 1, 1, 10, 30).isoformat(),
+        "sender": "user",
+        **fields
+    }
+
+
+class TestMessageBatchRoutes:
+    def test_batch_returns_results_and_summary(self, client):
+        stored = _message()
+        client.post("/api/messages/", json=stored)
+        batch = [_message(), stored, _message(sender="bot")]
+
+        response = client.post("/api/messages/batch", json=batch)
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["summary"] == {"created": 1, "duplicate": 1, "invalid": 1}
+        assert [result["status"] for result in body["results"]] == [
+            "created", "duplicate", "invalid"
+        ]
+        assert [result["index"] for result in body["results"]] == [0, 1, 2]
+        assert [result["message_id"] for result in body["results"]] == [
+            message["message_id"] for message in batch
+        ]
+        assert body["results"][2]["error"]["code"] == "INVALID_FORMAT"
+
+    def test_empty_batch_is_rejected(self, client):
+        response = client.post("/api/messages/batch", json=[])
+
+        assert response.status_code == 400
+        assert response.json()["status"] == "error"
+
+    def test_batch_over_the_limit_is_rejected(self, client, monkeypatch):
+        monkeypatch.setattr(message_service, "MESSAGE_BATCH_MAX_SIZE", 2)
+
+        response = client.post(
+            "/api/messages/batch", json=[_message() for _ in range(3)]
+        )
+
+        assert response.status_code == 400
+        assert response.json()["error"]["code"] == "BATCH_TOO_LARGE"
@@ -0,0 +1,93 @@
+import uuid
+from dataclasses import replace
+from datetime import datetime, timedelta
+import pytest
+from app.domain.value_objects import UUIDField, DatetimeField, SenderField
+from app.infrastructure.persistence.repositories.message_repository import (
+    SQLAlchemyMessageRepository
+)
+
+
+@pytest.fixture
+def message_repository(sqlite_session_factory):
+    db = sqlite_session_factory()
+    yield SQLAlchemyMessageRepository(db)
+    db.close()
+
+
+@pytest.fixture
+def stored_messages(message_repository, mocked_message_entity):
+    started_at = datetime(2024, 1, 1)
+    messages = [
+        replace(
+            mocked_message_entity,
+            id=UUIDField(uuid.uuid4()),
+            sender=SenderField("user" if number % 2 else "system"),
+            created_at=DatetimeField(started_at + timedelta(seconds=number))
+        )
+        for number in range(5)
+    ]
+    message_repository.create_messages(messages)
+    message_repository.db.expunge_all()
+    return messages
+
+
+class TestMessageReadModel:
+    def test_views_render_the_same_page_as_the_entities(
+            self,
+            message_repository,
+            stored_messages
+            ):
+        session_id = stored_messages[0].session_id
+
+        views, total = message_repository.get_message_views_by_session_id(
+            session_id, limit=2, offset=1, sender="system"
+            )
+        entities, _ = message_repository.get_message_by_session_id(
+            session_id, limit=2, offset=1, sender="system"
+            )
+
+        assert total == 3
+        assert [view.to_dict() for view in views] == [
+            entity.to_dict() for entity in entities
+        ]
+
+    def test_view_pages_follow_the_keyset_cursor(
+            self,
+            message_repository,
+            stored_messages
+            ):
+        session_id = stored_messages[0].session_id
+
+        views, has_more = (
+            message_repository.get_message_view_page_by_session_id(
+                session_id, limit=3
+                )
+            )
+        entities, _ = message_repository.get_message_page_by_session_id(
+            session_id, limit=3
+            )
+
+        assert has_more is True
+        assert [view.id for view in views] == [
+            str(message.id) for message in reversed(stored_messages[2:])
+        ]
+        assert [view.position for view in views] == [
+            (entity.created_at.value, str(entity.id)) for entity in entities
+        ]
+
+    def test_views_do_not_load_orm_instances(
+            self,
+            message_repository,
+            stored_messages
+            ):
+        message = stored_messages[0]
+
+        view = message_repository.get_message_view_by_id(message.id)
+        message_repository.get_message_views_by_session_id(message.session_id)
+
+        assert view.to_dict() == message.to_dict()
+        assert len(message_repository.db.identity_map) == 0
+        assert message_repository.get_message_view_by_id(
+            UUIDField(uuid.uuid4())
+            ) is None
@@ -0,0 +1,111 @@
+import uuid
+from dataclasses import replace
+import pytest
+from app.domain.exceptions import (
+    DatabaseOperationError,
+    DomainValidationException
+)
+from app.domain.value_objects import UUIDField
+from app.infrastructure.persistence.repositories.message_repository import (
+    SQLAlchemyMessageRepository
+)
+from app.infrastructure.persistence.repositories.async_message_repository \
+    import BlockingMessageRepositoryAdapter
+from app.services.message_service import AsyncMessageService
+
+
+@pytest.fixture
+def message_repository(sqlite_session_factory):
+    db = sqlite_session_factory()
+    yield SQLAlchemyMessageRepository(db)
+    db.close()
+
+
+def _copy(message, **fields):
+    return replace(message, id=UUIDField(uuid.uuid4()), **fields)
+
+
+class TestCreateMessages:
+    def test_ids_stored_meanwhile_are_skipped(
+            self,
+            message_repository,
+            mocked_message_entity
+            ):
+        """
+        A message stored by another request after the lookup of existing
+        ids is left out instead of failing the whole batch.
+        """
+        stored = _copy(mocked_message_entity)
+        message_repository.create_message(stored)
+        new = _copy(mocked_message_entity)
+
+        created = message_repository.create_messages([stored, new])
+
+        assert created == [new]
+        assert message_repository.count_message_by_session_id(
+            new.session_id
+        ) == 2
+
+
+class TestCreateMessageIfAbsent:
+    def test_duplicate_id_returns_none(
+            self,
+            message_repository,
+            mocked_message_entity
+            ):
+        assert message_repository.create_message_if_absent(
+            mocked_message_entity
+        ) == mocked_message_entity
+
+        assert message_repository.create_message_if_absent(
+            mocked_message_entity
+        ) is None
+        assert message_repository.count_message_by_session_id(
+            mocked_message_entity.session_id
+        ) == 1
+
+    def test_other_constraint_failures_are_raised(
+            self,
+            monkeypatch,
+            message_repository,
+            mocked_message_entity
+            ):
+        """Only a conflict on messages.id is treated as a duplicate."""
+        to_row = message_repository._to_row
+        monkeypatch.setattr(
+            message_repository, "_to_row",
+            lambda message: {**to_row(message), "created_at": None}
+        )
+
+        with pytest.raises(DatabaseOperationError) as exc_info:
+            message_repository.create_message_if_absent(
+                mocked_message_entity
+            )
+
+        assert "NOT NULL" in exc_info.value.detail
+
+    @pytest.mark.asyncio
+    async def test_write_modes_raise_the_same_duplicate_error(
+            self,
+            message_repository,
+            valid_message_data
+            ):
+        errors = []
+        for write_mode in (
+                "check_then_insert", AsyncMessageService.INSERT_OR_CONFLICT):
+            service = AsyncMessageService(
+                BlockingMessageRepositoryAdapter(message_repository),
+                write_mode=write_mode,
+                processing_pool=None
+            )
+            message_data = dict(
+                valid_message_data, message_id=str(uuid.uuid4())
+            )
+            await service.register_message(message_data)
+
+            with pytest.raises(DomainValidationException) as exc_info:
+                await service.register_message(message_data)
+            errors.append(exc_info.value.to_dict())
+
+        assert errors[0] == errors[1]
+        assert errors[0]["error"]["message"] == "Mensaje con id registrado"
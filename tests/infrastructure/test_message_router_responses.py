@@ -0,0 +1,72 @@
+import json
+from datetime import datetime, timedelta, timezone
+import pytest
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, ORJSONResponse
+from app.domain.read_models.message_view import MessageView
+from app.infrastructure.routes.message_router import (
+    EXPORT_LINES_PER_CHUNK,
+    _ndjson_chunks
+)
+
+
+def _view(created_at: datetime, processed_at=None) -> MessageView:
+    return MessageView(
+        id="0b4b2f8e-57e1-4a4c-9a43-3f0c1f6f9d1e",
+        session_id="5c7e3a52-2a57-4f3e-8a0a-6f1f0f7d1c2b",
+        content="¿Cuándo llega mi envío? \"urgente\" ***",
+        timestamp=created_at,
+        sender="user",
+        word_count=6,
+        character_count=33,
+        processed_at=processed_at,
+        created_at=created_at
+    )
+
+
+class TestMessageRouterResponses:
+    def test_orjson_body_matches_the_encoder_and_json_body(self):
+        """Keep the bytes of the previous jsonable_encoder + json path."""
+        moment = datetime(2024, 5, 1, 10, 30, 0, 125)
+        content = {
+            "messages": [
+                _view(moment, moment).to_dict(),
+                _view(moment.replace(microsecond=0)).to_dict(),
+                _view(
+                    moment.replace(tzinfo=timezone(timedelta(hours=-5))),
+                    moment.replace(tzinfo=timezone.utc)
+                ).to_dict(),
+            ],
+            "pagination": {
+                "total": 3,
+                "limit": 50,
+                "next_cursor": None,
+                "has_next": False
+            }
+        }
+
+        assert ORJSONResponse(content).body == JSONResponse(
+            jsonable_encoder(content)
+        ).body
+
+    @pytest.mark.asyncio
+    async def test_export_lines_carry_the_response_datetimes(
+            self,
+            mocked_message_entity
+            ):
+        """Each line is the message of the JSON responses and its cursor."""
+        async def messages():
+            for number in range(EXPORT_LINES_PER_CHUNK + 1):
+                yield mocked_message_entity, f"cursor-{number}"
+
+        chunks = [chunk async for chunk in _ndjson_chunks(messages())]
+
+        assert len(chunks) == 2
+        lines = b"".join(chunks).decode().splitlines()
+        expected = JSONResponse(
+            jsonable_encoder(mocked_message_entity.to_dict())
+        ).body
+        assert [json.loads(line) for line in lines] == [
+            {**json.loads(expected), "cursor": f"cursor-{number}"}
+            for number in range(EXPORT_LINES_PER_CHUNK + 1)
+        ]
@@ -0,0 +1,114 @@
+import uuid
+from dataclasses import replace
+import pytest
+from sqlalchemy import delete
+from app.domain.value_objects import (
+    UUIDField,
+    ContentField,
+    SearchQueryField,
+    SearchCursorField
+)
+from app.infrastructure.persistence.orm_models import MessageORM
+from app.infrastructure.persistence.repositories.message_repository import (
+    SQLAlchemyMessageRepository
+)
+from app.infrastructure.persistence.search_index import create_search_index
+
+
+def _message(mocked_message_entity, content, session_id=None):
+    return replace(
+        mocked_message_entity,
+        id=UUIDField(uuid.uuid4()),
+        session_id=session_id or mocked_message_entity.session_id,
+        content=ContentField(content),
+    )
+
+
+@pytest.fixture
+def search_repository(sqlite_session_factory):
+    db = sqlite_session_factory()
+    create_search_index(db.connection())
+    db.commit()
+    yield SQLAlchemyMessageRepository(db)
+    db.close()
+
+
+class TestMessageSearch:
+    def test_search_ranks_matches_and_builds_snippets(
+            self,
+            search_repository,
+            mocked_message_entity
+            ):
+        """
+        Find the messages through the FTS5 index, ignoring accents, with
+        the matched word highlighted in the snippet.
+        """
+        search_repository.create_messages([
+            _message(mocked_message_entity, "El envío llegó tarde"),
+            _message(mocked_message_entity, "Pedido entregado"),
+        ])
+
+        results, has_more = search_repository.search_messages(
+            SearchQueryField("envio")
+            )
+
+        assert has_more is False
+        assert len(results) == 1
+        message, snippet, rank = results[0]
+        assert message.content.value == "El envío llegó tarde"
+        assert snippet == "El [envío] llegó tarde"
+        assert rank < 0
+
+    def test_search_pages_with_cursor_and_filters_session(
+            self,
+            search_repository,
+            mocked_message_entity
+            ):
+        """
+        Walk every match once with the keyset cursor, and only the given
+        session when filtered.
+        """
+        other_session = UUIDField(uuid.uuid4())
+        search_repository.create_messages(
+            [_message(mocked_message_entity, f"hola {i}") for i in range(5)]
+            + [_message(mocked_message_entity, "hola", other_session)]
+        )
+
+        seen, cursor = [], None
+        while True:
+            results, has_more = search_repository.search_messages(
+                SearchQueryField("hola"), limit=2, cursor=cursor
+                )
+            seen += [str(message.id) for message, _, _ in results]
+            if not has_more:
+                break
+            last_message, _, last_rank = results[-1]
+            cursor = SearchCursorField.from_position(
+                last_rank, last_message.id
+                )
+
+        session_results, _ = search_repository.search_messages(
+            SearchQueryField("hola"), session_id=other_session
+            )
+
+        assert len(seen) == len(set(seen)) == 6
+        assert len(session_results) == 1
+
+    def test_deleted_messages_leave_the_index(
+            self,
+            search_repository,
+            mocked_message_entity
+            ):
+        """The triggers keep the index in sync with deletes."""
+        message = _message(mocked_message_entity, "mensaje temporal")
+        search_repository.create_messages([message])
+
+        search_repository.db.execute(
+            delete(MessageORM).where(MessageORM.id == str(message.id))
+        )
+        search_repository.db.commit()
+
+        results, _ = search_repository.search_messages(
+            SearchQueryField("temporal")
+            )
+        assert results == []
@@ -0,0 +1,152 @@
+import asyncio
+import threading
+import uuid
+from dataclasses import replace
+import pytest
+from app.domain.value_objects import UUIDField
+from app.domain.exceptions import DomainValidationException
+from app.infrastructure.persistence.orm_models import (
+    MessageORM,
+    SessionStatsORM
+)
+from app.infrastructure.persistence.write_buffer import MessageWriteBuffer
+
+
+def _message(mocked_message_entity, session_id=None, message_id=None):
+    return replace(
+        mocked_message_entity,
+        id=message_id or UUIDField(uuid.uuid4()),
+        session_id=session_id or mocked_message_entity.session_id,
+    )
+
+
+@pytest.mark.asyncio
+class TestMessageWriteBuffer:
+    async def test_concurrent_messages_share_one_group_commit(
+            self,
+            sqlite_session_factory,
+            mocked_message_entity
+            ):
+        """
+        Messages submitted within the delay window are written in a single
+        flush, and every future resolves once the rows are stored.
+        """
+        buffer = MessageWriteBuffer(
+            session_factory=sqlite_session_factory,
+            max_rows=100,
+            max_delay_ms=200,
+        )
+        messages = [_message(mocked_message_entity) for _ in range(10)]
+
+        stored = await asyncio.gather(
+            *(buffer.submit_async(message) for message in messages)
+        )
+        await asyncio.to_thread(buffer.close)
+
+        assert stored == messages
+        db = sqlite_session_factory()
+        assert db.query(MessageORM).count() == 10
+        assert db.query(SessionStatsORM).one().total_messages == 10
+        db.close()
+        assert buffer._flush_size.count >= 1
+
+    async def test_duplicate_message_fails_only_its_own_future(
+            self,
+            sqlite_session_factory,
+            mocked_message_entity
+            ):
+        """
+        A repeated id raises DomainValidationException for its request
+        while the rest of the group is committed.
+        """
+        buffer = MessageWriteBuffer(
+            session_factory=sqlite_session_factory,
+            max_rows=100,
+            max_delay_ms=200,
+        )
+        first = _message(mocked_message_entity)
+        repeated = _message(mocked_message_entity, message_id=first.id)
+        other = _message(mocked_message_entity)
+
+        results = await asyncio.gather(
+            *(buffer.submit_async(m) for m in (first, repeated, other)),
+            return_exceptions=True
+        )
+        await asyncio.to_thread(buffer.close)
+
+        assert results[0] == first
+        assert results[2] == other
+        assert isinstance(results[1], DomainValidationException)
+
+    async def test_close_drains_buffered_messages(
+            self,
+            sqlite_session_factory,
+            mocked_message_entity
+            ):
+        """
+        Closing the buffer writes every message that was already queued.
+        """
+        buffer = MessageWriteBuffer(
+            session_factory=sqlite_session_factory,
+            max_rows=2,
+            max_delay_ms=1000,
+        )
+        submits = [
+            asyncio.create_task(
+                buffer.submit_async(_message(mocked_message_entity))
+            )
+            for _ in range(5)
+        ]
+        # Lets every task put its message in the queue
+        await asyncio.sleep(0)
+
+        await asyncio.to_thread(buffer.close)
+
+        assert len(await asyncio.gather(*submits)) == 5
+        db = sqlite_session_factory()
+        assert db.query(MessageORM).count() == 5
+        db.close()
+
+    async def test_full_queue_waits_for_the_writer_without_polling(
+            self,
+            sqlite_session_factory,
+            mocked_message_entity
+            ):
+        """
+        A submit that finds the queue full waits until the writer thread
+        takes the next batch instead of failing or blocking the loop.
+        """
+        flushing = threading.Event()
+        release = threading.Event()
+
+        def blocked_session_factory():
+            flushing.set()
+            release.wait(5)
+            return sqlite_session_factory()
+
+        buffer = MessageWriteBuffer(
+            session_factory=blocked_session_factory,
+            max_rows=1,
+            max_delay_ms=0,
+            max_queue=1,
+        )
+        messages = [_message(mocked_message_entity) for _ in range(3)]
+        first = asyncio.create_task(buffer.submit_async(messages[0]))
+        # The writer holds the first message until it is released
+        assert await asyncio.to_thread(flushing.wait, 5)
+        queued = asyncio.create_task(buffer.submit_async(messages[1]))
+        waiting = asyncio.create_task(buffer.submit_async(messages[2]))
+        await asyncio.sleep(0.05)
+
+        assert buffer._queue.full()
+        assert len(buffer._room_waiters) == 1
+        assert not waiting.done()
+
+        release.set()
+        stored = await asyncio.wait_for(
+            asyncio.gather(first, queued, waiting), timeout=5
+        )
+        await asyncio.to_thread(buffer.close)
+
+        assert stored == messages
+        assert buffer._room_waiters == []
@@ -0,0 +1,9 @@
+from fastapi.testclient import TestClient
+from main import app
+
+
+class TestMetricsRoutes:
+    def test_metrics_require_an_access_token(self):
+        response = TestClient(app).get("/api/metrics/")
+
+        assert response.status_code == 401
@@ -0,0 +1,54 @@
+import uuid
+from datetime import datetime, timezone
+from app.infrastructure.persistence.types import (
+    CompactUUID,
+    EpochMicroseconds
+)
+
+
+class TestCompactUUID:
+    def test_round_trip(self, valid_uuid_str):
+        """Store 16 bytes and read back the canonical string."""
+        column_type = CompactUUID()
+
+        stored = column_type.process_bind_param(valid_uuid_str, None)
+
+        assert len(stored) == 16
+        assert column_type.process_result_value(stored, None) == \
+            valid_uuid_str
+
+    def test_bytes_keep_the_text_order(self):
+        """Sorting the stored bytes must match sorting the text ids."""
+        column_type = CompactUUID()
+        ids = [str(uuid.uuid4()) for _ in range(50)]
+
+        by_bytes = sorted(
+            ids, key=lambda id: column_type.process_bind_param(id, None)
+            )
+
+        assert by_bytes == sorted(ids)
+
+    def test_none_is_kept(self):
+        assert CompactUUID().process_bind_param(None, None) is None
+
+
+class TestEpochMicroseconds:
+    def test_round_trip(self):
+        """Keep the microseconds of a naive datetime."""
+        column_type = EpochMicroseconds()
+        value = datetime(2023, 6, 15, 14, 30, 0, 123456)
+
+        stored = column_type.process_bind_param(value, None)
+
+        assert isinstance(stored, int)
+        assert column_type.process_result_value(stored, None) == value
+
+    def test_aware_datetime_keeps_the_wall_clock(self):
+        """Drop the tzinfo like the SQLite DateTime type does."""
+        column_type = EpochMicroseconds()
+        value = datetime(2023, 6, 15, 14, 30, tzinfo=timezone.utc)
+
+        stored = column_type.process_bind_param(value, None)
+
+        assert column_type.process_result_value(stored, None) == \
+            datetime(2023, 6, 15, 14, 30)
@@ -0,0 +1,120 @@
+import uuid
+from dataclasses import replace
+from datetime import datetime, timedelta
+import pytest
+from app.domain.entities.refresh_token import RefreshToken
+from app.domain.value_objects import UUIDField
+from app.infrastructure.persistence.repositories.refresh_token_repository \
+    import SQLAlchemyRefreshTokenRepository
+
+
+def _refresh_token(family_id="family", expires_in=timedelta(days=1)):
+    now = datetime.utcnow()
+    return RefreshToken(
+        token_hash=uuid.uuid4().hex,
+        user_id=UUIDField(uuid.uuid4()),
+        family_id=family_id,
+        expires_at=now + expires_in,
+        created_at=now
+    )
+
+
+@pytest.fixture
+def refresh_token_repository(sqlite_session_factory):
+    db = sqlite_session_factory()
+    yield SQLAlchemyRefreshTokenRepository(db)
+    db.close()
+
+
+class TestRefreshTokenRepository:
+    def test_token_is_rotated_only_once(self, refresh_token_repository):
+        """A second rotation of the same token is refused."""
+        original = refresh_token_repository.create_refresh_token(
+            _refresh_token()
+            )
+        first = _refresh_token()
+
+        assert refresh_token_repository.rotate_refresh_token(
+            original.token_hash, first
+            )
+        assert not refresh_token_repository.rotate_refresh_token(
+            original.token_hash, _refresh_token()
+            )
+
+        stored = refresh_token_repository.get_refresh_token(
+            original.token_hash
+            )
+        assert stored.is_revoked
+        assert stored.replaced_by == first.token_hash
+        assert not refresh_token_repository.get_refresh_token(
+            first.token_hash
+            ).is_revoked
+
+    def test_revoke_family_revokes_every_active_token(
+            self,
+            refresh_token_repository
+            ):
+        tokens = [_refresh_token("leaked") for _ in range(2)]
+        other = _refresh_token("other")
+        for refresh_token in (*tokens, other):
+            refresh_token_repository.create_refresh_token(refresh_token)
+
+        revoked = refresh_token_repository.revoke_refresh_token_family(
+            "leaked"
+            )
+
+        assert revoked == 2
+        assert all(
+            refresh_token_repository.get_refresh_token(
+                refresh_token.token_hash
+            ).is_revoked
+            for refresh_token in tokens
+        )
+        assert not refresh_token_repository.get_refresh_token(
+            other.token_hash
+            ).is_revoked
+
+    def test_revoke_user_tokens_revokes_every_family_of_the_user(
+            self,
+            refresh_token_repository
+            ):
+        user_tokens = [_refresh_token("first"), _refresh_token("second")]
+        user_tokens[1] = replace(
+            user_tokens[1], user_id=user_tokens[0].user_id
+        )
+        other = _refresh_token("first")
+        for refresh_token in (*user_tokens, other):
+            refresh_token_repository.create_refresh_token(refresh_token)
+
+        revoked = refresh_token_repository.revoke_user_refresh_tokens(
+            user_tokens[0].user_id
+            )
+
+        assert revoked == 2
+        assert all(
+            refresh_token_repository.get_refresh_token(
+                refresh_token.token_hash
+            ).is_revoked
+            for refresh_token in user_tokens
+        )
+        assert not refresh_token_repository.get_refresh_token(
+            other.token_hash
+            ).is_revoked
+
+    def test_delete_expired_refresh_tokens(self, refresh_token_repository):
+        expired = _refresh_token(expires_in=timedelta(seconds=-1))
+        active = _refresh_token()
+        for refresh_token in (expired, active):
+            refresh_token_repository.create_refresh_token(refresh_token)
+
+        deleted = refresh_token_repository.delete_expired_refresh_tokens(
+            datetime.utcnow()
+            )
+
+        assert deleted == 1
+        assert refresh_token_repository.get_refresh_token(
+            expired.token_hash
+            ) is None
+        assert refresh_token_repository.get_refresh_token(
+            active.token_hash
+            ) is not None
@@ -0,0 +1,90 @@
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Dict
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from app.infrastructure.routes.request_schemas import (
+    MessageCreateRequest,
+    parsed_body
+)
+
+MESSAGE = {
+    "message_id": "366defc3-ac55-44fe-8354-463a7b391e12",
+    "session_id": "7dbc8073-6634-4b34-84db-9033f6133a95",
+    "content": "Hola, ¿cómo estás?",
+    "timestamp": "2023-06-15T14:30:00Z",
+    "sender": "user"
+}
+
+app = FastAPI()
+received = []
+
+
+@app.post("/parsed")
+async def parsed_endpoint(
+    data: Dict[str, Any] = Depends(parsed_body(MessageCreateRequest))
+):
+    received.append(data)
+    return {}
+
+
+@app.post("/plain")
+async def plain_endpoint(data: Dict[str, Any]):
+    return {}
+
+
+@pytest.fixture
+def client():
+    received.clear()
+    return TestClient(app)
+
+
+class TestParsedBody:
+    def test_valid_body_arrives_typed(self, client):
+        response = client.post(
+            "/parsed", json={**MESSAGE, "channel": "web"}
+        )
+
+        assert response.status_code == 200
+        assert received == [{
+            **MESSAGE,
+            "message_id": uuid.UUID(MESSAGE["message_id"]),
+            "session_id": uuid.UUID(MESSAGE["session_id"]),
+            "timestamp": datetime(2023, 6, 15, 14, 30, tzinfo=timezone.utc),
+            "channel": "web"
+        }]
+
+    @pytest.mark.parametrize("field, value", [
+        ("message_id", "no-es-un-uuid"),
+        ("content", None),
+        ("sender", "bot"),
+        ("timestamp", "1686839400"),
+        ("timestamp", "2023-06-15T14:30:00z"),
+    ])
+    def test_body_outside_the_schema_arrives_as_sent(
+            self, client, field, value):
+        """The value objects raise the domain exceptions for these."""
+        body = {**MESSAGE, field: value}
+
+        response = client.post("/parsed", json=body)
+
+        assert response.status_code == 200
+        assert received == [body]
+
+    @pytest.mark.parametrize("content, content_type", [
+        (b"", "application/json"),
+        (b"{\"message_id\": ", "application/json"),
+        (b"[1, 2]", "application/json"),
+        (b"{\"content\": \"hola\"}", "text/plain"),
+    ])
+    def test_invalid_json_objects_fail_as_dict_bodies(
+            self, client, content, content_type):
+        headers = {"content-type": content_type}
+
+        parsed = client.post("/parsed", content=content, headers=headers)
+        plain = client.post("/plain", content=content, headers=headers)
+
+        assert parsed.status_code == plain.status_code == 422
+        assert parsed.json() == plain.json()
+        assert received == []
@@ -0,0 +1,209 @@
+import os
+import sqlite3
+import subprocess
+import sys
+import uuid
+from datetime import datetime, timedelta
+import pytest
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+STARTED_AT = datetime(2024, 1, 1, 8, 30)
+# The layout SQLAlchemy gives a DateTime column on SQLite
+DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S.%f"
+COMPOSITE_INDEXES = {
+    "ix_messages_session_created_id",
+    "ix_messages_session_sender_created_id",
+}
+NO_CHANGES = "Dropped indexes: none. Rewritten tables: none.\n"
+COLUMNS = {
+    "messages": (
+        "id", "session_id", "content", "timestamp", "sender", "word_count",
+        "character_count", "processed_at", "created_at", "updated_at",
+    ),
+    "session_stats": (
+        "session_id", "total_messages", "user_messages", "system_messages",
+        "last_message_at",
+    ),
+}
+DATETIME_COLUMNS = {
+    "timestamp", "processed_at", "created_at", "updated_at",
+    "last_message_at",
+}
+
+
+def _migrate(path, compact: bool) -> str:
+    """
+    Runs migrate-schema in its own process, since the storage layout of
+    the ORM models is read from MESSAGE_COMPACT_SCHEMA on import.
+    """
+    env = {
+        **os.environ,
+        "DATABASE_URL": f"sqlite:///{path}",
+        "MESSAGE_COMPACT_SCHEMA": "true" if compact else "false",
+    }
+    return subprocess.run(
+        [
+            sys.executable, "-m", "app.infrastructure.persistence.maintenance",
+            "migrate-schema",
+        ],
+        cwd=ROOT_DIR, env=env, check=True, capture_output=True, text=True,
+    ).stdout
+
+
+def _rows(connection, table: str) -> list:
+    return sorted(connection.execute(
+        f"SELECT {', '.join(COLUMNS[table])} FROM {table}"
+    ).fetchall())
+
+
+def _as_text(table: str, row: tuple) -> tuple:
+    """A compact layout row in the text layout."""
+    values = []
+    for name, value in zip(COLUMNS[table], row):
+        if isinstance(value, bytes):
+            value = str(uuid.UUID(bytes=value))
+        elif name in DATETIME_COLUMNS:
+            value = (
+                datetime(1970, 1, 1) + timedelta(microseconds=value)
+            ).strftime(DATETIME_FORMAT)
+        values.append(value)
+    return tuple(values)
+
+
+def _indexes(connection) -> set:
+    return {
+        row[1] for row in connection.execute("PRAGMA index_list(messages)")
+    }
+
+
+def _text_id(value) -> str:
+    if isinstance(value, bytes):
+        return str(uuid.UUID(bytes=value))
+    return value
+
+
+def _search(connection, term: str) -> list:
+    rows = connection.execute(
+        "SELECT messages.id FROM messages_fts "
+        "JOIN messages ON messages.rowid = messages_fts.rowid "
+        "WHERE messages_fts MATCH ?", (term,)
+    )
+    return sorted(_text_id(row[0]) for row in rows)
+
+
+@pytest.fixture
+def text_database(tmp_path):
+    """A text layout file database with the legacy index and messages."""
+    path = tmp_path / "chat_messages.db"
+    assert _migrate(path, compact=False) == NO_CHANGES
+
+    sessions = [str(uuid.uuid4()) for _ in range(3)]
+    messages = []
+    for number in range(120):
+        created_at = STARTED_AT + timedelta(seconds=number, microseconds=7)
+        messages.append((
+            str(uuid.uuid4()),
+            sessions[number % 3],
+            f"Mensaje {number}: "
+            + ("la manzana está madura" if number % 4 else "hola otra vez"),
+            (created_at - timedelta(minutes=1)).strftime(DATETIME_FORMAT),
+            "user" if number % 2 else "system",
+            5,
+            24,
+            created_at.strftime(DATETIME_FORMAT),
+            created_at.strftime(DATETIME_FORMAT),
+            created_at.strftime(DATETIME_FORMAT),
+        ))
+
+    with sqlite3.connect(path) as connection:
+        connection.executemany(
+            "INSERT INTO messages (id, session_id, content, timestamp, "
+            "sender, word_count, character_count, processed_at, "
+            "created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            messages
+        )
+        connection.executemany(
+            "INSERT INTO session_stats (session_id, total_messages, "
+            "user_messages, system_messages, last_message_at) "
+            "VALUES (?, 40, 20, 20, ?)",
+            [
+                (session_id, messages[-1][7])
+                for session_id in sessions
+            ]
+        )
+        connection.execute(
+            "CREATE INDEX ix_messages_session_id ON messages (session_id)"
+        )
+    connection.close()
+    return path
+
+
+def _snapshot(path) -> dict:
+    with sqlite3.connect(path) as connection:
+        snapshot = {
+            "messages": _rows(connection, "messages"),
+            "session_stats": _rows(connection, "session_stats"),
+            "indexes": _indexes(connection),
+            "search": _search(connection, "manzana"),
+        }
+    connection.close()
+    return snapshot
+
+
+class TestMigrateMessageSchema:
+    def test_text_to_compact_converts_every_row(self, text_database):
+        before = _snapshot(text_database)
+
+        output = _migrate(text_database, compact=True)
+
+        assert output == (
+            "Dropped indexes: ix_messages_session_id. "
+            "Rewritten tables: messages, session_stats.\n"
+        )
+        with sqlite3.connect(text_database) as connection:
+            types = connection.execute(
+                "SELECT DISTINCT typeof(id), typeof(session_id), "
+                "typeof(created_at), typeof(timestamp) FROM messages"
+            ).fetchall()
+            indexes = _indexes(connection)
+            search = _search(connection, "manzana")
+            converted = {
+                table: sorted(
+                    _as_text(table, row) for row in _rows(connection, table)
+                )
+                for table in COLUMNS
+            }
+        connection.close()
+
+        assert types == [("blob", "blob", "integer", "integer")]
+        assert converted["messages"] == before["messages"]
+        assert converted["session_stats"] == before["session_stats"]
+        assert "ix_messages_session_id" not in indexes
+        assert COMPOSITE_INDEXES <= indexes
+        assert search == before["search"]
+        assert len(search) == 90
+
+    def test_round_trip_keeps_rows_byte_for_byte(self, text_database):
+        before = _snapshot(text_database)
+
+        _migrate(text_database, compact=True)
+        output = _migrate(text_database, compact=False)
+
+        assert output == (
+            "Dropped indexes: none. "
+            "Rewritten tables: messages, session_stats.\n"
+        )
+        after = _snapshot(text_database)
+        assert after["messages"] == before["messages"]
+        assert after["session_stats"] == before["session_stats"]
+        assert after["search"] == before["search"]
+        assert "ix_messages_session_id" not in after["indexes"]
+        assert COMPOSITE_INDEXES <= after["indexes"]
+
+    @pytest.mark.parametrize("compact", [True, False])
+    def test_second_run_is_a_no_op(self, text_database, compact):
+        _migrate(text_database, compact=compact)
+        migrated = _snapshot(text_database)
+
+        assert _migrate(text_database, compact=compact) == NO_CHANGES
+        assert _snapshot(text_database) == migrated
@@ -0,0 +1,297 @@
+import uuid
+from dataclasses import replace
+from datetime import datetime, timedelta
+import pytest
+from sqlalchemy import func, insert, select, update
+from app.domain.value_objects import UUIDField, DatetimeField, SenderField
+from app.infrastructure.persistence import maintenance
+from app.infrastructure.persistence.orm_models import (
+    MessageORM,
+    SessionStatsORM
+)
+from app.infrastructure.persistence.repositories.message_repository import (
+    SQLAlchemyMessageRepository
+)
+
+STARTED_AT = datetime(2024, 1, 1)
+
+
+@pytest.fixture
+def message_repository(sqlite_session_factory):
+    db = sqlite_session_factory()
+    yield SQLAlchemyMessageRepository(db)
+    db.close()
+
+
+@pytest.fixture
+def new_message(mocked_message_entity):
+    def build(session_id, sender="user", seconds=0):
+        return replace(
+            mocked_message_entity,
+            id=UUIDField(uuid.uuid4()),
+            session_id=session_id,
+            sender=SenderField(sender),
+            created_at=DatetimeField(
+                STARTED_AT + timedelta(seconds=seconds)
+            )
+        )
+    return build
+
+
+def _stats(repository, session_id):
+    row = repository.db.execute(
+        select(
+            SessionStatsORM.total_messages,
+            SessionStatsORM.user_messages,
+            SessionStatsORM.system_messages,
+            SessionStatsORM.last_message_at
+        ).where(SessionStatsORM.session_id == str(session_id))
+    ).one_or_none()
+    return tuple(row) if row else None
+
+
+def _counted(repository, session_id):
+    """The counters as a COUNT(*) over the messages table gives them."""
+    def count(*criteria):
+        return repository.db.execute(
+            select(func.count(MessageORM.id)).where(
+                MessageORM.session_id == str(session_id), *criteria
+            )
+        ).scalar()
+
+    last_message_at = repository.db.execute(
+        select(func.max(MessageORM.created_at)).where(
+            MessageORM.session_id == str(session_id)
+        )
+    ).scalar()
+    return (
+        count(),
+        count(MessageORM.sender == "user"),
+        count(MessageORM.sender == "system"),
+        last_message_at
+    )
+
+
+def _session():
+    return UUIDField(uuid.uuid4())
+
+
+class TestSessionStats:
+    def test_create_message_keeps_the_counters_equal_to_count(
+            self,
+            message_repository,
+            new_message
+            ):
+        session_id = _session()
+        senders = ["user", "system", "user", "user"]
+
+        for seconds, sender in enumerate(senders):
+            message_repository.create_message(
+                new_message(session_id, sender, seconds)
+            )
+
+        assert _stats(message_repository, session_id) == (
+            4, 3, 1, STARTED_AT + timedelta(seconds=3)
+        )
+        assert _stats(message_repository, session_id) == _counted(
+            message_repository, session_id
+        )
+
+    def test_create_message_if_absent_counts_only_inserted_rows(
+            self,
+            message_repository,
+            new_message
+            ):
+        session_id = _session()
+        message = new_message(session_id, "system")
+
+        assert message_repository.create_message_if_absent(message)
+        assert message_repository.create_message_if_absent(message) is None
+        message_repository.create_message_if_absent(
+            new_message(session_id, "user", 1)
+        )
+
+        assert _stats(message_repository, session_id)[:3] == (2, 1, 1)
+        assert _stats(message_repository, session_id) == _counted(
+            message_repository, session_id
+        )
+
+    def test_create_messages_updates_every_session_of_the_batch(
+            self,
+            message_repository,
+            new_message
+            ):
+        first, second = _session(), _session()
+        message_repository.create_messages([
+            new_message(first, "user", 0),
+            new_message(second, "system", 1),
+            new_message(first, "system", 2),
+        ])
+        # The second batch goes through the UPDATE of existing counters
+        message_repository.create_messages([
+            new_message(first, "user", 3),
+            new_message(second, "user", 4),
+            new_message(second, "user", 5),
+        ])
+
+        assert _stats(message_repository, first)[:3] == (3, 2, 1)
+        assert _stats(message_repository, second)[:3] == (3, 2, 1)
+        for session_id in (first, second):
+            assert _stats(message_repository, session_id) == _counted(
+                message_repository, session_id
+            )
+
+    def test_last_message_at_keeps_the_latest_value(
+            self,
+            message_repository,
+            new_message
+            ):
+        session_id = _session()
+
+        message_repository.create_message(new_message(session_id, seconds=9))
+        message_repository.create_message(new_message(session_id, seconds=1))
+
+        assert _stats(message_repository, session_id)[3] == (
+            STARTED_AT + timedelta(seconds=9)
+        )
+
+    def test_new_counters_include_rows_written_before_them(
+            self,
+            message_repository,
+            new_message
+            ):
+        """
+        The INSERT ... SELECT that creates the counters of a session
+        recounts the rows already stored without counters.
+        """
+        session_id = _session()
+        message_repository.db.execute(insert(MessageORM), [
+            message_repository._to_row(new_message(session_id, "system", 0)),
+            message_repository._to_row(new_message(session_id, "user", 1)),
+        ])
+        message_repository.db.commit()
+
+        message_repository.create_message(new_message(session_id, "user", 2))
+
+        assert _stats(message_repository, session_id)[:3] == (3, 2, 1)
+        assert _stats(message_repository, session_id) == _counted(
+            message_repository, session_id
+        )
+
+    def test_count_reads_the_counters(
+            self,
+            message_repository,
+            new_message
+            ):
+        session_id = _session()
+        message_repository.create_messages([
+            new_message(session_id, "user", 0),
+            new_message(session_id, "system", 1),
+            new_message(session_id, "user", 2),
+        ])
+        message_repository.db.execute(
+            update(SessionStatsORM).values(total_messages=10)
+        )
+
+        count = message_repository.count_message_by_session_id
+        assert count(session_id) == 10
+        assert count(session_id, sender="user") == 2
+        assert count(session_id, sender="system") == 1
+        assert count(session_id, sender="bot") == 0
+
+    def test_count_falls_back_to_count_without_counters(
+            self,
+            message_repository,
+            new_message
+            ):
+        session_id = _session()
+        message_repository.db.execute(insert(MessageORM), [
+            message_repository._to_row(new_message(session_id, "system", 0)),
+            message_repository._to_row(new_message(session_id, "user", 1)),
+            message_repository._to_row(new_message(session_id, "user", 2)),
+        ])
+
+        count = message_repository.count_message_by_session_id
+        assert _stats(message_repository, session_id) is None
+        assert count(session_id) == 3
+        assert count(session_id, sender="user") == 2
+        assert count(_session()) == 0
+
+    def test_recount_repairs_only_the_given_session(
+            self,
+            message_repository,
+            new_message
+            ):
+        corrupted, untouched = _session(), _session()
+        message_repository.create_messages([
+            new_message(corrupted, "user", 0),
+            new_message(corrupted, "system", 1),
+            new_message(untouched, "user", 2),
+        ])
+        message_repository.db.execute(
+            update(SessionStatsORM).values(
+                total_messages=99, user_messages=50, system_messages=49
+            )
+        )
+        message_repository.db.commit()
+
+        rebuilt = message_repository.recount_session_stats(corrupted)
+
+        assert rebuilt == 1
+        assert _stats(message_repository, corrupted) == _counted(
+            message_repository, corrupted
+        )
+        assert _stats(message_repository, untouched)[:3] == (99, 50, 49)
+
+    def test_recount_rebuilds_every_session(
+            self,
+            message_repository,
+            new_message
+            ):
+        sessions = [_session(), _session()]
+        message_repository.create_messages([
+            new_message(session_id, "user", seconds)
+            for seconds, session_id in enumerate(sessions)
+        ])
+        message_repository.db.execute(
+            update(SessionStatsORM).values(total_messages=0)
+        )
+        message_repository.db.commit()
+
+        assert message_repository.recount_session_stats() == 2
+        for session_id in sessions:
+            assert _stats(message_repository, session_id) == _counted(
+                message_repository, session_id
+            )
+
+    def test_recount_stats_command(
+            self,
+            monkeypatch,
+            capsys,
+            sqlite_session_factory,
+            message_repository,
+            new_message
+            ):
+        session_id = _session()
+        message_repository.create_messages([
+            new_message(session_id, "user", 0),
+            new_message(session_id, "user", 1),
+        ])
+        message_repository.db.execute(
+            update(SessionStatsORM).values(user_messages=7)
+        )
+        message_repository.db.commit()
+        monkeypatch.setattr(
+            maintenance, "SessionLocal", sqlite_session_factory
+        )
+        monkeypatch.setattr(maintenance, "create_db_tables", lambda: None)
+
+        maintenance.main(["recount-stats", "--session-id", str(session_id)])
+
+        assert capsys.readouterr().out == (
+            "Session stats rebuilt for 1 session(s).\n"
+        )
+        message_repository.db.expire_all()
+        assert _stats(message_repository, session_id) == _counted(
+            message_repository, session_id
+        )
@@ -0,0 +1,56 @@
+import uuid
+from datetime import datetime, timedelta
+import pytest
+from app.domain.value_objects import UUIDField
+from app.infrastructure.persistence.repositories \
+    .token_revocation_repository import SQLAlchemyTokenRevocationRepository
+
+
+@pytest.fixture
+def token_revocation_repository(sqlite_session_factory):
+    db = sqlite_session_factory()
+    yield SQLAlchemyTokenRevocationRepository(db)
+    db.close()
+
+
+class TestTokenRevocationRepository:
+    def test_user_token_version_starts_at_zero_and_increments(
+            self,
+            token_revocation_repository
+            ):
+        user_id = UUIDField(uuid.uuid4())
+
+        assert token_revocation_repository.get_user_token_version(
+            user_id
+            ) == 0
+        assert token_revocation_repository.increment_user_token_version(
+            user_id
+            ) == 1
+        assert token_revocation_repository.increment_user_token_version(
+            user_id
+            ) == 2
+
+    def test_revocations_of_expired_tokens_are_skipped_and_purged(
+            self,
+            token_revocation_repository
+            ):
+        now = datetime.utcnow()
+        user_id = UUIDField(uuid.uuid4())
+        token_revocation_repository.revoke_token(
+            "active", now + timedelta(minutes=5)
+            )
+        token_revocation_repository.revoke_token(
+            "expired", now - timedelta(minutes=5)
+            )
+        token_revocation_repository.increment_user_token_version(user_id)
+
+        jtis, user_versions = (
+            token_revocation_repository.get_token_revocations(now)
+        )
+        deleted = token_revocation_repository.delete_expired_revoked_tokens(
+            now
+            )
+
+        assert jtis == ["active"]
+        assert user_versions == {str(user_id): 1}
+        assert deleted == 1
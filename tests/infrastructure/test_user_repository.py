@@ -0,0 +1,82 @@
+import uuid
+import pytest
+from app.domain.entities.user import User
+from app.domain.value_objects import (
+    UUIDField,
+    EmailField,
+    UsernameField,
+    PasswordHashField
+)
+from app.infrastructure.persistence.repositories.user_repository import (
+    SQLAlchemyUserRepository
+)
+
+
+def _user(email, username, password_hash):
+    return User(
+        id=UUIDField(uuid.uuid4()),
+        email=EmailField(email),
+        username=UsernameField(username),
+        password_hash=PasswordHashField(password_hash)
+    )
+
+
+@pytest.fixture
+def user_repository(sqlite_session_factory):
+    db = sqlite_session_factory()
+    yield SQLAlchemyUserRepository(db)
+    db.close()
+
+
+class TestUserRepository:
+    def test_exists_by_email_or_username_reports_each_field(
+            self,
+            user_repository,
+            valid_password_hash_str
+            ):
+        user_repository.create_user_if_absent(
+            _user("taken@example.com", "takenuser", valid_password_hash_str)
+            )
+
+        assert user_repository.exists_by_email_or_username(
+            EmailField("taken@example.com"), UsernameField("freeuser")
+            ) == (True, False)
+        assert user_repository.exists_by_email_or_username(
+            EmailField("free@example.com"), UsernameField("takenuser")
+            ) == (False, True)
+        assert user_repository.exists_by_email_or_username(
+            EmailField("free@example.com"), UsernameField("freeuser")
+            ) == (False, False)
+
+    def test_create_user_if_absent_returns_none_on_unique_violation(
+            self,
+            user_repository,
+            valid_password_hash_str
+            ):
+        """A duplicate username is rejected by the UNIQUE constraint."""
+        first = _user("first@example.com", "sameuser", valid_password_hash_str)
+
+        assert user_repository.create_user_if_absent(first) is first
+        assert user_repository.create_user_if_absent(
+            _user("second@example.com", "sameuser", valid_password_hash_str)
+            ) is None
+        assert user_repository.get_user_by_email(
+            EmailField("second@example.com")
+            ) is None
+
+    def test_stored_user_is_rebuilt_with_the_same_fields(
+            self,
+            user_repository,
+            valid_password_hash_str
+            ):
+        user = _user(
+            "stored@example.com", "storeduser", valid_password_hash_str
+            )
+        user_repository.create_user(user)
+
+        stored = user_repository.get_user_by_id(user.id)
+
+        assert stored.id == user.id
+        assert stored.email == user.email
+        assert stored.username == user.username
+        assert stored.password_hash == user.password_hash
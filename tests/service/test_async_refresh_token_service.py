@@ -0,0 +1,151 @@
+import hashlib
+import uuid
+from dataclasses import replace
+from datetime import datetime, timedelta
+from unittest.mock import create_autospec
+import pytest
+from app.domain.entities.refresh_token import RefreshToken
+from app.domain.ports.async_refresh_token_repository_port import (
+    AsyncRefreshTokenRepositoryPort
+)
+from app.domain.value_objects import UUIDField
+from app.domain.exceptions import (
+    DomainValidationException,
+    RequiredFieldException
+)
+from app.services.refresh_token_service import AsyncRefreshTokenService
+
+TOKEN = "refresh-token"
+
+
+@pytest.fixture
+def refresh_token_repository_mock():
+    return create_autospec(AsyncRefreshTokenRepositoryPort)
+
+
+@pytest.fixture
+def refresh_token_service(refresh_token_repository_mock):
+    return AsyncRefreshTokenService(refresh_token_repository_mock)
+
+
+@pytest.fixture
+def stored_refresh_token():
+    return RefreshToken(
+        token_hash=hashlib.sha256(TOKEN.encode()).hexdigest(),
+        user_id=UUIDField(uuid.uuid4()),
+        family_id="family",
+        expires_at=datetime.utcnow() + timedelta(days=1)
+    )
+
+
+@pytest.mark.asyncio
+class TestAsyncRefreshTokenService:
+    async def test_issue_stores_only_the_token_digest(
+            self,
+            refresh_token_service,
+            refresh_token_repository_mock,
+            stored_refresh_token
+            ):
+        token = await refresh_token_service.issue_refresh_token(
+            stored_refresh_token.user_id
+            )
+
+        stored = (
+            refresh_token_repository_mock.create_refresh_token.call_args[0][0]
+        )
+        assert stored.token_hash == hashlib.sha256(token.encode()).hexdigest()
+        assert stored.user_id == stored_refresh_token.user_id
+
+    async def test_rotate_returns_user_and_a_token_of_the_same_family(
+            self,
+            refresh_token_service,
+            refresh_token_repository_mock,
+            stored_refresh_token
+            ):
+        refresh_token_repository_mock.get_refresh_token.return_value = (
+            stored_refresh_token
+        )
+        refresh_token_repository_mock.rotate_refresh_token.return_value = True
+
+        user_id, new_token = await refresh_token_service.rotate_refresh_token(
+            TOKEN
+            )
+
+        token_hash, new_refresh_token = (
+            refresh_token_repository_mock.rotate_refresh_token.call_args[0]
+        )
+        assert user_id == stored_refresh_token.user_id
+        assert new_token != TOKEN
+        assert token_hash == stored_refresh_token.token_hash
+        assert new_refresh_token.family_id == "family"
+
+    async def test_reusing_a_rotated_token_revokes_its_family(
+            self,
+            refresh_token_service,
+            refresh_token_repository_mock,
+            stored_refresh_token
+            ):
+        """A token presented after its rotation is treated as leaked."""
+        refresh_token_repository_mock.get_refresh_token.return_value = (
+            replace(stored_refresh_token, revoked_at=datetime.utcnow())
+        )
+
+        with pytest.raises(DomainValidationException) as error:
+            await refresh_token_service.rotate_refresh_token(TOKEN)
+
+        assert error.value.code == "REFRESH_TOKEN_REVOKED"
+        (refresh_token_repository_mock.revoke_refresh_token_family
+            .assert_awaited_once_with("family"))
+        refresh_token_repository_mock.rotate_refresh_token.assert_not_called()
+
+    async def test_losing_a_concurrent_rotation_revokes_its_family(
+            self,
+            refresh_token_service,
+            refresh_token_repository_mock,
+            stored_refresh_token
+            ):
+        refresh_token_repository_mock.get_refresh_token.return_value = (
+            stored_refresh_token
+        )
+        refresh_token_repository_mock.rotate_refresh_token.return_value = (
+            False
+        )
+
+        with pytest.raises(DomainValidationException) as error:
+            await refresh_token_service.rotate_refresh_token(TOKEN)
+
+        assert error.value.code == "REFRESH_TOKEN_REVOKED"
+        (refresh_token_repository_mock.revoke_refresh_token_family
+            .assert_awaited_once_with("family"))
+
+    async def test_expired_token_is_rejected(
+            self,
+            refresh_token_service,
+            refresh_token_repository_mock,
+            stored_refresh_token
+            ):
+        refresh_token_repository_mock.get_refresh_token.return_value = (
+            replace(
+                stored_refresh_token,
+                expires_at=datetime.utcnow() - timedelta(seconds=1)
+            )
+        )
+
+        with pytest.raises(DomainValidationException) as error:
+            await refresh_token_service.rotate_refresh_token(TOKEN)
+
+        assert error.value.code == "REFRESH_TOKEN_EXPIRED"
+
+    async def test_unknown_and_missing_tokens_are_rejected(
+            self,
+            refresh_token_service,
+            refresh_token_repository_mock
+            ):
+        refresh_token_repository_mock.get_refresh_token.return_value = None
+
+        with pytest.raises(DomainValidationException) as error:
+            await refresh_token_service.rotate_refresh_token(TOKEN)
+        with pytest.raises(RequiredFieldException):
+            await refresh_token_service.rotate_refresh_token(None)
+
+        assert error.value.code == "INVALID_REFRESH_TOKEN"
@@ -0,0 +1,133 @@
+import pytest
+from app.core.metrics import MetricsRegistry
+from app.domain.exceptions import RequiredFieldException
+from app.domain.value_objects import ContentField
+from app.services.message_pipeline import (
+    MessagePipeline,
+    MessageProcessingContext,
+    MessageProcessingStage,
+    TextCountStage
+)
+from app.services.message_service import AsyncMessageService
+
+
+@pytest.fixture
+def registry():
+    return MetricsRegistry()
+
+
+class LongestWordStage(MessageProcessingStage):
+    name = "longest_word"
+
+    def __init__(self):
+        self.seen_words = None
+
+    def process(self, context) -> None:
+        self.seen_words = context.words
+        context.fields['longest_word'] = max(context.words, key=len)
+
+
+class TestMessagePipeline:
+    @pytest.mark.parametrize("content, expected_words, expected_chars", [
+        ("Este es un mensaje.", 4, 16),
+        ("  Hola mundo  ", 2, 9),
+        ("Uno.", 1, 4),
+        ("", 0, 0),
+        ("    ", 0, 0),
+        (None, 0, 0)
+    ])
+    def test_count_words_and_characters(
+            self,
+            content,
+            expected_words,
+            expected_chars
+            ):
+        context = MessageProcessingContext({"content": content})
+        if content and content.strip():
+            context.content = ContentField(content)
+
+        TextCountStage().process(context)
+
+        assert context.fields == {
+            "character_count": expected_chars,
+            "word_count": expected_words
+        }
+
+    def test_builtin_stages_filter_and_count(self, registry):
+        pipeline = MessagePipeline(registry=registry)
+
+        processed = pipeline.run({"content": "  Hola   mundo malo "})
+
+        assert processed.content.value == "  Hola   mundo *** "
+        assert processed.fields == {
+            "character_count": 12,
+            "word_count": 3
+        }
+
+    def test_stages_share_the_words_of_the_content(self, registry):
+        pipeline = MessagePipeline(registry=registry)
+        stage = LongestWordStage()
+        pipeline.register(stage)
+
+        processed = pipeline.run({"content": "una palabra larguísima"})
+
+        assert processed.fields["longest_word"] == "larguísima"
+        assert stage.seen_words is processed.words
+
+    def test_duplicate_stage_name_raises_value_error(self, registry):
+        pipeline = MessagePipeline(registry=registry)
+
+        with pytest.raises(ValueError):
+            pipeline.register(TextCountStage())
+
+    def test_invalid_content_raises_before_later_stages(self, registry):
+        pipeline = MessagePipeline(registry=registry)
+        stage = LongestWordStage()
+        pipeline.register(stage)
+
+        with pytest.raises(RequiredFieldException):
+            pipeline.run({"content": "   "})
+        assert stage.seen_words is None
+
+    def test_every_stage_is_timed(self, registry):
+        pipeline = MessagePipeline(timing_every=1, registry=registry)
+
+        pipeline.run({"content": "Hola"})
+        pipeline.run({"content": "mundo"})
+
+        snapshot = registry.snapshot()
+        for name in ("content_filter", "text_counts"):
+            assert snapshot[f"message_pipeline_{name}_us"]["count"] == 2
+
+    def test_timing_is_sampled(self, registry):
+        pipeline = MessagePipeline(timing_every=4, registry=registry)
+
+        for _ in range(8):
+            pipeline.run({"content": "Hola"})
+
+        snapshot = registry.snapshot()
+        assert snapshot["message_pipeline_text_counts_us"]["count"] == 2
+
+    def test_stage_fields_cannot_override_message_fields(
+            self,
+            registry,
+            message_repository_mock,
+            valid_message_data
+            ):
+        class OverrideIdStage(MessageProcessingStage):
+            name = "override_id"
+
+            def process(self, context) -> None:
+                context.fields['id'] = "not-an-id"
+
+        pipeline = MessagePipeline(registry=registry)
+        pipeline.register(OverrideIdStage())
+        service = AsyncMessageService(
+            message_repository_mock, pipeline=pipeline
+            )
+
+        message = service._validate_message_data(valid_message_data)
+
+        assert str(message.id) == valid_message_data["message_id"]
+        assert message.word_count == 6
+        assert message.character_count == 24
@@ -0,0 +1,234 @@
+import uuid
+from datetime import datetime
+import pytest
+from app.core.metrics import MetricsRegistry
+from app.domain.exceptions import RequiredFieldException
+from app.services.message_processing_pool import (
+    MessageProcessingPool,
+    process_messages
+)
+from app.services.message_service import AsyncMessageService
+
+
+def _message_data(content: str) -> dict:
+    return {
+        "message_id": str(uuid.uuid4()),
+        "session_id": str(uuid.uuid4()),
+        "content": content,
+        "timestamp": datetime.now().isoformat(),
+        "sender": "user"
+    }
+
+
+@pytest.fixture(scope="module")
+def pool_registry():
+    return MetricsRegistry()
+
+
+@pytest.fixture(scope="module")
+def processing_pool(pool_registry):
+    pool = MessageProcessingPool(
+        max_workers=2, min_chars=100, min_batch=3, registry=pool_registry
+    )
+    pool.start()
+    yield pool
+    pool.close()
+
+
+class TestProcessMessages:
+    def test_returns_content_fields_and_errors_per_item(self):
+        results = process_messages([{"content": "hola malo"}, {}, "texto"])
+
+        content, fields = results[0]
+        assert content.value == "hola ***"
+        assert fields == {"character_count": 7, "word_count": 2}
+        assert isinstance(results[1], RequiredFieldException)
+        assert results[2] is None
+
+
+class TestMessageProcessingPoolPolicy:
+    def test_only_large_messages_and_batches_are_offloaded(self):
+        pool = MessageProcessingPool(
+            max_workers=1, min_chars=10, min_batch=3,
+            registry=MetricsRegistry()
+        )
+
+        assert pool.offloads_message({"content": "x" * 10})
+        assert not pool.offloads_message({"content": "x" * 9})
+        assert not pool.offloads_message({"content": None})
+        assert not pool.offloads_message("texto")
+        assert pool.offloads_batch([{}, {}, {}])
+        assert not pool.offloads_batch([{}, {}])
+
+    @pytest.mark.asyncio
+    async def test_pool_not_started_falls_back_inline(self):
+        registry = MetricsRegistry()
+        pool = MessageProcessingPool(max_workers=1, registry=registry)
+
+        assert await pool.process({"content": "hola"}) is None
+        snapshot = registry.snapshot()
+        assert snapshot["message_process_pool_inline_fallbacks"]["value"] == 1
+
+
+@pytest.mark.asyncio
+class TestMessageProcessingPoolBatches:
+    async def test_batch_is_split_in_one_chunk_per_worker(
+            self,
+            monkeypatch,
+            processing_pool
+            ):
+        submitted = []
+        submit = processing_pool._submit
+
+        async def record(executor, chunk):
+            submitted.append(len(chunk))
+            return await submit(executor, chunk)
+
+        monkeypatch.setattr(processing_pool, "_submit", record)
+        batch = [{"content": f"mensaje {number} malo"} for number in range(5)]
+
+        results = await processing_pool.process_batch(batch)
+
+        assert submitted == [3, 2]
+        assert [content.value for content, _ in results] == [
+            f"mensaje {number} ***" for number in range(5)
+        ]
+
+    async def test_results_keep_the_order_of_the_batch(
+            self,
+            processing_pool
+            ):
+        batch = [
+            {"content": "uno"},
+            "no es un objeto",
+            {"content": "   "},
+            {"content": "cuatro palabras muy largas"},
+            {"content": "cinco"},
+        ]
+
+        results = await processing_pool.process_batch(batch)
+
+        inline = process_messages(batch)
+        assert [results[0], results[1], *results[3:]] == [
+            inline[0], None, *inline[3:]
+        ]
+        assert isinstance(results[2], RequiredFieldException)
+
+    async def test_saturated_pool_falls_back_inline(self):
+        registry = MetricsRegistry()
+        pool = MessageProcessingPool(
+            max_workers=1, max_pending=0, registry=registry
+        )
+        pool.start()
+        try:
+            # A task running on the only worker takes the only slot
+            assert pool._try_acquire_slots(1) is not None
+
+            assert await pool.process_batch([{"content": "hola"}]) is None
+
+            pool._release_slots(1)
+            assert await pool.process_batch([{"content": "hola"}])
+        finally:
+            pool.close()
+
+        snapshot = registry.snapshot()
+        assert snapshot["message_process_pool_inline_fallbacks"]["value"] == 1
+        assert snapshot["message_process_pool_offloaded"]["value"] == 1
+        assert snapshot["message_process_pool_in_flight"]["value"] == 0
+
+    async def test_broken_pool_falls_back_inline_and_is_replaced(self):
+        registry = MetricsRegistry()
+        pool = MessageProcessingPool(max_workers=1, registry=registry)
+        pool.start()
+        try:
+            broken = pool._executor
+            for process in list(broken._processes.values()):
+                process.kill()
+                process.join()
+
+            assert await pool.process_batch([{"content": "hola"}]) is None
+
+            assert pool._executor is not broken
+            results = await pool.process_batch([{"content": "hola malo"}])
+            assert results[0][0].value == "hola ***"
+        finally:
+            pool.close()
+
+        snapshot = registry.snapshot()
+        assert snapshot["message_process_pool_errors"]["value"] == 1
+        assert snapshot["message_process_pool_restarts"]["value"] == 1
+
+    async def test_failed_task_falls_back_inline(self, processing_pool):
+        errors = processing_pool._errors
+        before = errors.value
+
+        # A lambda cannot be sent to a worker process
+        results = await processing_pool.process_batch([
+            {"content": "hola", "callback": lambda: None}
+        ])
+
+        assert results is None
+        assert errors.value == before + 1
+        assert await processing_pool.process_batch([{"content": "hola"}])
+
+
+@pytest.mark.asyncio
+class TestAsyncMessageServiceOnProcessPool:
+    async def test_large_message_is_processed_on_the_pool(
+            self,
+            processing_pool,
+            pool_registry,
+            message_repository_mock
+            ):
+        service = AsyncMessageService(
+            message_repository_mock, processing_pool=processing_pool
+        )
+        message_repository_mock.get_message_by_id.return_value = None
+        message_repository_mock.create_message.side_effect = (
+            lambda message: message
+        )
+        message_data = _message_data("palabra malo " * 20)
+        offloaded = pool_registry.counter("message_process_pool_offloaded")
+        before = offloaded.value
+
+        message = await service.register_message(message_data)
+
+        assert offloaded.value == before + 1
+        assert message.content.value == "palabra *** " * 20
+        assert message.word_count == 40
+        assert message.character_count == 200
+
+    async def test_batch_results_keep_the_order_and_errors(
+            self,
+            processing_pool,
+            message_repository_mock
+            ):
+        service = AsyncMessageService(
+            message_repository_mock, processing_pool=processing_pool
+        )
+        message_repository_mock.get_existing_message_ids.return_value = (
+            set()
+        )
+        message_repository_mock.create_messages.side_effect = (
+            lambda messages: messages
+        )
+        batch = [
+            _message_data("uno"),
+            _message_data("   "),
+            _message_data("tres spam"),
+            "no es un objeto",
+        ]
+
+        results = await service.register_messages(batch)
+
+        assert [result["status"] for result in results] == [
+            "created", "invalid", "created", "invalid"
+        ]
+        assert results[1]["error"]["code"] == "REQUIRED_FIELD"
+        assert results[3]["error"]["code"] == "INVALID_FORMAT"
+        stored = (
+            message_repository_mock.create_messages.call_args.args[0]
+        )
+        assert [message.content.value for message in stored] == [
+            "uno", "tres ***"
+        ]
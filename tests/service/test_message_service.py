@@ -1,14 +1,22 @@
 import uuid
 import pytest
 from app.domain.entities.message import Message
-from app.domain.value_objects import UUIDField
+from app.domain.read_models.message_view import MessageView
+from app.services.message_service import AsyncMessageService
+from app.domain.value_objects import (
+    UUIDField,
+    CursorField,
+    SearchCursorField
+)
 from app.domain.exceptions import (
-    DomainValidationException
+    DomainValidationException,
+    RequiredFieldException
 )
 
 
-class TestMessageService:
-    def test_register_message_successfully(
+@pytest.mark.asyncio
+class TestAsyncMessageService:
+    async def test_register_message_successfully(
             self,
             message_service,
             message_repository_mock,
@@ -25,7 +33,7 @@ class TestMessageService:
             mocked_message_entity
         )
 
-        registered_message = message_service.register_message(
+        registered_message = await message_service.register_message(
             valid_message_data
             )
 
@@ -39,7 +47,7 @@ class TestMessageService:
         assert registered_message.word_count == 5
         assert registered_message.character_count == 26
 
-    def test_register_message_raises_exception_if_message_exists(
+    async def test_register_message_raises_exception_if_message_exists(
             self,
             message_service,
             message_repository_mock,
@@ -56,13 +64,13 @@ class TestMessageService:
         )
 
         with pytest.raises(DomainValidationException) as exc_info:
-            message_service.register_message(valid_message_data)
+            await message_service.register_message(valid_message_data)
 
         assert "Mensaje con id registrado" in str(exc_info.value.message)
         message_repository_mock.get_message_by_id.assert_called_once()
         message_repository_mock.create_message.assert_not_called()
 
-    def test_get_message_by_id_successfully(
+    async def test_get_message_by_id_successfully(
         self,
         message_service,
         message_repository_mock,
@@ -75,7 +83,7 @@ class TestMessageService:
             mocked_message_entity
         )
 
-        retrieved_message = message_service.get_message_by_id(
+        retrieved_message = await message_service.get_message_by_id(
             str(mocked_message_entity.id.value)
             )
 
@@ -84,7 +92,7 @@ class TestMessageService:
             )
         assert retrieved_message == mocked_message_entity
 
-    def test_get_message_by_id_returns_none_if_not_found(
+    async def test_get_message_by_id_returns_none_if_not_found(
             self,
             message_service,
             message_repository_mock
@@ -95,34 +103,303 @@ class TestMessageService:
         message_id_str = str(uuid.uuid4())
         message_repository_mock.get_message_by_id.return_value = None
 
-        retrieved_message = message_service.get_message_by_id(message_id_str)
+        retrieved_message = await message_service.get_message_by_id(
+            message_id_str
+            )
 
         message_repository_mock.get_message_by_id.assert_called_once_with(
             UUIDField(message_id_str)
             )
         assert retrieved_message is None
 
-    @pytest.mark.parametrize("content, expected_words, expected_chars", [
-        ("Este es un mensaje.", 4, 16),
-        ("  Hola mundo  ", 2, 9),
-        ("Uno.", 1, 4),
-        ("", 0, 0),
-        ("    ", 0, 0),
-        (None, 0, 0)
-    ])
-    def test_calculate_counts_correctly(
+    async def test_get_message_by_session_id_passes_pagination(
+            self,
+            message_service,
+            message_repository_mock,
+            mocked_message_entity
+            ):
+        """
+        Await the repository with the session UUID and pagination values.
+        """
+        session_id = str(mocked_message_entity.session_id)
+        message_repository_mock.get_message_by_session_id\
+            .return_value = ([mocked_message_entity], 1)
+
+        messages, total = await message_service.get_message_by_session_id(
+            session_id, limit=10, offset=5, sender="user"
+            )
+
+        message_repository_mock.get_message_by_session_id\
+            .assert_awaited_once_with(
+                UUIDField(session_id), limit=10, offset=5, sender="user"
+                )
+        assert messages == [mocked_message_entity]
+        assert total == 1
+
+    async def test_get_message_page_builds_cursors(
+            self,
+            message_service,
+            message_repository_mock,
+            mocked_message_entity
+            ):
+        """
+        Return a next cursor when more rows exist and a previous cursor
+        when the page was requested with a cursor.
+        """
+        session_id = str(mocked_message_entity.session_id)
+        message_repository_mock.get_message_page_by_session_id\
+            .return_value = ([mocked_message_entity], True)
+        message_repository_mock.count_message_by_session_id\
+            .return_value = 2
+
+        messages, next_cursor, prev_cursor, total = (
+            await message_service.get_message_page_by_session_id(session_id, 1)
+            )
+
+        assert messages == [mocked_message_entity]
+        assert total == 2
+        assert prev_cursor is None
+        assert CursorField(next_cursor).position == (
+            mocked_message_entity.created_at.value,
+            str(mocked_message_entity.id)
+            )
+
+        messages, next_cursor, prev_cursor, total = (
+            await message_service.get_message_page_by_session_id(
+                session_id, 1, cursor=next_cursor
+                )
+            )
+
+        passed_cursor = message_repository_mock\
+            .get_message_page_by_session_id.call_args.kwargs["cursor"]
+        assert passed_cursor.direction == CursorField.NEXT
+        assert CursorField(prev_cursor).direction == CursorField.PREVIOUS
+
+    async def test_get_message_view_page_builds_cursors_from_views(
+            self,
+            message_service,
+            message_repository_mock,
+            mocked_message_entity
+            ):
+        """Build the page cursors from the positions of the read model."""
+        view = MessageView(
+            id=str(mocked_message_entity.id),
+            session_id=str(mocked_message_entity.session_id),
+            content=mocked_message_entity.content.value,
+            timestamp=mocked_message_entity.timestamp.value,
+            sender="user",
+            word_count=5,
+            character_count=26,
+            processed_at=mocked_message_entity.processed_at.value,
+            created_at=mocked_message_entity.created_at.value
+        )
+        message_repository_mock.get_message_view_page_by_session_id\
+            .return_value = ([view], True)
+        message_repository_mock.count_message_by_session_id\
+            .return_value = 2
+
+        views, next_cursor, prev_cursor, total = (
+            await message_service.get_message_view_page_by_session_id(
+                view.session_id, 1
+                )
+            )
+
+        assert views == [view]
+        assert view.to_dict() == mocked_message_entity.to_dict()
+        assert prev_cursor is None
+        assert CursorField(next_cursor).position == view.position
+
+    async def test_register_messages_reports_per_item_status(
             self,
             message_service,
-            content,
-            expected_words,
-            expected_chars
+            message_repository_mock,
+            valid_message_data
+            ):
+        """
+        Classify each batch item as created, duplicate or invalid using a
+        single lookup of existing ids and a single bulk insert.
+        """
+        existing = dict(valid_message_data, message_id=str(uuid.uuid4()))
+        invalid = dict(valid_message_data, message_id=str(uuid.uuid4()),
+                       sender="admin")
+        message_repository_mock.get_existing_message_ids.return_value = {
+            existing["message_id"]
+        }
+        message_repository_mock.create_messages.side_effect = (
+            lambda messages: messages
+        )
+
+        results = await message_service.register_messages([
+            valid_message_data, existing, valid_message_data, invalid
+        ])
+
+        assert [result["status"] for result in results] == [
+            "created", "duplicate", "duplicate", "invalid"
+        ]
+        assert results[3]["error"]["code"] == "INVALID_FORMAT"
+        message_repository_mock.get_existing_message_ids\
+            .assert_called_once()
+        inserted = message_repository_mock.create_messages.call_args[0][0]
+        assert [str(message.id) for message in inserted] == [
+            valid_message_data["message_id"]
+        ]
+
+    async def test_register_messages_reports_ids_stored_concurrently(
+            self,
+            message_service,
+            message_repository_mock,
+            valid_message_data
+            ):
+        """
+        Report as duplicates the messages the repository skipped because
+        another request stored their id after the lookup.
+        """
+        stored_meanwhile = dict(
+            valid_message_data, message_id=str(uuid.uuid4())
+        )
+        message_repository_mock.get_existing_message_ids.return_value = set()
+        message_repository_mock.create_messages.side_effect = (
+            lambda messages: messages[:1]
+        )
+
+        results = await message_service.register_messages([
+            valid_message_data, stored_meanwhile
+        ])
+
+        assert [result["status"] for result in results] == [
+            "created", "duplicate"
+        ]
+
+    async def test_register_messages_rejects_empty_batch(
+            self,
+            message_service,
+            message_repository_mock
             ):
         """
-        Verify that the private word and character count methods
-        work for various test cases.
+        Throw RequiredFieldException for an empty batch.
         """
-        word_count = message_service._calculate_word_count(content)
-        char_count = message_service._calculate_character_count(content)
+        with pytest.raises(RequiredFieldException):
+            await message_service.register_messages([])
 
-        assert word_count == expected_words
-        assert char_count == expected_chars
+        message_repository_mock.create_messages.assert_not_called()
+
+    async def test_register_message_insert_or_conflict_skips_lookup(
+            self,
+            message_repository_mock,
+            valid_message_data,
+            mocked_message_entity
+            ):
+        """
+        In insert_or_conflict mode the message is written with a single
+        repository call and no previous lookup by id.
+        """
+        service = AsyncMessageService(
+            message_repository_mock,
+            write_mode=AsyncMessageService.INSERT_OR_CONFLICT
+            )
+        message_repository_mock.create_message_if_absent.return_value = (
+            mocked_message_entity
+        )
+
+        registered_message = await service.register_message(valid_message_data)
+
+        assert registered_message == mocked_message_entity
+        message_repository_mock.create_message_if_absent\
+            .assert_called_once()
+        message_repository_mock.get_message_by_id.assert_not_called()
+        message_repository_mock.create_message.assert_not_called()
+
+    async def test_register_message_insert_or_conflict_maps_duplicates(
+            self,
+            message_repository_mock,
+            valid_message_data
+            ):
+        """
+        A primary key conflict keeps the same DomainValidationException
+        as the check-then-insert mode.
+        """
+        service = AsyncMessageService(
+            message_repository_mock,
+            write_mode=AsyncMessageService.INSERT_OR_CONFLICT
+            )
+        message_repository_mock.create_message_if_absent.return_value = None
+
+        with pytest.raises(DomainValidationException) as exc_info:
+            await service.register_message(valid_message_data)
+
+        assert "Mensaje con id registrado" in str(exc_info.value.message)
+
+    async def test_export_messages_pairs_each_message_with_its_cursor(
+            self,
+            message_service,
+            message_repository_mock,
+            mocked_message_entity
+            ):
+        """
+        Stream the repository rows with the cursor that resumes the export
+        after each one.
+        """
+        async def stream():
+            yield mocked_message_entity
+
+        session_id = str(mocked_message_entity.session_id)
+        message_repository_mock.stream_messages_by_session_id\
+            .return_value = stream()
+
+        exported = [
+            pair async for pair in message_service
+            .export_messages_by_session_id(session_id)
+        ]
+
+        assert [message for message, _ in exported] == [mocked_message_entity]
+        assert CursorField(exported[0][1]).position == (
+            mocked_message_entity.created_at.value,
+            str(mocked_message_entity.id)
+            )
+        call = message_repository_mock.stream_messages_by_session_id.call_args
+        assert call.args == (UUIDField(session_id),)
+        assert call.kwargs["cursor"] is None
+
+    async def test_export_messages_validates_cursor_before_streaming(
+            self,
+            message_service,
+            message_repository_mock,
+            valid_uuid_str
+            ):
+        """
+        Throw DomainValidationException for an invalid cursor before the
+        stream starts.
+        """
+        with pytest.raises(DomainValidationException):
+            message_service.export_messages_by_session_id(
+                valid_uuid_str, cursor="not-a-cursor"
+                )
+
+        message_repository_mock.stream_messages_by_session_id\
+            .assert_not_called()
+
+    async def test_search_messages_returns_cursor_of_last_result(
+            self,
+            message_service,
+            message_repository_mock,
+            mocked_message_entity
+            ):
+        """
+        Pass the validated query to the repository and build the next
+        cursor from the rank and id of the last result.
+        """
+        message_repository_mock.search_messages.return_value = (
+            [(mocked_message_entity, "[hola]", -0.5)], True
+            )
+
+        results, next_cursor = await message_service.search_messages(
+            "hola", limit=1
+            )
+
+        assert results == [(mocked_message_entity, "[hola]", -0.5)]
+        assert SearchCursorField(next_cursor).position == (
+            -0.5, str(mocked_message_entity.id)
+            )
+        call = message_repository_mock.search_messages.call_args
+        assert call.args[0].match_expression == '"hola"'
+        assert call.kwargs["limit"] == 1
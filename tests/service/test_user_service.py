@@ -10,8 +10,9 @@ from app.domain.value_objects import (
 from app.domain.exceptions import DomainValidationException
 
 
-class TestUserService:
-    def test_register_user_successfully(
+@pytest.mark.asyncio
+class TestAsyncUserService:
+    async def test_register_user_successfully(
             self,
             user_service,
             user_repository_mock,
@@ -23,32 +24,34 @@ class TestUserService:
         and the user does not exist.
         """
 
-        user_repository_mock.get_user_by_email.return_value = None
-        user_repository_mock.get_user_by_username.return_value = None
+        user_repository_mock.exists_by_email_or_username.return_value = (
+            False, False
+        )
 
-        user_repository_mock.create_user.return_value = User(
+        user_repository_mock.create_user_if_absent.return_value = User(
             id=UUIDField(uuid.uuid4()),
             email=EmailField(valid_user_data.get("email")),
             username=UsernameField(valid_user_data.get("username")),
             password_hash=PasswordHashField(valid_password_hash_str)
         )
 
-        registered_user = user_service.register_user(valid_user_data)
+        registered_user = await user_service.register_user(valid_user_data)
 
-        user_repository_mock.get_user_by_email.assert_called_once_with(
-            EmailField(valid_user_data["email"])
-        )
-        user_repository_mock.get_user_by_username.assert_called_once_with(
-            UsernameField(valid_user_data["username"])
-        )
+        (user_repository_mock.exists_by_email_or_username
+            .assert_called_once_with(
+                EmailField(valid_user_data["email"]),
+                UsernameField(valid_user_data["username"])
+            ))
 
-        create_call_args = user_repository_mock.create_user.call_args[0][0]
+        create_call_args = (
+            user_repository_mock.create_user_if_absent.call_args[0][0]
+        )
         assert isinstance(create_call_args, User)
         assert create_call_args.email.value == valid_user_data["email"]
 
         assert isinstance(registered_user, User)
 
-    def test_register_user_raises_exception_if_email_exists(
+    async def test_register_user_raises_exception_if_email_exists(
             self,
             user_service,
             user_repository_mock,
@@ -59,21 +62,21 @@ class TestUserService:
         throw DomainValidationException if a user with the same email
         already exists.
         """
-        user_repository_mock.get_user_by_email.return_value = (
-            mocked_user_entity
+        user_repository_mock.exists_by_email_or_username.return_value = (
+            True, False
         )
         with pytest.raises(DomainValidationException) as excinfo:
-            user_service.register_user(valid_user_data)
+            await user_service.register_user(valid_user_data)
 
         assert "Usuario ya se encuentra registrado" in str(
             excinfo.value.message
             )
         assert excinfo.value.code == "USER_ALREADY_REGISTERED"
-        user_repository_mock.get_user_by_email.assert_called_once()
-        user_repository_mock.get_user_by_username.assert_not_called()
-        user_repository_mock.create_user.assert_not_called()
+        assert "email" in excinfo.value.detail
+        user_repository_mock.exists_by_email_or_username.assert_called_once()
+        user_repository_mock.create_user_if_absent.assert_not_called()
 
-    def test_register_user_raises_exception_if_username_exists(
+    async def test_register_user_raises_exception_if_username_exists(
         self,
         user_service,
         user_repository_mock,
@@ -84,23 +87,42 @@ class TestUserService:
         throw DomainValidationException if a user with the same username
         already exists.
         """
-        user_repository_mock.get_user_by_email.return_value = None
-        user_repository_mock.get_user_by_username.return_value = (
-            mocked_user_entity
+        user_repository_mock.exists_by_email_or_username.return_value = (
+            False, True
         )
 
         with pytest.raises(DomainValidationException) as excinfo:
-            user_service.register_user(valid_user_data)
+            await user_service.register_user(valid_user_data)
 
         assert "Usuario ya se encuentra registrado" in (
             str(excinfo.value.message)
         )
         assert excinfo.value.code == "USER_ALREADY_REGISTERED"
-        user_repository_mock.get_user_by_email.assert_called_once()
-        user_repository_mock.get_user_by_username.assert_called_once()
-        user_repository_mock.create_user.assert_not_called()
+        assert "usuario" in excinfo.value.detail
+        user_repository_mock.exists_by_email_or_username.assert_called_once()
+        user_repository_mock.create_user_if_absent.assert_not_called()
 
-    def test_get_user_by_id_successfully(
+    async def test_register_user_maps_unique_violation_to_already_registered(
+        self,
+        user_service,
+        user_repository_mock,
+        valid_user_data
+    ):
+        """
+        throw USER_ALREADY_REGISTERED when a concurrent registration takes
+        the email or username after the existence check.
+        """
+        user_repository_mock.exists_by_email_or_username.return_value = (
+            False, False
+        )
+        user_repository_mock.create_user_if_absent.return_value = None
+
+        with pytest.raises(DomainValidationException) as excinfo:
+            await user_service.register_user(valid_user_data)
+
+        assert excinfo.value.code == "USER_ALREADY_REGISTERED"
+
+    async def test_get_user_by_id_successfully(
             self,
             user_service,
             user_repository_mock,
@@ -112,14 +134,14 @@ class TestUserService:
         user_id_str = str(mocked_user_entity.id.value)
         user_repository_mock.get_user_by_id.return_value = mocked_user_entity
 
-        retrieved_user = user_service.get_user_by_id(user_id_str)
+        retrieved_user = await user_service.get_user_by_id(user_id_str)
 
         user_repository_mock.get_user_by_id.assert_called_once_with(
             UUIDField(user_id_str)
             )
         assert retrieved_user == mocked_user_entity
 
-    def test_authenticate_user_successfully(
+    async def test_authenticate_user_successfully(
             self,
             user_service,
             user_repository_mock,
@@ -134,14 +156,16 @@ class TestUserService:
             mocked_user_entity
         )
 
-        authenticated_user = user_service.authenticate_user(valid_user_data)
+        authenticated_user = await user_service.authenticate_user(
+            valid_user_data
+            )
 
         user_repository_mock.get_user_by_email.assert_called_once_with(
             EmailField(valid_user_data["email"])
         )
         assert authenticated_user == mocked_user_entity
 
-    def test_authenticate_user_raises_exception_if_user_not_found(
+    async def test_authenticate_user_raises_exception_if_user_not_found(
             self,
             user_service,
             user_repository_mock,
@@ -153,13 +177,13 @@ class TestUserService:
         user_repository_mock.get_user_by_email.return_value = None
 
         with pytest.raises(DomainValidationException) as excinfo:
-            user_service.authenticate_user(valid_user_data)
+            await user_service.authenticate_user(valid_user_data)
 
         assert "Credenciales incorrectas" in str(excinfo.value.message)
         assert excinfo.value.code == "INVALID_CREDENTIALS"
         user_repository_mock.get_user_by_email.assert_called_once()
 
-    def test_authenticate_user_raises_exception_on_incorrect_password(
+    async def test_authenticate_user_raises_exception_on_incorrect_password(
         self,
         user_service,
         mocked_user_entity,
@@ -178,7 +202,7 @@ class TestUserService:
         }
 
         with pytest.raises(DomainValidationException) as excinfo:
-            user_service.authenticate_user(invalid_credentials)
+            await user_service.authenticate_user(invalid_credentials)
 
         assert "Credenciales incorrectas" in str(excinfo.value.message)
         assert excinfo.value.code == "INVALID_CREDENTIALS"